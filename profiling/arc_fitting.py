@@ -0,0 +1,46 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import math
+import ezdxf
+from ezdxf.math import fit_arcs_indices_2d
+from ezdxf.simplify import fit_arcs_polylines
+
+TOLERANCE = 0.005
+
+
+def semicircles(count: int, segments: int = 50):
+    # chain of alternating semicircles with radius 5 as dense polyline
+    points = []
+    for index in range(count):
+        cx = index * 10. + 5.
+        sign = 1 if index % 2 else -1
+        for step in range(segments):
+            angle = math.pi - math.pi * step / segments
+            points.append((cx + 5. * math.cos(angle), sign * 5. * math.sin(angle)))
+    points.append((count * 10., 0.))
+    return points
+
+
+def profile(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def profile_layout() -> float:
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for _ in range(10):
+        msp.add_lwpolyline(semicircles(200))
+    return profile(fit_arcs_polylines, msp, TOLERANCE)
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    points = semicircles(2000)
+    print_result(profile(fit_arcs_indices_2d, points, TOLERANCE), f'fit_arcs_indices_2d() {len(points)} vertices')
+    print_result(profile_layout(), 'fit_arcs_polylines() 10x LWPOLYLINE with 10001 vertices')
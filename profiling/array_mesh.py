@@ -0,0 +1,44 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import numpy
+import ezdxf
+from ezdxf.math import Matrix44
+from ezdxf.render import ArrayMesh, MeshTransformer
+
+SIZE = 1000
+
+
+def grid_mesh(size: int) -> ArrayMesh:
+    xs, ys = numpy.meshgrid(numpy.arange(size, dtype=float), numpy.arange(size, dtype=float))
+    vertices = numpy.column_stack([xs.ravel(), ys.ravel(), numpy.sin(xs.ravel() / 10.)])
+    i = numpy.arange(size * size).reshape(size, size)
+    quads = numpy.column_stack([i[:-1, :-1].ravel(), i[:-1, 1:].ravel(), i[1:, 1:].ravel(), i[1:, :-1].ravel()])
+    return ArrayMesh.from_numpy(vertices, quads)
+
+
+def profile(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    msp = ezdxf.new().modelspace()
+    matrix = Matrix44.chain(Matrix44.z_rotate(0.5), Matrix44.translate(1, 2, 3))
+    mesh = grid_mesh(SIZE)
+    transformer = MeshTransformer.from_mesh(mesh)
+    text = f'{mesh.face_count} faces'
+    print_result(profile(mesh.transform, matrix), f'ArrayMesh.transform() {text}')
+    print_result(profile(transformer.transform, matrix), f'MeshTransformer.transform() {text}')
+    print_result(profile(mesh.render, msp), f'ArrayMesh.render() {text}')
+    print_result(profile(transformer.render, msp), f'MeshTransformer.render() {text}')
+    mesh = grid_mesh(317)
+    text = f'{mesh.face_count} faces'
+    print_result(profile(mesh.subdivide, 3), f'ArrayMesh.subdivide(3) {text}')
+    transformer = MeshTransformer.from_mesh(grid_mesh(101))
+    print_result(profile(transformer.subdivide, 3), f'MeshTransformer.subdivide(3) {len(transformer.faces)} faces')
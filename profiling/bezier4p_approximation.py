@@ -0,0 +1,42 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import time
+import math
+from ezdxf.math import cubic_bezier_interpolation, cubic_bezier_chain_approximation
+from ezdxf.math import bezier4p
+from ezdxf.render import random_3d_path
+
+COUNT = 10
+SEGMENTS = 20
+
+path = list(random_3d_path(10_000, max_step_size=10, max_heading=math.pi * 0.8))
+curves = list(cubic_bezier_interpolation(path))
+
+
+def profile_single_curve_approximation() -> float:
+    t0 = time.perf_counter()
+    for _ in range(COUNT):
+        vertices = [curves[0].control_points[0]]
+        for curve in curves:
+            vertices.extend(curve.approximate(SEGMENTS))
+    return time.perf_counter() - t0
+
+
+def profile_chain_approximation() -> float:
+    t0 = time.perf_counter()
+    for _ in range(COUNT):
+        cubic_bezier_chain_approximation(curves, SEGMENTS)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    text = f'{COUNT}x {len(curves)} curves, {SEGMENTS} segments each'
+    print_result(profile_single_curve_approximation(), f'Bezier4P.approximate() {text}')
+    if bezier4p.numpy is not None:
+        print_result(profile_chain_approximation(), f'cubic_bezier_chain_approximation() {text}, numpy')
+    bezier4p.numpy = None
+    print_result(profile_chain_approximation(), f'cubic_bezier_chain_approximation() {text}, pure Python')
@@ -28,6 +28,14 @@ def profile(text, func, *args):
     print(f'{text} {t1 - t0:.3f}s')
 
 
+def profile_interpolation_scaling(counts):
+    for count in counts:
+        path = list(random_3d_path(count, max_step_size=10, max_heading=math.pi * 0.8))
+        profile(f'B-spline interpolation of {count} fit points: ', global_bspline_interpolation, path)
+        profile(f'B-spline interpolation of {count} fit points and end tangents: ', global_bspline_interpolation,
+                path, 3, [(1, 0, 0), (0, 1, 0)])
+
+
 def export_path(path):
     doc = ezdxf.new()
     msp = doc.modelspace()
@@ -47,3 +55,5 @@ profile('B-spline interpolation 300x: ', profile_bspline_interpolation, 300, pat
 
 spline = BSpline.from_fit_points(path, degree=3)
 profile('calculate 25x 1000 B-spline vertices: ', profile_vertex_calculation, 25, spline, 1000)
+
+profile_interpolation_scaling([1000, 10000, 100000])
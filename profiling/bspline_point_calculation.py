@@ -20,6 +20,18 @@ def profile_bspline_point_new(count, spline):
             spline.point(t)
 
 
+def profile_bspline_points_batch(count, spline):
+    params = list(linspace(0, 1.0, 100))
+    for _ in range(count):
+        list(spline.points(params))
+
+
+def profile_bspline_derivative_new(count, spline):
+    for _ in range(count):
+        for t in linspace(0, 1.0, 100):
+            spline.derivative(t)
+
+
 def profile_bspline_derivatives_new(count, spline):
     for _ in range(count):
         list(spline.derivatives(t=linspace(0, 1.0, 100)))
@@ -33,4 +45,6 @@ def profile(text, func, *args):
 
 
 profile('B-spline point new 300x: ', profile_bspline_point_new, 300, spline)
-profile('B-spline derivatives new 300x: ', profile_bspline_derivatives_new, 300, spline)
+profile('B-spline points batch 300x: ', profile_bspline_points_batch, 300, spline)
+profile('B-spline derivative new 300x: ', profile_bspline_derivative_new, 300, spline)
+profile('B-spline derivatives batch 300x: ', profile_bspline_derivatives_new, 300, spline)
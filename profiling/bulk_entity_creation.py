@@ -0,0 +1,36 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import time
+import ezdxf
+
+COUNT = 100_000
+LINES = [((x, 0, 0), (x, 1, 0)) for x in range(COUNT)]
+ATTRIBS = {'layer': 'LINES', 'color': 1}
+
+
+def add_line_by_line(msp):
+    for start, end in LINES:
+        msp.add_line(start, end, dxfattribs=ATTRIBS)
+
+
+def add_lines(msp):
+    msp.add_lines(LINES, dxfattribs=ATTRIBS)
+
+
+def profile(func) -> float:
+    msp = ezdxf.new().modelspace()
+    t0 = time.perf_counter()
+    func(msp)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    t1 = profile(add_line_by_line)
+    print_result(t1, f'add {COUNT} LINE entities by add_line()')
+    t2 = profile(add_lines)
+    print_result(t2, f'add {COUNT} LINE entities by add_lines()')
+    print(f'Ratio {t1 / t2:.1f}')
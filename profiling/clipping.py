@@ -0,0 +1,60 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import random
+from ezdxf.math import Vec2, clip_segments_to_rect_2d, clip_polylines_to_rect_2d, clip_polygons_2d
+from ezdxf.math import clipping
+
+SIZE = 1000.0
+RECT_MIN = (200, 200)
+RECT_MAX = (800, 600)
+
+
+def random_segments(count, max_length=10.0):
+    segments = []
+    for _ in range(count):
+        start = Vec2(random.uniform(0, SIZE), random.uniform(0, SIZE))
+        end = start + Vec2.from_deg_angle(random.uniform(0, 360), random.uniform(0, max_length))
+        segments.append((start, end))
+    return segments
+
+
+def random_polylines(count, vertices=100, max_length=10.0):
+    polylines = []
+    for _ in range(count):
+        vertex = Vec2(random.uniform(0, SIZE), random.uniform(0, SIZE))
+        polyline = [vertex]
+        for _ in range(vertices - 1):
+            vertex += Vec2.from_deg_angle(random.uniform(0, 360), random.uniform(0, max_length))
+            polyline.append(vertex)
+        polylines.append(polyline)
+    return polylines
+
+
+def random_polygons(count, size=20.0):
+    return [
+        [Vec2(random.uniform(0, SIZE), random.uniform(0, SIZE)) + Vec2.from_deg_angle(angle, size)
+         for angle in range(0, 360, 30)]
+        for _ in range(count)
+    ]
+
+
+def profile(text, func, *args):
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    print(f'{text} {t1 - t0:.3f}s')
+
+
+SEGMENTS = random_segments(1_000_000)
+POLYLINES = random_polylines(10_000)
+POLYGONS = random_polygons(100_000)
+CLIPPER = [(200, 200), (800, 200), (900, 500), (500, 800), (100, 500)]
+
+if clipping.numpy is not None:
+    profile('clip 1M segments to rect, numpy: ', clip_segments_to_rect_2d, SEGMENTS, RECT_MIN, RECT_MAX)
+    profile('clip 10k polylines to rect, numpy: ', clip_polylines_to_rect_2d, POLYLINES, RECT_MIN, RECT_MAX)
+clipping.numpy = None
+profile('clip 1M segments to rect, pure Python: ', clip_segments_to_rect_2d, SEGMENTS, RECT_MIN, RECT_MAX)
+profile('clip 10k polylines to rect, pure Python: ', clip_polylines_to_rect_2d, POLYLINES, RECT_MIN, RECT_MAX)
+profile('clip 100k polygons by convex polygon: ', clip_polygons_2d, CLIPPER, POLYGONS)
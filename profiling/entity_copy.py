@@ -0,0 +1,39 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import time
+import ezdxf
+from ezdxf.render.forms import cube
+
+COUNT = 20_000
+
+
+def setup_entities():
+    doc = ezdxf.new()
+    doc.appids.new('EZDXF')
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0))
+    line.set_xdata('EZDXF', [(1000, 'profiling'), (1040, 3.1415)])
+    lwpolyline = msp.add_lwpolyline([(x, x % 3) for x in range(100)])
+    spline = msp.add_spline([(x, x % 3) for x in range(20)])
+    mesh = cube().render(msp)
+    block = doc.blocks.new('BLK')
+    block.add_attdef('TAG', (0, 0))
+    insert = msp.add_blockref('BLK', (0, 0))
+    insert.add_auto_attribs({'TAG': 'value'})
+    return [line, lwpolyline, spline, mesh, insert]
+
+
+def profile_copy(entity) -> float:
+    t0 = time.perf_counter()
+    for _ in range(COUNT):
+        entity.copy()
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    for entity in setup_entities():
+        print_result(profile_copy(entity), f'copy {COUNT} {entity.dxftype()} entities')
@@ -65,6 +65,11 @@ def profile_LU_decomposition_inverse(count):
         LUDecomposition(RANDOM_GAUSS_MATRIX_1).inverse()
 
 
+def profile_matrix_mul(count):
+    for _ in range(count):
+        RANDOM_GAUSS_MATRIX_1 * RANDOM_GAUSS_MATRIX_1
+
+
 def profile(text, func, *args):
     t0 = time.perf_counter()
     func(*args)
@@ -80,3 +85,4 @@ profile('Gauss elimination matrix solver  - 3 vectors: ', profile_gauss_matrix_s
 profile('LU decomposition vector solver - 1 vector: ', profile_LU_vector_solver, 5)
 profile('LU decomposition matrix solver - 3 vectors: ', profile_LU_matrix_solver, 5)
 profile('LU decomposition inverse: ', profile_LU_decomposition_inverse, 5)
+profile('Matrix multiplication: ', profile_matrix_mul, 5)
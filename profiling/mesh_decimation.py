@@ -0,0 +1,47 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import math
+from ezdxf.render import ArrayMesh, decimate_mesh, decimation
+
+SIZE = 1000  # 2M triangles
+
+
+def terrain(size: int) -> ArrayMesh:
+    # smooth terrain grid of 2 * size * size triangles
+    vertices = [
+        (x, y, math.sin(x / 50) * math.cos(y / 70) * 20) for y in range(size + 1) for x in range(size + 1)
+    ]
+    faces = []
+    for row in range(size):
+        for column in range(size):
+            a = row * (size + 1) + column
+            faces.append((a, a + 1, a + size + 2))
+            faces.append((a, a + size + 2, a + size + 1))
+    mesh = ArrayMesh()
+    mesh.add_mesh(vertices=vertices, faces=faces)
+    return mesh
+
+
+def profile(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    mesh = terrain(SIZE)
+    count = mesh.face_count
+    print_result(profile(decimate_mesh, mesh, count // 10), f'decimate_mesh() {count} to {count // 10} triangles')
+    print_result(profile(decimate_mesh, mesh, None, 0.05), f'decimate_mesh() {count} triangles, max. error 0.05')
+    small = terrain(30)
+    count = small.face_count
+    numpy = decimation.numpy
+    decimation.numpy = None
+    print_result(profile(decimate_mesh, small, count // 10),
+                 f'decimate_mesh() {count} to {count // 10} triangles, pure Python')
+    decimation.numpy = numpy
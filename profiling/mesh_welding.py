@@ -0,0 +1,67 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import random
+from ezdxf.render import mesh
+from ezdxf.render.mesh import MeshVertexMerger, MeshVertexWelder
+
+SIZE = 300
+
+random.seed(42)
+
+
+def terrain_triangles(size: int):
+    # triangle soup of a terrain grid, each vertex is shared by up to 6 triangles
+    heights = [[random.random() for _ in range(size + 1)] for _ in range(size + 1)]
+    vertices = []
+    for i in range(size):
+        for j in range(size):
+            a = (i, j, heights[i][j])
+            b = (i + 1, j, heights[i + 1][j])
+            c = (i + 1, j + 1, heights[i + 1][j + 1])
+            d = (i, j + 1, heights[i][j + 1])
+            vertices.extend((a, b, c, a, c, d))
+    return vertices
+
+
+def profile_add_mesh(cls, vertices, faces) -> float:
+    t0 = time.perf_counter()
+    builder = cls()
+    builder.add_mesh(vertices=vertices, faces=faces)
+    return time.perf_counter() - t0
+
+
+def profile_weld_array(vertices) -> float:
+    array = mesh.numpy.array(vertices, dtype=float)
+    t0 = time.perf_counter()
+    MeshVertexWelder().weld(array)
+    return time.perf_counter() - t0
+
+
+def profile_weld_unique_vertices(count: int) -> float:
+    # random vertices without close neighbors, which is the worst case for the grid cell lookup
+    array = mesh.numpy.random.default_rng(42).random((count, 3)) * 100.
+    t0 = time.perf_counter()
+    MeshVertexWelder().weld(array)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    vertices = terrain_triangles(SIZE)
+    faces = [(index, index + 1, index + 2) for index in range(0, len(vertices), 3)]
+    text = f'{len(faces)} triangles'
+    print_result(profile_add_mesh(MeshVertexMerger, vertices, faces), f'MeshVertexMerger.add_mesh() {text}')
+    print_result(profile_add_mesh(MeshVertexWelder, vertices, faces), f'MeshVertexWelder.add_mesh() {text}')
+    if mesh.numpy is not None:
+        print_result(profile_weld_array(vertices), f'MeshVertexWelder.weld() {text} as numpy array')
+        for count in (100_000, 1_000_000):
+            print_result(profile_weld_unique_vertices(count), f'MeshVertexWelder.weld() {count} unique vertices')
+        numpy = mesh.numpy
+        mesh.numpy = None
+        print_result(profile_add_mesh(MeshVertexWelder, vertices, faces),
+                     f'MeshVertexWelder.add_mesh() {text}, pure Python')
+        mesh.numpy = numpy
@@ -0,0 +1,41 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import random
+from ezdxf.math import OCS, get_ocs, Vector
+
+COUNT = 100_000
+EXTRUSIONS = [(0, 0, 1), (0, 0, -1), (0.7081979129501316, 0.0754851955385861, 0.7019670229772758)]
+ENTITIES = [random.choice(EXTRUSIONS) for _ in range(COUNT)]
+POINTS = [Vector(random.uniform(-100, 100), random.uniform(-100, 100), 0) for _ in range(1_000_000)]
+
+
+def profile_ocs_setup():
+    for extrusion in ENTITIES:
+        OCS(extrusion)
+
+
+def profile_cached_ocs_setup():
+    for extrusion in ENTITIES:
+        get_ocs(extrusion)
+
+
+def profile_points_to_wcs():
+    list(OCS(EXTRUSIONS[2]).points_to_wcs(POINTS))
+
+
+def profile_points_to_wcs_array():
+    OCS(EXTRUSIONS[2]).points_to_wcs_array(POINTS)
+
+
+def profile(text, func, *args):
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    print(f'{text} {t1 - t0:.3f}s')
+
+
+profile(f'setup OCS for {COUNT} entities: ', profile_ocs_setup)
+profile(f'get cached OCS for {COUNT} entities: ', profile_cached_ocs_setup)
+profile(f'OCS.points_to_wcs() 1M points: ', profile_points_to_wcs)
+profile(f'OCS.points_to_wcs_array() 1M points: ', profile_points_to_wcs_array)
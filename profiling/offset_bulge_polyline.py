@@ -0,0 +1,60 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import math
+import random
+from ezdxf.math import offset_bulge_polylines_2d, offset_vertices_2d
+
+COUNT = 2000
+VERTICES = 40
+
+
+def contour(x, y):
+    # star shaped closed contour with random arc segments, located at (x, y)
+    vertices = []
+    for i in range(VERTICES):
+        angle = math.tau * i / VERTICES
+        radius = random.uniform(4, 5)
+        vertices.append((x + radius * math.cos(angle), y + radius * math.sin(angle), random.uniform(-0.1, 0.1)))
+    return vertices
+
+
+random.seed(42)
+CONTOURS = [contour(x * 12, y * 12) for x in range(int(math.sqrt(COUNT))) for y in range(int(math.sqrt(COUNT)))]
+
+
+def profile_offset_vertices_2d(offset: float) -> float:
+    # straight segments only, without self intersection removal
+    t0 = time.perf_counter()
+    for vertices in CONTOURS:
+        list(offset_vertices_2d(vertices, offset, closed=True))
+    return time.perf_counter() - t0
+
+
+def profile_offset_bulge_polylines_2d(offset: float) -> float:
+    t0 = time.perf_counter()
+    offset_bulge_polylines_2d(CONTOURS, offset, closed=True)
+    return time.perf_counter() - t0
+
+
+def profile_dense_circle(count: int, offset: float) -> float:
+    # the raw offset curve has a shallow loop at each concave corner
+    circle = [(100 * math.cos(math.tau * i / count), 100 * math.sin(math.tau * i / count)) for i in range(count)]
+    t0 = time.perf_counter()
+    offset_bulge_polylines_2d([circle], offset, closed=True)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    text = f'{len(CONTOURS)} contours with {VERTICES} vertices'
+    for offset in (-0.5, 0.5):
+        print_result(profile_offset_vertices_2d(offset), f'offset_vertices_2d() {text}, offset={offset}')
+        print_result(profile_offset_bulge_polylines_2d(offset), f'offset_bulge_polylines_2d() {text}, offset={offset}')
+    for count in (1000, 5000, 20000):
+        for offset in (-1, 1):
+            print_result(profile_dense_circle(count, offset),
+                         f'offset_bulge_polylines_2d() circle with {count} vertices, offset={offset}')
@@ -0,0 +1,53 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import random
+from ezdxf.math import Vec2, PolygonIndex, is_point_in_polygon_2d
+from ezdxf.math import polygon
+
+GRID = 50  # 2500 parcels
+VERTICES = 20
+
+
+def parcel(x, y):
+    # distorted square with VERTICES vertices
+    vertices = []
+    corners = [Vec2(x, y), Vec2(x + 1, y), Vec2(x + 1, y + 1), Vec2(x, y + 1)]
+    steps = VERTICES // 4
+    for start, end in zip(corners, corners[1:] + corners[:1]):
+        for i in range(steps):
+            vertices.append(start.lerp(end, i / steps))
+    return vertices
+
+
+PARCELS = [parcel(x, y) for x in range(GRID) for y in range(GRID)]
+
+
+def random_points(count):
+    return [Vec2(random.uniform(0, GRID), random.uniform(0, GRID)) for _ in range(count)]
+
+
+def profile_brute_force(points):
+    for point in points:
+        for p in PARCELS:
+            if is_point_in_polygon_2d(point, p) >= 0:
+                break
+
+
+def profile_index(points):
+    PolygonIndex(PARCELS).locate(points)
+
+
+def profile(text, func, *args):
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    print(f'{text} {t1 - t0:.3f}s')
+
+
+profile(f'brute force 100 points in {len(PARCELS)} parcels: ', profile_brute_force, random_points(100))
+POINTS = random_points(1_000_000)
+if polygon.numpy is not None:
+    profile(f'PolygonIndex 1M points in {len(PARCELS)} parcels, numpy: ', profile_index, POINTS)
+polygon.numpy = None
+profile(f'PolygonIndex 100k points in {len(PARCELS)} parcels, pure Python: ', profile_index, POINTS[:100_000])
@@ -1,8 +1,12 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
 import time
+import random
 
-from ezdxf.math import intersection_line_line_2d, ConstructionRay, Vec2
+from ezdxf.math import intersection_line_line_2d, ConstructionRay, Vec2, intersect_segments_2d
+from ezdxf.math import (
+    intersect_curve_with_curves_2d, intersect_polylines_2d, global_bspline_interpolation, ConstructionArc,
+)
 
 P1 = Vec2((0, 0))
 P2 = Vec2((10, 10))
@@ -30,9 +34,46 @@ def profile_intersection_line_line_xy(count=COUNT):
         intersection_line_line_2d(line1=(P1, P2), line2=(P3, P4))
 
 
-def profile(text, func):
+def random_segments(count, size=1000.0, max_length=10.0):
+    segments = []
+    for _ in range(count):
+        start = Vec2(random.uniform(0, size), random.uniform(0, size))
+        end = start + Vec2.from_deg_angle(random.uniform(0, 360), random.uniform(0, max_length))
+        segments.append((start, end))
+    return segments
+
+
+def profile_all_pairs_segment_intersection(segments):
+    for i in range(len(segments)):
+        for j in range(i + 1, len(segments)):
+            intersection_line_line_2d(segments[i], segments[j], virtual=False)
+
+
+def profile_grid_segment_intersection(segments):
+    intersect_segments_2d(segments)
+
+
+def random_arcs(count, size=50.0):
+    return [
+        ConstructionArc((random.uniform(0, size), random.uniform(-5, 5)), random.uniform(0.5, 3),
+                        random.uniform(0, 360), random.uniform(0, 360))
+        for _ in range(count)
+    ]
+
+
+def profile_curve_intersection(spline, arcs):
+    intersect_curve_with_curves_2d(spline, arcs)
+
+
+def profile_flattened_curve_intersection(spline, arcs):
+    vertices = list(spline.flattening(1e-4))
+    for arc in arcs:
+        intersect_polylines_2d([vertices, arc.flattening(1e-4)])
+
+
+def profile(text, func, *args):
     t0 = time.perf_counter()
-    func()
+    func(*args)
     t1 = time.perf_counter()
     print(f'{text} {t1 - t0:.3f}s')
 
@@ -40,3 +81,17 @@ def profile(text, func):
 profile('intersect ConstructionRay: ', profile_construction_ray)
 profile('intersect ConstructionRay init once: ', profile_construction_ray_init_once)
 profile('intersect line line xy: ', profile_intersection_line_line_xy)
+
+SEGMENTS_2K = random_segments(2000)
+profile('intersect 2k segments all pairs: ', profile_all_pairs_segment_intersection, SEGMENTS_2K)
+profile('intersect 2k segments grid: ', profile_grid_segment_intersection, SEGMENTS_2K)
+SEGMENTS_100K = random_segments(100_000, size=10000.0)
+profile('intersect 100k segments grid: ', profile_grid_segment_intersection, SEGMENTS_100K)
+DIAGONALS = [(Vec2(0, i * 1000), Vec2(10000, 10000 - i * 1000)) for i in range(10)]
+profile('intersect 100k segments and 10 long diagonals grid: ', profile_grid_segment_intersection,
+        SEGMENTS_100K + DIAGONALS)
+
+SPLINE = global_bspline_interpolation([(x, random.uniform(-5, 5)) for x in range(50)])
+ARCS_100 = random_arcs(100)
+profile('intersect spline with 100 arcs flattened: ', profile_flattened_curve_intersection, SPLINE, ARCS_100)
+profile('intersect spline with 100 arcs subdivision: ', profile_curve_intersection, SPLINE, ARCS_100)
@@ -0,0 +1,75 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+from ezdxf.render import forms
+from ezdxf.addons.pycsg import CSG
+
+
+def plate(level: int):
+    # 6 * 4 ** (5 + level) faces
+    return forms.cube().scale(20, 20, 1).subdivide(5).subdivide(level)
+
+
+def pipe(level: int):
+    # 258 * 4 ** level faces - degenerated faces
+    return forms.cylinder(count=256, radius=1, top_center=(0, 0, 4)).translate(3, 2, -2).subdivide(level)
+
+
+def block(level: int):
+    # 6 * 4 ** level faces
+    return forms.cube().scale(10, 10, 10).subdivide(level)
+
+
+def hole(level: int):
+    # pipe through the block, 258 * 4 ** level faces - degenerated faces
+    return forms.cylinder(count=256, radius=1, top_center=(0, 0, 12)).translate(3, 2, -6).subdivide(level)
+
+
+def torus(count: int):
+    # non-convex solid, count * count / 2 faces
+    profile = forms.translate(forms.circle(count // 2, radius=.3, close=True), (0, 1, 0))
+    return forms.rotation_form(count, profile)
+
+
+def profile(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+def subtract(a: CSG, b: CSG):
+    return (a - b).mesh()
+
+
+def union(a: CSG, b: CSG):
+    return (a + b).mesh()
+
+
+def intersect(a: CSG, b: CSG):
+    return (a * b).mesh()
+
+
+if __name__ == '__main__':
+    a = CSG(plate(2))
+    b = CSG(pipe(3))
+    count = f'{len(a.polygons)} - {len(b.polygons)} faces'
+    print_result(profile(subtract, a, b), f'CSG plate - pipe, {count}')
+    print_result(profile(union, a, b), f'CSG plate + pipe, {count}')
+    print_result(profile(intersect, a, b), f'CSG plate * pipe, {count}')
+    a = CSG(forms.sphere(count=64, stacks=32, radius=1))
+    b = CSG(forms.sphere(count=64, stacks=32, radius=1).translate(1, 0, 0))
+    count = f'{len(a.polygons)} - {len(b.polygons)} faces'
+    print_result(profile(subtract, a, b), f'CSG sphere - sphere, {count}')
+    print_result(profile(union, a, b), f'CSG sphere + sphere, {count}')
+    a = CSG(block(2))
+    b = CSG(hole(2))
+    print_result(profile(subtract, a, b), f'CSG block - pipe, {len(a.polygons)} - {len(b.polygons)} faces')
+    a = CSG(torus(64))
+    b = CSG(torus(64).translate(.1, .3, .2))
+    count = f'{len(a.polygons)} - {len(b.polygons)} faces'
+    print_result(profile(subtract, a, b), f'CSG torus - torus, {count}')
+    print_result(profile(union, a, b), f'CSG torus + torus, {count}')
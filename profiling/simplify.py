@@ -0,0 +1,56 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import io
+import math
+import random
+import ezdxf
+from ezdxf.math import douglas_peucker_indices, visvalingam_indices
+from ezdxf.math import simplify
+from ezdxf.simplify import simplify_polylines
+
+COUNT = 200_000
+TOLERANCE = 0.01
+
+random.seed(42)
+# survey like track: nearly collinear vertices with small noise
+POINTS = [(i * 0.1, math.sin(i / 5000) * 100 + random.uniform(-0.002, 0.002)) for i in range(COUNT)]
+
+
+def profile(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def file_size(doc) -> int:
+    stream = io.StringIO()
+    doc.write(stream)
+    return len(stream.getvalue())
+
+
+def profile_layout() -> None:
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(10):
+        msp.add_lwpolyline(POINTS[index * 10_000:(index + 1) * 10_000])
+    size = file_size(doc)
+    t = profile(simplify_polylines, msp, TOLERANCE)
+    print(f"Profiling: simplify_polylines() 10x LWPOLYLINE with 10000 vertices; takes {t:.2f} seconds")
+    print(f"DXF file size: {size} bytes before, {file_size(doc)} bytes after simplification")
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    text = f'{COUNT} vertices, tolerance={TOLERANCE}'
+    if simplify.numpy is not None:
+        print_result(profile(douglas_peucker_indices, POINTS, TOLERANCE), f'douglas_peucker_indices() {text}, numpy')
+    print_result(profile(visvalingam_indices, POINTS, TOLERANCE), f'visvalingam_indices() {text}')
+    numpy = simplify.numpy
+    simplify.numpy = None
+    print_result(profile(douglas_peucker_indices, POINTS, TOLERANCE), f'douglas_peucker_indices() {text}, pure Python')
+    simplify.numpy = numpy
+    profile_layout()
@@ -0,0 +1,60 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import time
+import math
+from ezdxf.math import Vec2, nest_polygons_2d, triangulate_polygons_2d, triangulate_polygon_2d
+
+
+def boundary_paths(count: int):
+    # count * count cells, every second cell is a 16-gon with a square hole
+    paths = []
+    for i in range(count):
+        for j in range(count):
+            x, y = i * 3, j * 3
+            if (i + j) % 2:
+                paths.append([Vec2(x, y), Vec2(x + 2, y), Vec2(x + 2, y + 2), Vec2(x, y + 2)])
+            else:
+                paths.append([Vec2.from_angle(a * math.pi / 8) + Vec2(x + 1, y + 1) for a in range(16)])
+                paths.append([Vec2(x + .5, y + .5), Vec2(x + 1.5, y + .5), Vec2(x + 1.5, y + 1.5), Vec2(x + .5, y + 1.5)])
+    return paths
+
+
+def wave(count: int):
+    # concave polygon
+    return [Vec2.from_angle(a * 2 * math.pi / count, 10 + math.sin(a * math.pi / 8)) for a in range(count)]
+
+
+def square_with_holes(count: int):
+    # square exterior path with count * count square holes
+    exterior = [Vec2(0, 0), Vec2(count * 2, 0), Vec2(count * 2, count * 2), Vec2(0, count * 2)]
+    holes = [
+        [Vec2(x + .5, y + .5), Vec2(x + 1.5, y + .5), Vec2(x + 1.5, y + 1.5), Vec2(x + .5, y + 1.5)]
+        for x in range(0, count * 2, 2) for y in range(0, count * 2, 2)
+    ]
+    return exterior, holes
+
+
+def profile(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    paths = boundary_paths(224)
+    polygons = nest_polygons_2d(paths)
+    t = profile(nest_polygons_2d, paths)
+    print_result(t, f'nest_polygons_2d() of {len(paths)} boundary paths')
+    t = profile(triangulate_polygons_2d, polygons)
+    print_result(t, f'triangulate_polygons_2d() of {len(polygons)} polygons')
+    # scaling of long wavy outlines, see docs of triangulate_indices_2d()
+    for count in (5000, 10000, 20000, 40000):
+        t = profile(triangulate_polygon_2d, wave(count))
+        print_result(t, f'triangulate_polygon_2d() of a concave polygon with {count} vertices')
+    for count in (10, 25, 50):
+        t = profile(triangulate_polygon_2d, *square_with_holes(count))
+        print_result(t, f'triangulate_polygon_2d() of a square with {count * count} holes')
@@ -0,0 +1,49 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import time
+import random
+from array import array
+from ezdxf.math import Matrix44, Vec3Array
+from ezdxf.math import vec3array
+
+COUNT = 1_000_000
+
+m = Matrix44.chain(
+    Matrix44.xyz_rotate(0.5, 1.0, 1.5),
+    Matrix44.scale(2, 3, 4),
+    Matrix44.translate(10, 20, 30),
+)
+
+
+def setup_vertices() -> Vec3Array:
+    return Vec3Array.from_array(array('d', (random.random() for _ in range(COUNT * 3))))
+
+
+def profile_transform_vertices(vertices: Vec3Array) -> float:
+    t0 = time.perf_counter()
+    list(m.transform_vertices(vertices))
+    return time.perf_counter() - t0
+
+
+def profile_transform_array(vertices: Vec3Array) -> float:
+    t0 = time.perf_counter()
+    m.transform_array(vertices)
+    return time.perf_counter() - t0
+
+
+def profile_transform_array_python(vertices: Vec3Array) -> float:
+    t0 = time.perf_counter()
+    vec3array._transform_array_python(m.matrix, vertices.values, True)
+    return time.perf_counter() - t0
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    vertices = setup_vertices()
+    print_result(profile_transform_vertices(vertices), f'Matrix44.transform_vertices() {COUNT} vertices')
+    print_result(profile_transform_array_python(vertices), f'Matrix44.transform_array() {COUNT} vertices, pure Python')
+    if vec3array.HAS_NUMPY:
+        print_result(profile_transform_array(vertices), f'Matrix44.transform_array() {COUNT} vertices, numpy')
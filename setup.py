@@ -51,6 +51,7 @@ setup(
     },
     provides=['ezdxf'],
     install_requires=['pyparsing>=2.0.1'],
+    extras_require={'numpy': ['numpy']},  # optional accelerator for batch vertex transformations
     setup_requires=['wheel'],
     tests_require=['pytest', 'geomdl'],
     keywords=['DXF', 'CAD'],
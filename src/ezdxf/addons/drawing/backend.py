@@ -2,12 +2,13 @@
 # Copyright (c) 2020, Matthew Broadway
 # License: MIT License
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, TYPE_CHECKING, Iterable
+import warnings
+from typing import Optional, Tuple, TYPE_CHECKING, Iterable, Sequence
 
 from ezdxf.addons.drawing.properties import Properties
 from ezdxf.addons.drawing.type_hints import Color, Radians
 from ezdxf.entities import DXFGraphic
-from ezdxf.math import Vector, Matrix44
+from ezdxf.math import Vector, Matrix44, triangulate_polygon_3d
 from ezdxf.render.path import Path
 
 if TYPE_CHECKING:
@@ -18,9 +19,29 @@ class Backend(ABC):
     def __init__(self):
         self._current_entity = None
         self._current_entity_stack = ()
-        # Approximate cubic Bèzier-curves by `n` segments, only used for basic back-ends
-        # without draw_path() support.
-        self.bezier_approximation_count = 32
+        # Max. distance from the center of a cubic Bèzier-curve segment to the center of its approximation line
+        # segment, for drawing unit = 1m, max. distance = 1cm. Only used for basic back-ends without
+        # draw_path() support.
+        self.max_flattening_distance = 0.01
+        # Deprecated fixed count of approximation segments for each cubic Bèzier-curve, overrides
+        # max_flattening_distance if set
+        self._bezier_approximation_count: Optional[int] = None
+
+    @property
+    def bezier_approximation_count(self) -> Optional[int]:
+        warnings.warn(
+            'Backend.bezier_approximation_count is deprecated, use max_flattening_distance. (removed in v0.15)',
+            DeprecationWarning
+        )
+        return self._bezier_approximation_count
+
+    @bezier_approximation_count.setter
+    def bezier_approximation_count(self, count: Optional[int]) -> None:
+        warnings.warn(
+            'Backend.bezier_approximation_count is deprecated, use max_flattening_distance. (removed in v0.15)',
+            DeprecationWarning
+        )
+        self._bezier_approximation_count = count
 
     def set_current_entity(self, entity: Optional[DXFGraphic], parent_stack: Tuple[DXFGraphic, ...] = ()) -> None:
         self._current_entity = entity
@@ -54,7 +75,10 @@ class Backend(ABC):
 
         """
         if len(path):
-            vertices = iter(path.approximate(segments=self.bezier_approximation_count))
+            if self._bezier_approximation_count is None:
+                vertices = iter(path.flattening(distance=self.max_flattening_distance))
+            else:
+                vertices = iter(path.approximate(segments=self._bezier_approximation_count))
             prev = next(vertices)
             for vertex in vertices:
                 self.draw_line(prev, vertex, properties)
@@ -68,6 +92,23 @@ class Backend(ABC):
     def draw_filled_polygon(self, points: Iterable[Vector], properties: Properties) -> None:
         raise NotImplementedError
 
+    def draw_filled_polygons(self, polygons: Iterable[Sequence[Sequence[Vector]]], properties: Properties) -> None:
+        """ Draw filled polygons with holes, each polygon is a sequence of boundary paths, the first path is the
+        exterior boundary path and all following paths are holes of this polygon.
+
+        Fall-back implementation, draws polygons without holes by :meth:`draw_filled_polygon` and triangulates
+        polygons with holes.
+
+        Override in inherited back-end for a more efficient implementation.
+
+        """
+        for polygon in polygons:
+            if len(polygon) == 1:
+                self.draw_filled_polygon(polygon[0], properties)
+            else:
+                for triangle in triangulate_polygon_3d(polygon[0], polygon[1:]):
+                    self.draw_filled_polygon(triangle, properties)
+
     @abstractmethod
     def draw_text(self, text: str, transform: Matrix44, properties: Properties, cap_height: float) -> None:
         """ draw a single line of text with the anchor point at the baseline left point """
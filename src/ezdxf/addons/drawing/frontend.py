@@ -15,7 +15,7 @@ from ezdxf.entities import (
 )
 from ezdxf.entities.dxfentity import DXFTagStorage
 from ezdxf.layouts import Layout
-from ezdxf.math import Vector, Z_AXIS, NULLVEC
+from ezdxf.math import Vector, Vec2, Z_AXIS, NULLVEC, nest_polygons_2d
 from ezdxf.render import MeshBuilder, TraceBuilder, Path
 
 __all__ = ['Frontend']
@@ -61,10 +61,8 @@ class Frontend:
         # Approximate a full circle by `n` segments, arcs have proportional less segments
         self.circle_approximation_count = 128
 
-        # The sagitta (also known as the versine) is a line segment drawn perpendicular to a chord, between the
-        # midpoint of that chord and the arc of the circle. https://en.wikipedia.org/wiki/Circle
-        # not used yet! Could be used for all curves CIRCLE, ARC, ELLIPSE and SPLINE
-        # self.approximation_max_sagitta = 0.01  # for drawing unit = 1m, max sagitta = 1cm
+        # Curves of CIRCLE, ARC, ELLIPSE and SPLINE are passed as Path() objects to the back-end, basic
+        # back-ends without draw_path() support approximate these paths by Backend.max_flattening_distance
 
     def skip_entity(self, msg: str):
         print(msg)
@@ -218,16 +216,14 @@ class Frontend:
 
         # For hatches, the approximation don't have to be that precise.
         paths.all_to_line_edges(num=64, spline_factor=8)
+        boundary_paths = []
         for p in paths:
             assert p.PATH_TYPE == 'EdgePath'
             vertices = []
             last_vertex = None
             for e in p.edges:
                 assert e.EDGE_TYPE == 'LineEdge'
-                start, end = ocs.points_to_wcs([
-                    Vector(e.start[0], e.start[1], elevation),
-                    Vector(e.end[0], e.end[1], elevation),
-                ])
+                start, end = Vec2(e.start), Vec2(e.end)
                 if last_vertex is None:
                     vertices.append(start)
                 elif not last_vertex.isclose(start):
@@ -235,11 +231,15 @@ class Frontend:
                     vertices.append(start)
                 vertices.append(end)
                 last_vertex = end
-
-            if vertices:
-                if last_vertex.isclose(vertices[0]):
-                    vertices.append(last_vertex)
-                self.out.draw_filled_polygon(vertices, properties)
+            boundary_paths.append(vertices)
+
+        # Nested boundary paths are holes of the surrounding boundary path (hatch style "normal"):
+        polygons = [
+            [list(ocs.points_to_wcs(Vector(v.x, v.y, elevation) for v in path)) for path in polygon]
+            for polygon in nest_polygons_2d(boundary_paths)
+        ]
+        if polygons:
+            self.out.draw_filled_polygons(polygons, properties)
 
     def draw_viewport_entity(self, entity: DXFGraphic) -> None:
         assert entity.dxftype() == 'VIEWPORT'
@@ -3,7 +3,7 @@
 # License: MIT License
 import math
 from math import degrees
-from typing import Optional, Tuple, Iterable
+from typing import Optional, Tuple, Iterable, Sequence
 
 import matplotlib.pyplot as plt
 from matplotlib.font_manager import FontProperties
@@ -97,6 +97,23 @@ class MatplotlibBackend(Backend):
     def draw_filled_polygon(self, points: Iterable[Vector], properties: Properties):
         self.ax.fill(*zip(*((p.x, p.y) for p in points)), color=properties.color, zorder=self._get_z())
 
+    def draw_filled_polygons(self, polygons: Iterable[Sequence[Sequence[Vector]]], properties: Properties):
+        # Exterior boundary paths and holes as one compound path, holes have the opposite orientation:
+        vertices = []
+        codes = []
+        for polygon in polygons:
+            for boundary in polygon:
+                if len(boundary) < 3:
+                    continue
+                vertices.extend((p.x, p.y) for p in boundary)
+                vertices.append((boundary[0].x, boundary[0].y))
+                codes.append(Path.MOVETO)
+                codes.extend([Path.LINETO] * (len(boundary) - 1))
+                codes.append(Path.CLOSEPOLY)
+        if vertices:
+            patch = PathPatch(Path(vertices, codes), color=properties.color, linewidth=0, zorder=self._get_z())
+            self.ax.add_patch(patch)
+
     def draw_text(self, text: str, transform: Matrix44, properties: Properties, cap_height: float):
         if not text:
             return  # no point rendering empty strings
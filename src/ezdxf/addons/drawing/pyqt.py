@@ -2,7 +2,7 @@
 # Copyright (c) 2020, Matthew Broadway
 # License: MIT License
 import math
-from typing import Optional, Iterable
+from typing import Optional, Iterable, Sequence
 
 from PyQt5 import QtCore as qc, QtGui as qg, QtWidgets as qw
 
@@ -121,6 +121,16 @@ class PyQtBackend(Backend):
         item = self.scene.addPolygon(polygon, self._no_line, brush)
         self._set_item_data(item)
 
+    def draw_filled_polygons(self, polygons: Iterable[Sequence[Sequence[Vector]]], properties: Properties) -> None:
+        brush = qg.QBrush(self._get_color(properties.color), qc.Qt.SolidPattern)
+        qt_path = qg.QPainterPath()  # default fill rule: Qt.OddEvenFill
+        for polygon in polygons:
+            for boundary in polygon:
+                qt_path.addPolygon(qg.QPolygonF([qc.QPointF(p.x, p.y) for p in boundary]))
+                qt_path.closeSubpath()
+        item = self.scene.addPath(qt_path, self._no_line, brush)
+        self._set_item_data(item)
+
     def draw_text(self, text: str, transform: Matrix44, properties: Properties, cap_height: float) -> None:
         if not text:
             return  # no point rendering empty strings
@@ -5,7 +5,7 @@ from math import tau
 from typing import List
 
 from ezdxf.addons.drawing.type_hints import Radians
-from ezdxf.math import Vector, Z_AXIS, OCS
+from ezdxf.math import Vector, Z_AXIS, get_ocs
 
 
 def normalize_angle(theta: Radians) -> Radians:
@@ -19,7 +19,7 @@ def get_draw_angles(start: float, end: float, extrusion: Vector):
     if extrusion.isclose(Z_AXIS):
         return start, end
     else:
-        ocs = OCS(extrusion)
+        ocs = get_ocs(extrusion)
         s = ocs.to_wcs(Vector.from_angle(start))
         e = ocs.to_wcs(Vector.from_angle(end))
         return normalize_angle(e.angle), normalize_angle(s.angle)
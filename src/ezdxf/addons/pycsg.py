@@ -3,10 +3,15 @@
 # Python port Copyright (c) 2012 Tim Knip (http://www.floorplanner.com), under the MIT license.
 # Additions by Alex Pletzer (Pennsylvania State University)
 # Integration as ezdxf add-on, Copyright (c) 2020, Manfred Moitzi, MIT License.
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Iterable, Tuple
+from array import array
+from itertools import chain
 from ezdxf.math import Vector
 from ezdxf.render import MeshVertexMerger, MeshBuilder, MeshTransformer
 
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
 # Implementation Details
 # ----------------------
 #
@@ -35,6 +40,12 @@ from ezdxf.render import MeshVertexMerger, MeshBuilder, MeshTransformer
 # Subtraction and intersection naturally follow from set operations. If
 # union is A | B, subtraction is A - B = ~(~A | B) and intersection is
 # A & B = ~(~A | ~B) where '~' is the complement operator.
+#
+# Polygons outside of the overlap box of both bounding boxes are outside of
+# the other solid and bypass the BSP trees, polygons crossing the overlap box
+# are split at the box. Inside of the overlap box both BSP trees contain the
+# complete surface of their solids and all split planes are located in the
+# overlap box, therefore the BSP operations of the inside polygons are exact.
 
 __all__ = ['CSG']
 
@@ -43,32 +54,88 @@ FRONT = 1  # all the vertices are in front of the plane
 BACK = 2  # all the vertices are at the back of the plane
 SPANNING = 3  # some vertices are in front, some in the back
 PLANE_EPSILON = 1e-5  # Tolerance used by split_polygon() to decide if a point is on the plane.
+BOX_MARGIN = 10 * PLANE_EPSILON  # Expansion of the overlap box of two solids.
+SPLIT_CANDIDATES = 8  # Count of candidate split planes scored by BSPNode.build().
+SPLIT_SAMPLES = 32  # Count of polygons used to score a candidate split plane.
+SPLIT_WEIGHT = 4  # Weight of a spanning polygon against the front/back imbalance.
+GOLDEN_RATIO = 0.6180339887498949  # Fractional part of the golden ratio, spreads samples without aliasing.
 
 
 class Plane:
     """ Represents a plane in 3D space.  """
-    __slots__ = ('normal', 'w')
+    __slots__ = ('nx', 'ny', 'nz', 'w')
 
-    def __init__(self, normal: Vector, w: float):
-        self.normal = normal
+    def __init__(self, normal: 'Vertex', w: float):
+        # normal vector is stored as float components for fast polygon splitting
+        self.nx, self.ny, self.nz = Vector(normal).xyz
         # w is the (perpendicular) distance of the plane from (0, 0, 0)
         self.w = w
 
+    @property
+    def normal(self) -> Vector:
+        return Vector(self.nx, self.ny, self.nz)
+
     @classmethod
     def from_points(cls, a: Vector, b: Vector, c: Vector) -> 'Plane':
         n = (b - a).cross(c - a).normalize()
         return Plane(n, n.dot(a))
 
+    @classmethod
+    def from_vertices(cls, vertices: List[Vector]) -> 'Plane':
+        """
+        Returns the plane of a polygon by Newell's method, which is also valid
+        for collinear leading vertices. Raises :class:`ZeroDivisionError` for
+        degenerated polygons without area.
+        """
+        nx = ny = nz = 0.
+        prev = vertices[-1]
+        for vertex in vertices:
+            nx += (prev.y - vertex.y) * (prev.z + vertex.z)
+            ny += (prev.z - vertex.z) * (prev.x + vertex.x)
+            nz += (prev.x - vertex.x) * (prev.y + vertex.y)
+            prev = vertex
+        n = Vector(nx, ny, nz).normalize()
+        return Plane(n, n.dot(vertices[0]))
+
     def clone(self) -> 'Plane':
-        return Plane(self.normal, self.w)
+        plane = Plane.__new__(Plane)
+        plane.nx = self.nx
+        plane.ny = self.ny
+        plane.nz = self.nz
+        plane.w = self.w
+        return plane
 
     def flip(self) -> None:
-        self.normal = -self.normal
+        self.nx = -self.nx
+        self.ny = -self.ny
+        self.nz = -self.nz
         self.w = -self.w
 
+    def flipped(self) -> 'Plane':
+        """ Returns a new flipped plane, planes are shared by polygon fragments and can not be flipped inplace. """
+        plane = self.clone()
+        plane.flip()
+        return plane
+
     def __repr__(self) -> str:
         return f'Plane({self.normal}, {self.w})'
 
+    def classify_polygon(self, polygon: 'Polygon') -> int:
+        """ Returns the location of `polygon` relative to this plane as COPLANAR, FRONT, BACK or SPANNING. """
+        nx = self.nx
+        ny = self.ny
+        nz = self.nz
+        w = self.w
+        coords = polygon.coords
+        polygon_type = COPLANAR
+        for index in range(0, len(coords), 3):
+            distance = nx * coords[index] + ny * coords[index + 1] + nz * coords[index + 2] - w
+            if distance < -PLANE_EPSILON:
+                polygon_type |= BACK
+            elif distance > PLANE_EPSILON:
+                polygon_type |= FRONT
+        return polygon_type
+
     def split_polygon(self, polygon: 'Polygon',
                       coplanar_front: List['Polygon'],
                       coplanar_back: List['Polygon'],
@@ -81,15 +148,30 @@ class Plane:
         respect to this plane. Polygons in front or in back of this plane go into
         either `front` or `back`
         """
+        nx = self.nx
+        ny = self.ny
+        nz = self.nz
+        w = self.w
+        # most polygons are far away from the split plane, the bounding sphere
+        # classifies them without testing each vertex
+        cx, cy, cz, radius = polygon.sphere
+        distance = nx * cx + ny * cy + nz * cz - w
+        if distance < -radius - PLANE_EPSILON:
+            back.append(polygon)
+            return
+        if distance > radius + PLANE_EPSILON:
+            front.append(polygon)
+            return
+
+        coords = polygon.coords
         polygon_type = 0
         vertex_types = []
-        vertices = polygon.vertices
-        meshid = polygon.meshid  # mesh ID of the associated mesh
+        distances = []
 
         # Classify each point as well as the entire polygon into one of four classes:
         # COPLANAR, FRONT, BACK, SPANNING = FRONT + BACK
-        for vertex in vertices:
-            distance = self.normal.dot(vertex) - self.w
+        for index in range(0, len(coords), 3):
+            distance = nx * coords[index] + ny * coords[index + 1] + nz * coords[index + 2] - w
             if distance < -PLANE_EPSILON:
                 vertex_type = BACK
             elif distance > PLANE_EPSILON:
@@ -98,10 +180,12 @@ class Plane:
                 vertex_type = COPLANAR
             polygon_type |= vertex_type
             vertex_types.append(vertex_type)
+            distances.append(distance)
 
         # Put the polygon in the correct list, splitting it when necessary.
         if polygon_type == COPLANAR:
-            if self.normal.dot(polygon.plane.normal) > 0:
+            plane = polygon.plane
+            if nx * plane.nx + ny * plane.ny + nz * plane.nz > 0:
                 coplanar_front.append(polygon)
             else:
                 coplanar_back.append(polygon)
@@ -110,28 +194,36 @@ class Plane:
         elif polygon_type == BACK:
             back.append(polygon)
         elif polygon_type == SPANNING:
-            front_vertices = []
-            back_vertices = []
-            len_vertices = len(vertices)
+            front_coords = array('d')
+            back_coords = array('d')
+            len_vertices = len(vertex_types)
             for index in range(len_vertices):
                 next_index = (index + 1) % len_vertices
                 vertex_type = vertex_types[index]
                 next_vertex_type = vertex_types[next_index]
-                vertex = vertices[index]
-                next_vertex = vertices[next_index]
+                i = index * 3
+                vertex = coords[i:i + 3]
                 if vertex_type != BACK:  # FRONT or COPLANAR
-                    front_vertices.append(vertex)
+                    front_coords.extend(vertex)
                 if vertex_type != FRONT:  # BACK or COPLANAR
-                    back_vertices.append(vertex)
+                    back_coords.extend(vertex)
                 if (vertex_type | next_vertex_type) == SPANNING:
-                    interpolation_weight = (self.w - self.normal.dot(vertex)) / self.normal.dot(next_vertex - vertex)
-                    plane_intersection_point = vertex.lerp(next_vertex, interpolation_weight)
-                    front_vertices.append(plane_intersection_point)
-                    back_vertices.append(plane_intersection_point)
-            if len(front_vertices) >= 3:
-                front.append(Polygon(front_vertices, meshid=meshid))
-            if len(back_vertices) >= 3:
-                back.append(Polygon(back_vertices, meshid=meshid))
+                    distance = distances[index]
+                    interpolation_weight = distance / (distance - distances[next_index])
+                    j = next_index * 3
+                    x, y, z = vertex
+                    plane_intersection_point = (
+                        x + (coords[j] - x) * interpolation_weight,
+                        y + (coords[j + 1] - y) * interpolation_weight,
+                        z + (coords[j + 2] - z) * interpolation_weight,
+                    )
+                    front_coords.extend(plane_intersection_point)
+                    back_coords.extend(plane_intersection_point)
+            # fragments are located in the plane of the source polygon
+            if len(front_coords) >= 9:
+                front.append(Polygon.from_coords(front_coords, polygon.plane, polygon.meshid))
+            if len(back_coords) >= 9:
+                back.append(Polygon.from_coords(back_coords, polygon.plane, polygon.meshid))
 
 
 class Polygon:
@@ -140,31 +232,78 @@ class Polygon:
     be coplanar and form a convex loop, the `meshid` argument associates a polygon
     to a mesh.
 
+    The vertices are stored as flat ``array.array`` of float coordinates, the
+    attribute :attr:`vertices` returns the vertices as list of :class:`Vector`
+    objects.
+
     Args:
         vertices: polygon vertices as :class:`Vector` objects
         meshid: id associated mesh
 
     """
-    __slots__ = ('vertices', 'plane', 'meshid')
+    __slots__ = ('coords', 'plane', 'meshid', 'sphere')
 
-    def __init__(self, vertices: List[Vector], meshid: int = 0):
-        self.vertices = vertices
-        self.plane = Plane.from_points(vertices[0], vertices[1], vertices[2])
+    def __init__(self, vertices: Iterable['Vertex'], meshid: int = 0):
+        vertices = Vector.list(vertices)
+        self.coords = array('d', chain.from_iterable(v.xyz for v in vertices))
+        self.plane = Plane.from_vertices(vertices)
         # number of mesh, this polygon is associated to
         self.meshid = meshid
+        # bounding sphere as (cx, cy, cz, radius) tuple for fast classification
+        self.sphere = _bounding_sphere(self.coords)
+
+    @classmethod
+    def from_coords(cls, coords: array, plane: Plane, meshid: int = 0) -> 'Polygon':
+        """ Create polygon from flat coordinate array `coords` and the `plane` of the polygon without copying. """
+        polygon = cls.__new__(cls)
+        polygon.coords = coords
+        polygon.plane = plane
+        polygon.meshid = meshid
+        polygon.sphere = _bounding_sphere(coords)
+        return polygon
+
+    @property
+    def vertices(self) -> List[Vector]:
+        coords = self.coords
+        return [Vector(coords[i], coords[i + 1], coords[i + 2]) for i in range(0, len(coords), 3)]
+
+    def extents(self) -> Tuple[float, float, float, float, float, float]:
+        """ Returns the bounding box as (xmin, ymin, zmin, xmax, ymax, zmax) tuple. """
+        coords = self.coords
+        x = coords[0::3]
+        y = coords[1::3]
+        z = coords[2::3]
+        return min(x), min(y), min(z), max(x), max(y), max(z)
 
     def clone(self) -> 'Polygon':
-        return Polygon(list(self.vertices), meshid=self.meshid)
+        # the plane is never modified inplace and can be shared
+        return Polygon.from_coords(array('d', self.coords), self.plane, self.meshid)
 
     def flip(self) -> None:
-        self.vertices.reverse()
-        self.plane.flip()
+        coords = self.coords
+        reversed_coords = array('d')
+        for index in range(len(coords) - 3, -1, -3):
+            reversed_coords.extend(coords[index:index + 3])
+        self.coords = reversed_coords
+        self.plane = self.plane.flipped()
 
     def __repr__(self) -> str:
         v = ', '.join(repr(v) for v in self.vertices)
         return f'Polygon([{v}], mesh={self.meshid})'
 
 
+def _bounding_sphere(coords: array) -> Tuple[float, float, float, float]:
+    """ Returns the bounding sphere of the flat coordinate array `coords` as (cx, cy, cz, radius) tuple. """
+    x = coords[0::3]
+    y = coords[1::3]
+    z = coords[2::3]
+    cx = (min(x) + max(x)) * 0.5
+    cy = (min(y) + max(y)) * 0.5
+    cz = (min(z) + max(z)) * 0.5
+    radius = max((vx - cx) ** 2 + (vy - cy) ** 2 + (vz - cz) ** 2 for vx, vy, vz in zip(x, y, z)) ** 0.5
+    return cx, cy, cz, radius
+
+
 class BSPNode:
     """
     Holds a node in a BSP tree. A BSP tree is built from a collection of polygons
@@ -172,6 +311,9 @@ class BSPNode:
     polygons) are added directly to that node and the other polygons are added to
     the front and/or back subtrees. This is not a leafy BSP tree since there is
     no distinction between internal and leaf nodes.
+
+    All methods process the tree without recursion, the depth of the tree is
+    not limited by the Python recursion limit.
     """
     __slots__ = ('plane', 'front', 'back', 'polygons')
 
@@ -183,95 +325,243 @@ class BSPNode:
         if polygons:
             self.build(polygons)
 
+    def nodes(self) -> Iterable['BSPNode']:
+        """ Yields all nodes of this BSP tree, each node before the nodes of its front and back subtree. """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.back:
+                stack.append(node.back)
+            if node.front:
+                stack.append(node.front)
+
     def clone(self) -> 'BSPNode':
-        node = BSPNode()
-        if self.plane:
-            node.plane = self.plane.clone()
-        if self.front:
-            node.front = self.front.clone()
-        if self.back:
-            node.back = self.back.clone()
-        node.polygons = [p.clone() for p in self.polygons]
-        return node
+        root = BSPNode()
+        stack = [(self, root)]
+        while stack:
+            node, copy = stack.pop()
+            if node.plane:
+                copy.plane = node.plane.clone()
+            copy.polygons = [p.clone() for p in node.polygons]
+            if node.front:
+                copy.front = BSPNode()
+                stack.append((node.front, copy.front))
+            if node.back:
+                copy.back = BSPNode()
+                stack.append((node.back, copy.back))
+        return root
 
     def invert(self) -> None:
         """ Convert solid space to empty space and empty space to solid space. """
-        for poly in self.polygons:
-            poly.flip()
-        self.plane.flip()
-        if self.front:
-            self.front.invert()
-        if self.back:
-            self.back.invert()
-        self.front, self.back = self.back, self.front
+        for node in list(self.nodes()):
+            for poly in node.polygons:
+                poly.flip()
+            if node.plane:
+                node.plane.flip()
+            node.front, node.back = node.back, node.front
 
     def clip_polygons(self, polygons: List[Polygon]) -> List[Polygon]:
-        """ Recursively remove all polygons in `polygons` that are inside this BSP tree. """
+        """ Remove all polygons in `polygons` that are inside this BSP tree. """
         if self.plane is None:
             return polygons[:]
 
-        front = []  # type: List[Polygon]
-        back = []  # type: List[Polygon]
-        for polygon in polygons:
-            self.plane.split_polygon(polygon, front, back, front, back)
-
-        if self.front:
-            front = self.front.clip_polygons(front)
-
-        if self.back:
-            back = self.back.clip_polygons(back)
-        else:
-            back = []
-
-        front.extend(back)
-        return front
+        result = []  # type: List[Polygon]
+        stack = [(self, polygons)]
+        while stack:
+            node, polygons = stack.pop()
+            if node.plane is None:
+                result.extend(polygons)
+                continue
+            front = []  # type: List[Polygon]
+            back = []  # type: List[Polygon]
+            split_polygon = node.plane.split_polygon
+            for polygon in polygons:
+                split_polygon(polygon, front, back, front, back)
+
+            # polygons at the back of a node without back subtree are inside
+            # the solid and removed
+            if node.back and back:
+                stack.append((node.back, back))
+            if node.front:
+                if front:
+                    stack.append((node.front, front))
+            else:
+                result.extend(front)
+        return result
 
     def clip_to(self, bsp: 'BSPNode') -> None:
         """ Remove all polygons in this BSP tree that are inside the other BSP tree `bsp`. """
-        self.polygons = bsp.clip_polygons(self.polygons)
-        if self.front:
-            self.front.clip_to(bsp)
-        if self.back:
-            self.back.clip_to(bsp)
+        for node in self.nodes():
+            node.polygons = bsp.clip_polygons(node.polygons)
 
     def all_polygons(self) -> List[Polygon]:
         """ Return a list of all polygons in this BSP tree. """
-        polygons = self.polygons[:]
-        if self.front:
-            polygons.extend(self.front.all_polygons())
-        if self.back:
-            polygons.extend(self.back.all_polygons())
+        polygons = []  # type: List[Polygon]
+        for node in self.nodes():
+            polygons.extend(node.polygons)
         return polygons
 
     def build(self, polygons: List[Polygon]) -> None:
         """
         Build a BSP tree out of `polygons`. When called on an existing tree, the
         new polygons are filtered down to the bottom of the tree and become new
-        nodes there. Each set of polygons is partitioned using the first polygon
-        (no heuristic is used to pick a good split).
+        nodes there. Each set of polygons is partitioned by the plane of a polygon
+        picked by :func:`_pick_split_polygon`, which prefers split planes with
+        few spanning polygons and balanced front and back subtrees.
         """
         if len(polygons) == 0:
             return
-        if self.plane is None:
-            # do a wise choice and pick the first polygon as split-plane ;)
-            self.plane = polygons[0].plane.clone()
-        # add first polygon to this node
-        self.polygons.append(polygons[0])
-        front = []  # type: List[Polygon]
-        back = []  # type: List[Polygon]
-        # split all other polygons at the split plane
-        for poly in polygons[1:]:
-            # coplanar front and back polygons go into self.polygons
-            self.plane.split_polygon(poly, self.polygons, self.polygons, front, back)
-        # recursively build the BSP tree
-        if len(front) > 0:
-            if self.front is None:
-                self.front = BSPNode()
-            self.front.build(front)
-        if len(back) > 0:
-            if self.back is None:
-                self.back = BSPNode()
-            self.back.build(back)
+        stack = [(self, polygons, False)]
+        while stack:
+            node, polygons, convex = stack.pop()
+            if node.plane is None:
+                if convex:
+                    # all split planes of a convex set have all other polygons
+                    # at the back, the first polygon is as good as any other
+                    index = 0
+                else:
+                    index, convex = _pick_split_polygon(polygons)
+                split = polygons[index]
+                node.plane = split.plane.clone()
+                # add split polygon to this node, none planar polygons would be
+                # split by their own plane forever
+                node.polygons.append(split)
+                polygons = polygons[:index] + polygons[index + 1:]
+            front = []  # type: List[Polygon]
+            back = []  # type: List[Polygon]
+            # split all other polygons at the split plane
+            split_polygon = node.plane.split_polygon
+            for poly in polygons:
+                # coplanar front and back polygons go into node.polygons
+                split_polygon(poly, node.polygons, node.polygons, front, back)
+            if len(front) > 0:
+                if node.front is None:
+                    node.front = BSPNode()
+                stack.append((node.front, front, convex))
+            if len(back) > 0:
+                if node.back is None:
+                    node.back = BSPNode()
+                stack.append((node.back, back, convex))
+
+
+def _pick_split_polygon(polygons: List[Polygon]) -> Tuple[int, bool]:
+    """
+    Returns the index of the split polygon for :meth:`BSPNode.build` and
+    ``True`` if `polygons` look like a convex set.
+
+    A few candidate planes are scored by the count of spanning polygons and
+    the imbalance of front and back polygons of a sample of `polygons`, the
+    candidate with the lowest score wins. The sample is spread by the golden
+    ratio, evenly spaced samples would pick the same location of each stack
+    or ring of regular meshes. The
+    quadratic runtime of a BSP tree built from the first polygon of each set
+    is caused by unbalanced trees, but for convex sets all candidates have
+    all other polygons at the back and no better choice exists.
+    """
+    count = len(polygons)
+    if count <= SPLIT_SAMPLES:
+        return 0, False
+    indices = [int(count * (i * GOLDEN_RATIO % 1.)) for i in range(SPLIT_SAMPLES)]
+    samples = [polygons[index] for index in indices]
+    best_index = 0
+    best_score = None
+    convex = True
+    for index in indices[:SPLIT_CANDIDATES]:
+        classify_polygon = polygons[index].plane.classify_polygon
+        front = back = spanning = 0
+        for polygon in samples:
+            polygon_type = classify_polygon(polygon)
+            if polygon_type == FRONT:
+                front += 1
+            elif polygon_type == BACK:
+                back += 1
+            elif polygon_type == SPANNING:
+                spanning += 1
+        if front or spanning:
+            convex = False
+        score = SPLIT_WEIGHT * spanning + abs(front - back)
+        if best_score is None or score < best_score:
+            best_index = index
+            best_score = score
+    return best_index, convex
+
+
+def _extents(polygons: Iterable[Polygon]) -> Optional[Tuple[float, float, float, float, float, float]]:
+    """ Returns the bounding box of `polygons` as (xmin, ymin, zmin, xmax, ymax, zmax) tuple or ``None``. """
+    extents = [polygon.extents() for polygon in polygons]
+    if not extents:
+        return None
+    columns = list(zip(*extents))
+    return min(columns[0]), min(columns[1]), min(columns[2]), max(columns[3]), max(columns[4]), max(columns[5])
+
+
+def _split_at_box(polygons: List[Polygon], box: Tuple[float, float, float, float, float, float]
+                  ) -> Tuple[List[Polygon], List[Polygon]]:
+    """ Returns polygons outside and inside of `box`, polygons crossing the box are split at the box planes. """
+    xmin, ymin, zmin, xmax, ymax, zmax = box
+    # front side of all box planes is outside of the box
+    box_planes = (
+        (0, Plane((-1, 0, 0), -xmin)),
+        (1, Plane((0, -1, 0), -ymin)),
+        (2, Plane((0, 0, -1), -zmin)),
+        (3, Plane((1, 0, 0), xmax)),
+        (4, Plane((0, 1, 0), ymax)),
+        (5, Plane((0, 0, 1), zmax)),
+    )
+    outside = []  # type: List[Polygon]
+    inside = []  # type: List[Polygon]
+    for polygon in polygons:
+        pxmin, pymin, pzmin, pxmax, pymax, pzmax = polygon.extents()
+        if pxmax < xmin or pymax < ymin or pzmax < zmin or pxmin > xmax or pymin > ymax or pzmin > zmax:
+            outside.append(polygon)
+            continue
+        crossed = (pxmin < xmin, pymin < ymin, pzmin < zmin, pxmax > xmax, pymax > ymax, pzmax > zmax)
+        pieces = [polygon]
+        for index, plane in box_planes:
+            if not crossed[index]:
+                continue
+            front = []  # type: List[Polygon]
+            back = []  # type: List[Polygon]
+            for piece in pieces:
+                # coplanar pieces are located at the box border
+                plane.split_polygon(piece, back, back, front, back)
+            outside.extend(front)
+            pieces = back
+        inside.extend(pieces)
+    return outside, inside
+
+
+def _split_operands(a: 'CSG', b: 'CSG') -> Tuple[List[Polygon], List[Polygon], List[Polygon], List[Polygon]]:
+    """
+    Returns copies of the polygons of solid `a` and solid `b` split at the
+    overlap box of both bounding boxes as (a_outside, a_inside, b_outside,
+    b_inside) tuple. Polygons outside of the overlap box are outside of the
+    other solid and do not take part in the BSP operations.
+    """
+    a_polygons = [p.clone() for p in a.polygons]
+    b_polygons = [p.clone() for p in b.polygons]
+    a_box = _extents(a_polygons)
+    b_box = _extents(b_polygons)
+    if a_box is None or b_box is None:
+        return a_polygons, [], b_polygons, []
+    box = (
+        max(a_box[0], b_box[0]) - BOX_MARGIN,
+        max(a_box[1], b_box[1]) - BOX_MARGIN,
+        max(a_box[2], b_box[2]) - BOX_MARGIN,
+        min(a_box[3], b_box[3]) + BOX_MARGIN,
+        min(a_box[4], b_box[4]) + BOX_MARGIN,
+        min(a_box[5], b_box[5]) + BOX_MARGIN,
+    )
+    if box[0] > box[3] or box[1] > box[4] or box[2] > box[5]:  # disjoint solids
+        return a_polygons, [], b_polygons, []
+    a_outside, a_inside = _split_at_box(a_polygons, box)
+    b_outside, b_inside = _split_at_box(b_polygons, box)
+    if not a_inside or not b_inside:
+        # solids do not overlap but touch the overlap box, process the
+        # unsplit polygons by the BSP operations
+        return [], a_polygons, [], b_polygons
+    return a_outside, a_inside, b_outside, b_inside
 
 
 class CSG:
@@ -294,7 +584,12 @@ class CSG:
         if mesh is None:
             self.polygons = []  # type: List[Polygon]
         else:
-            self.polygons = [Polygon(face, meshid) for face in mesh.faces_as_vertices()]
+            self.polygons = []
+            for face in mesh.faces_as_vertices():
+                try:
+                    self.polygons.append(Polygon(face, meshid))
+                except ZeroDivisionError:  # skip degenerated faces without area
+                    pass
 
     @classmethod
     def from_polygons(cls, polygons: List[Polygon]) -> 'CSG':
@@ -335,15 +630,16 @@ class CSG:
                  |       |            |       |
                  +-------+            +-------+
         """
-        a = BSPNode(self.clone().polygons)
-        b = BSPNode(other.clone().polygons)
+        a_outside, a_inside, b_outside, b_inside = _split_operands(self, other)
+        a = BSPNode(a_inside)
+        b = BSPNode(b_inside)
         a.clip_to(b)
         b.clip_to(a)
         b.invert()
         b.clip_to(a)
         b.invert()
         a.build(b.all_polygons())
-        return CSG.from_polygons(a.all_polygons())
+        return CSG.from_polygons(a_outside + b_outside + a.all_polygons())
 
     __add__ = union
 
@@ -363,8 +659,9 @@ class CSG:
                  |       |
                  +-------+
         """
-        a = BSPNode(self.clone().polygons)
-        b = BSPNode(other.clone().polygons)
+        a_outside, a_inside, b_outside, b_inside = _split_operands(self, other)
+        a = BSPNode(a_inside)
+        b = BSPNode(b_inside)
         a.invert()
         a.clip_to(b)
         b.clip_to(a)
@@ -373,7 +670,7 @@ class CSG:
         b.invert()
         a.build(b.all_polygons())
         a.invert()
-        return CSG.from_polygons(a.all_polygons())
+        return CSG.from_polygons(a_outside + a.all_polygons())
 
     __sub__ = subtract
 
@@ -393,8 +690,9 @@ class CSG:
                  |       |
                  +-------+
         """
-        a = BSPNode(self.clone().polygons)
-        b = BSPNode(other.clone().polygons)
+        _, a_inside, _, b_inside = _split_operands(self, other)
+        a = BSPNode(a_inside)
+        b = BSPNode(b_inside)
         a.invert()
         b.clip_to(a)
         b.invert()
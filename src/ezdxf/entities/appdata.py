@@ -28,6 +28,12 @@ class AppData:
     def __len__(self) -> int:
         return len(self.data)
 
+    def copy(self) -> 'AppData':
+        """ Returns a copy, tag lists are copied but the immutable DXF tags are shared. """
+        appdata = self.__class__()
+        appdata.data = OrderedDict((appid, Tags(tags)) for appid, tags in self.data.items())
+        return appdata
+
     def get(self, appid: str) -> Tags:
         try:
             return self.data[uniform_appid(appid)]
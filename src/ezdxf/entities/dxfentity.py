@@ -2,8 +2,7 @@
 # License: MIT License
 # Created 2019-02-13
 # DXFEntity - Root Entity
-from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar, Set
-import copy
+from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar, Set, Dict
 from ezdxf import options
 from ezdxf.lldxf.types import handle_code, dxftag, cast_value
 from ezdxf.lldxf.tags import Tags
@@ -60,8 +59,13 @@ class DXFNamespace:
     The namespace can only contain immutable objects: string, int, float, bool, Vector
     Because of the immutability, copy and deepcopy are the same.
 
+    Rewiring the namespace to an entity changes the class of the namespace to a specialized subclass for the
+    DXF attribute definitions of the entity, see :func:`namespace_class`.
+
     (internal class)
     """
+    # DXF attribute definitions of specialized namespace classes
+    _DXFATTRIBS = None  # type: DXFAttributes
 
     def __init__(self, processor: 'SubclassProcessor' = None, entity: 'DXFEntity' = None):
         if processor:
@@ -78,8 +82,8 @@ class DXFNamespace:
 
     def copy(self, entity: 'DXFEntity'):
         namespace = self.__class__()
-        for k, v in self.__dict__.items():
-            namespace.__dict__[k] = v
+        # shallow copy is sufficient, because all DXF attribute values are immutable
+        namespace.__dict__.update(self.__dict__)
         namespace.rewire(entity)
         return namespace
 
@@ -103,6 +107,10 @@ class DXFNamespace:
         """
         # bypass __setattr__()
         self.__dict__['_entity'] = entity
+        if entity is not None:
+            dxfattribs = entity.DXFATTRIBS
+            if dxfattribs is not self._DXFATTRIBS:
+                object.__setattr__(self, '__class__', namespace_class(dxfattribs))
         if handle is not None:
             self.__dict__['handle'] = handle
         if owner is not None:
@@ -110,6 +118,9 @@ class DXFNamespace:
 
     def __getattr__(self, key: str) -> Any:
         """ called if key does not exist, returns default value or None for unset default values
+
+        Specialized namespace classes provide the default values as class attributes, therefore this method is only
+        called for callback attributes and invalid attribute names.
         """
         attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
         if attrib_def:
@@ -275,6 +286,38 @@ class DXFNamespace:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype))
 
 
+_NAMESPACE_CLASSES = {}  # type: Dict[DXFAttributes, Type[DXFNamespace]]
+
+
+def namespace_class(dxfattribs: DXFAttributes) -> Type[DXFNamespace]:
+    """
+    Returns the specialized :class:`DXFNamespace` class for the DXF attribute definitions `dxfattribs`, the classes
+    are created on demand and cached.
+
+    The DXF default values are stored as class attributes, which provides the DXF default value of an unset
+    attribute by the regular attribute lookup of Python without calling :meth:`DXFNamespace.__getattr__`. An existing
+    attribute in the instance ``__dict__`` still takes precedence, therefore :meth:`DXFNamespace.hasattr`,
+    :meth:`DXFNamespace.get` and :meth:`DXFNamespace.discard` work as before.
+
+    Callback attributes and names which would shadow methods of :class:`DXFNamespace` are not stored as class
+    attributes, these are still resolved by :meth:`DXFNamespace.__getattr__`.
+
+    (internal API)
+    """
+    cls = _NAMESPACE_CLASSES.get(dxfattribs)
+    if cls is None:
+        namespace = {
+            '__slots__': (),  # no additional instance storage
+            '_DXFATTRIBS': dxfattribs,
+        }
+        for name, attrib in dxfattribs.items():
+            if attrib.xtype != XType.callback and not hasattr(DXFNamespace, name):
+                namespace[name] = attrib.default
+        cls = type('DXFNamespace', (DXFNamespace,), namespace)
+        _NAMESPACE_CLASSES[dxfattribs] = cls
+    return cls
+
+
 BASE_CLASS_CODES = {0, 5, 102, 330}
 
 
@@ -524,14 +567,19 @@ class DXFEntity:
         entity.reactors = None
         entity.proxy_graphic = self.proxy_graphic  # immutable bytes
 
+        # The immutable DXF tags of appdata, xdata and embedded objects are shared by the copy, only the
+        # tag containers are copied.
         # if appdata contains handles, they are treated as shared resources
-        entity.appdata = copy.deepcopy(self.appdata)
+        if self.appdata:
+            entity.appdata = self.appdata.copy()
 
         # if xdata contains handles, they are treated as shared resources
-        entity.xdata = copy.deepcopy(self.xdata)
+        if self.xdata:
+            entity.xdata = self.xdata.copy()
 
         # if embedded objects contains handles, they are treated as shared resources
-        entity.embedded_objects = copy.deepcopy(self.embedded_objects)
+        if self.embedded_objects:
+            entity.embedded_objects = self.embedded_objects.copy()
         self._copy_data(entity)
         return entity
 
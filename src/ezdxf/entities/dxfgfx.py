@@ -11,7 +11,7 @@ from ezdxf.lldxf.const import SUBCLASS_MARKER, DXFInvalidLayerName, DXFInvalidLi
 from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.lldxf.validator import is_valid_layer_name
 from .dxfentity import DXFEntity, base_class, SubclassProcessor
-from ezdxf.math import OCS, UCS, Matrix44, NULLVEC
+from ezdxf.math import OCS, UCS, Matrix44, NULLVEC, get_ocs
 from ezdxf.tools.rgb import int2rgb, rgb2int
 from ezdxf.tools import float2transparency, transparency2float
 from .factory import register_entity
@@ -170,7 +170,7 @@ class DXFGraphic(DXFEntity):
         # extrusion is only defined for 2D entities like Text, Circle, ...
         if self.dxf.is_supported('extrusion'):
             extrusion = self.dxf.get('extrusion', default=(0, 0, 1))
-            return OCS(extrusion)
+            return get_ocs(extrusion)
         else:
             return None
 
@@ -4,7 +4,7 @@
 from typing import TYPE_CHECKING, Iterable, cast, Tuple, Union, Optional, List, Callable, Dict
 import math
 import warnings
-from ezdxf.math import Vector, X_AXIS, Y_AXIS, Matrix44, OCS, UCS
+from ezdxf.math import Vector, X_AXIS, Y_AXIS, Matrix44, UCS, get_ocs
 from ezdxf.math.transformtools import OCSTransform, InsertTransformationError
 
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
@@ -401,7 +401,7 @@ class Insert(DXFGraphic):
             # apply y-reflection:
             y_scale = -y_scale
 
-        ocs = OCSTransform.from_ocs(OCS(dxf.extrusion), OCS(uz), m)
+        ocs = OCSTransform.from_ocs(get_ocs(dxf.extrusion), get_ocs(uz), m)
         dxf.insert = ocs.transform_vertex(dxf.insert)
         dxf.rotation = ocs.transform_deg_angle(dxf.rotation)
 
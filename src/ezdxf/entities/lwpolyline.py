@@ -3,7 +3,6 @@
 # Created 2019-02-15
 from typing import TYPE_CHECKING, Tuple, Sequence, Iterable, cast, List, Union
 import array
-import copy
 from contextlib import contextmanager
 from ezdxf.math import Vector, Matrix44
 from ezdxf.math.transformtools import OCSTransform, NonUniformScalingError
@@ -59,7 +58,7 @@ class LWPolyline(DXFGraphic):
 
     def _copy_data(self, entity: 'LWPolyline') -> None:
         """ Copy lwpoints. """
-        entity.lwpoints = copy.deepcopy(self.lwpoints)
+        entity.lwpoints = self.lwpoints.clone()
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         """
@@ -177,10 +176,8 @@ class LWPolyline(DXFGraphic):
         Returns iterable of all polyline points as Vector(x, y, z) in :ref:`WCS`.
 
         """
-        ocs = self.ocs()
         elevation = self.get_dxf_attrib('elevation', default=0.)
-        for x, y in self.vertices():
-            yield ocs.to_wcs((x, y, elevation))
+        return self.ocs().points_to_wcs_array((x, y, elevation) for x, y in self.vertices())
 
     def vertices_in_ocs(self) -> Iterable['Vertex']:
         """
@@ -3,13 +3,13 @@
 # Created 2019-03-06
 from typing import TYPE_CHECKING, Iterable, Sequence, Tuple, Union, List, Dict
 import array
-import copy
 from itertools import chain
 
 from contextlib import contextmanager
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, DXFValueError, DXFStructureError
 from ezdxf.lldxf.packedtags import VertexArray, TagArray, TagList
+from ezdxf.math import Vec3Array
 from ezdxf.tools import take2
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
@@ -75,6 +75,10 @@ class FaceList(TagList):
     def __len__(self) -> int:
         return len(self.values)
 
+    def clone(self) -> 'FaceList':
+        """ Returns a deep copy. """
+        return self.__class__(data=(array.array(face.typecode, face) for face in self.values))
+
     def __iter__(self) -> Iterable[array.array]:
         return iter(self.values)
 
@@ -97,6 +101,8 @@ class FaceList(TagList):
 
 
 def face_to_array(face: Sequence[int]) -> array.array:
+    if isinstance(face, array.array):  # copy by a single memory copy operation
+        return array.array(face.typecode, face)
     max_index = max(face)
     if max_index < 256:
         dtype = 'B'
@@ -170,10 +176,10 @@ class Mesh(DXFGraphic):
 
     def _copy_data(self, entity: 'Mesh') -> None:
         """ Copy data: vertices, faces, edges, creases. """
-        entity._vertices = copy.deepcopy(self._vertices)
-        entity._faces = copy.deepcopy(self._faces)
-        entity._edges = copy.deepcopy(self._edges)
-        entity._creases = copy.deepcopy(self._creases)
+        entity._vertices = self._vertices.clone()
+        entity._faces = self._faces.clone()
+        entity._edges = self._edges.clone()
+        entity._creases = array.array(self._creases.typecode, self._creases)
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
@@ -279,7 +285,10 @@ class Mesh(DXFGraphic):
 
     @vertices.setter
     def vertices(self, points: Iterable['Vertex']) -> None:
-        self._vertices = VertexArray(chain.from_iterable(points))
+        if isinstance(points, Vec3Array):  # same memory layout, copy by a single memory copy operation
+            self._vertices = VertexArray(points.values)
+        else:
+            self._vertices = VertexArray(chain.from_iterable(points))
 
     @property
     def edges(self):
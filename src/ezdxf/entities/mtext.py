@@ -4,7 +4,7 @@
 from typing import TYPE_CHECKING, Union, Tuple, List
 import math
 
-from ezdxf.math import Vector, Matrix44, OCS
+from ezdxf.math import Vector, Matrix44, get_ocs
 from ezdxf.math.transformtools import transform_extrusion
 from ezdxf.lldxf import const
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
@@ -323,7 +323,7 @@ class MText(DXFGraphic):
             # MTEXT is not an OCS entity, but I don't know how else to convert
             # a rotation angle for an entity just defined by an extrusion vector.
             # It's correct for the most common case: extrusion=(0, 0, 1)
-            ocs = OCS(old_extrusion)
+            ocs = get_ocs(old_extrusion)
             dxf.text_direction = ocs.to_wcs(Vector.from_deg_angle(dxf.rotation))
 
         dxf.discard('rotation')
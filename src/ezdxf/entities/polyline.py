@@ -587,6 +587,51 @@ class Polyface(Polyline):
             new_faces.append(face_record)
         self._rebuild(chain(existing_faces, new_faces))
 
+    def append_indexed_faces(self, vertices: Iterable['Vertex'], faces: Iterable[Sequence[int]],
+                             dxfattribs: dict = None) -> None:
+        """
+        Append multiple faces as indexed data. `vertices` is a list of ``(x, y, z)`` tuples and `faces` is a list of
+        faces, a face is a sequence of 3 or 4 indices into `vertices`. Unlike :meth:`append_faces`, the vertices are
+        not merged, which is much faster for big meshes with already unique vertices.
+
+        Args:
+            vertices: list of ``(x, y, z)`` tuples
+            faces: list of faces as sequences of 3 or 4 vertex indices
+            dxfattribs: dict of DXF attributes for :class:`Vertex` entity
+
+        Raises:
+            ValueError: invalid face
+
+        .. versionadded:: 0.14
+
+        """
+        dxfattribs = dict(dxfattribs or {})
+        mesh_vertices = []
+        face_records = []
+        for vertex in self.vertices:  # type: DXFVertex
+            (mesh_vertices if vertex.is_poly_face_mesh_vertex else face_records).append(vertex)
+        new_vertices = self._points_to_dxf_vertices(Vector.generate(vertices), dict(dxfattribs))
+        offset = len(mesh_vertices) + 1  # face record indices are 1-based
+        count = offset + len(new_vertices)
+        dxfattribs['flags'] = const.VTX_3D_POLYFACE_MESH_VERTEX
+        dxfattribs['layer'] = self.get_dxf_attrib('layer', '0')
+        # location of face record vertex is always (0, 0, 0)
+        dxfattribs['location'] = NULLVEC
+        new_face_records = []
+        for face in faces:
+            if not (3 <= len(face) <= 4):
+                raise ValueError('face requires 3 or 4 vertex indices')
+            for index, name in zip(face, VERTEXNAMES):
+                index += offset
+                if not (offset <= index < count):
+                    raise ValueError(f'invalid vertex index: {index - offset}')
+                dxfattribs[name] = index
+            if len(face) == 3:
+                dxfattribs.pop('vtx3', None)
+            new_face_records.append(self._new_compound_entity('VERTEX', dxfattribs))
+        self.vertices = list(chain(mesh_vertices, new_vertices, face_records, new_face_records))
+        self.update_count(count - 1, len(face_records) + len(new_face_records))
+
     def _rebuild(self, faces: Iterable['FaceProxy'], precision: int = 6) -> None:
         """
         Build a valid Polyface structure out of *faces*.
@@ -3,7 +3,6 @@
 # Created 2019-03-06
 from typing import TYPE_CHECKING, Iterable, Sequence, cast
 import array
-import copy
 import warnings
 from itertools import chain
 from contextlib import contextmanager
@@ -81,10 +80,10 @@ class Spline(DXFGraphic):
 
     def _copy_data(self, entity: 'Spline') -> None:
         """ Copy data: control_points, fit_points, weights, knot_values. """
-        entity._control_points = copy.deepcopy(self._control_points)
-        entity._fit_points = copy.deepcopy(self._fit_points)
-        entity._knots = copy.deepcopy(self._knots)
-        entity._weights = copy.deepcopy(self._weights)
+        entity._control_points = self._control_points.clone()
+        entity._fit_points = self._fit_points.clone()
+        entity._knots = array.array(self._knots.typecode, self._knots)
+        entity._weights = array.array(self._weights.typecode, self._weights)
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
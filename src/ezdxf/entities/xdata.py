@@ -28,6 +28,12 @@ class XData:
     def __len__(self):
         return len(self.data)
 
+    def copy(self) -> 'XData':
+        """ Returns a copy, tag lists are copied but the immutable DXF tags are shared. """
+        xdata = self.__class__()
+        xdata.data = OrderedDict((appid, Tags(tags)) for appid, tags in self.data.items())
+        return xdata
+
     def __contains__(self, appid: str) -> bool:
         return appid in self.data
 
@@ -170,6 +176,10 @@ class EmbeddedObjects:
     def __init__(self, embedded_objects: List[Tags]):
         self.embedded_objects = embedded_objects
 
+    def copy(self) -> 'EmbeddedObjects':
+        """ Returns a copy, tag lists are copied but the immutable DXF tags are shared. """
+        return self.__class__([Tags(tags) for tags in self.embedded_objects])
+
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         for tags in self.embedded_objects:
             tagwriter.write_tags(tags)
@@ -2,7 +2,7 @@
 # Created: 2019-02-14
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import Optional, Iterable, Tuple, TYPE_CHECKING, Dict, Set
+from typing import Optional, Iterable, Tuple, TYPE_CHECKING, Dict, Set, List
 from ezdxf.tools.handle import HandleGenerator
 from ezdxf.lldxf.types import is_valid_handle
 from ezdxf.entities.dxfentity import DXFEntity
@@ -75,6 +75,16 @@ class EntityDB:
             if handle not in self._database:  # you can not trust $HANDSEED value
                 return handle
 
+    def reserve_handles(self, count: int) -> List[str]:
+        """ Returns `count` unique handles, which are not used by the database. This handles are not stored in the
+        database, this happens by adding an entity with a reserved handle to the database.
+        """
+        database = self._database
+        handles = []
+        while len(handles) < count:  # you can not trust $HANDSEED value
+            handles.extend(handle for handle in self.handles.reserve(count - len(handles)) if handle not in database)
+        return handles
+
     def keys(self) -> Iterable[str]:
         """ Iterable of all handles. """
         return self._database.keys()
@@ -108,6 +118,16 @@ class EntityDB:
         if hasattr(entity, 'add_sub_entities_to_entitydb'):
             entity.add_sub_entities_to_entitydb()
 
+    def add_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """ Add multiple new `entities` to the database in one step, the handles of the `entities` have to be
+        reserved by :meth:`reserve_handles`. Sub entities are not added, the `entities` must not have sub entities.
+
+        (internal API)
+        """
+        if self.locked:
+            raise DXFInternalEzdxfError('Locked entity database.')
+        self._database.update((entity.dxf.handle, entity) for entity in entities)
+
     def delete_entity(self, entity: DXFEntity) -> None:
         """ Removes `entity` from database and destroys the `entity`. """
         if entity.is_alive:
@@ -260,8 +280,9 @@ class EntitySpace:
 
     def extend(self, entities: Iterable['DXFEntity']) -> None:
         """ Add multiple `entities`."""
-        for entity in entities:
-            self.add(entity)
+        entities = list(entities)
+        assert all(isinstance(entity, DXFEntity) for entity in entities), 'DXFEntity expected'
+        self.entities.extend(entities)
 
     def export_dxf(self, tagwriter: 'TagWriter', order=0) -> None:
         """
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Iterable, Union, Callable, Optional, cast
 
 from ezdxf.entities import factory
 from ezdxf.lldxf.const import DXFStructureError, DXFTypeError, VERTEXNAMES, BYBLOCK
-from ezdxf.math import Vector, bulge_to_arc, OCS
+from ezdxf.math import Vector, bulge_to_arc, get_ocs
 from ezdxf.math.transformtools import NonUniformScalingError, InsertTransformationError
 from ezdxf.math import fit_points_to_cad_cv
 from ezdxf.query import EntityQuery
@@ -304,7 +304,7 @@ def virtual_polyline2d_entities(polyline: 'Polyline') -> Iterable[Union['Line',
 
 def _virtual_polyline_entities(points, elevation: float, extrusion: Vector, dxfattribs: dict, doc) -> Iterable[
     Union['Line', 'Arc']]:
-    ocs = OCS(extrusion) if extrusion else OCS()
+    ocs = get_ocs(extrusion) if extrusion else get_ocs()
     prev_point = None
     prev_bulge = None
 
@@ -1,19 +1,22 @@
 # Created: 10.03.2013
 # Copyright (c) 2013-2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Sequence, Dict, Tuple, cast
+from typing import TYPE_CHECKING, Iterable, Sequence, Dict, Tuple, List, Set, Union, Optional, cast
+import gc
 import math
 import logging
 
 from ezdxf.lldxf import const
 from ezdxf.lldxf.const import DXFValueError, DXFVersionError, DXF2000, DXF2007, LATEST_DXF_VERSION
-from ezdxf.math import Vector
+from ezdxf.math import Vector, get_ocs
 from ezdxf.math import global_bspline_interpolation
 from ezdxf.render.arrows import ARROWS
 from ezdxf.entities.dimstyleoverride import DimStyleOverride
 from ezdxf.entities import factory
 from ezdxf.render.dim_linear import multi_point_linear_dimension
 from ezdxf.entitydb import EntitySpace
+from ezdxf.entities.dxfentity import DXFEntity, SETTER_EVENTS, ERR_INVALID_DXF_ATTRIB
+from ezdxf.lldxf.attributes import XType
 
 logger = logging.getLogger('ezdxf')
 
@@ -61,9 +64,110 @@ class CreatorInterface:
         self.add_entity(entity)
         return entity
 
+    def new_entities(self, type_: str, dxfattribs: dict, unique_attribs: Iterable[dict]) -> List['DXFGraphic']:
+        """
+        Create multiple entities of the same DXF type in the drawing database and add them to the entity space
+        in one step.
+
+        The common DXF attributes `dxfattribs` are validated once and shared as template by all new entities,
+        each dict of `unique_attribs` creates a new entity. The names of the unique attributes are validated, but
+        the values are NOT validated and have to be stored in the final data type,
+        e.g. :class:`~ezdxf.math.Vector` for points and ``float`` for floating point values.
+
+        Args:
+            type_ : DXF type string, like ``'LINE'``, ``'CIRCLE'`` or ``'LWPOLYLINE'``
+            dxfattribs: common DXF attributes for all new entities
+            unique_attribs: iterable of entity specific DXF attributes as dicts
+
+        Raises:
+            DXFAttributeError: invalid DXF attribute name in `unique_attribs`
+
+        """
+        # The template entity validates the common attributes and runs the post creation checks like layer name
+        # and linetype validation, the template itself is not stored in the entity database.
+        template = self.dxffactory.new_entity(type_, dxfattribs)
+        common_attribs = template.dxf.all_existing_dxf_attribs()
+        # handle and owner will be set by adding the entities to the entity database and the entity space
+        del common_attribs['handle']
+        del common_attribs['owner']
+        # Attributes which can be stored directly in the namespace, callback attributes and attributes with setter
+        # events require DXFNamespace.__setattr__()
+        direct_names = {
+            name for name, attrib in template.DXFATTRIBS.items()
+            if attrib.xtype != XType.callback and name not in SETTER_EVENTS
+        }
+
+        # Every new entity and its DXF namespace are a reference cycle, the cyclic garbage collector is paused while
+        # creating many entities, else each collection of the young generation has to scan all new entities.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            unique_attribs = list(unique_attribs)
+            # validate the names of the unique attributes before any entity is created
+            names = set().union(*(attribs.keys() for attribs in unique_attribs))
+            for name in names:
+                if name not in template.DXFATTRIBS:
+                    raise const.DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(name, type_))
+            entities = self._create_entities(template, common_attribs, direct_names, unique_attribs)
+            # The new entities have reserved handles and no sub entities, INSERT entities get their ATTRIB entities
+            # after creation, therefore all entities are stored in the entity database in one step.
+            self.doc.entitydb.add_entities(entities)
+            self._add_new_entities(entities)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return entities
+
+    def _create_entities(self, template: 'DXFGraphic', common_attribs: dict, direct_names: Set[str],
+                        unique_attribs: List[dict]) -> List['DXFGraphic']:
+        # Returns new entities of the same type as `template` with reserved handles, which are not stored in the
+        # entity database. Entity types without their own constructor are cloned from the state of a new instance
+        # without calling DXFEntity.__init__() and DXFNamespace.__init__(), entity types with their own
+        # constructor, like INSERT and LWPOLYLINE, may create mutable instance attributes and are created by their
+        # constructor.
+        doc = self.doc
+        class_ = template.__class__
+        clone = class_.__init__ is DXFEntity.__init__
+        entity_state = {key: value for key, value in class_(doc).__dict__.items() if key != 'dxf'}
+        namespace_class = template.dxf.__class__
+        new = object.__new__
+        entities = []
+        for handle, attribs in zip(doc.entitydb.reserve_handles(len(unique_attribs)), unique_attribs):
+            if clone:
+                entity = new(class_)
+                entity.__dict__.update(entity_state)
+                dxf = new(namespace_class)
+                entity.dxf = dxf
+                namespace = dxf.__dict__
+                namespace['_entity'] = entity
+            else:
+                entity = class_(doc)
+                dxf = entity.dxf
+                namespace = dxf.__dict__
+            namespace.update(common_attribs)
+            namespace['handle'] = handle
+            if attribs.keys() <= direct_names:
+                namespace.update(attribs)  # bypass DXFNamespace.__setattr__()
+            else:
+                for name, value in attribs.items():
+                    if name in direct_names:
+                        namespace[name] = value
+                    else:
+                        dxf.set(name, value)
+            entities.append(entity)
+        return entities
+
+    def _add_new_entities(self, entities: List['DXFGraphic']) -> None:
+        # Add new entities without linked entities created by new_entities() to the entity space. (internal API)
+        self.add_entities(entities)
+
     def add_entity(self, entity: 'DXFGraphic') -> None:
         pass
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        for entity in entities:
+            self.add_entity(entity)
+
     def add_point(self, location: 'Vertex', dxfattribs: dict = None) -> 'Point':
         """
         Add a :class:`~ezdxf.entities.Point` entity at `location`.
@@ -92,6 +196,37 @@ class CreatorInterface:
         dxfattribs['end'] = Vector(end)
         return self.new_entity('LINE', dxfattribs)
 
+    def add_points(self, locations: Iterable['Vertex'], dxfattribs: dict = None) -> List['Point']:
+        """
+        Add multiple :class:`~ezdxf.entities.Point` entities at once, all entities share the same DXF
+        attributes `dxfattribs`. This is much faster than calling :meth:`add_point` for each point.
+
+        Args:
+            locations: iterable of 2D/3D points in :ref:`WCS`, e.g. an array of shape (n, 3)
+            dxfattribs: additional DXF attributes for all entities
+
+        .. versionadded:: 0.14
+
+        """
+        return self.new_entities('POINT', dxfattribs, ({'location': Vector(location)} for location in locations))
+
+    def add_lines(self, lines: Iterable[Tuple['Vertex', 'Vertex']], dxfattribs: dict = None) -> List['Line']:
+        """
+        Add multiple :class:`~ezdxf.entities.Line` entities at once, all entities share the same DXF
+        attributes `dxfattribs`. This is much faster than calling :meth:`add_line` for each line.
+
+        Args:
+            lines: iterable of (`start`, `end`) tuples as 2D/3D points in :ref:`WCS`, e.g. an array of
+                shape (n, 2, 3)
+            dxfattribs: additional DXF attributes for all entities
+
+        .. versionadded:: 0.14
+
+        """
+        return self.new_entities('LINE', dxfattribs, (
+            {'start': Vector(start), 'end': Vector(end)} for start, end in lines
+        ))
+
     def add_circle(self, center: 'Vertex', radius: float, dxfattribs: dict = None) -> 'Circle':
         """
         Add a :class:`~ezdxf.entities.Circle` entity. This is an 2D element, which can be placed in space by
@@ -108,6 +243,24 @@ class CreatorInterface:
         dxfattribs['radius'] = float(radius)
         return self.new_entity('CIRCLE', dxfattribs)
 
+    def add_circles(self, centers: Iterable['Vertex'], radii: Iterable[float],
+                    dxfattribs: dict = None) -> List['Circle']:
+        """
+        Add multiple :class:`~ezdxf.entities.Circle` entities at once, all entities share the same DXF
+        attributes `dxfattribs`. This is much faster than calling :meth:`add_circle` for each circle.
+
+        Args:
+            centers: iterable of 2D/3D points in :ref:`WCS`
+            radii: iterable of circle radii, one for each center point
+            dxfattribs: additional DXF attributes for all entities
+
+        .. versionadded:: 0.14
+
+        """
+        return self.new_entities('CIRCLE', dxfattribs, (
+            {'center': Vector(center), 'radius': float(radius)} for center, radius in zip(centers, radii)
+        ))
+
     def add_ellipse(self, center: 'Vertex', major_axis: 'Vertex' = (1, 0, 0), ratio: float = 1, start_param: float = 0,
                     end_param: float = 2 * math.pi, dxfattribs: dict = None) -> 'Ellipse':
         """
@@ -230,6 +383,109 @@ class CreatorInterface:
         blockref = self.new_entity('INSERT', dxfattribs)  # type: Insert
         return blockref
 
+    def add_blockrefs(self, name: str, insert_points: Iterable['Vertex'], rotations: Iterable[float] = None,
+                      scales: Iterable[Union[float, 'Vertex']] = None, attribs: Iterable[Dict[str, str]] = None,
+                      dxfattribs: dict = None) -> List['Insert']:
+        """
+        Add multiple :class:`~ezdxf.entities.Insert` entities of the same block definition at once, all entities
+        share the same DXF attributes `dxfattribs`. This is much faster than calling :meth:`add_blockref` and
+        :meth:`~ezdxf.entities.Insert.add_auto_attribs` for each block reference.
+
+        If argument `attribs` is not ``None``, an :class:`~ezdxf.entities.Attrib` entity is attached to each block
+        reference for each :class:`~ezdxf.entities.AttDef` entity of the block definition like
+        :meth:`~ezdxf.entities.Insert.add_auto_attribs` does, `attribs` is an iterable of dicts with ``tag/value``
+        pairs, one dict for each block reference. The ATTDEF entities are processed only once and the ATTRIB
+        transformation is done only once for each unique (`rotation`, `scale`) combination, for each block reference
+        the transformed ATTRIB entities are just moved to the final location.
+
+        Args:
+            name: block name as str
+            insert_points: iterable of insert locations as 2D/3D points in :ref:`WCS`
+            rotations: iterable of rotation angles in degrees, one for each block reference or ``None``
+            scales: iterable of scaling values, one for each block reference or ``None``, a scaling value is a
+                ``float`` for uniform scaling or a (`xscale`, `yscale`, `zscale`) tuple
+            attribs: iterable of :class:`~ezdxf.entities.Attrib` tag values as ``tag/value`` dicts, one dict for each
+                block reference or ``None`` to attach no ATTRIB entities
+            dxfattribs: additional DXF attributes for all :class:`Insert` entities
+
+        .. versionadded:: 0.14
+
+        """
+        if not isinstance(name, str):
+            raise DXFValueError('Block name as string required.')
+
+        insert_points = [Vector(point) for point in insert_points]
+        count = len(insert_points)
+        unique_attribs = [{'insert': point} for point in insert_points]
+
+        if rotations is not None:
+            rotations = [float(angle) for angle in rotations]
+            if len(rotations) != count:
+                raise DXFValueError('Count of rotation angles does not match count of insert points.')
+            for data, angle in zip(unique_attribs, rotations):
+                data['rotation'] = angle
+
+        if scales is not None:
+            scales = [_scaling_tuple(scale) for scale in scales]
+            if len(scales) != count:
+                raise DXFValueError('Count of scaling values does not match count of insert points.')
+            for data, (sx, sy, sz) in zip(unique_attribs, scales):
+                data['xscale'] = sx
+                data['yscale'] = sy
+                data['zscale'] = sz
+
+        if attribs is not None:
+            attribs = list(attribs)
+            if len(attribs) != count:
+                raise DXFValueError('Count of attribute dicts does not match count of insert points.')
+
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['name'] = name
+        blockrefs = self.new_entities('INSERT', dxfattribs, unique_attribs)
+        if attribs is not None:
+            self._add_auto_attribs_to_blockrefs(blockrefs, attribs)
+        return blockrefs
+
+    def _add_auto_attribs_to_blockrefs(self, blockrefs: List['Insert'], attribs: List[Dict[str, str]]) -> None:
+        if len(blockrefs) == 0:
+            return
+        doc = self.doc
+        blockdef = doc.blocks[blockrefs[0].dxf.name]
+        # ATTRIB templates at the block base point, processed only once for all block references
+        templates = [
+            factory.new('ATTRIB', attdef.dxfattribs(drop={'prompt', 'handle', 'owner', 'paperspace'}), doc)
+            for attdef in blockdef.attdefs()
+        ]
+        if len(templates) == 0:
+            return
+
+        # Cache of ATTRIB templates transformed by the first block reference of each unique (rotation, scaling,
+        # extrusion) combination, all following block references with the same transformation parameters
+        # just move the transformed templates from the location of the first block reference to their own location.
+        transformed_templates = dict()
+        entitydb = doc.entitydb
+        for blockref, values in zip(blockrefs, attribs):
+            dxf = blockref.dxf
+            extrusion = dxf.extrusion
+            location = get_ocs(extrusion).to_wcs(dxf.insert)
+            key = (dxf.rotation, dxf.xscale, dxf.yscale, dxf.zscale, extrusion)
+            try:
+                transformed, origin = transformed_templates[key]
+            except KeyError:
+                m = blockref.matrix44()
+                transformed = [template.copy().transform(m) for template in templates]
+                origin = location
+                transformed_templates[key] = (transformed, origin)
+
+            dx, dy, dz = location - origin
+            for template in transformed:
+                attrib = template.copy()
+                attrib.dxf.text = values.get(template.dxf.tag, '')
+                attrib.translate(dx, dy, dz)
+                entitydb.add(attrib)
+                blockref.link_entity(attrib)
+            blockref.new_seqend()
+
     def add_auto_blockref(self, name: str, insert: 'Vertex', values: Dict[str, str], dxfattribs: dict = None) \
             -> 'Insert':
         """
@@ -463,6 +719,35 @@ class CreatorInterface:
         lwpolyline.closed = closed
         return lwpolyline
 
+    def add_lwpolylines(self, polylines: Iterable[Iterable['Vertex']], format: str = 'xyseb',
+                        dxfattribs: dict = None) -> List['LWPolyline']:
+        """
+        Add multiple :class:`~ezdxf.entities.LWPolyline` entities at once, all entities share the same DXF
+        attributes `dxfattribs`, the ``closed`` attribute is also supported. This is much faster than calling
+        :meth:`add_lwpolyline` for each polyline. (requires DXF R2000)
+
+        Args:
+            polylines: iterable of polyline vertices, each polyline is an iterable of
+                (x, y, [start_width, [end_width, [bulge]]]) tuples
+            format: user defined point format for all polylines, default is ``"xyseb"``,
+                see :meth:`add_lwpolyline`
+            dxfattribs: additional DXF attributes for all entities
+
+        .. versionadded:: 0.14
+
+        """
+        if self.dxfversion < DXF2000:
+            raise DXFVersionError('LWPOLYLINE requires DXF R2000')
+        dxfattribs = dict(dxfattribs or {})
+        if dxfattribs.pop('closed', False):
+            # closed state is stored in the shared 'flags' attribute
+            dxfattribs['flags'] = dxfattribs.get('flags', 0) | const.LWPOLYLINE_CLOSED
+        polylines = list(polylines)
+        lwpolylines = self.new_entities('LWPOLYLINE', dxfattribs, ({} for _ in polylines))
+        for lwpolyline, points in zip(lwpolylines, polylines):
+            lwpolyline.set_points(points, format=format)
+        return lwpolylines
+
     def add_mtext(self, text: str, dxfattribs: dict = None) -> 'MText':
         """
         Add a multiline text entity with automatic text wrapping at boundaries as :class:`~ezdxf.entities.MText` entity.
@@ -1565,5 +1850,21 @@ class VirtualLayout(CreatorInterface):
         self.entities.add(entity)
         return entity
 
+    def new_entities(self, type_: str, dxfattribs: dict, unique_attribs: Iterable[dict]) -> List['DXFGraphic']:
+        entities = []
+        for attribs in unique_attribs:
+            entity_attribs = dict(dxfattribs or {})
+            entity_attribs.update(attribs)
+            entities.append(factory.new(type_, dxfattribs=entity_attribs, doc=self.doc))
+        self.entities.extend(entities)
+        return entities
+
 
 LEADER_UNSUPPORTED_DIMSTYLE_ATTRIBS = {'dimblk', 'dimblk1', 'dimblk2'}
+
+
+def _scaling_tuple(scale: Union[float, 'Vertex']) -> Tuple[float, float, float]:
+    if isinstance(scale, (int, float)):
+        scale = float(scale)
+        return scale, scale, scale
+    return Vector(scale).xyz
@@ -1,7 +1,7 @@
 # Created: 2019-02-18
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, cast
+from typing import TYPE_CHECKING, Iterable, List, cast
 from ezdxf.lldxf.const import DXFValueError, DXFStructureError
 from ezdxf.query import EntityQuery
 from ezdxf.groupby import groupby
@@ -130,6 +130,34 @@ class BaseLayout(CreatorInterface):
 
         self.block_record.add_entity(entity)
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Add multiple existing :class:`DXFGraphic` entities to a layout in one step, same restrictions as for
+        :meth:`add_entity`.
+
+        .. versionadded:: 0.14
+
+        """
+        entities = list(entities)
+        if any(entity.doc != self.doc for entity in entities):
+            raise DXFStructureError('Adding entities from a different DXF drawing is not supported.')
+
+        self.block_record.add_entities(entities)
+
+    def _add_new_entities(self, entities: List['DXFGraphic']) -> None:
+        # Add new entities without linked entities created by new_entities() to the entity space in one step,
+        # owner and paperspace flag are stored directly in the DXF namespace. (internal API)
+        owner = self.block_record.dxf.handle
+        paperspace = int(self.is_any_paperspace)
+        for entity in entities:
+            namespace = entity.dxf.__dict__
+            namespace['owner'] = owner
+            if paperspace:
+                namespace['paperspace'] = paperspace
+            else:
+                namespace.pop('paperspace', None)
+        self.entity_space.extend(entities)
+
     def add_foreign_entity(self, entity: 'DXFGraphic', copy=True) -> None:
         """
         Add a foreign DXF entity to a layout, this foreign entity could be from another DXF document or an entity
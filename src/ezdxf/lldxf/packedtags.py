@@ -9,7 +9,7 @@ from .const import DXFTypeError, DXFIndexError, DXFValueError
 from .tags import Tags
 from ezdxf.tools.indexing import Index
 from ezdxf.lldxf.tagwriter import TagWriter
-from ezdxf.math import UCS, Matrix44
+from ezdxf.math import UCS, Matrix44, Vec3Array
 
 
 class TagList:
@@ -23,6 +23,9 @@ class TagList:
         """ Returns a deep copy. """
         return self.__class__(data=self.values)
 
+    def __deepcopy__(self, memodict: dict = None):
+        return self.clone()
+
     @classmethod
     def from_tags(cls, tags: Tags, code: int) -> 'TagList':
         """
@@ -126,6 +129,9 @@ class VertexArray:
         """ Returns a deep copy. """
         return self.__class__(data=self.values)
 
+    def __deepcopy__(self, memodict: dict = None):
+        return self.clone()
+
     @classmethod
     def from_tags(cls, tags: Iterable[DXFTag], code: int = 10) -> 'VertexArray':
         """
@@ -211,7 +217,33 @@ class VertexArray:
         .. versionadded:: 0.13
 
         """
+        if self.VERTEX_SIZE == 3:
+            self.values = m.transform_array(self.vec3array()).values
+            return
         values = array('d')
         for vertex in m.transform_vertices(self):
             values.extend(vertex)
         self.values = values
+
+    def vec3array(self) -> Vec3Array:
+        """ Returns the vertices as :class:`~ezdxf.math.Vec3Array`, the :class:`~ezdxf.math.Vec3Array` shares the
+        underlying ``array.array('d')`` with this :class:`VertexArray` without copying the data, requires a vertex
+        size of 3.
+
+        .. versionadded:: 0.14
+
+        """
+        if self.VERTEX_SIZE != 3:
+            raise DXFTypeError('requires a vertex size of 3')
+        return Vec3Array.from_array(self.values)
+
+    def set_vec3array(self, vertices: Vec3Array) -> None:
+        """ Replace all vertices by `vertices`, this :class:`VertexArray` shares the underlying ``array.array('d')``
+        of the :class:`~ezdxf.math.Vec3Array` without copying the data, requires a vertex size of 3.
+
+        .. versionadded:: 0.14
+
+        """
+        if self.VERTEX_SIZE != 3:
+            raise DXFTypeError('requires a vertex size of 3')
+        self.values = vertices.values
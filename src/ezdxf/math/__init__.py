@@ -12,6 +12,7 @@ from .construct2d import (
 from .construct3d import (
     is_planar_face, subdivide_face, subdivide_ngons, Plane, LocationState, intersection_ray_ray_3d, normal_vector_3p,
 )
+from .vec3array import Vec3Array
 from .matrix44 import Matrix44
 from .linalg import (
     Matrix, LUDecomposition, gauss_jordan_inverse, gauss_jordan_solver, gauss_vector_solver, gauss_matrix_solver,
@@ -26,10 +27,13 @@ from .bspline import (
     local_cubic_bspline_interpolation,
 )
 from .bezier import Bezier
-from .bezier4p import Bezier4P, cubic_bezier_from_arc, cubic_bezier_from_ellipse, cubic_bezier_interpolation
+from .bezier4p import (
+    Bezier4P, cubic_bezier_from_arc, cubic_bezier_from_ellipse, cubic_bezier_interpolation,
+    cubic_bezier_chain_approximation,
+)
 from .surfaces import BezierSurface
 from .eulerspiral import EulerSpiral
-from .ucs import OCS, UCS, PassTroughUCS
+from .ucs import OCS, UCS, PassTroughUCS, get_ocs
 from .bulge import bulge_to_arc, bulge_3_points, bulge_center, bulge_radius, arc_to_bulge
 from .arc import ConstructionArc
 from .line import ConstructionRay, ConstructionLine, ParallelRaysError
@@ -38,7 +42,20 @@ from .ellipse import ConstructionEllipse, angle_to_param, param_to_angle, rytz_a
 from .box import ConstructionBox
 from .shape import Shape2d
 from .bbox import BoundingBox2d, BoundingBox
-from .offset2d import offset_vertices_2d
+from .offset2d import offset_vertices_2d, offset_bulge_polyline_2d, offset_bulge_polylines_2d
+from .intersection import (
+    intersect_segments_2d, intersect_polylines_2d, intersect_curves_2d, intersect_curve_with_curves_2d,
+)
+from .clipping import (
+    clip_polygon_2d, clip_polygons_2d, clip_segments_to_rect_2d, clip_polylines_to_rect_2d,
+    greiner_hormann_intersection, greiner_hormann_union, greiner_hormann_difference, clip_polygons_general_2d,
+)
+from .polygon import points_in_polygon_2d, PolygonIndex
+from .simplify import douglas_peucker_indices, simplify_douglas_peucker, visvalingam_indices, simplify_visvalingam
+from .arcfit import fit_arcs_indices_2d, fit_arcs_2d
+from .triangulation import (
+    triangulate_indices_2d, triangulate_polygon_2d, triangulate_polygons_2d, triangulate_polygon_3d, nest_polygons_2d,
+)
 from .transformtools import NonUniformScalingError, InsertTransformationError
 
 
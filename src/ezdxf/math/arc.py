@@ -104,6 +104,32 @@ class ConstructionArc:
         for angle in a:
             yield center + Vec2.from_deg_angle(angle, radius)
 
+    def flattening(self, sagitta: float) -> Iterable[Vec2]:
+        """ Approximate the arc by vertices, argument `sagitta` is the max. distance from the center of an arc
+        segment to the center of its chord. The count of segments is calculated from the `sagitta`, all segments
+        have the same length.
+
+        Args:
+            sagitta: max. distance from the arc to the approximation chord, has to be > 0
+
+        .. versionadded:: 0.14
+
+        """
+        if sagitta <= 0.:
+            raise ValueError('sagitta has to be > 0')
+        radius = abs(self.radius)
+        start = self.start_angle % 360
+        stop = self.end_angle % 360
+        if stop <= start:
+            stop += 360
+        if sagitta < radius:
+            # chord angle of an arc segment with the given sagitta
+            segment_angle = 2.0 * math.acos(1.0 - sagitta / radius)
+        else:
+            segment_angle = math.pi
+        count = max(math.ceil(math.radians(stop - start) / segment_angle), 1)
+        return self.vertices(self.angles(count + 1))
+
     def tangents(self, a: Iterable[float]) -> Iterable[Vec2]:
         """
         Yields tangents on arc for angles in iterable `a` in WCS as direction vectors.
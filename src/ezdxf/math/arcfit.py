@@ -0,0 +1,149 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Optional, Sequence
+import math
+from .vector import Vec2
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['fit_arcs_indices_2d', 'fit_arcs_2d']
+
+# Max. sweep angle of a fitted arc, the bulge value of a full circle is infinite
+MAX_SWEEP_ANGLE = math.tau * 0.99
+
+
+def fit_arcs_indices_2d(vertices: Iterable['Vertex'], tolerance: float, min_segments: int = 3) -> List[
+    Tuple[int, float]]:
+    """
+    Returns the arc fitting of a polyline in the xy-plane as list of ``(index, bulge)`` tuples, the `index` of the
+    kept vertex and the `bulge` value of the segment starting at this vertex. Runs of at least `min_segments`
+    straight segments located within `tolerance` of a circular arc, are replaced by a single arc segment, other
+    segments are kept as straight segments with a bulge value of ``0``. The arcs start and end at existing
+    vertices, the first and the last vertex are always kept.
+
+    The longest matching arc is searched by an exponential and a binary search for each start vertex, the
+    arc is defined by its start-, middle- and end vertex.
+
+    For closed polylines append the first vertex as last vertex.
+
+    Args:
+        vertices: iterable of :class:`Vec2` compatible vertices
+        tolerance: max. distance of all vertices and segments to the fitted arc
+        min_segments: min. count of straight segments replaced by an arc
+
+    .. versionadded:: 0.14
+
+    """
+    points = [(v.x, v.y) for v in Vec2.generate(vertices)]
+    count = len(points)
+    min_segments = max(int(min_segments), 2)
+    result = []
+    start = 0
+    while start < count - 1:
+        end, bulge = _longest_arc(points, start, tolerance, min_segments)
+        if bulge:
+            result.append((start, bulge))
+        else:  # straight segments
+            result.extend((index, 0.) for index in range(start, end))
+        start = end
+    if count:
+        result.append((count - 1, 0.))
+    return result
+
+
+def fit_arcs_2d(vertices: Iterable['Vertex'], tolerance: float, min_segments: int = 3) -> List[
+    Tuple[float, float, float]]:
+    """
+    Returns the arc fitting of a polyline in the xy-plane as list of ``(x, y, bulge)`` tuples, which is
+    compatible to the ``'xyb'`` format of :class:`~ezdxf.entities.LWPolyline`, see :func:`fit_arcs_indices_2d`.
+
+    .. versionadded:: 0.14
+
+    """
+    points = Vec2.list(vertices)
+    return [(points[index].x, points[index].y, bulge) for index, bulge in
+            fit_arcs_indices_2d(points, tolerance, min_segments)]
+
+
+def _longest_arc(points: List[Sequence[float]], start: int, tolerance: float, min_segments: int) -> Tuple[int, float]:
+    # Returns the end index and the bulge value of the longest arc starting at index `start`, or the end index and
+    # bulge 0 for straight segments.
+    last = len(points) - 1
+    good = start + min_segments
+    if good > last:
+        return start + 1, 0.
+    bulge = _fit_arc(points, start, good, tolerance)
+    if bulge is None:
+        return start + 1, 0.
+    # exponential search for the first failing end index
+    bad = None
+    step = min_segments
+    while good < last:
+        probe = min(good + step, last)
+        probe_bulge = _fit_arc(points, start, probe, tolerance)
+        if probe_bulge is None:
+            bad = probe
+            break
+        good = probe
+        bulge = probe_bulge
+        step *= 2
+    # binary search between the last matching and the first failing end index
+    if bad is not None:
+        while bad - good > 1:
+            probe = (good + bad) // 2
+            probe_bulge = _fit_arc(points, start, probe, tolerance)
+            if probe_bulge is None:
+                bad = probe
+            else:
+                good = probe
+                bulge = probe_bulge
+    # The search does not reject straight arcs, because the short runs of dense polylines are always straight
+    # within tolerance. The sagitta of the arc is bulge * chord length / 2.
+    ax, ay = points[start]
+    bx, by = points[good]
+    if math.fabs(bulge) * math.hypot(bx - ax, by - ay) * .5 <= tolerance:
+        return good, 0.  # straight segments within tolerance
+    return good, bulge
+
+
+def _fit_arc(points: List[Sequence[float]], start: int, end: int, tolerance: float) -> Optional[float]:
+    # Returns the bulge value of the arc through the start-, middle- and end point, if all points and segments
+    # from start to end are located within tolerance to this arc, else None
+    ax, ay = points[start]
+    mx, my = points[(start + end) // 2]
+    bx, by = points[end]
+    d = 2. * (ax * (my - by) + mx * (by - ay) + bx * (ay - my))
+    if d == 0.:
+        return None  # collinear points
+    a2 = ax * ax + ay * ay
+    m2 = mx * mx + my * my
+    b2 = bx * bx + by * by
+    cx = (a2 * (my - by) + m2 * (by - ay) + b2 * (ay - my)) / d
+    cy = (a2 * (bx - mx) + m2 * (ax - bx) + b2 * (mx - ax)) / d
+    radius = math.hypot(ax - cx, ay - cy)
+    ccw = (mx - ax) * (by - my) - (my - ay) * (bx - mx) > 0.
+    # max. step angle for a sagitta <= tolerance: radius * (1 - cos(angle / 2)) <= tolerance
+    max_step = 2. * math.acos(max(1. - tolerance / radius, -1.))
+    sweep = 0.
+    ux = ax - cx
+    uy = ay - cy
+    for index in range(start + 1, end + 1):
+        px, py = points[index]
+        vx = px - cx
+        vy = py - cy
+        if math.fabs(math.hypot(vx, vy) - radius) > tolerance:
+            return None
+        step = math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+        if not ccw:
+            step = -step
+        if step <= 0. or step > max_step:
+            return None  # wrong direction or sagitta of segment > tolerance
+        sweep += step
+        ux = vx
+        uy = vy
+    if sweep > MAX_SWEEP_ANGLE:
+        return None  # (nearly) full circle
+    bulge = math.tan(sweep * .25)
+    return bulge if ccw else -bulge
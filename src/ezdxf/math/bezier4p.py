@@ -2,18 +2,21 @@
 # Created: 26.03.2010
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
-from typing import List, TYPE_CHECKING, Iterable, Union, Sequence
+from typing import List, TYPE_CHECKING, Iterable, Union, Sequence, Tuple
 import math
+from array import array
 from functools import lru_cache
-from ezdxf.math import Vector, Vec2, tridiagonal_matrix_solver
+from ezdxf.math import Vector, Vec2, Vec3Array, linspace, tridiagonal_vector_solver
 from ezdxf.math.ellipse import ConstructionEllipse
+from ezdxf.math.flattening import adaptive_subdivision
+from ezdxf.math.vec3array import numpy
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
 
 __all__ = [
-    'Bezier4P', 'cubic_bezier_interpolation', 'cubic_bezier_arc_parameters', 'cubic_bezier_from_arc',
-    'cubic_bezier_from_ellipse', 'tangents_cubic_bezier_interpolation',
+    'Bezier4P', 'cubic_bezier_chain_approximation', 'cubic_bezier_interpolation', 'cubic_bezier_arc_parameters',
+    'cubic_bezier_from_arc', 'cubic_bezier_from_ellipse', 'tangents_cubic_bezier_interpolation',
 ]
 
 
@@ -39,6 +42,18 @@ def bernstein3(t: float) -> Sequence[float]:
     return a, b, c, d
 
 
+@lru_cache(maxsize=32)
+def bernstein3_table(segments: int) -> Tuple[Tuple[float, float, float, float], ...]:
+    """ Bernstein polynom of 3rd degree for `segments` + 1 evenly spaced parameters from 0 to 1, shared by
+    all Bézier-curves approximated by the same count of segments.
+    """
+    if segments < 1:
+        raise ValueError('segments has to be >= 1')
+    delta_t = 1. / segments
+    table = tuple(bernstein3.__wrapped__(delta_t * segment) for segment in range(segments))
+    return table + ((0., 0., 0., 1.),)  # exact end point
+
+
 @lru_cache(maxsize=128)
 def bernstein3_d1(t: float) -> Sequence[float]:
     """ First derivative of Bernstein polynom of 3rd degree. """
@@ -117,11 +132,42 @@ class Bezier4P:
             segments: count of segments for approximation
 
         """
-        delta_t = 1. / segments
-        yield self._control_points[0]
-        for segment in range(1, segments):
-            yield self._get_curve_point(delta_t * segment)
-        yield self._control_points[3]
+        table = bernstein3_table(segments)
+        p1, p2, p3, p4 = self._control_points
+        yield p1
+        if isinstance(p1, Vector):
+            x1, y1, z1 = p1.xyz
+            x2, y2, z2 = p2.xyz
+            x3, y3, z3 = p3.xyz
+            x4, y4, z4 = p4.xyz
+            for a, b, c, d in table[1:-1]:
+                yield Vector(
+                    x1 * a + x2 * b + x3 * c + x4 * d,
+                    y1 * a + y2 * b + y3 * c + y4 * d,
+                    z1 * a + z2 * b + z3 * c + z4 * d,
+                )
+        else:
+            for a, b, c, d in table[1:-1]:
+                yield Vec2(
+                    p1.x * a + p2.x * b + p3.x * c + p4.x * d,
+                    p1.y * a + p2.y * b + p3.y * c + p4.y * d,
+                )
+        yield p4
+
+    def flattening(self, distance: float, segments: int = 4) -> Iterable[Union[Vector, Vec2]]:
+        """ Adaptive flattening by iterative subdivision. The argument `segments` is the minimum count of
+        approximation segments, if the distance from the center of the approximation segment to the curve point
+        at the mid param is bigger than `distance` the segment will be subdivided.
+
+        Args:
+            distance: maximum distance from the center of the cubic (C3) curve to the center of the linear (C1)
+                curve between two approximation points to determine if a segment should be subdivided.
+            segments: minimum segment count
+
+        .. versionadded:: 0.14
+
+        """
+        return adaptive_subdivision(self._get_curve_point, list(linspace(0., 1., segments + 1)), distance)
 
     def _get_curve_point(self, t: float) -> Union[Vector, Vec2]:
         b1, b2, b3, b4 = self._control_points
@@ -148,6 +194,48 @@ class Bezier4P:
         return Bezier4P(list(reversed(self.control_points)))
 
 
+def cubic_bezier_chain_approximation(curves: Sequence[Bezier4P], segments: int) -> Vec3Array:
+    """
+    Returns the approximation vertices of a chain of connected cubic Bézier-curves as :class:`Vec3Array`, each
+    curve is approximated by `segments` line segments. The result are the start point of the first curve and
+    `segments` vertices for each curve, the start points of all following curves are skipped, because they
+    are the end points of the previous curves.
+
+    Uses :mod:`numpy` if installed to evaluate all curves at once.
+
+    Args:
+        curves: sequence of connected :class:`Bezier4P` curves
+        segments: count of segments for approximation of each curve
+
+    .. versionadded:: 0.14
+
+    """
+    table = bernstein3_table(segments)
+    if len(curves) == 0:
+        return Vec3Array()
+    if numpy is not None:
+        control_points = numpy.array(
+            [[Vector(p).xyz for p in curve.control_points] for curve in curves], dtype=numpy.float64)
+        coefficients = numpy.array(table[1:], dtype=numpy.float64)
+        # (segments, 4) x (curves, 4, 3) -> (curves, segments, 3)
+        vertices = numpy.einsum('sk,ckd->csd', coefficients, control_points).reshape(-1, 3)
+        return Vec3Array.from_numpy(numpy.concatenate((control_points[0, :1], vertices)))
+
+    values = array('d', Vector(curves[0].control_points[0]).xyz)
+    for curve in curves:
+        x1, y1, z1 = Vector(curve.control_points[0]).xyz
+        x2, y2, z2 = Vector(curve.control_points[1]).xyz
+        x3, y3, z3 = Vector(curve.control_points[2]).xyz
+        x4, y4, z4 = Vector(curve.control_points[3]).xyz
+        for a, b, c, d in table[1:]:
+            values.extend((
+                x1 * a + x2 * b + x3 * c + x4 * d,
+                y1 * a + y2 * b + y3 * c + y4 * d,
+                z1 * a + z2 * b + z3 * c + z4 * d,
+            ))
+    return Vec3Array.from_array(values)
+
+
 def cubic_bezier_from_arc(
         center: Vector = (0, 0), radius: float = 1, start_angle: float = 0, end_angle: float = 360,
         segments: int = 1) -> Iterable[Bezier4P]:
@@ -292,14 +380,14 @@ def cubic_bezier_interpolation(points: Iterable['Vertex']) -> Iterable[Bezier4P]
     b[num - 1] = 7.0
     a[num - 1] = 2.0
 
-    # setup right-hand side quantities
-    points_vector = [points[0] + 2.0 * points[1]]
-    points_vector.extend(2.0 * (2.0 * points[i] + points[i + 1]) for i in range(1, num - 1))
-    points_vector.append(8.0 * points[num - 1] + points[num])
-
-    # solve tri-diagonal linear equation system
-    solution = tridiagonal_matrix_solver((a, b, c), points_vector)
-    control_points_1 = Vector.list(solution.rows())
+    # setup right-hand side quantities and solve tri-diagonal linear equation system for each axis
+    axis = []
+    for p in zip(*points):
+        r = [p[0] + 2.0 * p[1]]
+        r.extend(2.0 * (2.0 * p[i] + p[i + 1]) for i in range(1, num - 1))
+        r.append(8.0 * p[num - 1] + p[num])
+        axis.append(tridiagonal_vector_solver((a, b, c), r))
+    control_points_1 = [Vector(x, y, z) for x, y, z in zip(*axis)]
     control_points_2 = [p * 2.0 - cp for p, cp in zip(points[1:], control_points_1[1:])]
     control_points_2.append((control_points_1[num - 1] + points[num]) / 2.0)
 
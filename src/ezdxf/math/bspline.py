@@ -17,16 +17,19 @@ https://www.cl.cam.ac.uk/teaching/2000/AGraphHCI/SMEG/node5.html:
 https://books.google.at/books/about/The_NURBS_Book.html?id=7dqY5dyAwWkC&redir_esc=y
 
 """
-from typing import List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional, Union
+from typing import List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional
 import math
 import bisect
+from functools import lru_cache
 from .vector import Vector, NULLVEC
 from .parametrize import create_t_vector, estimate_tangents, estimate_end_tangent_magnitude
 from .linalg import (
-    LUDecomposition, Matrix, BandedMatrixLU, compact_banded_matrix, detect_banded_matrix,
+    LUDecomposition, BandedMatrixLU,
     quadratic_equation, binomial_coefficient,
 )
 from .construct2d import linspace
+from .flattening import adaptive_subdivision
+from .vec3array import numpy
 from ezdxf.lldxf.const import DXFValueError
 from ezdxf import PYPY
 
@@ -448,26 +451,158 @@ def double_knots(n: int, p: int, t: Sequence[float]) -> List[float]:
     return u
 
 
-def _get_best_solver(matrix: Union[List, Matrix], degree: int):
-    """ Returns best suited linear equation solver depending on matrix
-    configuration and python interpreter.
+# Sparse matrix row: index of the first nonzero column and the nonzero values
+SparseRow = Tuple[int, List[float]]
+
+
+def _solve_sparse_rows(rows: List[SparseRow], B: Sequence['Vertex']) -> List[Vector]:
+    """ Solves the linear equation system A . x = B for the square matrix A given as sparse rows.
+
+    Small systems are solved by the default equation solver, big systems by the LU decomposition of the
+    compact banded matrix, which is build directly from the sparse rows without creating the dense matrix,
+    this requires O(n·bandwidth²) time and O(n·bandwidth) memory.
     """
-    A = matrix if isinstance(matrix, Matrix) else Matrix(matrix=matrix)
+    n = len(rows)
     if PYPY:
         limit = USE_BANDED_MATRIX_SOLVER_PYPY_LIMIT
     else:
         limit = USE_BANDED_MATRIX_SOLVER_CPYTHON_LIMIT
-    if A.nrows < limit:  # use default equation solver
-        lu = LUDecomposition(A)
+    if n < limit:  # use default equation solver
+        lu = LUDecomposition(_expand_sparse_rows(rows, n))
     else:
         # Theory: band parameters m1, m2 are at maximum degree-1, for
-        # B-spline interpolation and approximation:
-        # m1 = m2 = degree-1
-        # But the speed gain is not that big and just to be sure:
-        m1, m2 = detect_banded_matrix(A, check_all=False)
-        A = compact_banded_matrix(A, m1, m2)
+        # B-spline interpolation and approximation, but the tangent
+        # constraints can widen the band.
+        m1, m2, A = _compact_banded_sparse_rows(rows)
         lu = BandedMatrixLU(A, m1, m2)
-    return lu
+    return Vector.list(lu.solve_matrix(B).rows())
+
+
+def _expand_sparse_rows(rows: List[SparseRow], count: int) -> List[List[float]]:
+    matrix = []
+    for first, values in rows:
+        row = [0.0] * count
+        row[first:first + len(values)] = values
+        matrix.append(row)
+    return matrix
+
+
+def _compact_banded_sparse_rows(rows: List[SparseRow]) -> Tuple[int, int, List[List[float]]]:
+    # Returns the lower band count m1, the upper band count m2 and the
+    # compact banded matrix, see also linalg.compact_banded_matrix()
+    m1 = max(0, max(i - first for i, (first, _) in enumerate(rows)))
+    m2 = max(0, max(first + len(values) - 1 - i for i, (first, values) in enumerate(rows)))
+    width = m1 + m2 + 1
+    compact = []
+    for i, (first, values) in enumerate(rows):
+        row = [0.0] * width
+        start = first - i + m1
+        row[start:start + len(values)] = values
+        compact.append(row)
+    return m1, m2, compact
+
+
+def _collocation_rows(basis: 'Basis', t_vector: Sequence[float]) -> List[SparseRow]:
+    """ Returns the sparse rows of the collocation matrix of the non-rational `basis` for all parameters in
+    `t_vector`, each row has `order` nonzero values. Uses :mod:`numpy` if installed.
+    """
+    if numpy is not None and len(t_vector):
+        spans, funcs = _basis_funcs_numpy(basis, t_vector)
+        spans = spans.tolist()
+        funcs = funcs.tolist()
+    else:
+        spans = [basis.find_span(t) for t in t_vector]
+        funcs = [basis.basis_funcs(span, t) for span, t in zip(spans, t_vector)]
+    p = basis.order - 1
+    return [(span - p, values) for span, values in zip(spans, funcs)]
+
+
+def _basis_funcs_numpy(basis: 'Basis', t_vector: Sequence[float]):
+    # Returns the knot spans as (params, ) and the non-rational basis functions as (params, order) numpy arrays.
+    # Algorithm A2.2 from The NURBS Book, vectorized for all parameters.
+    p = basis.order - 1
+    knots, u, spans = _spans_numpy(basis, t_vector)
+    N = numpy.zeros((len(u), p + 1))
+    left = numpy.zeros((len(u), p + 1))
+    right = numpy.zeros((len(u), p + 1))
+    N[:, 0] = 1.0
+    for j in range(1, p + 1):
+        left[:, j] = u - knots[spans + 1 - j]
+        right[:, j] = knots[spans + j] - u
+        saved = numpy.zeros(len(u))
+        for r in range(j):
+            temp = N[:, r] / (right[:, r + 1] + left[:, j - r])
+            N[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        N[:, j] = saved
+    return spans, N
+
+
+def _basis_funcs_derivatives_numpy(basis: 'Basis', t_vector: Sequence[float], n: int):
+    # Returns the knot spans as (params, ) and the derivatives of the non-rational basis functions as
+    # (params, n + 1, order) numpy arrays. Algorithm A2.3 from The NURBS Book, vectorized for all parameters.
+    order = basis.order
+    p = order - 1
+    knots, u, spans = _spans_numpy(basis, t_vector)
+    size = len(u)
+    ndu = numpy.ones((size, order, order))
+    left = numpy.ones((size, order))
+    right = numpy.ones((size, order))
+    for j in range(1, order):
+        left[:, j] = u - knots[spans + 1 - j]
+        right[:, j] = knots[spans + j] - u
+        saved = numpy.zeros(size)
+        for r in range(j):
+            # lower triangle
+            ndu[:, j, r] = right[:, r + 1] + left[:, j - r]
+            temp = ndu[:, r, j - 1] / ndu[:, j, r]
+            # upper triangle
+            ndu[:, r, j] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        ndu[:, j, j] = saved
+
+    derivatives = numpy.zeros((size, n + 1, order))
+    derivatives[:, 0, :] = ndu[:, :, p]
+    for r in range(order):
+        a = numpy.ones((2, size, order))
+        s1 = 0
+        s2 = 1
+        for k in range(1, n + 1):
+            d = numpy.zeros(size)
+            rk = r - k
+            pk = p - k
+            if r >= k:
+                a[s2, :, 0] = a[s1, :, 0] / ndu[:, pk + 1, rk]
+                d = a[s2, :, 0] * ndu[:, rk, pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = k - 1 if (r - 1) <= pk else p - r
+            for j in range(j1, j2 + 1):
+                a[s2, :, j] = (a[s1, :, j] - a[s1, :, j - 1]) / ndu[:, pk + 1, rk + j]
+                d += a[s2, :, j] * ndu[:, rk + j, pk]
+            if r <= pk:
+                a[s2, :, k] = -a[s1, :, k - 1] / ndu[:, pk + 1, r]
+                d += a[s2, :, k] * ndu[:, r, pk]
+            derivatives[:, k, r] = d
+            s1, s2 = s2, s1
+
+    # Multiply through by the the correct factors
+    r = float(p)
+    for k in range(1, n + 1):
+        derivatives[:, k, :] *= r
+        r *= (p - k)
+    return spans, derivatives
+
+
+def _spans_numpy(basis: 'Basis', t_vector: Sequence[float]):
+    # Span detection by binary search for clamped knot vectors and parameters
+    # in range [knots[p], max_t], like the standard interpolation functions create.
+    p = basis.order - 1
+    count = basis.count
+    knots = numpy.array(basis.knots, dtype=numpy.float64)
+    u = numpy.array(t_vector, dtype=numpy.float64)
+    spans = numpy.searchsorted(knots[:count], u, side='right') - 1
+    numpy.clip(spans, p, count - 1, out=spans)
+    return knots, u, spans
 
 
 def unconstrained_global_bspline_interpolation(
@@ -494,9 +629,8 @@ def unconstrained_global_bspline_interpolation(
     # Source: http://pages.mtu.edu/~shene/COURSES/cs3621/NOTES/INT-APP/CURVE-INT-global.html
     knots = knots_from_parametrization(len(fit_points) - 1, degree, t_vector, knot_generation_method, constrained=False)
     N = Basis(knots=knots, order=degree + 1, count=len(fit_points))
-    solver = _get_best_solver([N.basis_vector(t) for t in t_vector], degree)
-    control_points = solver.solve_matrix(fit_points)
-    return Vector.list(control_points.rows()), knots
+    control_points = _solve_sparse_rows(_collocation_rows(N, t_vector), fit_points)
+    return control_points, knots
 
 
 def global_bspline_interpolation_end_tangents(
@@ -534,16 +668,12 @@ def global_bspline_interpolation_end_tangents(
     knots = knots_from_parametrization(n + 2, p, t_vector, knot_generation_method, constrained=True)
 
     N = Basis(knots=knots, order=p + 1, count=n + 3)
-    rows = [N.basis_vector(u) for u in t_vector]
-    spacing = [0.0] * (n + 1)
-    rows.insert(1, [-1.0, +1.0] + spacing)
-    rows.insert(-1, spacing + [-1.0, +1.0])
+    rows = _collocation_rows(N, t_vector)
+    rows.insert(1, (0, [-1.0, +1.0]))
+    rows.insert(-1, (n + 1, [-1.0, +1.0]))
     fit_points.insert(1, start_tangent * (knots[p + 1] / p))
     fit_points.insert(-1, end_tangent * ((1.0 - knots[-(p + 2)]) / p))
-
-    solver = _get_best_solver(rows, degree)
-    control_points = solver.solve_matrix(fit_points)
-    return Vector.list(control_points.rows()), knots
+    return _solve_sparse_rows(rows, fit_points), knots
 
 
 def global_bspline_interpolation_first_derivatives(
@@ -571,10 +701,8 @@ def global_bspline_interpolation_first_derivatives(
 
     def nbasis(t: float):
         span = N.find_span(t)
-        front = span - p
-        back = count + p + 1 - span
         for basis in N.basis_funcs_derivatives(span, t, n=1):
-            yield [0.0] * front + basis + [0.0] * back
+            yield span - p, basis
 
     p = degree
     n = len(fit_points) - 1
@@ -582,14 +710,14 @@ def global_bspline_interpolation_first_derivatives(
     count = len(fit_points) * 2
     N = Basis(knots=knots, order=p + 1, count=count)
     A = [
-        [1.0] + [0.0] * (count - 1),  # Q0
-        [-1.0, +1.0] + [0.0] * (count - 2),  # D0
+        (0, [1.0]),  # Q0
+        (0, [-1.0, +1.0]),  # D0
     ]
     for f in (nbasis(t) for t in t_vector[1:-1]):
         A.extend(f)  # Qi, Di
     # swapped equations!
-    A.append([0.0] * (count - 2) + [-1.0, +1.0])  # Dn
-    A.append([0.0] * (count - 1) + [+1.0])  # Qn
+    A.append((count - 2, [-1.0, +1.0]))  # Dn
+    A.append((count - 1, [+1.0]))  # Qn
 
     # Build right handed matrix B
     B = []
@@ -602,9 +730,7 @@ def global_bspline_interpolation_first_derivatives(
     # modify equation for derivatives D0 and Dn
     B[1] *= knots[p + 1] / p
     B[-2] *= (1.0 - knots[-(p + 2)]) / p
-    solver = _get_best_solver(A, degree)
-    control_points = solver.solve_matrix(B)
-    return Vector.list(control_points.rows()), knots
+    return _solve_sparse_rows(A, B), knots
 
 
 def local_cubic_bspline_interpolation_from_tangents(
@@ -813,10 +939,15 @@ class Basis:
         return sum(N[i] * control_points[span - p + i] for i in range(p + 1))
 
     def curve_derivatives(self, u: float, control_points: Sequence[Vector], n: int = 1) -> List[Vector]:
-        # Source: The NURBS Book: Algorithm A3.2
-        p = self.order - 1
         span = self.find_span(u)
         basis_funcs_derivatives = self.basis_funcs_derivatives(span, u, n)
+        return self._curve_derivatives(span, basis_funcs_derivatives, control_points, n)
+
+    def _curve_derivatives(self, span: int, basis_funcs_derivatives: List[List[float]],
+                           control_points: Sequence[Vector], n: int) -> List[Vector]:
+        # Source: The NURBS Book: Algorithm A3.2
+        p = self.order - 1
+        n = min(n, p)
         if self.is_rational:
             # Homogeneous point representation required:
             # (x*w, y*w, z*w, w)
@@ -849,6 +980,119 @@ class Basis:
             ]
         return CK
 
+    def _batch_key(self, t: Iterable[float]) -> Tuple:
+        max_t = self.max_t
+        params = tuple(max_t if math.isclose(u, max_t) else u for u in t)
+        weights = tuple(self.weights) if self.is_rational else None
+        return tuple(self.knots), self.order, self.count, weights, params
+
+    def basis_funcs_batch(self, t: Iterable[float]) -> Tuple[List[int], List[List[float]]]:
+        """ Returns the knot spans and the basis functions for all parameters `t`. The result is cached and shared
+        by all B-splines with the same knot vector, order, count of control points and weights.
+        """
+        return _basis_funcs_batch(*self._batch_key(t))
+
+    def curve_points(self, t: Iterable[float], control_points: Sequence[Vector]) -> List[Vector]:
+        """ Returns the curve points for all parameters `t` as list of :class:`Vector` objects. Uses :mod:`numpy`
+        for clamped non-rational B-splines if installed, else the basis functions are cached and shared by all
+        B-splines with the same knot vector, order, count of control points and weights.
+        """
+        key = self._batch_key(t)
+        if len(key[-1]) == 0:
+            return []
+        if numpy is not None and not self.is_rational and self.knots[self.order - 1] == 0.0:
+            # Vectorized evaluation of the compact basis functions for clamped B-splines, the same span
+            # detection by binary search as find_span(), the basis functions are not cached.
+            spans, basis_funcs = _basis_funcs_numpy(self, key[-1])
+            # (params, order, 3) control points weighted by the (params, order) basis functions
+            points = _gather_control_points(spans, basis_funcs, self.order, control_points).sum(axis=1)
+            return [Vector(point) for point in points.tolist()]
+
+        spans, basis_funcs = _basis_funcs_batch(*key)
+        p = self.order - 1
+        xs, ys, zs = zip(*control_points)
+        points = []
+        for span, funcs in zip(spans, basis_funcs):
+            start = span - p
+            x = y = z = 0.
+            for index, f in enumerate(funcs, start):
+                x += xs[index] * f
+                y += ys[index] * f
+                z += zs[index] * f
+            points.append(Vector(x, y, z))
+        return points
+
+    def curve_derivatives_batch(self, t: Iterable[float], control_points: Sequence[Vector],
+                                n: int = 1) -> List[List[Vector]]:
+        """ Returns the curve points and the derivatives up to `n` for all parameters `t`. Uses :mod:`numpy`
+        for clamped non-rational B-splines if installed, else the basis function derivatives are cached and shared
+        by all B-splines with the same knot vector, order and count of control points.
+        """
+        knots, order, count, weights, params = self._batch_key(t)
+        if len(params) == 0:
+            return []
+        n = min(n, order - 1)
+        if numpy is not None and not self.is_rational and knots[order - 1] == 0.0:
+            # vectorized evaluation for clamped B-splines like curve_points(), not cached
+            spans, basis_funcs_derivatives = _basis_funcs_derivatives_numpy(self, params, n)
+            # (params, n + 1, order, 3) control points weighted by the (params, n + 1, order) basis functions
+            derivatives = _gather_control_points(spans, basis_funcs_derivatives, order, control_points).sum(axis=2)
+            return [[Vector(d) for d in vectors] for vectors in derivatives.tolist()]
+
+        spans, basis_funcs_derivatives = _basis_funcs_derivatives_batch(knots, order, count, params, n)
+        if self.is_rational:
+            return [
+                self._curve_derivatives(span, derivatives, control_points, n)
+                for span, derivatives in zip(spans, basis_funcs_derivatives)
+            ]
+
+        p = order - 1
+        xs, ys, zs = zip(*control_points)
+        result = []
+        for span, derivatives in zip(spans, basis_funcs_derivatives):
+            start = span - p
+            vectors = []
+            for funcs in derivatives:
+                x = y = z = 0.
+                for index, f in enumerate(funcs, start):
+                    x += xs[index] * f
+                    y += ys[index] * f
+                    z += zs[index] * f
+                vectors.append(Vector(x, y, z))
+            result.append(vectors)
+        return result
+
+
+# The caches store the basis functions of parameter vectors for knot vectors, the key is the content of
+# the knot vector, order, count of control points, weights and the parameter vector.
+# B-splines with identical knot vectors, e.g. all open uniform B-splines with the same count of control points,
+# share the cached results.
+@lru_cache(maxsize=32)
+def _basis_funcs_batch(knots: Tuple[float, ...], order: int, count: int, weights: Optional[Tuple[float, ...]],
+                       params: Tuple[float, ...]) -> Tuple[List[int], List[List[float]]]:
+    basis = Basis(knots, order, count, weights)
+    spans = [basis.find_span(u) for u in params]
+    return spans, [basis.basis_funcs(span, u) for span, u in zip(spans, params)]
+
+
+@lru_cache(maxsize=32)
+def _basis_funcs_derivatives_batch(knots: Tuple[float, ...], order: int, count: int, params: Tuple[float, ...],
+                                   n: int) -> Tuple[List[int], List[List[List[float]]]]:
+    basis = Basis(knots, order, count)
+    spans = [basis.find_span(u) for u in params]
+    return spans, [basis.basis_funcs_derivatives(span, u, n) for span, u in zip(spans, params)]
+
+
+def _gather_control_points(spans: List[int], basis_funcs: List, order: int, control_points: Sequence[Vector]):
+    # Returns the control points of the knot span of each parameter weighted by the compact basis functions,
+    # the basis functions have the shape (params, order) or (params, n + 1, order) for derivatives.
+    funcs = numpy.asarray(basis_funcs, dtype=numpy.float64)
+    indices = numpy.asarray(spans)[:, numpy.newaxis] - (order - 1) + numpy.arange(order)  # (params, order)
+    points = numpy.array(control_points, dtype=numpy.float64)[indices]  # (params, order, 3)
+    if funcs.ndim == 3:
+        points = points[:, numpy.newaxis, :, :]
+    return funcs[..., numpy.newaxis] * points
+
 
 class BSpline:
     """
@@ -992,6 +1236,23 @@ class BSpline:
         """ Approximates curve by vertices as :class:`Vector` objects, vertices count = segments + 1. """
         yield from self.points(self.params(segments))
 
+    def flattening(self, distance: float, segments: int = 4) -> Iterable[Vector]:
+        """ Adaptive flattening by iterative subdivision. The argument `segments` is the minimum count of
+        approximation segments for each span between two knots, if the distance from the center of the
+        approximation segment to the curve point at the mid param is bigger than `distance` the segment will be
+        subdivided.
+
+        Args:
+            distance: maximum distance from the center of the curve to the center of the line segment between two
+                approximation points to determine if a segment should be subdivided.
+            segments: minimum segment count per span
+
+        .. versionadded:: 0.14
+
+        """
+        spans = max(self.count - self.order + 1, 1)
+        return adaptive_subdivision(self.point, list(self.params(segments * spans)), distance)
+
     def params(self, segments: int) -> Iterable[float]:
         """ Yield evenly spaced parameters from 0 to max_t for given segment count. """
         return linspace(0, self.max_t, segments + 1)
@@ -1016,8 +1277,7 @@ class BSpline:
             t: parameters in range [0, max_t]
 
         """
-        for u in t:
-            yield self.point(u)
+        yield from self.basis.curve_points(t, self.control_points)
 
     def derivative(self, t: float, n: int = 2) -> List[Vector]:
         """
@@ -1051,8 +1311,7 @@ class BSpline:
             List of n+1 values as :class:`Vector` objects
 
         """
-        for u in t:
-            yield self.derivative(u, n)
+        yield from self.basis.curve_derivatives_batch(t, self.control_points, n)
 
     def insert_knot(self, t: float) -> None:
         """
@@ -0,0 +1,475 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple, Optional
+from .vector import Vec2
+from .construct2d import is_point_in_polygon_2d
+from .vec3array import numpy, USE_NUMPY_LIMIT
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = [
+    'clip_polygon_2d', 'clip_polygons_2d', 'clip_segments_to_rect_2d', 'clip_polylines_to_rect_2d',
+    'greiner_hormann_intersection', 'greiner_hormann_union', 'greiner_hormann_difference', 'clip_polygons_general_2d',
+]
+
+
+Point = Tuple[float, float]
+Line = Tuple[float, float, float, float]  # x1, y1, x2, y2
+# index of line, start param, end param, x1, y1, x2, y2 of the clipped line
+ClippedLine = Tuple[int, float, float, float, float, float, float]
+BBox = Tuple[float, float, float, float]  # min_x, min_y, max_x, max_y
+
+
+def clip_polygon_2d(clipper: Iterable['Vertex'], subject: Iterable['Vertex']) -> List[Vec2]:
+    """
+    Returns the part of polygon `subject` inside of the **convex** polygon `clipper` as list of :class:`Vec2`,
+    the result is an empty list if `subject` is outside of `clipper`. Both polygons are located in the xy-plane,
+    the z-axis is ignored, the vertex order (clockwise or counter clockwise) does not matter and an explicit
+    closing vertex is not required.
+
+    This is the Sutherland-Hodgman algorithm, a concave `subject` polygon, which is split into multiple parts by
+    `clipper` returns a single polygon with connecting edges on the border of `clipper`.
+
+    Args:
+        clipper: convex clipping polygon, at least 3 vertices
+        subject: polygon to clip
+
+    Raises:
+        ValueError: less than 3 clipper vertices
+
+    .. versionadded:: 0.14
+
+    """
+    edges = _convex_clipping_edges(clipper)
+    return [Vec2(p) for p in _sutherland_hodgman(edges, _points(subject))]
+
+
+def clip_polygons_2d(clipper: Iterable['Vertex'], subjects: Iterable[Iterable['Vertex']]) -> List[List[Vec2]]:
+    """
+    Batch version of :func:`clip_polygon_2d`, returns the clipped polygons for all `subjects` in the same order as
+    the input, polygons outside of the bounding box of `clipper` are rejected without further tests.
+
+    Args:
+        clipper: convex clipping polygon, at least 3 vertices
+        subjects: iterable of polygons to clip
+
+    .. versionadded:: 0.14
+
+    """
+    edges = _convex_clipping_edges(clipper)
+    bbox = _bbox([(x, y) for x, y, _, _ in edges])
+    result = []
+    for subject in subjects:
+        points = _points(subject)
+        if points and _overlap(bbox, _bbox(points)):
+            result.append([Vec2(p) for p in _sutherland_hodgman(edges, points)])
+        else:
+            result.append([])
+    return result
+
+
+def _points(vertices: Iterable['Vertex']) -> List[Point]:
+    points = [(v.x, v.y) for v in Vec2.generate(vertices)]
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()  # remove explicit closing vertex
+    return points
+
+
+def _bbox(points: Sequence[Point]) -> BBox:
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _overlap(bbox1: BBox, bbox2: BBox) -> bool:
+    return not (bbox1[0] > bbox2[2] or bbox2[0] > bbox1[2] or bbox1[1] > bbox2[3] or bbox2[1] > bbox1[3])
+
+
+def _signed_area(points: Sequence[Point]) -> float:
+    # shoelace formula, > 0 for counter clockwise orientation
+    return sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])) * .5
+
+
+def _convex_clipping_edges(clipper: Iterable['Vertex']) -> List[Line]:
+    points = _points(clipper)
+    if len(points) < 3:
+        raise ValueError('At least 3 clipper vertices required.')
+    if _signed_area(points) < 0.:
+        points.reverse()  # counter clockwise orientation, inside is left of the clipping edges
+    return [(x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])]
+
+
+def _sutherland_hodgman(edges: List[Line], points: List[Point]) -> List[Point]:
+    bbox = None
+    for ax, ay, bx, by in edges:
+        if not points:
+            break
+        ex = bx - ax
+        ey = by - ay
+        # fast check by the corners of the bounding box of the polygon
+        if bbox is None:
+            bbox = _bbox(points)
+        min_x, min_y, max_x, max_y = bbox
+        inside = 0
+        for x, y in ((min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)):
+            if ex * (y - ay) - ey * (x - ax) >= 0.:
+                inside += 1
+        if inside == 4:
+            continue
+        if inside == 0:
+            return []
+        bbox = None
+        result = []
+        prev_x, prev_y = points[-1]
+        prev_side = ex * (prev_y - ay) - ey * (prev_x - ax)
+        for x, y in points:
+            side = ex * (y - ay) - ey * (x - ax)
+            # add intersection points only for edges crossing the clipping edge, a vertex on the
+            # clipping edge is inside
+            if side >= 0.:
+                if prev_side < 0. < side:
+                    t = prev_side / (prev_side - side)
+                    result.append((prev_x + (x - prev_x) * t, prev_y + (y - prev_y) * t))
+                result.append((x, y))
+            elif prev_side > 0.:
+                t = prev_side / (prev_side - side)
+                result.append((prev_x + (x - prev_x) * t, prev_y + (y - prev_y) * t))
+            prev_x = x
+            prev_y = y
+            prev_side = side
+        points = result
+    return points
+
+
+def clip_segments_to_rect_2d(segments: Iterable[Sequence['Vertex']], rect_min: 'Vertex',
+                             rect_max: 'Vertex') -> List[Tuple[int, Vec2, Vec2]]:
+    """
+    Clips the 2D line `segments` to an axis aligned rectangle by the Liang-Barsky algorithm, returns the
+    segments inside of the rectangle as list of ``(index, start, end)`` tuples, where `index` is the index of the
+    segment in the input sequence and `start` and `end` are the clipped segment vertices as :class:`Vec2`.
+    Segments outside of the rectangle are not in the result. Uses `numpy` for clipping many segments if installed.
+
+    Args:
+        segments: iterable of line segments as ``(start, end)`` tuples of :class:`Vec2` compatible objects,
+            the z-axis is ignored
+        rect_min: lower left corner of the clipping rectangle
+        rect_max: upper right corner of the clipping rectangle
+
+    .. versionadded:: 0.14
+
+    """
+    lines = []
+    for start, end in segments:
+        start = Vec2(start)
+        end = Vec2(end)
+        lines.append((start.x, start.y, end.x, end.y))
+    return [
+        (index, Vec2((x1, y1)), Vec2((x2, y2)))
+        for index, _, _, x1, y1, x2, y2 in _clip_lines(lines, rect_min, rect_max)
+    ]
+
+
+def clip_polylines_to_rect_2d(polylines: Iterable[Iterable['Vertex']], rect_min: 'Vertex',
+                              rect_max: 'Vertex') -> List[Tuple[int, List[Vec2]]]:
+    """
+    Clips 2D `polylines` to an axis aligned rectangle, returns the parts inside of the rectangle as list of
+    ``(index, vertices)`` tuples, where `index` is the index of the polyline in the input sequence and `vertices`
+    is a list of :class:`Vec2`. A polyline which leaves and reenters the rectangle returns multiple parts.
+    All segments of all polylines are clipped at once by :func:`clip_segments_to_rect_2d`.
+
+    Args:
+        polylines: iterable of polylines, each polyline as iterable of :class:`Vec2` compatible vertices
+        rect_min: lower left corner of the clipping rectangle
+        rect_max: upper right corner of the clipping rectangle
+
+    .. versionadded:: 0.14
+
+    """
+    lines = []
+    locations = []  # polyline index, segment index
+    for polyline_index, polyline in enumerate(polylines):
+        points = [(v.x, v.y) for v in Vec2.generate(polyline)]
+        for segment_index, ((x1, y1), (x2, y2)) in enumerate(zip(points, points[1:])):
+            lines.append((x1, y1, x2, y2))
+            locations.append((polyline_index, segment_index))
+
+    result = []
+    prev_location = (-1, -1)
+    prev_t1 = 0.
+    for index, t0, t1, x1, y1, x2, y2 in _clip_lines(lines, rect_min, rect_max):
+        polyline_index, segment_index = locations[index]
+        if t0 == 0. and prev_t1 == 1. and prev_location == (polyline_index, segment_index - 1):
+            result[-1][1].append(Vec2((x2, y2)))  # continue polyline part
+        else:
+            result.append((polyline_index, [Vec2((x1, y1)), Vec2((x2, y2))]))
+        prev_location = (polyline_index, segment_index)
+        prev_t1 = t1
+    return result
+
+
+def _clip_lines(lines: List[Line], rect_min: 'Vertex', rect_max: 'Vertex') -> List[ClippedLine]:
+    min_x, min_y = Vec2(rect_min)
+    max_x, max_y = Vec2(rect_max)
+    rect = (min(min_x, max_x), min(min_y, max_y), max(min_x, max_x), max(min_y, max_y))
+    if numpy is not None and len(lines) > USE_NUMPY_LIMIT:
+        return _liang_barsky_numpy(lines, rect)
+    return _liang_barsky(lines, rect)
+
+
+def _liang_barsky(lines: List[Line], rect: BBox) -> List[ClippedLine]:
+    min_x, min_y, max_x, max_y = rect
+    result = []
+    for index, (x1, y1, x2, y2) in enumerate(lines):
+        dx = x2 - x1
+        dy = y2 - y1
+        t0 = 0.
+        t1 = 1.
+        for p, q in ((-dx, x1 - min_x), (dx, max_x - x1), (-dy, y1 - min_y), (dy, max_y - y1)):
+            if p == 0.:
+                if q < 0.:  # parallel and outside of clipping edge
+                    break
+            elif p < 0.:
+                r = q / p
+                if r > t1:
+                    break
+                if r > t0:
+                    t0 = r
+            else:
+                r = q / p
+                if r < t0:
+                    break
+                if r < t1:
+                    t1 = r
+        else:
+            result.append((index, t0, t1, x1 + dx * t0, y1 + dy * t0, x1 + dx * t1, y1 + dy * t1))
+    return result
+
+
+def _liang_barsky_numpy(lines: List[Line], rect: BBox) -> List[ClippedLine]:
+    min_x, min_y, max_x, max_y = rect
+    x1, y1, x2, y2 = numpy.array(lines, dtype=float).reshape((-1, 4)).T
+    dx = x2 - x1
+    dy = y2 - y1
+    p = numpy.stack((-dx, dx, -dy, dy))
+    q = numpy.stack((x1 - min_x, max_x - x1, y1 - min_y, max_y - y1))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        r = q / p
+    t0 = numpy.max(numpy.where(p < 0., r, 0.), axis=0)
+    t1 = numpy.min(numpy.where(p > 0., r, 1.), axis=0)
+    inside = (t0 <= t1) & ~numpy.any((p == 0.) & (q < 0.), axis=0)
+    indices = numpy.nonzero(inside)[0]
+    t0 = t0[indices]
+    t1 = t1[indices]
+    x1 = x1[indices]
+    y1 = y1[indices]
+    dx = dx[indices]
+    dy = dy[indices]
+    clipped = numpy.stack((t0, t1, x1 + dx * t0, y1 + dy * t0, x1 + dx * t1, y1 + dy * t1), axis=1)
+    return [(index, *values) for index, values in zip(indices.tolist(), clipped.tolist())]
+
+
+def greiner_hormann_intersection(p1: Iterable['Vertex'], p2: Iterable['Vertex']) -> List[List[Vec2]]:
+    """
+    Returns the intersection of the polygons `p1` and `p2` as list of polygons, each polygon as list of
+    :class:`Vec2`. Both polygons are located in the xy-plane, the z-axis is ignored, can be convex or concave
+    and an explicit closing vertex is not required.
+
+    This is the Greiner-Hormann algorithm, which does not handle degenerated cases, like a vertex of one
+    polygon located on an edge of the other polygon or overlapping edges.
+
+    Args:
+        p1: first polygon, at least 3 vertices
+        p2: second polygon, at least 3 vertices
+
+    .. versionadded:: 0.14
+
+    """
+    return _greiner_hormann(p1, p2, False, False)
+
+
+def greiner_hormann_union(p1: Iterable['Vertex'], p2: Iterable['Vertex']) -> List[List[Vec2]]:
+    """
+    Returns the union of the polygons `p1` and `p2` as list of polygons, see
+    :func:`greiner_hormann_intersection`.
+
+    .. versionadded:: 0.14
+
+    """
+    return _greiner_hormann(p1, p2, True, True)
+
+
+def greiner_hormann_difference(p1: Iterable['Vertex'], p2: Iterable['Vertex']) -> List[List[Vec2]]:
+    """
+    Returns the difference of the polygons `p1` - `p2` as list of polygons, see
+    :func:`greiner_hormann_intersection`. A polygon `p2` completely inside of `p1` returns `p1` and `p2` as hole.
+
+    .. versionadded:: 0.14
+
+    """
+    return _greiner_hormann(p1, p2, True, False)
+
+
+def clip_polygons_general_2d(clipper: Iterable['Vertex'],
+                             subjects: Iterable[Iterable['Vertex']]) -> List[List[List[Vec2]]]:
+    """
+    Batch version of :func:`greiner_hormann_intersection`, returns the intersections of all `subjects` with the
+    convex or concave polygon `clipper` in the same order as the input, each intersection as list of polygons.
+    Polygons outside of the bounding box of `clipper` are rejected without further tests.
+
+    Args:
+        clipper: clipping polygon, at least 3 vertices
+        subjects: iterable of polygons to clip
+
+    .. versionadded:: 0.14
+
+    """
+    clipper = _points(clipper)
+    bbox = _bbox(clipper)
+    result = []
+    for subject in subjects:
+        subject = _points(subject)
+        if subject and _overlap(bbox, _bbox(subject)):
+            result.append(_greiner_hormann(subject, clipper, False, False))
+        else:
+            result.append([])
+    return result
+
+
+class _Node:
+    __slots__ = ('x', 'y', 'alpha', 'intersection', 'entry', 'checked', 'neighbor', 'next', 'prev')
+
+    def __init__(self, x: float, y: float, alpha: float = 0., intersection: bool = False):
+        self.x = x
+        self.y = y
+        self.alpha = alpha
+        self.intersection = intersection
+        self.entry = True
+        self.checked = False
+        self.neighbor: Optional[_Node] = None
+        self.next: Optional[_Node] = None
+        self.prev: Optional[_Node] = None
+
+
+def _ring(points: List[Point]) -> List[_Node]:
+    # Returns the polygon vertices as circular doubly linked list
+    nodes = [_Node(x, y) for x, y in points]
+    for prev, node in zip(nodes, nodes[1:] + nodes[:1]):
+        prev.next = node
+        node.prev = prev
+    return nodes
+
+
+def _insert(node: _Node, start: _Node, end: _Node) -> None:
+    # insert intersection node between the polygon vertices start and end, sorted by alpha
+    current = start.next
+    while current is not end and current.alpha < node.alpha:
+        current = current.next
+    node.next = current
+    node.prev = current.prev
+    current.prev.next = node
+    current.prev = node
+
+
+def _greiner_hormann(p1: Iterable['Vertex'], p2: Iterable['Vertex'], reverse1: bool, reverse2: bool) -> List[
+    List[Vec2]]:
+    points1 = _points(p1)
+    points2 = _points(p2)
+    if len(points1) < 3 or len(points2) < 3:
+        raise ValueError('At least 3 polygon vertices required.')
+    ring1 = _ring(points1)
+    ring2 = _ring(points2)
+
+    # Phase 1: insert intersection nodes into both polygons
+    has_intersections = False
+    for s1, e1 in zip(ring1, ring1[1:] + ring1[:1]):
+        x1, y1, x2, y2 = s1.x, s1.y, e1.x, e1.y
+        dx1 = x2 - x1
+        dy1 = y2 - y1
+        for s2, e2 in zip(ring2, ring2[1:] + ring2[:1]):
+            x3, y3 = s2.x, s2.y
+            dx2 = e2.x - x3
+            dy2 = e2.y - y3
+            d = dx1 * dy2 - dy1 * dx2
+            if d == 0.:
+                continue  # parallel edges
+            alpha1 = ((x3 - x1) * dy2 - (y3 - y1) * dx2) / d
+            alpha2 = ((x3 - x1) * dy1 - (y3 - y1) * dx1) / d
+            if 0. < alpha1 < 1. and 0. < alpha2 < 1.:
+                x = x1 + dx1 * alpha1
+                y = y1 + dy1 * alpha1
+                node1 = _Node(x, y, alpha1, True)
+                node2 = _Node(x, y, alpha2, True)
+                node1.neighbor = node2
+                node2.neighbor = node1
+                _insert(node1, s1, e1)
+                _insert(node2, s2, e2)
+                has_intersections = True
+
+    vertices1 = Vec2.list(points1)
+    vertices2 = Vec2.list(points2)
+    if not has_intersections:
+        return _contained(vertices1, vertices2, reverse1, reverse2)
+
+    # Phase 2: mark intersections as entry or exit points
+    for ring, other, reverse in ((ring1, vertices2, reverse1), (ring2, vertices1, reverse2)):
+        entry = (is_point_in_polygon_2d(Vec2(ring[0].x, ring[0].y), other) < 0) != reverse
+        node = ring[0]
+        while True:
+            if node.intersection:
+                node.entry = entry
+                entry = not entry
+            node = node.next
+            if node is ring[0]:
+                break
+
+    # Phase 3: build result polygons
+    result = []
+    start = ring1[0]
+    while True:
+        while not start.intersection or start.checked:
+            start = start.next
+            if start is ring1[0]:
+                return result
+        current = start
+        polygon = [Vec2(current.x, current.y)]
+        while True:
+            current.checked = True
+            current.neighbor.checked = True
+            if current.entry:
+                while True:
+                    current = current.next
+                    polygon.append(Vec2(current.x, current.y))
+                    if current.intersection:
+                        break
+            else:
+                while True:
+                    current = current.prev
+                    polygon.append(Vec2(current.x, current.y))
+                    if current.intersection:
+                        break
+            current = current.neighbor
+            if current.checked:
+                break
+        if len(polygon) > 1 and polygon[0].isclose(polygon[-1]):
+            polygon.pop()
+        result.append(polygon)
+
+
+def _contained(vertices1: List[Vec2], vertices2: List[Vec2], reverse1: bool, reverse2: bool) -> List[List[Vec2]]:
+    # polygons without intersecting edges
+    inside1 = is_point_in_polygon_2d(vertices1[0], vertices2) >= 0
+    inside2 = is_point_in_polygon_2d(vertices2[0], vertices1) >= 0
+    if not reverse1:  # intersection
+        if inside1:
+            return [vertices1]
+        return [vertices2] if inside2 else []
+    if reverse2:  # union
+        if inside1:
+            return [vertices2]
+        return [vertices1] if inside2 else [vertices1, vertices2]
+    # difference
+    if inside1:
+        return []
+    return [vertices1, vertices2] if inside2 else [vertices1]
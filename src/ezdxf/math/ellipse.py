@@ -4,8 +4,9 @@ from typing import TYPE_CHECKING, Iterable, Dict, Tuple
 import math
 from .vector import Vector, NULLVEC, X_AXIS, Z_AXIS
 from .matrix44 import Matrix44
-from .ucs import OCS
+from .ucs import get_ocs
 from .construct2d import enclosing_angles, linspace
+from .flattening import adaptive_subdivision
 
 pi2 = math.pi / 2
 
@@ -67,7 +68,7 @@ class ConstructionEllipse:
         if NULLVEC.isclose(extrusion):
             raise ValueError(f'Invalid extrusion: {str(extrusion)}')
         ratio = 1.0
-        ocs = OCS(extrusion)
+        ocs = get_ocs(extrusion)
         center = ocs.to_wcs(center)
         # Major axis along the OCS x-axis.
         major_axis = ocs.to_wcs(Vector(radius, 0, 0))
@@ -238,6 +239,35 @@ class ConstructionEllipse:
             y = math.sin(param) * radius_y * y_axis
             yield center + x + y
 
+    def flattening(self, distance: float, segments: int = 4) -> Iterable[Vector]:
+        """ Adaptive flattening by iterative subdivision. The argument `segments` is the minimum count of
+        approximation segments, if the distance from the center of the approximation segment to the curve point
+        at the mid param is bigger than `distance` the segment will be subdivided.
+
+        Args:
+            distance: maximum distance from the curve point at the mid param to the center of the chord between
+                two approximation points to determine if a segment should be subdivided.
+            segments: minimum segment count
+
+        .. versionadded:: 0.14
+
+        """
+        center = self.center
+        radius_x = self.major_axis.magnitude
+        x_axis = self.major_axis.normalize(radius_x)
+        y_axis = self.minor_axis.normalize(radius_x * self.ratio)
+        cos = math.cos
+        sin = math.sin
+
+        def vertex(param: float) -> Vector:
+            return center + x_axis * cos(param) + y_axis * sin(param)
+
+        start = self.start_param
+        end = self.end_param
+        if end <= start:
+            end += math.tau
+        return adaptive_subdivision(vertex, list(linspace(start, end, segments + 1)), distance)
+
     def params_from_vertices(self, vertices: Iterable['Vertex']) -> Iterable[float]:
         """
         Yields ellipse params for all given `vertices`.
@@ -315,7 +345,7 @@ class ConstructionEllipse:
         OCS elevation is stored in :attr:`center.z`.
 
         """
-        ocs = OCS(self.extrusion)
+        ocs = get_ocs(self.extrusion)
         return self.__class__(
             center=ocs.from_wcs(self.center),
             major_axis=ocs.from_wcs(self.major_axis).replace(z=0),
@@ -0,0 +1,47 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import Callable, Sequence, Iterable, TypeVar
+
+__all__ = ['adaptive_subdivision']
+
+T = TypeVar('T')  # Vector or Vec2
+
+# Max. subdivision depth of one initial segment, 2^16 vertices per initial segment
+MAX_LEVEL = 16
+
+
+def adaptive_subdivision(point: Callable[[float], T], params: Sequence[float], distance: float) -> Iterable[T]:
+    """ Yields curve vertices, where the max. distance between the curve and the chord of two consecutive
+    vertices is smaller than `distance`.
+
+    Each segment between two consecutive `params` is subdivided at the mid param, as long as the distance of
+    the curve point at the mid param to the midpoint of the chord is bigger than `distance`. The initial
+    `params` should be dense enough to detect all features of the curve, like inflection points.
+
+    Args:
+        point: function which returns the curve point for a given param
+        params: initial curve params in ascending order, at least two params
+        distance: max. distance from curve to the approximation chord
+
+    (internal API)
+    """
+    if len(params) < 2:
+        raise ValueError('at least two params required')
+    if distance <= 0.:
+        raise ValueError('distance has to be > 0')
+    start_t = params[0]
+    start_point = point(start_t)
+    yield start_point
+    for end_t in params[1:]:
+        stack = [(end_t, point(end_t))]
+        while stack:
+            end_t, end_point = stack[-1]
+            mid_t = (start_t + end_t) * 0.5
+            mid_point = point(mid_t)
+            if len(stack) < MAX_LEVEL and mid_point.distance(start_point.lerp(end_point)) > distance:
+                stack.append((mid_t, mid_point))
+            else:
+                stack.pop()
+                yield end_point
+                start_t = end_t
+                start_point = end_point
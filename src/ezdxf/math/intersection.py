@@ -0,0 +1,583 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple, Optional, Dict, Union
+import math
+from .vector import Vec2
+from .construct2d import TOLERANCE
+from .line import ConstructionLine
+from .arc import ConstructionArc
+from .ellipse import ConstructionEllipse
+from .bezier import Bezier
+from .bezier4p import Bezier4P
+from .bspline import BSpline
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['intersect_segments_2d', 'intersect_polylines_2d', 'intersect_curves_2d', 'intersect_curve_with_curves_2d']
+
+# (index of 1st segment, index of 2nd segment, intersection point)
+SegmentIntersection = Tuple[int, int, Vec2]
+# polyline index, segment index
+SegmentLocation = Tuple[int, int]
+
+# Max. grid cells in each direction is this factor * sqrt(count of segments)
+MAX_GRID_FACTOR = 4
+
+# Max. count of subdivisions of a pair of curve pieces
+MAX_SUBDIVISION_LEVEL = 64
+
+# Max. count of subdivided curve piece pairs, all remaining pairs are intersected as chords
+MAX_PIECE_PAIRS = 100000
+
+# Chords of flat curve pieces continue each other, if the deviation is less than this multiple of the tolerance
+CONTINUATION_FACTOR = 10
+
+Curve = Union[ConstructionLine, ConstructionArc, ConstructionEllipse, Bezier, Bezier4P, BSpline]
+BBox = Tuple[float, float, float, float]  # min_x, min_y, max_x, max_y
+
+
+def intersect_segments_2d(segments: Iterable[Sequence['Vertex']], abs_tol: float = TOLERANCE,
+                          cell_size: float = None) -> List[SegmentIntersection]:
+    """
+    Returns all intersections of the 2D line `segments` in the xy-plane as list of ``(index1, index2, point)``
+    tuples, where `index1` < `index2` are the indices of the intersecting segments in the input sequence and `point`
+    is the intersection point as :class:`Vec2`. The result is sorted by the segment indices.
+
+    The intersection test for each segment pair is the same as for :func:`intersection_line_line_2d`
+    with argument `virtual` set to ``False``, therefore parallel and collinear overlapping segments do not
+    intersect. Only segment pairs which share at least one cell of an uniform grid are tested, this
+    requires roughly O(n + k) time for n segments and k intersections, instead of O(n²) for testing
+    all pairs. Long diagonal segments are stored only in the grid cells they pass through.
+
+    Curves like arcs, ellipses or splines have to be flattened into segments, e.g. by the `flattening()` methods
+    of :class:`ConstructionArc`, :class:`ConstructionEllipse`, :class:`BSpline` or :class:`Bezier4P`.
+
+    Args:
+        segments: iterable of line segments as ``(start, end)`` tuples of :class:`Vec2` compatible objects,
+            the z-axis is ignored
+        abs_tol: tolerance for intersection test
+        cell_size: edge length of the grid cells, default is the average segment size
+
+    .. versionadded:: 0.14
+
+    """
+    lines = []
+    for start, end in segments:
+        start = Vec2(start)
+        end = Vec2(end)
+        lines.append((start.x, start.y, end.x, end.y))
+    if len(lines) < 2:
+        return []
+
+    # bounding boxes of all segments expanded by the tolerance
+    boxes = [
+        (min(x1, x2) - abs_tol, min(y1, y2) - abs_tol, max(x1, x2) + abs_tol, max(y1, y2) + abs_tol)
+        for x1, y1, x2, y2 in lines
+    ]
+    min_x = min(box[0] for box in boxes)
+    min_y = min(box[1] for box in boxes)
+    width = max(box[2] for box in boxes) - min_x
+    height = max(box[3] for box in boxes) - min_y
+    if cell_size is None:
+        cell_size = sum(max(box[2] - box[0], box[3] - box[1]) for box in boxes) / len(boxes)
+        # limit count of grid cells
+        cell_size = max(cell_size, max(width, height) / (MAX_GRID_FACTOR * math.sqrt(len(boxes))))
+    if cell_size <= 0.:
+        raise ValueError('cell_size has to be > 0')
+    ncols = int(width / cell_size) + 1
+
+    # cell ranges of all segments as (col0, row0, col1, row1) tuples
+    ranges = [
+        (int((x1 - min_x) / cell_size), int((y1 - min_y) / cell_size),
+         int((x2 - min_x) / cell_size), int((y2 - min_y) / cell_size))
+        for x1, y1, x2, y2 in boxes
+    ]
+    grid: Dict[int, List[int]] = dict()
+    # Segments with a cell range of more than two cells in both directions are long diagonals, they are stored
+    # only in the cells covered by the segment, row by row, instead of all cells of their bounding box.
+    # Horizontal segments can span more than two rows by the tolerance, but they cover their whole bounding box.
+    is_long = [False] * len(lines)
+    for index, (col0, row0, col1, row1) in enumerate(ranges):
+        if col1 - col0 > 1 and row1 - row0 > 1 and lines[index][1] != lines[index][3]:
+            is_long[index] = True
+            for row, col0, col1 in _covered_cells(lines[index], row0, row1, min_x, min_y, cell_size, abs_tol):
+                key = row * ncols
+                for col in range(col0, col1 + 1):
+                    grid.setdefault(key + col, []).append(index)
+            continue
+        for row in range(row0, row1 + 1):
+            key = row * ncols
+            for col in range(col0, col1 + 1):
+                grid.setdefault(key + col, []).append(index)
+
+    result = []
+    # pairs with a long segment have no common first cell
+    tested_pairs = set()
+    for key, indices in grid.items():
+        count = len(indices)
+        if count < 2:
+            continue
+        row, col = divmod(key, ncols)
+        for a in range(count - 1):
+            i = indices[a]
+            col0_i, row0_i, _, _ = ranges[i]
+            min_x_i, min_y_i, max_x_i, max_y_i = boxes[i]
+            for b in range(a + 1, count):
+                j = indices[b]
+                if is_long[i] or is_long[j]:
+                    if (i, j) in tested_pairs:
+                        continue
+                    tested_pairs.add((i, j))
+                else:
+                    col0_j, row0_j, _, _ = ranges[j]
+                    # test each pair only in the first shared cell
+                    if max(col0_i, col0_j) != col or max(row0_i, row0_j) != row:
+                        continue
+                min_x_j, min_y_j, max_x_j, max_y_j = boxes[j]
+                if min_x_i > max_x_j or min_x_j > max_x_i or min_y_i > max_y_j or min_y_j > max_y_i:
+                    continue
+                point = _intersect_segments(lines[i], lines[j], abs_tol)
+                if point is not None:
+                    result.append((i, j, point))  # indices in cells are in ascending order
+    result.sort(key=lambda e: (e[0], e[1]))
+    return result
+
+
+def _covered_cells(line: Tuple[float, float, float, float], row0: int, row1: int, min_x: float, min_y: float,
+                   cell_size: float, abs_tol: float) -> Iterable[Tuple[int, int, int]]:
+    # Yields the grid cells covered by a not horizontal line segment expanded by the tolerance as
+    # (row, col0, col1) tuples: the segment part in each row determines the column range of the row.
+    x1, y1, x2, y2 = line
+    if y1 > y2:
+        x1, y1, x2, y2 = x2, y2, x1, y1
+    slope = (x2 - x1) / (y2 - y1)
+    for row in range(row0, row1 + 1):
+        bottom = min(max(min_y + row * cell_size - abs_tol, y1), y2)
+        top = min(max(min_y + (row + 1) * cell_size + abs_tol, y1), y2)
+        xa = x1 + (bottom - y1) * slope
+        xb = x1 + (top - y1) * slope
+        if xa > xb:
+            xa, xb = xb, xa
+        yield row, int((xa - abs_tol - min_x) / cell_size), int((xb + abs_tol - min_x) / cell_size)
+
+
+def _intersect_segments(line1: Tuple[float, float, float, float], line2: Tuple[float, float, float, float],
+                        abs_tol: float) -> Optional[Vec2]:
+    # same algorithm as intersection_line_line_2d(virtual=False) for (x1, y1, x2, y2) tuples
+    x1, y1, x2, y2 = line1
+    x3, y3, x4, y4 = line2
+    x1_x2 = x1 - x2
+    y3_y4 = y3 - y4
+    y1_y2 = y1 - y2
+    x3_x4 = x3 - x4
+    d = x1_x2 * y3_y4 - y1_y2 * x3_x4
+    if math.fabs(d) <= abs_tol:
+        return None
+    a = x1 * y2 - y1 * x2
+    b = x3 * y4 - y3 * x4
+    x = (a * x3_x4 - x1_x2 * b) / d
+    y = (a * y3_y4 - y1_y2 * b) / d
+    if not (min(x1, x2) - abs_tol <= x <= max(x1, x2) + abs_tol):
+        return None
+    if not (min(x3, x4) - abs_tol <= x <= max(x3, x4) + abs_tol):
+        return None
+    if not (min(y1, y2) - abs_tol <= y <= max(y1, y2) + abs_tol):
+        return None
+    if not (min(y3, y4) - abs_tol <= y <= max(y3, y4) + abs_tol):
+        return None
+    return Vec2((x, y))
+
+
+def intersect_polylines_2d(polylines: Iterable[Iterable['Vertex']], closed: bool = False,
+                           abs_tol: float = TOLERANCE) -> List[Tuple[SegmentLocation, SegmentLocation, Vec2]]:
+    """
+    Returns all intersections of 2D `polylines` in the xy-plane as list of ``(location1, location2, point)``
+    tuples, where a location is a ``(polyline index, segment index)`` tuple, segment `i` of a polyline goes from
+    vertex `i` to vertex `i+1`. Intersections of different polylines and self intersections are reported,
+    the common vertex of consecutive segments of the same polyline is not reported as intersection.
+
+    See :func:`intersect_segments_2d` for more information.
+
+    Args:
+        polylines: iterable of polylines, each polyline as iterable of :class:`Vec2` compatible vertices
+        closed: ``True`` to add a closing segment from the last to the first vertex of each polyline
+        abs_tol: tolerance for intersection test
+
+    .. versionadded:: 0.14
+
+    """
+    segments = []
+    locations = []
+    for polyline_index, polyline in enumerate(polylines):
+        vertices = Vec2.list(polyline)
+        if closed and len(vertices) > 2 and not vertices[0].isclose(vertices[-1], abs_tol=abs_tol):
+            vertices.append(vertices[0])
+        segment_count = len(vertices) - 1
+        for segment_index in range(segment_count):
+            segments.append((vertices[segment_index], vertices[segment_index + 1]))
+            locations.append((polyline_index, segment_index, segment_count))
+
+    result = []
+    for i, j, point in intersect_segments_2d(segments, abs_tol):
+        polyline1, segment1, segment_count = locations[i]
+        polyline2, segment2, _ = locations[j]
+        if polyline1 == polyline2:
+            delta = segment2 - segment1
+            if delta == 1 or (closed and segment_count > 2 and delta == segment_count - 1):
+                continue  # consecutive segments
+        result.append(((polyline1, segment1), (polyline2, segment2), point))
+    return result
+
+
+def intersect_curves_2d(curve1: Curve, curve2: Curve, abs_tol: float = TOLERANCE) -> List[Vec2]:
+    """
+    Returns the intersection points of two curves in the xy-plane as list of :class:`Vec2`, sorted
+    along `curve1` from the start to the end of the curve, the z-axis is ignored.
+
+    Supported curve types are :class:`ConstructionLine`, :class:`ConstructionArc`, :class:`ConstructionEllipse`,
+    :class:`Bezier`, :class:`Bezier4P` and :class:`BSpline`. B-splines are decomposed into Bézier curves, which
+    requires a clamped non-rational B-spline.
+
+    The intersections are located by hierarchical subdivision of both curves: pairs of curve pieces with
+    disjoint bounding boxes are rejected, overlapping pairs are subdivided until both pieces deviate less
+    than `abs_tol` from their chords, and finally the intersection of the chords is the intersection point.
+    Bounding boxes of Bézier curves are the bounding boxes of the control points (convex hull property),
+    bounding boxes of elliptic arcs are exact. Coincident overlapping curve sections do not intersect and
+    curves which touch each other without crossing may not be detected, like for
+    :func:`intersection_line_line_2d`. Arcs of the same ellipse and identical Bézier curves are rejected without
+    subdivision, the count of subdivisions is limited to prevent an excessive runtime for other coincident curves.
+
+    Args:
+        curve1: first curve
+        curve2: second curve
+        abs_tol: max. deviation of the curve from the approximation chord, which is also the precision of
+            the intersection points
+
+    Raises:
+        TypeError: unsupported curve type or a B-spline which can not be decomposed into Bézier curves
+
+    .. versionadded:: 0.14
+
+    """
+    return _intersect_pieces(_curve_pieces(curve1), _curve_pieces(curve2), abs_tol)
+
+
+def intersect_curve_with_curves_2d(curve: Curve, curves: Iterable[Curve],
+                                   abs_tol: float = TOLERANCE) -> List[Tuple[int, Vec2]]:
+    """
+    Returns the intersection points of `curve` with many other `curves` in the xy-plane as list of
+    ``(index, point)`` tuples, where `index` is the index of the intersecting curve in `curves` and `point` is
+    the intersection point as :class:`Vec2`. The result is sorted by the curve index and the intersection points
+    of each curve are sorted along `curve`. Curves with a bounding box not overlapping the bounding box of
+    `curve` are rejected without further tests.
+
+    See :func:`intersect_curves_2d` for more information.
+
+    Args:
+        curve: curve to intersect, e.g. the curve to trim or to extend
+        curves: iterable of curves to intersect with `curve`
+        abs_tol: precision of the intersection points
+
+    .. versionadded:: 0.14
+
+    """
+    pieces = _curve_pieces(curve)
+    bbox = _pieces_bbox(pieces, abs_tol)
+    result = []
+    for index, other in enumerate(curves):
+        other_pieces = _curve_pieces(other)
+        if not _overlap(bbox, _pieces_bbox(other_pieces, abs_tol)):
+            continue
+        result.extend((index, point) for point in _intersect_pieces(pieces, other_pieces, abs_tol))
+    return result
+
+
+class _BezierPiece:
+    """ Bézier curve in the xy-plane from param `t0` to `t1` of curve piece `index`. """
+    __slots__ = ('points', 'index', 't0', 't1', 'bbox')
+
+    def __init__(self, points: List[Tuple[float, float]], index: int, t0: float = 0., t1: float = 1.):
+        self.points = points
+        self.index = index
+        self.t0 = t0
+        self.t1 = t1
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    def chord(self) -> Tuple[float, float, float, float]:
+        return self.points[0] + self.points[-1]
+
+    def is_flat(self, abs_tol: float) -> bool:
+        # the curve is inside the convex hull of the control points
+        x1, y1, x2, y2 = self.chord()
+        return all(_distance_point_segment(x, y, x1, y1, x2, y2) <= abs_tol for x, y in self.points[1:-1])
+
+    def split(self) -> Tuple['_BezierPiece', '_BezierPiece']:
+        # de Casteljau's algorithm at t=0.5
+        points = self.points
+        left = [points[0]]
+        right = [points[-1]]
+        while len(points) > 1:
+            points = [((x1 + x2) * .5, (y1 + y2) * .5) for (x1, y1), (x2, y2) in zip(points, points[1:])]
+            left.append(points[0])
+            right.append(points[-1])
+        right.reverse()
+        t = (self.t0 + self.t1) * .5
+        return _BezierPiece(left, self.index, self.t0, t), _BezierPiece(right, self.index, t, self.t1)
+
+
+class _EllipticPiece:
+    """ Elliptic arc in the xy-plane from param `t0` to `t1` of curve piece `index`, the curve point for
+    param t is ``center + cos(t) * u + sin(t) * v``.
+    """
+    __slots__ = ('ellipse', 'index', 't0', 't1', 'start', 'end', 'bbox')
+
+    def __init__(self, ellipse: Tuple[float, ...], index: int, t0: float, t1: float,
+                 start: Tuple[float, float] = None, end: Tuple[float, float] = None):
+        self.ellipse = ellipse
+        self.index = index
+        self.t0 = t0
+        self.t1 = t1
+        self.start = start or self.point(t0)
+        self.end = end or self.point(t1)
+        points = [self.start, self.end]
+        # add extreme points of the ellipse in x- and y-direction located in the param range
+        for param in ellipse[7:]:
+            param = t0 + (param - t0) % math.tau
+            if param <= t1:
+                points.append(self.point(param))
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    def point(self, t: float) -> Tuple[float, float]:
+        cx, cy, ux, uy, vx, vy = self.ellipse[:6]
+        cos_t = math.cos(t)
+        sin_t = math.sin(t)
+        return cx + cos_t * ux + sin_t * vx, cy + cos_t * uy + sin_t * vy
+
+    def chord(self) -> Tuple[float, float, float, float]:
+        return self.start + self.end
+
+    def is_flat(self, abs_tol: float) -> bool:
+        # the ellipse is an affine image of the unit circle, which scales the sagitta of the
+        # unit circle arc at most by the max. singular value of the transformation
+        return self.ellipse[6] * (1. - math.cos((self.t1 - self.t0) * .5)) <= abs_tol
+
+    def split(self) -> Tuple['_EllipticPiece', '_EllipticPiece']:
+        t = (self.t0 + self.t1) * .5
+        mid = self.point(t)
+        return (
+            _EllipticPiece(self.ellipse, self.index, self.t0, t, self.start, mid),
+            _EllipticPiece(self.ellipse, self.index, t, self.t1, mid, self.end),
+        )
+
+
+_Piece = Union[_BezierPiece, _EllipticPiece]
+
+
+def _elliptic_piece(center: 'Vertex', u: 'Vertex', v: 'Vertex', start: float, span: float) -> _EllipticPiece:
+    cx, cy = Vec2(center)
+    ux, uy = Vec2(u)
+    vx, vy = Vec2(v)
+    # max. singular value of the 2x2 matrix [u v]
+    a = ux * ux + uy * uy + vx * vx + vy * vy
+    det = ux * vy - uy * vx
+    scale = math.sqrt((a + math.sqrt(max(a * a - 4. * det * det, 0.))) * .5)
+    tx = math.atan2(vx, ux)  # params of the extreme points in x-direction
+    ty = math.atan2(vy, uy)  # params of the extreme points in y-direction
+    ellipse = (cx, cy, ux, uy, vx, vy, scale, tx, tx + math.pi, ty, ty + math.pi)
+    return _EllipticPiece(ellipse, 0, start, start + span)
+
+
+def _curve_pieces(curve: Curve) -> List[_Piece]:
+    if isinstance(curve, ConstructionLine):
+        return [_BezierPiece([(curve.start.x, curve.start.y), (curve.end.x, curve.end.y)], 0)]
+    if isinstance(curve, ConstructionArc):
+        r = curve.radius
+        return [_elliptic_piece(
+            curve.center, (r, 0), (0, r), math.radians(curve.start_angle), math.radians(curve.angle_span))]
+    if isinstance(curve, ConstructionEllipse):
+        return [_elliptic_piece(
+            curve.center, curve.major_axis, curve.minor_axis, curve.start_param, curve.param_span)]
+    if isinstance(curve, (Bezier, Bezier4P)):
+        control_point_sets = [curve.control_points]
+    elif isinstance(curve, BSpline):
+        control_point_sets = curve.bezier_decomposition()
+    else:
+        raise TypeError(f'unsupported curve type: {type(curve)}')
+    return [
+        _BezierPiece([(p[0], p[1]) for p in control_points], index)
+        for index, control_points in enumerate(control_point_sets)
+    ]
+
+
+def _pieces_bbox(pieces: List[_Piece], abs_tol: float) -> BBox:
+    return (
+        min(piece.bbox[0] for piece in pieces) - abs_tol,
+        min(piece.bbox[1] for piece in pieces) - abs_tol,
+        max(piece.bbox[2] for piece in pieces) + abs_tol,
+        max(piece.bbox[3] for piece in pieces) + abs_tol,
+    )
+
+
+def _overlap(bbox1: BBox, bbox2: BBox, abs_tol: float = 0.) -> bool:
+    return not (bbox1[0] > bbox2[2] + abs_tol or bbox2[0] > bbox1[2] + abs_tol or
+                bbox1[1] > bbox2[3] + abs_tol or bbox2[1] > bbox1[3] + abs_tol)
+
+
+def _intersect_pieces(pieces1: List[_Piece], pieces2: List[_Piece], abs_tol: float) -> List[Vec2]:
+    # intersections as (sort key along the 1st curve, point) tuples
+    intersections = []
+    stack = [(piece1, piece2, 0) for piece1 in pieces1 for piece2 in pieces2]
+    count = 0
+    while stack:
+        piece1, piece2, level = stack.pop()
+        if not _overlap(piece1.bbox, piece2.bbox, abs_tol) or _is_coincident(piece1, piece2, abs_tol):
+            continue
+        flat1 = piece1.is_flat(abs_tol)
+        flat2 = piece2.is_flat(abs_tol)
+        if (flat1 and flat2) or level >= MAX_SUBDIVISION_LEVEL or count >= MAX_PIECE_PAIRS:
+            chord1 = piece1.chord()
+            chord2 = piece2.chord()
+            if _is_coincident_chords(chord1, chord2, abs_tol):
+                continue  # coincident curve sections do not intersect
+            s = _intersect_chords(chord1, chord2, abs_tol)
+            if s is not None:
+                x1, y1, x2, y2 = chord1
+                point = Vec2((x1 + (x2 - x1) * s, y1 + (y2 - y1) * s))
+                intersections.append(((piece1.index, piece1.t0 + (piece1.t1 - piece1.t0) * s), point))
+            continue
+        level += 1
+        count += 1
+        if flat2 or (not flat1 and _bbox_size(piece1.bbox) >= _bbox_size(piece2.bbox)):
+            stack.extend((piece, piece2, level) for piece in piece1.split())
+        else:
+            stack.extend((piece1, piece, level) for piece in piece2.split())
+
+    intersections.sort(key=lambda e: e[0])
+    result = []
+    for _, point in intersections:
+        # an intersection at the joint of two curve pieces is found twice, both are neighbors in sort order,
+        # except at the start and end point of closed curves
+        if not (result and (point.isclose(result[-1], abs_tol=abs_tol * 2.) or
+                            point.isclose(result[0], abs_tol=abs_tol * 2.))):
+            result.append(point)
+    return result
+
+
+def _bbox_size(bbox: BBox) -> float:
+    return max(bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+
+def _intersect_chords(line1: Tuple[float, float, float, float], line2: Tuple[float, float, float, float],
+                      abs_tol: float) -> Optional[float]:
+    # Returns the param of the intersection point on line1 in the range [0, 1], the range is extended by abs_tol
+    x1, y1, x2, y2 = line1
+    x3, y3, x4, y4 = line2
+    dx1 = x2 - x1
+    dy1 = y2 - y1
+    dx2 = x4 - x3
+    dy2 = y4 - y3
+    length1 = math.hypot(dx1, dy1)
+    length2 = math.hypot(dx2, dy2)
+    d = dx1 * dy2 - dy1 * dx2
+    if math.fabs(d) <= 1e-12 * length1 * length2:  # parallel or degenerated chords
+        return None
+    s = ((x3 - x1) * dy2 - (y3 - y1) * dx2) / d
+    t = ((x3 - x1) * dy1 - (y3 - y1) * dx1) / d
+    tol1 = abs_tol / length1
+    tol2 = abs_tol / length2
+    if -tol1 <= s <= 1. + tol1 and -tol2 <= t <= 1. + tol2:
+        return s
+    return None
+
+
+def _is_coincident(piece1: _Piece, piece2: _Piece, abs_tol: float) -> bool:
+    # Pieces of the same ellipse or Bézier curves with the same control points do not cross each other
+    if type(piece1) is not type(piece2):
+        return False
+    if isinstance(piece1, _EllipticPiece):
+        return piece1.ellipse is piece2.ellipse or _is_same_ellipse(piece1.ellipse, piece2.ellipse, abs_tol)
+    points1 = piece1.points
+    points2 = piece2.points
+    if len(points1) != len(points2):
+        return False
+    return _is_close(points1, points2, abs_tol) or _is_close(points1, reversed(points2), abs_tol)
+
+
+def _is_same_ellipse(ellipse1: Tuple[float, ...], ellipse2: Tuple[float, ...], abs_tol: float) -> bool:
+    # Ellipses with the same center and the same matrix M * transpose(M) for M = [u v] are the same curve,
+    # independent from the parametrization
+    if not _is_close(ellipse1[:2], ellipse2[:2], abs_tol):
+        return False
+    _, _, ux1, uy1, vx1, vy1, scale = ellipse1[:7]
+    _, _, ux2, uy2, vx2, vy2, _ = ellipse2[:7]
+    return _is_close(
+        (ux1 * ux1 + vx1 * vx1, ux1 * uy1 + vx1 * vy1, uy1 * uy1 + vy1 * vy1),
+        (ux2 * ux2 + vx2 * vx2, ux2 * uy2 + vx2 * vy2, uy2 * uy2 + vy2 * vy2),
+        abs_tol * scale,
+    )
+
+
+def _is_close(values1: Iterable, values2: Iterable, abs_tol: float) -> bool:
+    # compares floats or (x, y) tuples
+    for value1, value2 in zip(values1, values2):
+        if isinstance(value1, tuple):
+            if not (math.isclose(value1[0], value2[0], abs_tol=abs_tol) and
+                    math.isclose(value1[1], value2[1], abs_tol=abs_tol)):
+                return False
+        elif not math.isclose(value1, value2, abs_tol=abs_tol):
+            return False
+    return True
+
+
+def _is_coincident_chords(line1: Tuple[float, float, float, float], line2: Tuple[float, float, float, float],
+                          abs_tol: float) -> bool:
+    # Returns True if the chords of two flat curve pieces are located on the same curve: overlapping collinear
+    # chords or chords which continue each other at a shared end point in nearly the same direction.
+    x1, y1, x2, y2 = line1
+    x3, y3, x4, y4 = line2
+    if _is_collinear(line1, line2, abs_tol):
+        return True
+    for px, py, ax, ay in ((x1, y1, x2, y2), (x2, y2, x1, y1)):
+        for qx, qy, bx, by in ((x3, y3, x4, y4), (x4, y4, x3, y3)):
+            if math.hypot(px - qx, py - qy) <= abs_tol:
+                # The chords of two adjacent flat pieces of the same arc deviate up to 8 times the
+                # max. sagitta abs_tol from each other.
+                return (ax - px) * (bx - px) + (ay - py) * (by - py) < 0. and \
+                    _distance_point_line(bx, by, px, py, ax, ay) <= abs_tol * CONTINUATION_FACTOR
+    return False
+
+
+def _is_collinear(line1: Tuple[float, float, float, float], line2: Tuple[float, float, float, float],
+                  abs_tol: float) -> bool:
+    # Returns True if each line is located in the abs_tol range of the infinite extension of the other line
+    x1, y1, x2, y2 = line1
+    x3, y3, x4, y4 = line2
+    return _distance_point_line(x3, y3, x1, y1, x2, y2) <= abs_tol and \
+        _distance_point_line(x4, y4, x1, y1, x2, y2) <= abs_tol and \
+        _distance_point_line(x1, y1, x3, y3, x4, y4) <= abs_tol and \
+        _distance_point_line(x2, y2, x3, y3, x4, y4) <= abs_tol
+
+
+def _distance_point_line(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    dx = x2 - x1
+    dy = y2 - y1
+    length = math.hypot(dx, dy)
+    if length == 0.:
+        return math.hypot(x - x1, y - y1)
+    return math.fabs((x - x1) * dy - (y - y1) * dx) / length
+
+
+def _distance_point_segment(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    dx = x2 - x1
+    dy = y2 - y1
+    length2 = dx * dx + dy * dy
+    t = 0.
+    if length2 > 0.:
+        t = min(max(((x - x1) * dx + (y - y1) * dy) / length2, 0.), 1.)
+    return math.hypot(x - x1 - t * dx, y - y1 - t * dy)
@@ -5,6 +5,7 @@ from functools import lru_cache
 from itertools import repeat
 import math
 import reprlib
+from .vec3array import numpy
 
 __all__ = [
     'Matrix', 'gauss_vector_solver', 'gauss_matrix_solver', 'gauss_jordan_solver', 'gauss_jordan_inverse',
@@ -14,6 +15,14 @@ __all__ = [
 ]
 
 
+# Delegation of matrix operations to numpy if installed, below this limits
+# the numpy overhead is bigger than the pure Python calculation:
+# matrix multiplication for result matrices with at least 16 values
+# LU decomposition and LU equation solver for matrices with at least 40 rows
+USE_NUMPY_MUL_LIMIT = 16
+USE_NUMPY_LU_LIMIT = 40
+
+
 def zip_to_list(*args) -> Iterable[List]:
     for e in zip(*args):  # returns immutable tuples
         yield list(e)  # need mutable list
@@ -300,9 +309,12 @@ class Matrix:
     def __mul__(self, other: Union['Matrix', float]) -> 'Matrix':
         """ Matrix multiplication by another matrix or a float, returns a new matrix. """
         if isinstance(other, Matrix):
+            if numpy is not None and self.nrows * other.ncols >= USE_NUMPY_MUL_LIMIT:
+                product = numpy.array(self.matrix, dtype=numpy.float64) @ numpy.array(other.matrix, dtype=numpy.float64)
+                return Matrix(matrix=product.tolist())
+            Y_cols = list(zip(*other.matrix))
             matrix = Matrix(
-                matrix=[[sum(a * b for a, b in zip(X_row, Y_col)) for Y_col in zip(*other.matrix)] for X_row in
-                        self.matrix])
+                matrix=[[sum(a * b for a, b in zip(X_row, Y_col)) for Y_col in Y_cols] for X_row in self.matrix])
         else:
             factor = float(other)
             matrix = Matrix(matrix=[[item * factor for item in row] for row in self.matrix])
@@ -462,18 +474,19 @@ def _build_upper_triangle(A: MatrixData, B: List) -> None:
         B[max_row], B[i] = B[i], B[max_row]
 
         # Make all rows below this one 0 in current column
+        pivot_row = A[i]
         for row in range(i + 1, num):
-            c = -A[row][i] / A[i][i]
-            for col in range(i, num):
-                if i == col:
-                    A[row][col] = 0
-                else:
-                    A[row][col] += c * A[i][col]
+            current_row = A[row]
+            c = -current_row[i] / pivot_row[i]
+            current_row[i] = 0
+            for col in range(i + 1, num):
+                current_row[col] += c * pivot_row[col]
             if b_col_count == 1:
                 B[row] += c * B[i]
             else:
-                for col in range(b_col_count):
-                    B[row][col] += c * B[i][col]
+                B_row = B[row]
+                for col, value in enumerate(B[i]):
+                    B_row[col] += c * value
 
 
 def _backsubstitution(A: MatrixData, B: List[float]) -> List[float]:
@@ -487,9 +500,10 @@ def _backsubstitution(A: MatrixData, B: List[float]) -> List[float]:
     num = len(A)
     x = [0.0] * num
     for i in range(num - 1, -1, -1):
-        x[i] = B[i] / A[i][i]
+        x_i = B[i] / A[i][i]
+        x[i] = x_i
         for row in range(i - 1, -1, -1):
-            B[row] -= A[row][i] * x[i]
+            B[row] -= A[row][i] * x_i
     return x
 
 
@@ -534,14 +548,16 @@ def gauss_jordan_solver(A: Iterable[Iterable[float]], B: Iterable[Iterable[float
 
     for i in range(n):
         big = 0.0
+        free_cols = [k for k in range(n) if ipiv[k] == 0]
         for j in range(n):
             if ipiv[j] != 1:
-                for k in range(n):
-                    if ipiv[k] == 0:
-                        if abs(A[j][k]) >= big:
-                            big = abs(A[j][k])
-                            irow = j
-                            icol = k
+                A_row = A[j]
+                for k in free_cols:
+                    value = abs(A_row[k])
+                    if value >= big:
+                        big = value
+                        irow = j
+                        icol = k
 
         ipiv[icol] += 1
         if irow != icol:
@@ -555,15 +571,18 @@ def gauss_jordan_solver(A: Iterable[Iterable[float]], B: Iterable[Iterable[float
         A[icol][icol] = 1.0
         A[icol] = [v * pivinv for v in A[icol]]
         B[icol] = [v * pivinv for v in B[icol]]
+        A_icol = A[icol]
+        B_icol = B[icol]
         for row in range(n):
             if row == icol:
                 continue
-            dum = A[row][icol]
-            A[row][icol] = 0.0
-            for col in range(n):
-                A[row][col] -= A[icol][col] * dum
-            for col in range(m):
-                B[row][col] -= B[icol][col] * dum
+            A_row = A[row]
+            dum = A_row[icol]
+            if dum == 0.0:
+                continue
+            A_row[icol] = 0.0
+            A[row] = [a - b * dum for a, b in zip(A_row, A_icol)]
+            B[row] = [a - b * dum for a, b in zip(B[row], B_icol)]
 
     for i in range(n - 1, -1, -1):
         irow = row_indices[i]
@@ -600,7 +619,8 @@ class LUDecomposition:
     """ Represents a `LU decomposition`_ matrix of A, raise :class:`ZeroDivisionError` for a singular matrix.
 
     This algorithm is a little bit faster than the `Gauss-Elimination`_ algorithm using CPython and
-    much faster when using pypy.
+    much faster when using pypy. The decomposition and the equation solver of big matrices are delegated to
+    :mod:`numpy` if installed.
 
     The :attr:`LUDecomposition.matrix` attribute gives access to the matrix data
     as list of rows like in the :class:`Matrix` class, and the :attr:`LUDecomposition.index`
@@ -620,37 +640,10 @@ class LUDecomposition:
     def __init__(self, A: Iterable[Iterable[float]]):
         lu = copy_float_matrix(A)
         n = len(lu)
-        det = 1.0
-        index = []
-
-        # find max value for each row, raises ZeroDivisionError for singular matrix!
-        scaling = [1.0 / max(abs(v) for v in row) for row in lu]
-
-        for k in range(n):
-            big = 0.0
-            imax = k
-            for i in range(k, n):
-                temp = scaling[i] * abs(lu[i][k])
-                if temp > big:
-                    big = temp
-                    imax = i
-
-            if k != imax:
-                for col in range(n):
-                    temp = lu[imax][col]
-                    lu[imax][col] = lu[k][col]
-                    lu[k][col] = temp
-
-                det = -det
-                scaling[imax] = scaling[k]
-
-            index.append(imax)
-            for i in range(k + 1, n):
-                temp = lu[i][k] / lu[k][k]
-                lu[i][k] = temp
-                for j in range(k + 1, n):
-                    lu[i][j] -= temp * lu[k][j]
-
+        if numpy is not None and n >= USE_NUMPY_LU_LIMIT:
+            lu, index, det = _lu_decomposition_numpy(lu)
+        else:
+            lu, index, det = _lu_decomposition(lu)
         self.index: List[int] = index
         self.matrix: MatrixData = lu
         self._det = det
@@ -692,17 +685,19 @@ class LUDecomposition:
             sum_ = X[ip]
             X[ip] = X[i]
             if ii != 0:
+                lu_row = lu[i]
                 for j in range(ii - 1, i):
-                    sum_ -= lu[i][j] * X[j]
+                    sum_ -= lu_row[j] * X[j]
             elif sum_ != 0.0:
                 ii = i + 1
             X[i] = sum_
 
         for row in range(n - 1, -1, -1):
+            lu_row = lu[row]
             sum_ = X[row]
             for col in range(row + 1, n):
-                sum_ -= lu[row][col] * X[col]
-            X[row] = sum_ / lu[row][row]
+                sum_ -= lu_row[col] * X[col]
+            X[row] = sum_ / lu_row[row]
         return X
 
     def solve_matrix(self, B: Iterable[Iterable[float]]) -> Matrix:
@@ -722,6 +717,8 @@ class LUDecomposition:
         if B.nrows != self.nrows:
             raise ValueError('Row count of self and matrix B has to match.')
 
+        if numpy is not None and self.nrows >= USE_NUMPY_LU_LIMIT:
+            return Matrix(matrix=_lu_solve_matrix_numpy(self.matrix, self.index, B.matrix))
         return Matrix(matrix=[self.solve_vector(col) for col in B.cols()]).transpose()
 
     def inverse(self) -> Matrix:
@@ -739,6 +736,80 @@ class LUDecomposition:
         return det
 
 
+def _lu_decomposition(lu: MatrixData) -> Tuple[MatrixData, List[int], float]:
+    # Inplace LU decomposition of `lu` with scaled partial pivoting.
+    n = len(lu)
+    det = 1.0
+    index = []
+
+    # find max value for each row, raises ZeroDivisionError for singular matrix!
+    scaling = [1.0 / max(abs(v) for v in row) for row in lu]
+
+    for k in range(n):
+        big = 0.0
+        imax = k
+        for i in range(k, n):
+            temp = scaling[i] * abs(lu[i][k])
+            if temp > big:
+                big = temp
+                imax = i
+
+        if k != imax:
+            lu[imax], lu[k] = lu[k], lu[imax]
+            det = -det
+            scaling[imax] = scaling[k]
+
+        index.append(imax)
+        lu_k = lu[k]
+        pivot = lu_k[k]
+        for i in range(k + 1, n):
+            lu_i = lu[i]
+            temp = lu_i[k] / pivot
+            lu_i[k] = temp
+            for j in range(k + 1, n):
+                lu_i[j] -= temp * lu_k[j]
+    return lu, index, det
+
+
+def _lu_decomposition_numpy(lu: MatrixData) -> Tuple[MatrixData, List[int], float]:
+    # Same algorithm as _lu_decomposition(), each elimination step is vectorized.
+    a = numpy.array(lu, dtype=numpy.float64)
+    n = len(a)
+    det = 1.0
+    index = []
+    # raises ZeroDivisionError for singular matrix like the pure Python implementation
+    scaling = numpy.array([1.0 / m for m in numpy.abs(a).max(axis=1).tolist()])
+    for k in range(n):
+        imax = k + int(numpy.argmax(scaling[k:] * numpy.abs(a[k:, k])))
+        if k != imax:
+            a[[k, imax]] = a[[imax, k]]
+            det = -det
+            scaling[imax] = scaling[k]
+        index.append(imax)
+        if k + 1 < n:
+            pivot = a[k, k]
+            if pivot == 0.0:
+                raise ZeroDivisionError('float division by zero')
+            a[k + 1:, k] /= pivot
+            a[k + 1:, k + 1:] -= numpy.outer(a[k + 1:, k], a[k, k + 1:])
+    return a.tolist(), index, det
+
+
+def _lu_solve_matrix_numpy(lu: MatrixData, index: List[int], B: MatrixData) -> MatrixData:
+    # Forward- and backsubstitution of all columns of B at once.
+    a = numpy.array(lu, dtype=numpy.float64)
+    x = numpy.array(B, dtype=numpy.float64)
+    n = len(a)
+    for i in range(n):
+        ip = index[i]
+        if ip != i:
+            x[[i, ip]] = x[[ip, i]]
+        x[i] -= a[i, :i] @ x[:i]
+    for row in range(n - 1, -1, -1):
+        x[row] = (x[row] - a[row, row + 1:] @ x[row + 1:]) / a[row, row]
+    return x.tolist()
+
+
 def tridiagonal_vector_solver(A: Iterable[Iterable[float]], B: Iterable[float]) -> List[float]:
     """
     Solves the linear equation system given by a tri-diagonal nxn Matrix A . x = B,
@@ -5,11 +5,12 @@
 # Created: 19.04.2010
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
-from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING
+from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING, Union
 import math
 from math import sin, cos, tan
 from itertools import chain
 from .vector import Vector, X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
+from .vec3array import Vec3Array, transform_array, normalize_array
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -541,6 +542,38 @@ class Matrix44:
             )
             yield v.normalize() if normalize else v
 
+    def transform_array(self, vertices: Union['Vec3Array', Iterable['Vertex']]) -> 'Vec3Array':
+        """ Returns transformed `vertices` as new :class:`~ezdxf.math.Vec3Array`, uses :mod:`numpy` if installed.
+
+        Args:
+            vertices: :class:`~ezdxf.math.Vec3Array` or iterable of :class:`Vector` compatible objects
+
+        .. versionadded:: 0.14
+
+        """
+        if not isinstance(vertices, Vec3Array):
+            vertices = Vec3Array(vertices)
+        return Vec3Array.from_array(transform_array(self.matrix, vertices.values, translate=True))
+
+    def transform_directions_array(self, vectors: Union['Vec3Array', Iterable['Vertex']],
+                                   normalize=False) -> 'Vec3Array':
+        """ Returns transformed direction `vectors` without translation as new :class:`~ezdxf.math.Vec3Array`,
+        uses :mod:`numpy` if installed.
+
+        Args:
+            vectors: :class:`~ezdxf.math.Vec3Array` or iterable of :class:`Vector` compatible objects
+            normalize: normalize transformed direction vectors
+
+        .. versionadded:: 0.14
+
+        """
+        if not isinstance(vectors, Vec3Array):
+            vectors = Vec3Array(vectors)
+        values = transform_array(self.matrix, vectors.values, translate=False)
+        if normalize:
+            values = normalize_array(values)
+        return Vec3Array.from_array(values)
+
     def ucs_vertex_from_wcs(self, wcs: Vector) -> Vector:
         """
         Returns an UCS vector from WCS vertex.
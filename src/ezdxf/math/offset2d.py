@@ -1,13 +1,28 @@
 # Created: 15.12.2019
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Sequence, Dict, Callable, Optional
+import math
+import heapq
 from ezdxf.math import Vec2
 from ezdxf.math.line import ConstructionRay, ParallelRaysError
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
 
+# Segment of a bulge polyline: x1, y1, x2, y2, bulge
+Segment = Tuple[float, float, float, float, float]
+# Vertex of a bulge polyline: x, y, bulge of the following segment
+BulgeVertex = Tuple[float, float, float]
+Point = Tuple[float, float]
+# Split position at a raw offset segment: segment index, segment param
+Position = Tuple[int, float]
+
+# Polylines with more segments use a bounding box hierarchy for the distance test of the offset slices
+MAX_BRUTE_FORCE_SEGMENTS = 32
+# Count of boxes grouped by a bounding box of the next level in the nearest segment search
+CHUNK_SIZE = 8
+
 
 def offset_vertices_2d(vertices: Iterable['Vertex'], offset: float, closed: bool = False) -> Iterable['Vec2']:
     """
@@ -67,3 +82,585 @@ def offset_vertices_2d(vertices: Iterable['Vertex'], offset: float, closed: bool
     # last offset vertex = end point of last segment for open shapes
     if not closed:
         yield offset_segments[-1][1]
+
+
+def offset_bulge_polyline_2d(points: Iterable[Sequence[float]], offset: float, closed: bool = False,
+                             abs_tol: float = 1e-6) -> List[List[BulgeVertex]]:
+    """
+    Returns the offset of a 2D polyline with bulges like :class:`~ezdxf.entities.LWPolyline` as list of polylines,
+    each polyline as list of ``(x, y, bulge)`` tuples, the bulge value of a vertex defines the segment to the next
+    vertex like for the LWPOLYLINE entity. The source polyline is located in the xy-plane, an offset > ``0`` is
+    `left` of the segment direction, an offset < ``0`` is `right` of the segment direction, which is inside of a
+    counter clockwise oriented closed polyline for an offset > ``0``.
+
+    Arc segments remain arcs and corners are rounded by arcs, like the path of a round tool. Self intersections of
+    the raw offset curve, located by a sweep over the bounding boxes of the offset segments, are removed:
+    the raw offset curve is split at the self intersections and all parts which come closer to the source polyline
+    than `offset` or run in the opposite direction of the nearest source segment are removed. Therefore the result
+    can be empty or consist of multiple polylines, which are all closed for a closed source polyline, else all open.
+    Closed polylines do not repeat the first vertex.
+    The result for a self intersecting source polyline is undefined.
+
+    Get the source points of a LWPOLYLINE entity by :code:`lwpolyline.get_points('xyb')`.
+
+    Args:
+        points: polyline vertices as ``(x, y[, bulge])`` tuples, the z-axis is ignored
+        offset: offset distance
+        closed: ``True`` for a closed polyline
+        abs_tol: tolerance for coincident points
+
+    .. versionadded:: 0.14
+
+    """
+    segments = _bulge_segments(points, closed, abs_tol)
+    if not segments:
+        return []
+    if offset == 0.:
+        return [_bulge_vertices(segments, closed)]
+    raw_offset = _raw_offset(segments, offset, closed, abs_tol)
+    if not raw_offset:
+        return []
+    min_distance = abs(offset) - abs_tol
+    nearest = _nearest_segment_function(segments, abs(offset))
+    cutters = []
+    if not closed:
+        # The raw offset curve of an open polyline is also split at the raw offset curve of the opposite side and
+        # at the circles around the end points, like in CavalierContours by Jedidiah Buck McCready
+        cutters = _raw_offset(segments, -offset, closed, abs_tol)
+        cutters.extend(_circle_segments(segments[0][0], segments[0][1], abs(offset)))
+        cutters.extend(_circle_segments(segments[-1][2], segments[-1][3], abs(offset)))
+    valid_slices = []
+    for offset_slice in _split_at_self_intersections(raw_offset, closed, cutters, abs_tol):
+        if _is_valid_slice(offset_slice, segments, nearest, min_distance):
+            valid_slices.append(offset_slice)
+    return [_bulge_vertices(chain, closed) for chain in _stitch(valid_slices, closed, abs_tol)]
+
+
+def offset_bulge_polylines_2d(polylines: Iterable[Iterable[Sequence[float]]], offset: float, closed: bool = False,
+                              abs_tol: float = 1e-6) -> List[List[List[BulgeVertex]]]:
+    """
+    Batch version of :func:`offset_bulge_polyline_2d`, returns the offset polylines for all `polylines` in the same
+    order as the input.
+
+    Args:
+        polylines: iterable of polylines, each polyline as iterable of ``(x, y[, bulge])`` tuples
+        offset: offset distance
+        closed: ``True`` for closed polylines
+        abs_tol: tolerance for coincident points
+
+    .. versionadded:: 0.14
+
+    """
+    return [offset_bulge_polyline_2d(points, offset, closed, abs_tol) for points in polylines]
+
+
+def _bulge_segments(points: Iterable[Sequence[float]], closed: bool, abs_tol: float) -> List[Segment]:
+    vertices = []
+    for point in points:
+        point = tuple(point)
+        x = point[0]
+        y = point[1]
+        bulge = point[2] if len(point) > 2 else 0.
+        if vertices and math.hypot(x - vertices[-1][0], y - vertices[-1][1]) <= abs_tol:
+            vertices[-1] = vertices[-1][:2] + (bulge,)  # remove coincident vertex
+        else:
+            vertices.append((x, y, bulge))
+    if closed and len(vertices) > 2 and math.hypot(vertices[0][0] - vertices[-1][0],
+                                                   vertices[0][1] - vertices[-1][1]) <= abs_tol:
+        vertices.pop()  # remove explicit closing vertex
+    segments = [(x1, y1, x2, y2, bulge) for (x1, y1, bulge), (x2, y2, _) in zip(vertices, vertices[1:])]
+    if closed and len(vertices) > 1:
+        x1, y1, bulge = vertices[-1]
+        x2, y2, _ = vertices[0]
+        segments.append((x1, y1, x2, y2, bulge))
+    return segments
+
+
+def _bulge_vertices(segments: List[Segment], closed: bool) -> List[BulgeVertex]:
+    vertices = [(x1, y1, bulge) for x1, y1, _, _, bulge in segments]
+    if not closed:
+        vertices.append((segments[-1][2], segments[-1][3], 0.))
+    return vertices
+
+
+def _arc(segment: Segment) -> Tuple[float, float, float, float, float]:
+    # Returns center x, center y, radius, start angle and sweep angle of an arc segment, sweep angle > 0 is
+    # counter clockwise
+    x1, y1, x2, y2, bulge = segment
+    f = (1. - bulge * bulge) / (4. * bulge)
+    cx = (x1 + x2) * .5 - (y2 - y1) * f
+    cy = (y1 + y2) * .5 + (x2 - x1) * f
+    return cx, cy, math.hypot(x1 - cx, y1 - cy), math.atan2(y1 - cy, x1 - cx), 4. * math.atan(bulge)
+
+
+def _segment_point(segment: Segment, t: float) -> Point:
+    x1, y1, x2, y2, bulge = segment
+    if bulge == 0.:
+        return x1 + (x2 - x1) * t, y1 + (y2 - y1) * t
+    cx, cy, radius, angle, sweep = _arc(segment)
+    angle += sweep * t
+    return cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+
+
+def _segment_length(segment: Segment) -> float:
+    x1, y1, x2, y2, bulge = segment
+    chord = math.hypot(x2 - x1, y2 - y1)
+    if bulge == 0. or chord == 0.:
+        return chord
+    _, _, radius, _, sweep = _arc(segment)
+    return radius * abs(sweep)
+
+
+def _tangents(segment: Segment) -> Tuple[Point, Point]:
+    # Returns the normalized tangents at the start and the end of a segment
+    x1, y1, x2, y2, bulge = segment
+    if bulge == 0.:
+        length = math.hypot(x2 - x1, y2 - y1)
+        tangent = ((x2 - x1) / length, (y2 - y1) / length)
+        return tangent, tangent
+    cx, cy, radius, _, _ = _arc(segment)
+    sign = math.copysign(1. / radius, bulge)
+    return (-(y1 - cy) * sign, (x1 - cx) * sign), (-(y2 - cy) * sign, (x2 - cx) * sign)
+
+
+def _offset_segment(segment: Segment, offset: float) -> Segment:
+    x1, y1, x2, y2, bulge = segment
+    if bulge == 0.:
+        length = math.hypot(x2 - x1, y2 - y1)
+        nx = -(y2 - y1) / length * offset
+        ny = (x2 - x1) / length * offset
+        return x1 + nx, y1 + ny, x2 + nx, y2 + ny, 0.
+    # left of a counter clockwise arc is the center side
+    cx, cy, radius, _, _ = _arc(segment)
+    f = (radius - offset * math.copysign(1., bulge)) / radius
+    if f <= 0.:  # collapsed arc is replaced by a line, which will be removed as invalid
+        bulge = 0.
+    return cx + (x1 - cx) * f, cy + (y1 - cy) * f, cx + (x2 - cx) * f, cy + (y2 - cy) * f, bulge
+
+
+def _raw_offset(segments: List[Segment], offset: float, closed: bool, abs_tol: float) -> List[Segment]:
+    offset_segments = [_offset_segment(segment, offset) for segment in segments]
+    raw_offset = []
+    for index, offset_segment in enumerate(offset_segments):
+        if index:
+            _join(raw_offset, segments[index - 1], segments[index], offset_segments[index - 1], offset_segment,
+                  offset, abs_tol)
+        raw_offset.append(offset_segment)
+    if closed:
+        _join(raw_offset, segments[-1], segments[0], offset_segments[-1], offset_segments[0], offset, abs_tol)
+    # remove segments of collapsed arcs, the remaining segments are still connected
+    return [s for s in raw_offset if s[0] != s[2] or s[1] != s[3]]
+
+
+def _join(raw_offset: List[Segment], segment1: Segment, segment2: Segment, offset1: Segment, offset2: Segment,
+          offset: float, abs_tol: float) -> None:
+    # Connects two raw offset segments by an arc around the common vertex of the source segments, the arc
+    # creates a loop at concave corners, which is removed by the self intersection test.
+    x1, y1 = offset1[2], offset1[3]
+    x2, y2 = offset2[0], offset2[1]
+    if x1 == x2 and y1 == y2:
+        return
+    bulge = 0.
+    if math.hypot(x2 - x1, y2 - y1) > abs_tol:
+        _, (tx1, ty1) = _tangents(segment1)
+        (tx2, ty2), _ = _tangents(segment2)
+        turn = math.atan2(tx1 * ty2 - ty1 * tx2, tx1 * tx2 + ty1 * ty2)
+        if math.isclose(abs(turn), math.pi):  # U-turn: go around the common vertex
+            turn = -math.copysign(math.pi, offset)
+        bulge = math.tan(turn / 4.)
+    raw_offset.append((x1, y1, x2, y2, bulge))
+
+
+def _circle_segments(cx: float, cy: float, radius: float) -> List[Segment]:
+    # Full circle as two half circle arcs
+    return [(cx - radius, cy, cx + radius, cy, 1.), (cx + radius, cy, cx - radius, cy, 1.)]
+
+
+def _segment_bbox(segment: Segment) -> Tuple[float, float, float, float]:
+    x1, y1, x2, y2, bulge = segment
+    xs = [x1, x2]
+    ys = [y1, y2]
+    if bulge != 0.:
+        cx, cy, radius, start, sweep = _arc(segment)
+        # add extreme points of the circle located on the arc
+        for quadrant in range(4):
+            angle = quadrant * math.pi * .5
+            delta = (angle - start) % math.tau if sweep > 0. else (start - angle) % math.tau
+            if delta <= abs(sweep):
+                xs.append(cx + radius * math.cos(angle))
+                ys.append(cy + radius * math.sin(angle))
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _arc_param(arc: Tuple[float, float, float, float, float], x: float, y: float) -> float:
+    cx, cy, _, start, sweep = arc
+    angle = math.atan2(y - cy, x - cx)
+    delta = (angle - start) % math.tau if sweep > 0. else (start - angle) % math.tau
+    if delta > math.pi + abs(sweep) * .5:  # located before the start point
+        delta -= math.tau
+    return delta / abs(sweep)
+
+
+def _line_param(segment: Segment, x: float, y: float) -> float:
+    x1, y1, x2, y2, _ = segment
+    dx = x2 - x1
+    dy = y2 - y1
+    return ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)
+
+
+def _intersect(segment1: Segment, segment2: Segment, abs_tol: float) -> List[Tuple[float, float, Point]]:
+    # Returns intersections of two segments as (param1, param2, point) tuples
+    points = []
+    bulge1 = segment1[4]
+    bulge2 = segment2[4]
+    # arc parameters are calculated only once for each segment
+    arc1 = _arc(segment1) if bulge1 != 0. else None
+    arc2 = _arc(segment2) if bulge2 != 0. else None
+    if bulge1 == 0. and bulge2 == 0.:
+        x1, y1, x2, y2, _ = segment1
+        x3, y3, x4, y4, _ = segment2
+        dx1 = x2 - x1
+        dy1 = y2 - y1
+        dx2 = x4 - x3
+        dy2 = y4 - y3
+        d = dx1 * dy2 - dy1 * dx2
+        if math.fabs(d) <= 1e-12 * math.hypot(dx1, dy1) * math.hypot(dx2, dy2):
+            return []  # parallel or collinear segments
+        t = ((x3 - x1) * dy2 - (y3 - y1) * dx2) / d
+        points.append((x1 + dx1 * t, y1 + dy1 * t))
+    elif bulge1 == 0. or bulge2 == 0.:
+        line, arc = (segment1, arc2) if bulge1 == 0. else (segment2, arc1)
+        cx, cy, radius, _, _ = arc
+        x1, y1, x2, y2, _ = line
+        dx = x2 - x1
+        dy = y2 - y1
+        fx = x1 - cx
+        fy = y1 - cy
+        a = dx * dx + dy * dy
+        b = 2. * (fx * dx + fy * dy)
+        c = fx * fx + fy * fy - radius * radius
+        discriminant = b * b - 4. * a * c
+        if discriminant < 0.:
+            return []
+        root = math.sqrt(discriminant)
+        for t in {(-b - root) / (2. * a), (-b + root) / (2. * a)}:
+            points.append((x1 + dx * t, y1 + dy * t))
+    else:
+        cx1, cy1, r1, _, _ = arc1
+        cx2, cy2, r2, _, _ = arc2
+        dx = cx2 - cx1
+        dy = cy2 - cy1
+        distance = math.hypot(dx, dy)
+        if distance == 0. or distance > r1 + r2 or distance < abs(r1 - r2):
+            return []
+        a = (r1 * r1 - r2 * r2 + distance * distance) / (2. * distance)
+        h = math.sqrt(max(r1 * r1 - a * a, 0.))
+        mx = cx1 + dx * a / distance
+        my = cy1 + dy * a / distance
+        ox = -dy * h / distance
+        oy = dx * h / distance
+        points.append((mx + ox, my + oy))
+        if h > 0.:
+            points.append((mx - ox, my - oy))
+
+    result = []
+    tol1 = abs_tol / (arc1[2] * abs(arc1[4]) if arc1 else _segment_length(segment1))
+    tol2 = abs_tol / (arc2[2] * abs(arc2[4]) if arc2 else _segment_length(segment2))
+    for x, y in points:
+        t1 = _arc_param(arc1, x, y) if arc1 else _line_param(segment1, x, y)
+        t2 = _arc_param(arc2, x, y) if arc2 else _line_param(segment2, x, y)
+        if -tol1 <= t1 <= 1. + tol1 and -tol2 <= t2 <= 1. + tol2:
+            result.append((min(max(t1, 0.), 1.), min(max(t2, 0.), 1.), (x, y)))
+    return result
+
+
+def _split_at_self_intersections(raw_offset: List[Segment], closed: bool, cutters: List[Segment],
+                                 abs_tol: float) -> List[List[Segment]]:
+    count = len(raw_offset)
+    lengths = [_segment_length(s) for s in raw_offset]
+    split_points: Dict[Position, Point] = dict()
+
+    def add_split_position(index: int, t: float, point: Point) -> None:
+        tol = abs_tol / lengths[index]
+        if t >= 1. - tol:  # use the start point of the next segment
+            index += 1
+            t = 0.
+        if index == count:
+            if not closed:
+                return  # end point of open polyline
+            index = 0
+        if t <= tol:
+            if index == 0 and not closed:
+                return  # start point of open polyline
+            point = raw_offset[index][0], raw_offset[index][1]
+            t = 0.
+        split_points.setdefault((index, t), point)
+
+    def is_joint(index: int, point: Point) -> bool:
+        # point is the start point of segment `index`
+        return math.hypot(point[0] - raw_offset[index][0], point[1] - raw_offset[index][1]) <= abs_tol
+
+    # Sweep over the bounding boxes of the segments in x-direction, the cutters are appended to the raw offset
+    # segments and split only the raw offset segments
+    all_segments = raw_offset + cutters
+    boxes = [_segment_bbox(s) for s in all_segments]
+    active = []
+    for i in sorted(range(len(all_segments)), key=lambda index: boxes[index][0]):
+        min_x, min_y, max_x, max_y = boxes[i]
+        active = [j for j in active if boxes[j][2] >= min_x - abs_tol]
+        for j in active:
+            box = boxes[j]
+            if box[1] > max_y + abs_tol or box[3] < min_y - abs_tol:
+                continue
+            a, b = (i, j) if i < j else (j, i)
+            if a >= count:
+                continue  # cutter - cutter
+            for ta, tb, point in _intersect(all_segments[a], all_segments[b], abs_tol):
+                if b >= count:
+                    add_split_position(a, ta, point)
+                    continue
+                if b == a + 1 and is_joint(b, point):
+                    continue  # common vertex of consecutive segments
+                if closed and a == 0 and b == count - 1 and is_joint(0, point):
+                    continue
+                add_split_position(a, ta, point)
+                add_split_position(b, tb, point)
+        active.append(i)
+
+    positions = sorted(split_points)
+    if not positions:
+        return [raw_offset]
+    if closed:
+        starts = positions
+        ends = positions[1:] + [(positions[0][0] + count, positions[0][1])]
+    else:
+        starts = [(0, 0.)] + positions
+        ends = positions + [(count, 0.)]
+    split_points[(0, 0.)] = raw_offset[0][:2]
+    split_points[(count, 0.)] = raw_offset[-1][2:4]
+
+    slices = []
+    for (index, t), (end_index, end_t) in zip(starts, ends):
+        point = split_points[(index, t)]
+        end_point = split_points[(end_index % count, end_t)] if end_index < count or closed else \
+            split_points[(count, 0.)]
+        segments = []
+        while index <= end_index:
+            segment = raw_offset[index % count]
+            if index == end_index:
+                t1 = end_t
+                p1 = end_point
+            else:
+                t1 = 1.
+                p1 = segment[2], segment[3]
+            if t1 > t:
+                if t == 0. and t1 == 1.:
+                    segments.append(segment)
+                else:
+                    bulge = segment[4]
+                    if bulge != 0.:
+                        bulge = math.tan(math.atan(bulge) * (t1 - t))
+                    segments.append(point + p1 + (bulge,))
+            index += 1
+            t = 0.
+            point = p1
+        if segments:
+            slices.append(segments)
+    return slices
+
+
+def _distance_point_segment(x: float, y: float, segment: Segment) -> float:
+    x1, y1, x2, y2, bulge = segment
+    if bulge != 0.:
+        cx, cy, radius, start, sweep = _arc(segment)
+        angle = math.atan2(y - cy, x - cx)
+        delta = (angle - start) % math.tau if sweep > 0. else (start - angle) % math.tau
+        if delta <= abs(sweep):
+            return abs(math.hypot(x - cx, y - cy) - radius)
+        return min(math.hypot(x - x1, y - y1), math.hypot(x - x2, y - y2))
+    dx = x2 - x1
+    dy = y2 - y1
+    length2 = dx * dx + dy * dy
+    t = 0.
+    if length2 > 0.:
+        t = min(max(((x - x1) * dx + (y - y1) * dy) / length2, 0.), 1.)
+    return math.hypot(x - x1 - t * dx, y - y1 - t * dy)
+
+
+def _direction(segment: Segment, x: float, y: float) -> Point:
+    # Returns the normalized tangent of a segment at the point (x, y), for arcs the tangent at the projection
+    # of the point onto the circle
+    x1, y1, x2, y2, bulge = segment
+    if bulge == 0.:
+        dx = x2 - x1
+        dy = y2 - y1
+    else:
+        cx, cy, _, _, _ = _arc(segment)
+        sign = math.copysign(1., bulge)
+        dx = -(y - cy) * sign
+        dy = (x - cx) * sign
+    length = math.hypot(dx, dy)
+    if length == 0.:
+        return 0., 0.
+    return dx / length, dy / length
+
+
+def _is_valid_slice(offset_slice: List[Segment], segments: List[Segment],
+                    nearest: Callable[[float, float], Tuple[float, int]], min_distance: float) -> bool:
+    # A valid slice does not come closer to the source polyline than the offset distance and runs in the direction
+    # of the nearest source segment. The loops of the raw offset curve at concave corners are removed by the
+    # direction test, which is independent from the turn angle, the distance test fails for the shallow loops
+    # of dense polylines.
+    for segment in offset_slice:
+        x, y = _segment_point(segment, .5)
+        distance, index = nearest(x, y)
+        if distance < min_distance:
+            return False
+        if index >= 0:
+            tx, ty = _direction(segment, x, y)
+            sx, sy = _direction(segments[index], x, y)
+            if tx * sx + ty * sy < -.5:
+                return False
+    return True
+
+
+def _nearest_segment_function(segments: List[Segment], radius: float) -> Callable[[float, float], Tuple[float, int]]:
+    # Returns a function which returns the distance of a point to the polyline `segments` and the index of the
+    # nearest segment, if the distance is smaller than `radius`, else (`radius`, -1).
+    if len(segments) <= MAX_BRUTE_FORCE_SEGMENTS:
+        def nearest(x: float, y: float) -> Tuple[float, int]:
+            best = radius
+            best_index = -1
+            for index, segment in enumerate(segments):
+                distance = _distance_point_segment(x, y, segment)
+                if distance < best:
+                    best = distance
+                    best_index = index
+            return best, best_index
+
+        return nearest
+
+    # Bounding box hierarchy of consecutive segments: each level groups CHUNK_SIZE boxes of the level below,
+    # consecutive segments of a polyline are close together, so the boxes stay compact for any vertex density.
+    # The boxes are searched nearest first and only boxes closer than the nearest segment found so far are opened.
+    levels = [[_segment_bbox(segment) for segment in segments]]
+    while len(levels) == 1 or len(levels[-1]) > CHUNK_SIZE:
+        boxes = levels[-1]
+        levels.append([(
+            min(box[0] for box in chunk),
+            min(box[1] for box in chunk),
+            max(box[2] for box in chunk),
+            max(box[3] for box in chunk),
+        ) for chunk in (boxes[start:start + CHUNK_SIZE] for start in range(0, len(boxes), CHUNK_SIZE))])
+    top = len(levels) - 1
+
+    def box_distance2(x: float, y: float, box: Tuple[float, float, float, float]) -> float:
+        x1, y1, x2, y2 = box
+        dx = x1 - x if x < x1 else (x - x2 if x > x2 else 0.)
+        dy = y1 - y if y < y1 else (y - y2 if y > y2 else 0.)
+        return dx * dx + dy * dy
+
+    def nearest(x: float, y: float) -> Tuple[float, int]:
+        best = radius
+        best_index = -1
+        best2 = best * best
+        heap = [(box_distance2(x, y, box), top, index) for index, box in enumerate(levels[top])]
+        heapq.heapify(heap)
+        while heap:
+            distance2, level, index = heapq.heappop(heap)
+            if distance2 >= best2:
+                break
+            level -= 1
+            boxes = levels[level]
+            start = index * CHUNK_SIZE
+            for child in range(start, min(start + CHUNK_SIZE, len(boxes))):
+                distance2 = box_distance2(x, y, boxes[child])
+                if distance2 >= best2:
+                    continue
+                if level:
+                    heapq.heappush(heap, (distance2, level, child))
+                    continue
+                # the segments of the nearest chunk are tested immediately
+                distance = _distance_point_segment(x, y, segments[child])
+                if distance < best:
+                    best = distance
+                    best_index = child
+                    best2 = best * best
+        return best, best_index
+
+    return nearest
+
+
+def _stitch(slices: List[List[Segment]], closed: bool, abs_tol: float) -> List[List[Segment]]:
+    # Connects slices with coincident end- and start points, prefers the next slice in the order of the
+    # raw offset curve. Unclosed chains of a closed polyline are removed.
+    count = len(slices)
+    used = [False] * count
+    result = []
+    for first in range(count):
+        if used[first]:
+            continue
+        used[first] = True
+        chain = list(slices[first])
+        start_x, start_y = chain[0][0], chain[0][1]
+        current = first
+        is_closed = False
+        while True:
+            end_x, end_y = chain[-1][2], chain[-1][3]
+            if closed and math.hypot(end_x - start_x, end_y - start_y) <= abs_tol:
+                is_closed = True
+                break
+            for step in range(1, count):
+                candidate = (current + step) % count
+                if not used[candidate]:
+                    x, y = slices[candidate][0][0], slices[candidate][0][1]
+                    if math.hypot(x - end_x, y - end_y) <= abs_tol:
+                        break
+            else:
+                break
+            used[candidate] = True
+            _extend_chain(chain, slices[candidate], abs_tol)
+            current = candidate
+        if is_closed and len(chain) > 1:
+            merged = _merge_segments(chain[-1], chain[0], abs_tol)
+            if merged:
+                chain.pop()
+                chain[0] = merged
+        if is_closed or not closed:
+            result.append(chain)
+    return result
+
+
+def _extend_chain(chain: List[Segment], segments: List[Segment], abs_tol: float) -> None:
+    # Removes the split point between two parts of the same raw offset segment
+    merged = _merge_segments(chain[-1], segments[0], abs_tol)
+    if merged:
+        chain[-1] = merged
+        chain.extend(segments[1:])
+    else:
+        chain.extend(segments)
+
+
+def _merge_segments(segment1: Segment, segment2: Segment, abs_tol: float) -> Optional[Segment]:
+    # Returns the merged segment if segment2 continues segment1 with the same line or arc, else None
+    bulge1 = segment1[4]
+    bulge2 = segment2[4]
+    if bulge1 == 0. and bulge2 == 0.:
+        x1, y1, x2, y2, _ = segment1
+        _, _, x3, y3, _ = segment2
+        dx = x3 - x1
+        dy = y3 - y1
+        length = math.hypot(dx, dy)
+        if length == 0. or math.fabs((x2 - x1) * dy - (y2 - y1) * dx) / length > abs_tol or \
+                (x2 - x1) * dx + (y2 - y1) * dy <= 0. or (x3 - x2) * dx + (y3 - y2) * dy <= 0.:
+            return None
+        return x1, y1, x3, y3, 0.
+    if bulge1 == 0. or bulge2 == 0. or (bulge1 > 0.) != (bulge2 > 0.):
+        return None
+    cx1, cy1, r1, _, _ = _arc(segment1)
+    cx2, cy2, r2, _, _ = _arc(segment2)
+    quarter_sweep = math.atan(bulge1) + math.atan(bulge2)
+    if math.hypot(cx2 - cx1, cy2 - cy1) > abs_tol or math.fabs(r2 - r1) > abs_tol or \
+            math.fabs(quarter_sweep) >= math.pi * .49:  # sweep angle close to 360 deg
+        return None
+    return segment1[0], segment1[1], segment2[2], segment2[3], math.tan(quarter_sweep)
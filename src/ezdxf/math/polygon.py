@@ -0,0 +1,246 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Optional, Sequence
+import math
+from .vector import Vec2
+from .construct2d import TOLERANCE
+from .vec3array import numpy, USE_NUMPY_LIMIT
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['points_in_polygon_2d', 'PolygonIndex']
+
+# Max. count of point-edge pairs processed by numpy at once
+NUMPY_CHUNK_SIZE = 1_000_000
+
+Line = Tuple[float, float, float, float]  # x1, y1, x2, y2
+BBox = Tuple[float, float, float, float]  # min_x, min_y, max_x, max_y
+
+
+def points_in_polygon_2d(points: Iterable['Vertex'], polygon: Iterable['Vertex'], abs_tol=TOLERANCE) -> List[int]:
+    """
+    Test if `points` are inside of `polygon`, same as :func:`is_point_in_polygon_2d` for many points, but the
+    polygon edges are prepared only once and the test is vectorized by `numpy` if installed. The polygon is
+    located in the xy-plane, the z-axis is ignored.
+
+    Args:
+        points: iterable of :class:`Vec2` compatible points to test
+        polygon: iterable of :class:`Vec2` compatible polygon vertices, at least 3 vertices
+        abs_tol: tolerance for distance check
+
+    Returns:
+        list of ``+1`` for inside, ``0`` for on boundary line, ``-1`` for outside, for each point
+
+    Raises:
+        ValueError: less than 3 polygon vertices
+
+    .. versionadded:: 0.14
+
+    """
+    edges = _polygon_edges(polygon)
+    coords = [(v.x, v.y) for v in Vec2.generate(points)]
+    if numpy is not None and len(coords) > USE_NUMPY_LIMIT:
+        xs, ys = numpy.array(coords, dtype=float).T
+        return _points_in_polygon_numpy(xs, ys, numpy.array(edges, dtype=float), abs_tol).tolist()
+    return [_point_in_polygon(x, y, edges, abs_tol) for x, y in coords]
+
+
+def _polygon_edges(polygon: Iterable['Vertex']) -> List[Line]:
+    points = [(v.x, v.y) for v in Vec2.generate(polygon)]
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    if len(points) < 3:
+        raise ValueError('At least 3 polygon points required.')
+    return [(x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])]
+
+
+def _edges_bbox(edges: List[Line]) -> BBox:
+    xs = [e[0] for e in edges]
+    ys = [e[1] for e in edges]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _point_in_polygon(x: float, y: float, edges: List[Line], abs_tol: float) -> int:
+    # same algorithm as is_point_in_polygon_2d() for prepared edges
+    inside = False
+    for x1, y1, x2, y2 in edges:
+        if ((x1 <= x <= x2) or (x2 <= x <= x1)) and ((y1 <= y <= y2) or (y2 <= y <= y1)) and \
+                math.fabs((y2 - y1) * x - (x2 - x1) * y + (x2 * y1 - y2 * x1)) <= abs_tol:
+            return 0
+        if ((y1 <= y < y2) or (y2 <= y < y1)) and (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1):
+            inside = not inside
+    return 1 if inside else -1
+
+
+def _points_in_polygon_numpy(xs: 'numpy.ndarray', ys: 'numpy.ndarray', edges: 'numpy.ndarray',
+                             abs_tol: float) -> 'numpy.ndarray':
+    x1, y1, x2, y2 = edges.T
+    min_x = numpy.minimum(x1, x2)
+    max_x = numpy.maximum(x1, x2)
+    min_y = numpy.minimum(y1, y2)
+    max_y = numpy.maximum(y1, y2)
+    dx = x2 - x1
+    dy = y2 - y1
+    c = x2 * y1 - y2 * x1
+    result = numpy.empty(len(xs), dtype=int)
+    chunk_size = max(NUMPY_CHUNK_SIZE // len(edges), 1)
+    for start in range(0, len(xs), chunk_size):
+        # broadcast points as column vectors against edges as row vectors
+        x = xs[start:start + chunk_size, None]
+        y = ys[start:start + chunk_size, None]
+        on_boundary = (min_x <= x) & (x <= max_x) & (min_y <= y) & (y <= max_y) & \
+                      (numpy.fabs(dy * x - dx * y + c) <= abs_tol)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            crossing = (((y1 <= y) & (y < y2)) | ((y2 <= y) & (y < y1))) & (x < dx * (y - y1) / dy + x1)
+        chunk = numpy.where(numpy.count_nonzero(crossing, axis=1) % 2 == 1, 1, -1)
+        chunk[numpy.any(on_boundary, axis=1)] = 0
+        result[start:start + chunk_size] = chunk
+    return result
+
+
+# R-tree node: bounding box, is leaf, polygon indices for leaf nodes else child nodes
+_Node = Tuple[BBox, bool, list]
+
+
+class PolygonIndex:
+    """
+    Spatial index of 2D polygons in the xy-plane to locate the polygons containing given points, e.g. to assign
+    survey points to parcel boundaries. The polygons are stored as prepared edge lists and their bounding boxes
+    are organized in a static R-tree (sort-tile-recursive bulk loading), so a point is only tested against
+    polygons with a bounding box containing the point. A point on the boundary of a polygon is inside of this
+    polygon.
+
+    The vertices of LWPOLYLINE and HATCH boundary paths can be used as polygons, curved segments have to be
+    flattened in advance.
+
+    Args:
+        polygons: iterable of polygons, each polygon as iterable of :class:`Vec2` compatible vertices, at least 3
+            vertices
+        abs_tol: tolerance for the boundary check
+        node_size: max. count of entries of a R-tree node
+
+    .. versionadded:: 0.14
+
+    """
+
+    def __init__(self, polygons: Iterable[Iterable['Vertex']], abs_tol: float = TOLERANCE, node_size: int = 16):
+        if node_size < 2:
+            raise ValueError('node_size has to be >= 2')
+        self.abs_tol = abs_tol
+        self._edges: List[List[Line]] = [_polygon_edges(polygon) for polygon in polygons]
+        self._bboxes: List[BBox] = [_edges_bbox(edges) for edges in self._edges]
+        self._edge_arrays = None  # numpy arrays of edges, created on demand
+        self._root: Optional[_Node] = _build_str_tree(self._bboxes, node_size) if self._bboxes else None
+
+    def __len__(self) -> int:
+        """ Returns count of indexed polygons. """
+        return len(self._edges)
+
+    def candidates(self, point: 'Vertex') -> List[int]:
+        """ Returns the indices of all polygons with a bounding box containing `point` in ascending order. """
+        point = Vec2(point)
+        x = point.x
+        y = point.y
+        tol = self.abs_tol
+        result = []
+        stack = [self._root] if self._root else []
+        while stack:
+            (min_x, min_y, max_x, max_y), is_leaf, entries = stack.pop()
+            if min_x - tol <= x <= max_x + tol and min_y - tol <= y <= max_y + tol:
+                if is_leaf:
+                    result.extend(entries)
+                else:
+                    stack.extend(entries)
+        result.sort()
+        return result
+
+    def polygons_at(self, point: 'Vertex') -> List[int]:
+        """ Returns the indices of all polygons containing `point` in ascending order. """
+        point = Vec2(point)
+        return [
+            index for index in self.candidates(point)
+            if _point_in_polygon(point.x, point.y, self._edges[index], self.abs_tol) >= 0
+        ]
+
+    def locate(self, points: Iterable['Vertex']) -> List[int]:
+        """
+        Returns the index of the polygon containing each point or ``-1`` for points outside of all polygons.
+        If a point is located in multiple polygons, the lowest polygon index is returned. Uses `numpy` for
+        many points if installed.
+
+        """
+        points = Vec2.list(points)
+        if numpy is not None and len(points) > USE_NUMPY_LIMIT:
+            return self._locate_numpy(points)
+        result = []
+        edges = self._edges
+        abs_tol = self.abs_tol
+        for point in points:
+            index = -1
+            for candidate in self.candidates(point):
+                if _point_in_polygon(point.x, point.y, edges[candidate], abs_tol) >= 0:
+                    index = candidate
+                    break
+            result.append(index)
+        return result
+
+    def _locate_numpy(self, points: List[Vec2]) -> List[int]:
+        # Reverse search: locate the candidate points of each polygon in the points sorted by x
+        if self._edge_arrays is None:
+            self._edge_arrays = [numpy.array(edges, dtype=float) for edges in self._edges]
+        xs = numpy.array([p.x for p in points], dtype=float)
+        ys = numpy.array([p.y for p in points], dtype=float)
+        order = numpy.argsort(xs, kind='stable')
+        sorted_xs = xs[order]
+        result = numpy.full(len(points), -1, dtype=int)
+        tol = self.abs_tol
+        for index, (min_x, min_y, max_x, max_y) in enumerate(self._bboxes):
+            start = numpy.searchsorted(sorted_xs, min_x - tol, side='left')
+            end = numpy.searchsorted(sorted_xs, max_x + tol, side='right')
+            if start == end:
+                continue
+            candidates = order[start:end]
+            candidate_ys = ys[candidates]
+            candidates = candidates[(candidate_ys >= min_y - tol) & (candidate_ys <= max_y + tol)]
+            candidates = candidates[result[candidates] < 0]  # lowest polygon index wins
+            if len(candidates) == 0:
+                continue
+            inside = _points_in_polygon_numpy(xs[candidates], ys[candidates], self._edge_arrays[index], tol)
+            result[candidates[inside >= 0]] = index
+        return result.tolist()
+
+
+def _build_str_tree(bboxes: Sequence[BBox], node_size: int) -> _Node:
+    # Sort-Tile-Recursive bulk loading: Leutenegger, Lopez, Edgington 1997
+    entries = [(bbox, index) for index, bbox in enumerate(bboxes)]
+    is_leaf = True
+    while True:
+        nodes = [
+            (_union_bbox([bbox for bbox, _ in group]), is_leaf, [entry for _, entry in group])
+            for group in _str_groups(entries, node_size)
+        ]
+        if len(nodes) == 1:
+            return nodes[0]
+        entries = [(node[0], node) for node in nodes]
+        is_leaf = False
+
+
+def _str_groups(entries: list, node_size: int) -> Iterable[list]:
+    node_count = math.ceil(len(entries) / node_size)
+    slice_size = math.ceil(math.sqrt(node_count)) * node_size
+    entries = sorted(entries, key=lambda e: e[0][0] + e[0][2])  # by x-center
+    for start in range(0, len(entries), slice_size):
+        vertical_slice = sorted(entries[start:start + slice_size], key=lambda e: e[0][1] + e[0][3])  # by y-center
+        for group_start in range(0, len(vertical_slice), node_size):
+            yield vertical_slice[group_start:group_start + node_size]
+
+
+def _union_bbox(bboxes: List[BBox]) -> BBox:
+    return (
+        min(bbox[0] for bbox in bboxes),
+        min(bbox[1] for bbox in bboxes),
+        max(bbox[2] for bbox in bboxes),
+        max(bbox[3] for bbox in bboxes),
+    )
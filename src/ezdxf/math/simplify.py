@@ -0,0 +1,213 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import TYPE_CHECKING, Iterable, List, Sequence
+import heapq
+import math
+from .vector import Vector
+from .vec3array import numpy, USE_NUMPY_LIMIT
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = [
+    'douglas_peucker_indices', 'simplify_douglas_peucker', 'visvalingam_indices', 'simplify_visvalingam',
+]
+
+
+def douglas_peucker_indices(vertices: Iterable['Vertex'], tolerance: float) -> List[int]:
+    """
+    Returns the indices of the vertices kept by the Douglas-Peucker simplification in ascending order. The first
+    and the last vertex are always kept, all removed vertices have a distance <= `tolerance` to the simplified
+    polyline. The algorithm runs iterative without recursion limit and the distances to a segment are
+    vectorized by `numpy` if installed.
+
+    For closed polylines append the first vertex as last vertex.
+
+    Args:
+        vertices: iterable of :class:`Vector` compatible vertices
+        tolerance: max. distance of removed vertices to the simplified polyline
+
+    .. versionadded:: 0.14
+
+    """
+    coords = [(v.x, v.y, v.z) for v in Vector.generate(vertices)]
+    count = len(coords)
+    if count < 3:
+        return list(range(count))
+    if numpy is not None and count > USE_NUMPY_LIMIT:
+        return _douglas_peucker_numpy(numpy.array(coords, dtype=float), tolerance)
+    return _douglas_peucker(coords, tolerance)
+
+
+def simplify_douglas_peucker(vertices: Iterable['Vertex'], tolerance: float) -> List[Vector]:
+    """
+    Returns the vertices kept by the Douglas-Peucker simplification as list of :class:`Vector`,
+    see :func:`douglas_peucker_indices`.
+
+    .. versionadded:: 0.14
+
+    """
+    vertices = Vector.list(vertices)
+    return [vertices[index] for index in douglas_peucker_indices(vertices, tolerance)]
+
+
+def visvalingam_indices(vertices: Iterable['Vertex'], min_area: float) -> List[int]:
+    """
+    Returns the indices of the vertices kept by the Visvalingam-Whyatt simplification in ascending order.
+    The vertex with the smallest effective area, which is the area of the triangle formed by the vertex and its
+    neighbors, is removed until all remaining vertices have an effective area >= `min_area`. The first and the
+    last vertex are always kept.
+
+    For closed polylines append the first vertex as last vertex.
+
+    Args:
+        vertices: iterable of :class:`Vector` compatible vertices
+        min_area: min. effective area of kept vertices
+
+    .. versionadded:: 0.14
+
+    """
+    coords = [(v.x, v.y, v.z) for v in Vector.generate(vertices)]
+    count = len(coords)
+    if count < 3:
+        return list(range(count))
+
+    prev = list(range(-1, count - 1))
+    next_ = list(range(1, count + 1))
+    if numpy is not None and count > USE_NUMPY_LIMIT:
+        points = numpy.array(coords, dtype=float)
+        areas = [math.inf] + _triangle_areas_numpy(points[:-2], points[1:-1], points[2:]).tolist() + [math.inf]
+    else:
+        areas = [math.inf] + [
+            _triangle_area(coords[index - 1], coords[index], coords[index + 1]) for index in range(1, count - 1)
+        ] + [math.inf]
+    heap = [(area, index) for index, area in enumerate(areas) if area < min_area]
+    heapq.heapify(heap)
+    removed = [False] * count
+    while heap:
+        area, index = heapq.heappop(heap)
+        if removed[index] or area != areas[index]:
+            continue  # removed vertex or outdated area
+        removed[index] = True
+        p = prev[index]
+        n = next_[index]
+        next_[p] = n
+        prev[n] = p
+        for neighbor in (p, n):
+            if neighbor == 0 or neighbor == count - 1:
+                continue
+            # the effective area of a neighbor can not be smaller than the area of the removed vertex
+            new_area = max(_triangle_area(coords[prev[neighbor]], coords[neighbor], coords[next_[neighbor]]), area)
+            areas[neighbor] = new_area
+            if new_area < min_area:
+                heapq.heappush(heap, (new_area, neighbor))
+    return [index for index in range(count) if not removed[index]]
+
+
+def simplify_visvalingam(vertices: Iterable['Vertex'], min_area: float) -> List[Vector]:
+    """
+    Returns the vertices kept by the Visvalingam-Whyatt simplification as list of :class:`Vector`,
+    see :func:`visvalingam_indices`.
+
+    .. versionadded:: 0.14
+
+    """
+    vertices = Vector.list(vertices)
+    return [vertices[index] for index in visvalingam_indices(vertices, min_area)]
+
+
+def _distance_point_segment(p: Sequence[float], a: Sequence[float], b: Sequence[float]) -> float:
+    ax, ay, az = a
+    dx = b[0] - ax
+    dy = b[1] - ay
+    dz = b[2] - az
+    px = p[0] - ax
+    py = p[1] - ay
+    pz = p[2] - az
+    length2 = dx * dx + dy * dy + dz * dz
+    if length2 > 0.:
+        t = min(max((px * dx + py * dy + pz * dz) / length2, 0.), 1.)
+        px -= dx * t
+        py -= dy * t
+        pz -= dz * t
+    return math.sqrt(px * px + py * py + pz * pz)
+
+
+def _douglas_peucker(coords: List[Sequence[float]], tolerance: float) -> List[int]:
+    count = len(coords)
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a = coords[start]
+        b = coords[end]
+        max_distance = -1.
+        max_index = start
+        for index in range(start + 1, end):
+            distance = _distance_point_segment(coords[index], a, b)
+            if distance > max_distance:
+                max_distance = distance
+                max_index = index
+        if max_distance > tolerance:
+            keep[max_index] = True
+            stack.append((start, max_index))
+            stack.append((max_index, end))
+    return [index for index in range(count) if keep[index]]
+
+
+def _douglas_peucker_numpy(points: 'numpy.ndarray', tolerance: float) -> List[int]:
+    count = len(points)
+    keep = numpy.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        if end - start <= USE_NUMPY_LIMIT:
+            # small ranges are faster in pure Python
+            coords = points[start:end + 1].tolist()
+            a = coords[0]
+            b = coords[-1]
+            distances = [_distance_point_segment(p, a, b) for p in coords[1:-1]]
+            max_index = max(range(len(distances)), key=distances.__getitem__)
+            max_distance = distances[max_index]
+        else:
+            a = points[start]
+            direction = points[end] - a
+            vectors = points[start + 1:end] - a
+            length2 = direction.dot(direction)
+            if length2 > 0.:
+                t = numpy.clip(vectors.dot(direction) / length2, 0., 1.)
+                vectors -= t[:, None] * direction
+            distances = numpy.einsum('ij,ij->i', vectors, vectors)
+            max_index = int(numpy.argmax(distances))
+            max_distance = math.sqrt(distances[max_index])
+        if max_distance > tolerance:
+            max_index += start + 1
+            keep[max_index] = True
+            stack.append((start, max_index))
+            stack.append((max_index, end))
+    return numpy.flatnonzero(keep).tolist()
+
+
+def _triangle_area(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> float:
+    ux = b[0] - a[0]
+    uy = b[1] - a[1]
+    uz = b[2] - a[2]
+    vx = c[0] - a[0]
+    vy = c[1] - a[1]
+    vz = c[2] - a[2]
+    x = uy * vz - uz * vy
+    y = uz * vx - ux * vz
+    z = ux * vy - uy * vx
+    return math.sqrt(x * x + y * y + z * z) * .5
+
+
+def _triangle_areas_numpy(a: 'numpy.ndarray', b: 'numpy.ndarray', c: 'numpy.ndarray') -> 'numpy.ndarray':
+    cross = numpy.cross(b - a, c - a)
+    return numpy.sqrt(numpy.einsum('ij,ij->i', cross, cross)) * .5
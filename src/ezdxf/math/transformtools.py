@@ -6,7 +6,7 @@ import math
 from .matrix44 import Matrix44
 from .construct2d import sign
 from .vector import Vector, X_AXIS, Y_AXIS, Vec2
-from .ucs import OCS
+from .ucs import OCS, get_ocs
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFGraphic, Vertex
@@ -51,7 +51,7 @@ def transform_extrusion(extrusion: 'Vertex', m: Matrix44) -> Tuple[Vector, bool]
     Returns:
 
     """
-    ocs = OCS(extrusion)
+    ocs = get_ocs(extrusion)
     ocs_x_axis_in_wcs = ocs.to_wcs(X_AXIS)
     ocs_y_axis_in_wcs = ocs.to_wcs(Y_AXIS)
     x_axis, y_axis = m.transform_directions((ocs_x_axis_in_wcs, ocs_y_axis_in_wcs))
@@ -70,9 +70,9 @@ class OCSTransform:
             self.scale_uniform = False
             self.new_ocs = None
         else:
-            self.old_ocs = OCS(extrusion)
+            self.old_ocs = get_ocs(extrusion)
             new_extrusion, self.scale_uniform = transform_extrusion(extrusion, m)
-            self.new_ocs = OCS(new_extrusion)
+            self.new_ocs = get_ocs(new_extrusion)
 
     @property
     def old_extrusion(self) -> Vector:
@@ -0,0 +1,898 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+#
+# Ear clipping with hole elimination and z-order hashing is based on the
+# "earcut" algorithm, Copyright (c) 2016 Mapbox, ISC License:
+# https://github.com/mapbox/earcut
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple, Optional
+import math
+from .vector import Vec2, Vector
+from .ucs import OCS
+from .polygon import _edges_bbox, _point_in_polygon
+from .construct2d import TOLERANCE
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = [
+    'triangulate_indices_2d', 'triangulate_polygon_2d', 'triangulate_polygons_2d', 'triangulate_polygon_3d',
+    'nest_polygons_2d',
+]
+
+# Use z-order hashing to find points inside of ears for polygons with more vertices than this limit
+USE_HASHING_LIMIT = 80
+# Use a grid to find the bridges to the outer boundary for polygons with more holes than this limit
+USE_GRID_HOLES_LIMIT = 16
+
+Triangle = Tuple[int, int, int]
+Ring = List[Tuple[float, float]]
+BBox = Tuple[float, float, float, float]  # min_x, min_y, max_x, max_y
+Line = Tuple[float, float, float, float]  # x1, y1, x2, y2
+
+
+def triangulate_indices_2d(exterior: Iterable['Vertex'], holes: Iterable[Iterable['Vertex']] = None) -> List[Triangle]:
+    """
+    Triangulate a simple polygon with optional `holes` in the xy-plane by ear clipping, the z-axis is ignored.
+    Holes are eliminated by bridges to the exterior boundary, which are located by a grid for polygons with many
+    holes, and ears are located by z-order hashing for big polygons. The runtime is close to O(n log n) for
+    polygons with a compact outline, but each ear is tested against all vertices in the z-order range
+    of its bounding box: the large ears of long wavy or comb shaped outlines increase the runtime towards O(n²).
+
+    Returns the triangles as 3-tuples of vertex indices, the indices refer to the concatenated list of the `exterior`
+    vertices followed by the vertices of all `holes` as given, closing vertices equal to the first vertex of a
+    boundary path are never referenced. The triangles have the same orientation as the `exterior` boundary path.
+
+    Args:
+        exterior: exterior boundary path as iterable of :class:`Vec2` compatible vertices
+        holes: iterable of hole boundary paths, each path as iterable of :class:`Vec2` compatible vertices
+
+    .. versionadded:: 0.14
+
+    """
+    return _triangulate_rings(_path_coords(exterior), [_path_coords(hole) for hole in holes or []], 0)
+
+
+def triangulate_polygon_2d(exterior: Iterable['Vertex'],
+                           holes: Iterable[Iterable['Vertex']] = None) -> List[Tuple[Vec2, Vec2, Vec2]]:
+    """
+    Triangulate a simple polygon with optional `holes` in the xy-plane, same as :func:`triangulate_indices_2d`
+    but returns the triangles as 3-tuples of :class:`Vec2` objects.
+
+    Args:
+        exterior: exterior boundary path as iterable of :class:`Vec2` compatible vertices
+        holes: iterable of hole boundary paths, each path as iterable of :class:`Vec2` compatible vertices
+
+    .. versionadded:: 0.14
+
+    """
+    vertices = Vec2.list(exterior)
+    hole_vertices = [Vec2.list(hole) for hole in holes or []]
+    triangles = triangulate_indices_2d(vertices, hole_vertices)
+    for hole in hole_vertices:
+        vertices.extend(hole)
+    return [(vertices[a], vertices[b], vertices[c]) for a, b, c in triangles]
+
+
+def triangulate_polygons_2d(polygons: Iterable[Sequence[Iterable['Vertex']]]) -> Tuple[List[Vec2], List[Triangle]]:
+    """
+    Batch triangulation of many polygons with holes in the xy-plane, e.g. the boundary paths of many hatches.
+    Each polygon is a sequence of boundary paths, the first path is the exterior boundary path and all following
+    paths are holes, see also :func:`nest_polygons_2d`.
+
+    Returns the vertices of all polygons as list of :class:`Vec2` without the closing vertices and the triangles of
+    all polygons as 3-tuples of indices into this vertex list, which is ready to use for mesh building.
+
+    Args:
+        polygons: iterable of polygons, each polygon as sequence of boundary paths and each path as iterable of
+            :class:`Vec2` compatible vertices
+
+    .. versionadded:: 0.14
+
+    """
+    vertices = []  # type: List[Vec2]
+    triangles = []  # type: List[Triangle]
+    for paths in polygons:
+        if not paths:
+            continue
+        paths = [_open_path(Vec2.list(path)) for path in paths]
+        rings = [[(v.x, v.y) for v in path] for path in paths]
+        triangles.extend(_triangulate_rings(rings[0], rings[1:], len(vertices)))
+        for path in paths:
+            vertices.extend(path)
+    return vertices, triangles
+
+
+def triangulate_polygon_3d(exterior: Iterable['Vertex'],
+                           holes: Iterable[Iterable['Vertex']] = None) -> List[Tuple[Vector, Vector, Vector]]:
+    """
+    Triangulate a planar polygon with optional `holes` in 3D space. The vertices are projected onto the plane
+    defined by the normal vector of the `exterior` boundary path, the triangles have the same orientation as the
+    `exterior` boundary path. Returns an empty list for degenerated polygons without area.
+
+    Args:
+        exterior: exterior boundary path as iterable of :class:`Vector` compatible vertices
+        holes: iterable of hole boundary paths, each path as iterable of :class:`Vector` compatible vertices
+
+    .. versionadded:: 0.14
+
+    """
+    vertices = Vector.list(exterior)
+    hole_vertices = [Vector.list(hole) for hole in holes or []]
+    triangles = _triangulate_indices_3d(vertices, hole_vertices)
+    for hole in hole_vertices:
+        vertices.extend(hole)
+    return [(vertices[a], vertices[b], vertices[c]) for a, b, c in triangles]
+
+
+def _triangulate_indices_3d(exterior: List[Vector], holes: List[List[Vector]]) -> List[Triangle]:
+    # Indices refer to the concatenated list of exterior and hole vertices as given.
+    normal = _newell_normal(exterior)
+    if normal.is_null:
+        return []
+    ocs = OCS(normal)
+    rings = [[(v.x, v.y) for v in ocs.points_from_wcs(path)] for path in [exterior] + holes]
+    return _triangulate_rings(rings[0], rings[1:], 0)
+
+
+def nest_polygons_2d(paths: Iterable[Iterable['Vertex']], abs_tol: float = TOLERANCE) -> List[List[List[Vec2]]]:
+    """
+    Group closed boundary paths in the xy-plane into polygons with holes by the even-odd rule, like the "normal"
+    hatch style of HATCH entities: a path inside of an even count of other paths is an exterior boundary path,
+    a path inside of an odd count of other paths is a hole of the smallest surrounding path. The boundary paths
+    must not intersect each other.
+
+    Returns a list of polygons, each polygon as list of boundary paths, the first path is the exterior boundary path
+    in counter clockwise order, all following paths are holes in clockwise order. The paths are lists of
+    :class:`Vec2` without closing vertices. Paths with less than 3 vertices are ignored.
+
+    Args:
+        paths: iterable of closed boundary paths, each path as iterable of :class:`Vec2` compatible vertices
+        abs_tol: tolerance for the boundary check
+
+    .. versionadded:: 0.14
+
+    """
+    paths = [path for path in (_open_path(Vec2.list(path)) for path in paths) if len(path) > 2]
+    rings = [[(v.x, v.y) for v in path] for path in paths]
+    areas = [_signed_area(ring) for ring in rings]
+    # larger paths first, a path can only be inside of a larger path
+    order = sorted(range(len(paths)), key=lambda i: -abs(areas[i]))
+    rank = [0] * len(paths)
+    for position, index in enumerate(order):
+        rank[index] = position
+    edges = [_ring_edges(ring) for ring in rings]
+    bboxes = [_edges_bbox(ring_edges) for ring_edges in edges]
+    grid = _BBoxGrid(bboxes, abs_tol)
+    depth = [0] * len(paths)
+    parent = [-1] * len(paths)
+    for current in order:
+        path = paths[current]
+        min_x, min_y, max_x, max_y = bboxes[current]
+        containers = []
+        for candidate in grid.candidates(path[0]):
+            if rank[candidate] >= rank[current]:
+                continue
+            c_min_x, c_min_y, c_max_x, c_max_y = bboxes[candidate]
+            if c_min_x - abs_tol <= min_x and c_min_y - abs_tol <= min_y and \
+                    max_x <= c_max_x + abs_tol and max_y <= c_max_y + abs_tol and \
+                    _is_inside(rings[current], edges[candidate], abs_tol):
+                containers.append(candidate)
+        if containers:
+            depth[current] = len(containers)
+            # the smallest surrounding path is the last processed path
+            parent[current] = max(containers, key=lambda c: rank[c])
+
+    polygons = []  # type: List[List[List[Vec2]]]
+    polygon_of_path = {}
+    for current in order:
+        path = paths[current]
+        if depth[current] % 2 == 0:
+            if areas[current] < 0:
+                path.reverse()
+            polygon_of_path[current] = len(polygons)
+            polygons.append([path])
+        else:
+            if areas[current] > 0:
+                path.reverse()
+            polygons[polygon_of_path[parent[current]]].append(path)
+    return polygons
+
+
+class _BBoxGrid:
+    """ Uniform grid of bounding boxes to locate the bounding boxes containing a point. """
+
+    def __init__(self, bboxes: List[BBox], abs_tol: float):
+        self.cells = dict()
+        if not bboxes:
+            return
+        self.min_x = min(bbox[0] for bbox in bboxes)
+        self.min_y = min(bbox[1] for bbox in bboxes)
+        width = max(bbox[2] for bbox in bboxes) - self.min_x
+        height = max(bbox[3] for bbox in bboxes) - self.min_y
+        # about one cell for each bounding box
+        size = max(width, height) / max(math.sqrt(len(bboxes)), 1.)
+        self.inv_size = 1. / size if size > 0. else 0.
+        cells = self.cells
+        cell = self.cell
+        for index, (min_x, min_y, max_x, max_y) in enumerate(bboxes):
+            x0, y0 = cell(min_x - abs_tol, min_y - abs_tol)
+            x1, y1 = cell(max_x + abs_tol, max_y + abs_tol)
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    cells.setdefault((x, y), []).append(index)
+
+    def cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int((x - self.min_x) * self.inv_size), int((y - self.min_y) * self.inv_size)
+
+    def candidates(self, point: Vec2) -> List[int]:
+        """ Returns the indices of bounding boxes which may contain `point`. """
+        return self.cells.get(self.cell(point.x, point.y), [])
+
+
+def _is_inside(ring: Ring, edges: List[Line], abs_tol: float) -> bool:
+    # Paths do not intersect each other, a path is inside of a larger path if no vertex is outside, vertices on the
+    # boundary are ignored, e.g. a hole touching the exterior boundary path.
+    for x, y in ring:
+        if _point_in_polygon(x, y, edges, abs_tol) < 0:
+            return False
+    return True
+
+
+def _ring_edges(ring: Ring) -> List[Line]:
+    return [(x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1])]
+
+
+def _newell_normal(vertices: List[Vector]) -> Vector:
+    nx = ny = nz = 0.
+    prev = vertices[-1]
+    for vertex in vertices:
+        nx += (prev.y - vertex.y) * (prev.z + vertex.z)
+        ny += (prev.z - vertex.z) * (prev.x + vertex.x)
+        nz += (prev.x - vertex.x) * (prev.y + vertex.y)
+        prev = vertex
+    return Vector(nx, ny, nz)
+
+
+def _open_path(path: list) -> list:
+    if len(path) > 1 and path[0].isclose(path[-1]):
+        path.pop()
+    return path
+
+
+def _path_coords(path: Iterable['Vertex']) -> Ring:
+    # keeps closing vertex to preserve the vertex indices
+    return [(v.x, v.y) for v in Vec2.generate(path)]
+
+
+def _signed_area(ring: Ring) -> float:
+    # > 0 for counter clockwise orientation
+    area = 0.
+    x0, y0 = ring[-1]
+    for x1, y1 in ring:
+        area += (x0 - x1) * (y0 + y1)
+        x0 = x1
+        y0 = y1
+    return area / 2.
+
+
+class _Node:
+    """ Vertex of a circular doubly linked boundary path. """
+    __slots__ = ('i', 'x', 'y', 'prev', 'next', 'z', 'prev_z', 'next_z')
+
+    def __init__(self, i: int, x: float, y: float):
+        self.i = i  # vertex index
+        self.x = x
+        self.y = y
+        self.prev = None  # type: Optional[_Node]
+        self.next = None  # type: Optional[_Node]
+        self.z = -1  # z-order curve value
+        self.prev_z = None  # type: Optional[_Node]
+        self.next_z = None  # type: Optional[_Node]
+
+
+def _triangulate_rings(exterior: Ring, holes: List[Ring], offset: int) -> List[Triangle]:
+    """
+    Returns the triangles of the `exterior` ring with `holes` as vertex indices starting at `offset`. Closing
+    vertices of the rings are ignored but count for the vertex indices.
+    """
+    triangles = []  # type: List[Triangle]
+    if len(exterior) < 3:
+        return triangles
+    start = offset + len(exterior)
+    exterior_ccw = _signed_area(exterior) > 0
+    outer = _linked_list(exterior, offset, clockwise=True)
+    hole_nodes = []
+    for hole in holes:
+        if len(hole) > 2:
+            node = _linked_list(hole, start, clockwise=False)
+            if node is not None and node.next is not node.prev:
+                hole_nodes.append(node)
+        start += len(hole)
+    if outer is None or outer.next is outer.prev:
+        return triangles
+
+    vertex_count = len(exterior)
+    if hole_nodes:
+        outer = _eliminate_holes(hole_nodes, outer)
+        vertex_count += sum(len(hole) for hole in holes)
+
+    hashing = None
+    if vertex_count > USE_HASHING_LIMIT:
+        xs = [x for x, _ in exterior]
+        ys = [y for _, y in exterior]
+        min_x = min(xs)
+        min_y = min(ys)
+        size = max(max(xs) - min_x, max(ys) - min_y)
+        # z-order of coordinates as 15 bit integers
+        hashing = (min_x, min_y, 32767. / size if size else 0.)
+    _earcut_linked(outer, triangles, hashing)
+    if not exterior_ccw:
+        # the exterior ring is processed in counter clockwise order
+        triangles = [(c, b, a) for a, b, c in triangles]
+    return triangles
+
+
+def _linked_list(ring: Ring, offset: int, clockwise: bool) -> Optional[_Node]:
+    count = len(ring)
+    if count > 1 and ring[0] == ring[-1]:
+        count -= 1
+    last = None
+    # "clockwise" refers to a y-axis pointing down like the original implementation,
+    # the exterior ring is counter clockwise and holes are clockwise oriented in the xy-plane
+    if clockwise == (_signed_area(ring[:count]) > 0):
+        for index in range(count):
+            x, y = ring[index]
+            last = _insert_node(offset + index, x, y, last)
+    else:
+        for index in range(count - 1, -1, -1):
+            x, y = ring[index]
+            last = _insert_node(offset + index, x, y, last)
+    if last is not None and _equals(last, last.next):
+        _remove_node(last)
+        last = last.next
+    return last
+
+
+def _insert_node(i: int, x: float, y: float, last: Optional[_Node]) -> _Node:
+    node = _Node(i, x, y)
+    if last is None:
+        node.prev = node
+        node.next = node
+    else:
+        node.next = last.next
+        node.prev = last
+        last.next.prev = node
+        last.next = node
+    return node
+
+
+def _remove_node(node: _Node) -> None:
+    node.next.prev = node.prev
+    node.prev.next = node.next
+    if node.prev_z:
+        node.prev_z.next_z = node.next_z
+    if node.next_z:
+        node.next_z.prev_z = node.prev_z
+
+
+def _filter_points(start: Optional[_Node], end: _Node = None) -> Optional[_Node]:
+    """ Remove duplicated and collinear points. """
+    if start is None:
+        return start
+    if end is None:
+        end = start
+    node = start
+    while True:
+        again = False
+        if _equals(node, node.next) or _area(node.prev, node, node.next) == 0:
+            _remove_node(node)
+            node = end = node.prev
+            if node is node.next:
+                break
+            again = True
+        else:
+            node = node.next
+        if not again and node is end:
+            break
+    return end
+
+
+def _earcut_linked(ear: Optional[_Node], triangles: List[Triangle], hashing) -> None:
+    # The recursive passes of earcut are processed by a stack:
+    # pass 0: clip ears
+    # pass 1: remove collinear points and clip ears
+    # pass 2: cure local self intersections and clip ears
+    # pass 3: split polygon into two polygons and start again with pass 0
+    stack = [(ear, 0)]
+    while stack:
+        ear, current_pass = stack.pop()
+        if ear is None:
+            continue
+        if current_pass == 0 and hashing:
+            _index_curve(ear, hashing)
+        stop = ear
+        while ear.prev is not ear.next:
+            prev = ear.prev
+            next_ = ear.next
+            if _is_ear_hashed(ear, hashing) if hashing else _is_ear(ear):
+                triangles.append((prev.i, ear.i, next_.i))
+                _remove_node(ear)
+                # skipping the next vertex leads to less sliver triangles
+                ear = next_.next
+                stop = next_.next
+                continue
+            ear = next_
+            if ear is stop:
+                if current_pass == 0:
+                    stack.append((_filter_points(ear), 1))
+                elif current_pass == 1:
+                    ear = _cure_local_intersections(_filter_points(ear), triangles)
+                    stack.append((ear, 2))
+                else:
+                    stack.extend((node, 0) for node in _split_earcut(ear))
+                break
+
+
+def _is_ear(ear: _Node) -> bool:
+    a = ear.prev
+    b = ear
+    c = ear.next
+    ax, ay, bx, by, cx, cy = a.x, a.y, b.x, b.y, c.x, c.y
+    if (by - ay) * (cx - bx) - (bx - ax) * (cy - by) >= 0:
+        return False  # reflex, can't be an ear
+    # triangle bounding box for fast rejection
+    min_x = ax if ax < bx else bx
+    min_x = min_x if min_x < cx else cx
+    min_y = ay if ay < by else by
+    min_y = min_y if min_y < cy else cy
+    max_x = ax if ax > bx else bx
+    max_x = max_x if max_x > cx else cx
+    max_y = ay if ay > by else by
+    max_y = max_y if max_y > cy else cy
+    node = c.next
+    while node is not a:
+        px = node.x
+        py = node.y
+        if min_x <= px <= max_x and min_y <= py <= max_y and \
+                (cx - px) * (ay - py) >= (ax - px) * (cy - py) and \
+                (ax - px) * (by - py) >= (bx - px) * (ay - py) and \
+                (bx - px) * (cy - py) >= (cx - px) * (by - py) and \
+                _area(node.prev, node, node.next) >= 0:
+            return False
+        node = node.next
+    return True
+
+
+def _is_ear_hashed(ear: _Node, hashing) -> bool:
+    a = ear.prev
+    b = ear
+    c = ear.next
+    if _area(a, b, c) >= 0:
+        return False  # reflex, can't be an ear
+    ax, ay, bx, by, cx, cy = a.x, a.y, b.x, b.y, c.x, c.y
+    min_x = min(ax, bx, cx)
+    min_y = min(ay, by, cy)
+    max_x = max(ax, bx, cx)
+    max_y = max(ay, by, cy)
+    # z-order range of the triangle bounding box
+    min_z = _z_order(min_x, min_y, hashing)
+    max_z = _z_order(max_x, max_y, hashing)
+
+    def is_inside(node: _Node) -> bool:
+        px = node.x
+        py = node.y
+        return min_x <= px <= max_x and min_y <= py <= max_y and \
+            node is not a and node is not c and \
+            (cx - px) * (ay - py) >= (ax - px) * (cy - py) and \
+            (ax - px) * (by - py) >= (bx - px) * (ay - py) and \
+            (bx - px) * (cy - py) >= (cx - px) * (by - py) and \
+            _area(node.prev, node, node.next) >= 0
+
+    # look for points inside the triangle in both directions
+    p = ear.prev_z
+    n = ear.next_z
+    while p is not None and p.z >= min_z and n is not None and n.z <= max_z:
+        if is_inside(p) or is_inside(n):
+            return False
+        p = p.prev_z
+        n = n.next_z
+    while p is not None and p.z >= min_z:
+        if is_inside(p):
+            return False
+        p = p.prev_z
+    while n is not None and n.z <= max_z:
+        if is_inside(n):
+            return False
+        n = n.next_z
+    return True
+
+
+def _cure_local_intersections(start: _Node, triangles: List[Triangle]) -> _Node:
+    node = start
+    while True:
+        a = node.prev
+        b = node.next.next
+        if not _equals(a, b) and _intersects(a, node, node.next, b) and _locally_inside(a, b) and \
+                _locally_inside(b, a):
+            triangles.append((a.i, node.i, b.i))
+            _remove_node(node)
+            _remove_node(node.next)
+            node = start = b
+        node = node.next
+        if node is start:
+            break
+    return _filter_points(node)
+
+
+def _split_earcut(start: _Node) -> List[_Node]:
+    """ Split polygon by a valid diagonal into two polygons, returns the start nodes of the new polygons. """
+    a = start
+    while True:
+        b = a.next.next
+        while b is not a.prev:
+            if a.i != b.i and _is_valid_diagonal(a, b):
+                c = _split_polygon(a, b)
+                a = _filter_points(a, a.next)
+                c = _filter_points(c, c.next)
+                return [c, a]
+            b = b.next
+        a = a.next
+        if a is start:
+            return []
+
+
+def _eliminate_holes(holes: List[_Node], outer: _Node) -> _Node:
+    queue = [_leftmost(hole) for hole in holes]
+    queue.sort(key=lambda node: (node.x, node.y))
+    grid = None
+    if len(holes) > USE_GRID_HOLES_LIMIT:
+        grid = _NodeGrid(outer, holes)
+    for hole in queue:
+        outer = _eliminate_hole(hole, outer, grid)
+    return outer
+
+
+def _eliminate_hole(hole: _Node, outer: _Node, grid: '_NodeGrid' = None) -> _Node:
+    """ Connect `hole` to the `outer` boundary by a bridge. """
+    if grid is None:
+        bridge = _find_hole_bridge(hole, outer)
+    else:
+        bridge = _find_hole_bridge_in_grid(hole, grid)
+    if bridge is None:
+        return outer
+    bridge_reverse = _split_polygon(bridge, hole)
+    changed = []
+    if grid is not None:
+        # the hole and the new bridge nodes are part of the outer boundary from now on
+        node = bridge
+        while node is not bridge_reverse.next:
+            changed.append(node)
+            node = node.next
+        changed.append(node)
+    # filter collinear points around the cuts
+    _filter_local_points(bridge_reverse, changed)
+    outer = _filter_local_points(bridge, changed)
+    if grid is not None:
+        for node in changed:
+            grid.add(node)
+    return outer
+
+
+def _filter_local_points(node: _Node, changed: List[_Node]) -> _Node:
+    """
+    Remove duplicated and collinear points at `node` and its neighbors, unlike :func:`_filter_points` this does
+    not check the whole ring after a removal. Returns `node` or the nearest remaining predecessor, the
+    predecessors of removed nodes are appended to `changed`.
+    """
+    start = node
+    stack = [node.next, node]
+    while stack:
+        node = stack.pop()
+        if _is_removed(node) or node is node.next:
+            continue
+        if _equals(node, node.next) or _area(node.prev, node, node.next) == 0:
+            _remove_node(node)
+            changed.append(node.prev)
+            stack.append(node.next)
+            stack.append(node.prev)
+    while _is_removed(start):
+        start = start.prev  # removed nodes keep the links to their former neighbors
+    return start
+
+
+def _is_removed(node: _Node) -> bool:
+    return node.next.prev is not node
+
+
+class _NodeGrid:
+    """
+    Uniform grid of the outer boundary segments for the hole elimination of polygons with many holes, each node is
+    stored in the grid cells of the bounding box of the segment to its successor. Nodes are only added, a node is
+    stored again after a change of its successor and removed nodes are skipped by the queries.
+    """
+
+    def __init__(self, outer: _Node, holes: List[_Node]):
+        self.cells = dict()
+        nodes = list(_ring_nodes(outer))
+        all_nodes = nodes + [node for hole in holes for node in _ring_nodes(hole)]
+        self.min_x = min(node.x for node in all_nodes)
+        self.min_y = min(node.y for node in all_nodes)
+        width = max(node.x for node in all_nodes) - self.min_x
+        height = max(node.y for node in all_nodes) - self.min_y
+        # about one cell for each node
+        size = max(width, height) / max(math.sqrt(len(all_nodes)), 1.)
+        self.size = size
+        self.inv_size = 1. / size if size > 0. else 0.
+        for node in nodes:
+            self.add(node)
+
+    def cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int((x - self.min_x) * self.inv_size), int((y - self.min_y) * self.inv_size)
+
+    def add(self, node: _Node) -> None:
+        cells = self.cells
+        next_ = node.next
+        x0, y0 = self.cell(min(node.x, next_.x), min(node.y, next_.y))
+        x1, y1 = self.cell(max(node.x, next_.x), max(node.y, next_.y))
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cells.setdefault((x, y), []).append(node)
+
+    def nodes(self, x0: int, y0: int, x1: int, y1: int) -> Iterable[_Node]:
+        """ Returns the remaining nodes stored in the cell range, nodes can appear more than once. """
+        cells = self.cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for node in cells.get((x, y), ()):
+                    if not _is_removed(node):
+                        yield node
+
+
+def _ring_nodes(start: _Node) -> Iterable[_Node]:
+    node = start
+    while True:
+        yield node
+        node = node.next
+        if node is start:
+            return
+
+
+def _find_hole_bridge(hole: _Node, outer: _Node) -> Optional[_Node]:
+    """ David Eberly's algorithm for finding a bridge between a hole and the outer boundary. """
+    node = outer
+    hx = hole.x
+    hy = hole.y
+    qx = -float('inf')
+    m = None
+    if _equals(hole, node):
+        return node
+    # find a segment intersected by a ray from the hole's leftmost point to the left;
+    # segment's endpoint with lesser x will be the potential connection point
+    while True:
+        next_ = node.next
+        if _equals(hole, next_):
+            return next_
+        if node.y >= hy >= next_.y and next_.y != node.y:
+            x = node.x + (hy - node.y) * (next_.x - node.x) / (next_.y - node.y)
+            if qx < x <= hx:
+                qx = x
+                m = node if node.x < next_.x else next_
+                if x == hx:
+                    return m  # hole touches outer segment; pick leftmost endpoint
+        node = next_
+        if node is outer:
+            break
+    if m is None:
+        return None
+    return _nearest_bridge_node(hole, m, qx, _ring_nodes(m))
+
+
+def _find_hole_bridge_in_grid(hole: _Node, grid: _NodeGrid) -> Optional[_Node]:
+    """ Same as :func:`_find_hole_bridge` for the outer boundary segments stored in `grid`. """
+    hx = hole.x
+    hy = hole.y
+    qx = -float('inf')
+    m = None
+    col, row = grid.cell(hx, hy)
+    # scan the cells left of the hole point until the nearest intersection is found
+    while col >= 0 and grid.min_x + (col + 1) * grid.size >= qx:
+        for node in grid.nodes(col, row, col, row):
+            next_ = node.next
+            if _equals(hole, node):
+                return node
+            if node.y >= hy >= next_.y and next_.y != node.y:
+                x = node.x + (hy - node.y) * (next_.x - node.x) / (next_.y - node.y)
+                if qx < x <= hx:
+                    qx = x
+                    m = node if node.x < next_.x else next_
+                    if x == hx:
+                        return m
+        col -= 1
+    if m is None:
+        return None
+    x0, y0 = grid.cell(m.x, min(hy, m.y))
+    x1, y1 = grid.cell(hx, max(hy, m.y))
+    return _nearest_bridge_node(hole, m, qx, grid.nodes(x0, y0, x1, y1))
+
+
+def _nearest_bridge_node(hole: _Node, m: _Node, qx: float, nodes: Iterable[_Node]) -> _Node:
+    # look for points inside the triangle of hole point, segment intersection and endpoint;
+    # if there are no points found, we have a valid connection;
+    # otherwise choose the point of the minimum angle with the ray as connection point
+    hx = hole.x
+    hy = hole.y
+    mx = m.x
+    my = m.y
+    tan_min = float('inf')
+    for node in nodes:
+        if hx >= node.x >= mx and hx != node.x and _point_in_triangle(
+                hx if hy < my else qx, hy, mx, my, qx if hy < my else hx, hy, node.x, node.y):
+            tan = abs(hy - node.y) / (hx - node.x)
+            if _locally_inside(node, hole) and (tan < tan_min or (tan == tan_min and (
+                    node.x > m.x or (node.x == m.x and _sector_contains_sector(m, node))))):
+                m = node
+                tan_min = tan
+    return m
+
+
+def _sector_contains_sector(m: _Node, p: _Node) -> bool:
+    return _area(m.prev, m, p.prev) < 0 and _area(p.next, m, m.next) < 0
+
+
+def _index_curve(start: _Node, hashing) -> None:
+    """ Link polygon nodes in z-order. """
+    nodes = []
+    node = start
+    while True:
+        if node.z < 0:
+            node.z = _z_order(node.x, node.y, hashing)
+        nodes.append(node)
+        node = node.next
+        if node is start:
+            break
+    nodes.sort(key=lambda n: n.z)
+    prev = None
+    for node in nodes:
+        node.prev_z = prev
+        if prev is not None:
+            prev.next_z = node
+        prev = node
+    prev.next_z = None
+
+
+def _z_order(x: float, y: float, hashing) -> int:
+    """ z-order of a point given coords and inverse of the longer side of data bbox. """
+    min_x, min_y, inv_size = hashing
+    x = int((x - min_x) * inv_size)
+    y = int((y - min_y) * inv_size)
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    y = (y | (y << 8)) & 0x00FF00FF
+    y = (y | (y << 4)) & 0x0F0F0F0F
+    y = (y | (y << 2)) & 0x33333333
+    y = (y | (y << 1)) & 0x55555555
+    return x | (y << 1)
+
+
+def _leftmost(start: _Node) -> _Node:
+    node = start
+    leftmost = start
+    while True:
+        if node.x < leftmost.x or (node.x == leftmost.x and node.y < leftmost.y):
+            leftmost = node
+        node = node.next
+        if node is start:
+            return leftmost
+
+
+def _point_in_triangle(ax: float, ay: float, bx: float, by: float, cx: float, cy: float,
+                       px: float, py: float) -> bool:
+    return (cx - px) * (ay - py) >= (ax - px) * (cy - py) and \
+           (ax - px) * (by - py) >= (bx - px) * (ay - py) and \
+           (bx - px) * (cy - py) >= (cx - px) * (by - py)
+
+
+def _is_valid_diagonal(a: _Node, b: _Node) -> bool:
+    """ Check if a diagonal between two polygon nodes is valid (lies in polygon interior). """
+    return a.next.i != b.i and a.prev.i != b.i and not _intersects_polygon(a, b) and (
+        # locally visible and does not create opposite-facing sectors
+        (_locally_inside(a, b) and _locally_inside(b, a) and _middle_inside(a, b) and
+         (_area(a.prev, a, b.prev) != 0 or _area(a, b.prev, b) != 0)) or
+        # special zero-length case
+        (_equals(a, b) and _area(a.prev, a, a.next) > 0 and _area(b.prev, b, b.next) > 0)
+    )
+
+
+def _area(p: _Node, q: _Node, r: _Node) -> float:
+    """ Signed area of a triangle, < 0 for clockwise orientation. """
+    return (q.y - p.y) * (r.x - q.x) - (q.x - p.x) * (r.y - q.y)
+
+
+def _equals(p1: _Node, p2: _Node) -> bool:
+    return p1.x == p2.x and p1.y == p2.y
+
+
+def _sign(value: float) -> int:
+    return 1 if value > 0 else (-1 if value < 0 else 0)
+
+
+def _on_segment(p: _Node, q: _Node, r: _Node) -> bool:
+    """ For collinear points p, q, r, check if point q lies on segment pr. """
+    return max(p.x, r.x) >= q.x >= min(p.x, r.x) and max(p.y, r.y) >= q.y >= min(p.y, r.y)
+
+
+def _intersects(p1: _Node, q1: _Node, p2: _Node, q2: _Node) -> bool:
+    """ Check if two segments intersect. """
+    o1 = _sign(_area(p1, q1, p2))
+    o2 = _sign(_area(p1, q1, q2))
+    o3 = _sign(_area(p2, q2, p1))
+    o4 = _sign(_area(p2, q2, q1))
+    if o1 != o2 and o3 != o4:
+        return True  # general case
+    if o1 == 0 and _on_segment(p1, p2, q1):
+        return True  # p1, q1 and p2 are collinear and p2 lies on p1q1
+    if o2 == 0 and _on_segment(p1, q2, q1):
+        return True  # p1, q1 and q2 are collinear and q2 lies on p1q1
+    if o3 == 0 and _on_segment(p2, p1, q2):
+        return True  # p2, q2 and p1 are collinear and p1 lies on p2q2
+    if o4 == 0 and _on_segment(p2, q1, q2):
+        return True  # p2, q2 and q1 are collinear and q1 lies on p2q2
+    return False
+
+
+def _intersects_polygon(a: _Node, b: _Node) -> bool:
+    """ Check if a polygon diagonal intersects any polygon segments. """
+    node = a
+    while True:
+        next_ = node.next
+        if node.i != a.i and next_.i != a.i and node.i != b.i and next_.i != b.i and _intersects(node, next_, a, b):
+            return True
+        node = next_
+        if node is a:
+            return False
+
+
+def _locally_inside(a: _Node, b: _Node) -> bool:
+    """ Check if a polygon diagonal is locally inside the polygon. """
+    if _area(a.prev, a, a.next) < 0:
+        return _area(a, b, a.next) >= 0 and _area(a, a.prev, b) >= 0
+    return _area(a, b, a.prev) < 0 or _area(a, a.next, b) < 0
+
+
+def _middle_inside(a: _Node, b: _Node) -> bool:
+    """ Check if the middle point of a polygon diagonal is inside the polygon. """
+    node = a
+    inside = False
+    px = (a.x + b.x) / 2.
+    py = (a.y + b.y) / 2.
+    while True:
+        next_ = node.next
+        if (node.y > py) != (next_.y > py) and next_.y != node.y and \
+                px < (next_.x - node.x) * (py - node.y) / (next_.y - node.y) + node.x:
+            inside = not inside
+        node = next_
+        if node is a:
+            return inside
+
+
+def _split_polygon(a: _Node, b: _Node) -> _Node:
+    """
+    Link two polygon vertices with a bridge; if the vertices belong to the same ring, it splits polygon into two;
+    if one belongs to the outer ring and another to a hole, it merges it into a single ring.
+    """
+    a2 = _Node(a.i, a.x, a.y)
+    b2 = _Node(b.i, b.x, b.y)
+    an = a.next
+    bp = b.prev
+    a.next = b
+    b.prev = a
+    a2.next = an
+    an.prev = a2
+    b2.next = a2
+    a2.prev = b2
+    bp.next = b2
+    b2.prev = bp
+    return b2
@@ -1,8 +1,9 @@
 # Copyright (c) 2018-2020 Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Tuple, Sequence, Iterable, List
+from typing import TYPE_CHECKING, Tuple, Sequence, Iterable, List, Dict, Union
 from .vector import Vector, X_AXIS, Y_AXIS, Z_AXIS
 from .matrix44 import Matrix44
+from .vec3array import Vec3Array
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex, BaseLayout
@@ -16,10 +17,16 @@ def render_axis(layout: 'BaseLayout',
         layout.add_line(start, point, dxfattribs={'color': color})
 
 
+# Max. count of cached OCS instances, see get_ocs()
+OCS_CACHE_SIZE = 256
+
+
 class OCS:
     """
     Establish an :ref:`OCS` for a given extrusion vector.
 
+    Use :func:`get_ocs` to get a shared :class:`OCS` instance for frequently used extrusion vectors.
+
     Args:
         extrusion: extrusion vector.
 
@@ -83,6 +90,28 @@ class OCS:
         else:
             yield from points
 
+    def points_from_wcs_array(self, points: Union[Vec3Array, Iterable['Vertex']]) -> Vec3Array:
+        """ Returns OCS vertices for WCS `points` as new :class:`Vec3Array`, uses :mod:`numpy` if installed.
+
+        .. versionadded:: 0.14
+
+        """
+        if self.transform:
+            m = self.matrix.copy()
+            m.transpose()  # inverse of the orthonormal OCS matrix without translation
+            return m.transform_array(points)
+        return _copy_array(points)
+
+    def points_to_wcs_array(self, points: Union[Vec3Array, Iterable['Vertex']]) -> Vec3Array:
+        """ Returns WCS vertices for OCS `points` as new :class:`Vec3Array`, uses :mod:`numpy` if installed.
+
+        .. versionadded:: 0.14
+
+        """
+        if self.transform:
+            return self.matrix.transform_array(points)
+        return _copy_array(points)
+
     def render_axis(self, layout: 'BaseLayout', length: float = 1, colors: Tuple[int, int, int] = (1, 3, 5)):
         """ Render axis as 3D lines into a `layout`. """
         render_axis(
@@ -97,6 +126,40 @@ class OCS:
         )
 
 
+_WCS_OCS = OCS()
+_OCS_CACHE: Dict[Tuple[float, float, float], OCS] = dict()
+
+
+def get_ocs(extrusion: 'Vertex' = Z_AXIS) -> OCS:
+    """
+    Returns a shared :class:`OCS` instance for `extrusion` vector, the instances are cached by the extrusion vector,
+    because most entities share the same few extrusion vectors and the default extrusion ``(0, 0, 1)`` is returned
+    without any setup. The returned :class:`OCS` is shared, do not modify it.
+
+    Args:
+        extrusion: extrusion vector
+
+    .. versionadded:: 0.14
+
+    """
+    key = Vector(extrusion).xyz
+    if key == (0., 0., 1.):
+        return _WCS_OCS
+    ocs = _OCS_CACHE.get(key)
+    if ocs is None:
+        if len(_OCS_CACHE) >= OCS_CACHE_SIZE:
+            _OCS_CACHE.clear()
+        ocs = OCS(key)
+        _OCS_CACHE[key] = ocs
+    return ocs
+
+
+def _copy_array(points: Union[Vec3Array, Iterable['Vertex']]) -> Vec3Array:
+    if isinstance(points, Vec3Array):
+        return points.copy()
+    return Vec3Array(points)
+
+
 class UCS:
     """
     Establish an user coordinate system (:ref:`UCS`). The UCS is defined by the origin and two unit vectors for the x-,
@@ -180,6 +243,14 @@ class UCS:
         """ Returns iterable of WCS vectors for UCS `points`. """
         return self.matrix.transform_vertices(points)
 
+    def points_to_wcs_array(self, points: Union[Vec3Array, Iterable['Vertex']]) -> Vec3Array:
+        """ Returns WCS vertices for UCS `points` as new :class:`Vec3Array`, uses :mod:`numpy` if installed.
+
+        .. versionadded:: 0.14
+
+        """
+        return self.matrix.transform_array(points)
+
     def direction_to_wcs(self, vector: 'Vertex') -> 'Vector':
         """ Returns WCS direction for UCS `vector` without origin adjustment. """
         return self.matrix.transform_direction(vector)
@@ -194,6 +265,16 @@ class UCS:
         for point in points:
             yield from_wcs(point)
 
+    def points_from_wcs_array(self, points: Union[Vec3Array, Iterable['Vertex']]) -> Vec3Array:
+        """ Returns UCS vertices for WCS `points` as new :class:`Vec3Array`, uses :mod:`numpy` if installed.
+
+        .. versionadded:: 0.14
+
+        """
+        m = self.matrix.copy()
+        m.inverse()
+        return m.transform_array(points)
+
     def direction_from_wcs(self, vector: 'Vertex') -> 'Vector':
         """ Returns UCS vector for WCS `vector` without origin adjustment. """
         return self.matrix.ucs_direction_from_wcs(vector)
@@ -206,7 +287,7 @@ class UCS:
 
         """
         wpoint = self.to_wcs(point)
-        return OCS(self.uz).from_wcs(wpoint)
+        return get_ocs(self.uz).from_wcs(wpoint)
 
     def points_to_ocs(self, points: Iterable['Vertex']) -> Iterable['Vector']:
         """
@@ -219,7 +300,7 @@ class UCS:
 
         """
         wcs = self.to_wcs
-        ocs = OCS(self.uz)
+        ocs = get_ocs(self.uz)
         for point in points:
             yield ocs.from_wcs(wcs(point))
 
@@ -250,7 +331,7 @@ class UCS:
         Transforms UCS `direction` vector into OCS direction vector of the parent coordinate system (most likely
         the WCS), target OCS is defined by the UCS z-axis.
         """
-        return OCS(self.uz).from_wcs(self.direction_to_wcs(direction))
+        return get_ocs(self.uz).from_wcs(self.direction_to_wcs(direction))
 
     def rotate(self, axis: 'Vertex', angle: float) -> 'UCS':
         """
@@ -0,0 +1,183 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import Iterable, Sequence, TYPE_CHECKING
+from array import array
+from itertools import chain
+from .vector import Vector
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional accelerator, other modules import this handle
+    numpy = None
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex, Matrix44
+
+__all__ = ['Vec3Array', 'HAS_NUMPY']
+
+HAS_NUMPY = numpy is not None
+# Use numpy for batches with more items than this limit, below this limit the numpy overhead is bigger than
+# the pure Python calculation
+USE_NUMPY_LIMIT = 64
+
+
+class Vec3Array:
+    """ Compact container of 3D vertices, the vertices are stored as flat ``array.array('d')`` of x, y, z
+    values, the same memory layout as an (N, 3) float64 :class:`numpy.ndarray`.
+
+    The batch transformation methods of :class:`~ezdxf.math.Matrix44` use :mod:`numpy` if installed, else a pure
+    Python implementation is used.
+
+    Args:
+        data: iterable of :class:`Vector` compatible objects
+
+    .. versionadded:: 0.14
+
+    """
+    __slots__ = ('values',)
+
+    def __init__(self, data: Iterable['Vertex'] = None):
+        values = array('d')
+        if data is not None:
+            values.extend(chain.from_iterable(Vector.generate(data)))
+        self.values = values
+
+    @classmethod
+    def from_array(cls, values: array) -> 'Vec3Array':
+        """ Returns a :class:`Vec3Array` which uses the ``array.array('d')`` `values` as storage, without copying
+        the data. The length of `values` has to be a multiple of 3.
+        """
+        if len(values) % 3:
+            raise ValueError('count of values has to be a multiple of 3')
+        if values.typecode != 'd':
+            values = array('d', values)
+        vertices = cls()
+        vertices.values = values
+        return vertices
+
+    @classmethod
+    def from_numpy(cls, data) -> 'Vec3Array':
+        """ Returns a :class:`Vec3Array` from an (N, 3) :class:`numpy.ndarray`. The data is copied by a single memory
+        copy operation if `data` is already a C-contiguous float64 array.
+        """
+        data = numpy.ascontiguousarray(data, dtype=numpy.float64)
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError('expected an array of shape (N, 3)')
+        return cls.from_array(_ndarray_to_array(data))
+
+    def to_numpy(self):
+        """ Returns an (N, 3) :class:`numpy.ndarray` view of the vertex data without copying the data.
+
+        The size of the :class:`Vec3Array` can not be changed as long as the view exist.
+
+        """
+        return numpy.frombuffer(self.values, dtype=numpy.float64).reshape(-1, 3)
+
+    def __len__(self) -> int:
+        """ Count of vertices. """
+        return len(self.values) // 3
+
+    def __getitem__(self, index: int) -> Vector:
+        """ Returns vertex at `index` as :class:`Vector`. """
+        if index < 0:
+            index += len(self)
+        if not (0 <= index < len(self)):
+            raise IndexError('index out of range')
+        index *= 3
+        return Vector(self.values[index:index + 3])
+
+    def __iter__(self) -> Iterable[Vector]:
+        """ Returns iterable of all vertices as :class:`Vector`. """
+        values = self.values
+        return (Vector(x, y, z) for x, y, z in zip(values[0::3], values[1::3], values[2::3]))
+
+    def __eq__(self, other: 'Vec3Array') -> bool:
+        if not isinstance(other, Vec3Array):
+            return NotImplemented
+        return self.values == other.values
+
+    def append(self, vertex: 'Vertex') -> None:
+        """ Append `vertex`. """
+        self.values.extend(Vector(vertex).xyz)
+
+    def extend(self, vertices: Iterable['Vertex']) -> None:
+        """ Append multiple `vertices`. """
+        self.values.extend(chain.from_iterable(Vector.generate(vertices)))
+
+    def copy(self) -> 'Vec3Array':
+        """ Returns a copy. """
+        return self.from_array(array('d', self.values))
+
+    def transform(self, m: 'Matrix44') -> None:
+        """ Transform all vertices inplace by transformation matrix `m`. """
+        self.values = m.transform_array(self).values
+
+
+def _ndarray_to_array(data) -> array:
+    # C-contiguous float64 ndarray to array.array('d') by a single memory copy
+    values = array('d')
+    values.frombytes(memoryview(data).cast('B'))
+    return values
+
+
+def transform_array(m: Sequence[float], values: array, translate: bool = True) -> array:
+    """ Returns transformed flat array `values` of x, y, z coordinates as new ``array.array('d')``, `m` is the flat
+    row major transformation matrix as sequence of 16 floats. Translation is ignored for `translate` is ``False``.
+
+    (internal API)
+    """
+    if numpy is not None and len(values) > USE_NUMPY_LIMIT * 3:
+        return _transform_array_numpy(m, values, translate)
+    return _transform_array_python(m, values, translate)
+
+
+def _transform_array_numpy(m: Sequence[float], values: array, translate: bool) -> array:
+    if len(values) == 0:
+        return array('d')
+    vertices = numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 3)
+    matrix = numpy.array(m, dtype=numpy.float64).reshape(4, 4)
+    result = vertices @ matrix[:3, :3]
+    if translate:
+        result += matrix[3, :3]
+    return _ndarray_to_array(result)
+
+
+def _transform_array_python(m: Sequence[float], values: array, translate: bool) -> array:
+    m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = m
+    if not translate:
+        m12 = m13 = m14 = 0.
+    xs, ys, zs = values[0::3], values[1::3], values[2::3]
+    transformed = array('d', values)
+    transformed[0::3] = array('d', [x * m0 + y * m4 + z * m8 + m12 for x, y, z in zip(xs, ys, zs)])
+    transformed[1::3] = array('d', [x * m1 + y * m5 + z * m9 + m13 for x, y, z in zip(xs, ys, zs)])
+    transformed[2::3] = array('d', [x * m2 + y * m6 + z * m10 + m14 for x, y, z in zip(xs, ys, zs)])
+    return transformed
+
+
+def normalize_array(values: array) -> array:
+    """ Returns normalized flat array `values` of x, y, z coordinates as new ``array.array('d')``.
+
+    (internal API)
+
+    Raises:
+        ZeroDivisionError: for vectors of zero length
+
+    """
+    if numpy is not None and len(values) > USE_NUMPY_LIMIT * 3:
+        return _normalize_array_numpy(values)
+    return _normalize_array_python(values)
+
+
+def _normalize_array_numpy(values: array) -> array:
+    if len(values) == 0:
+        return array('d')
+    vertices = numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 3)
+    lengths = numpy.linalg.norm(vertices, axis=1)
+    if not numpy.all(lengths):
+        raise ZeroDivisionError('float division by zero')
+    return _ndarray_to_array(vertices / lengths[:, numpy.newaxis])
+
+
+def _normalize_array_python(values: array) -> array:
+    return array('d', chain.from_iterable(v.normalize() for v in Vec3Array.from_array(values)))
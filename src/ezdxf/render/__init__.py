@@ -4,6 +4,7 @@
 from .arrows import ARROWS
 from .r12spline import R12Spline
 from .curves import Bezier, EulerSpiral, Spline, random_2d_path, random_3d_path
-from .mesh import MeshBuilder, MeshVertexMerger, MeshTransformer, MeshAverageVertexMerger
+from .mesh import MeshBuilder, MeshVertexMerger, MeshTransformer, MeshAverageVertexMerger, MeshVertexWelder, ArrayMesh
+from .decimation import decimate_mesh
 from .trace import TraceBuilder
-from .path import Path, Command
+from .path import Path, Command, offset_paths_2d
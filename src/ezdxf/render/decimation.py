@@ -0,0 +1,498 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import List, Tuple, Dict, Sequence, Optional, Iterable
+import math
+from ezdxf.math import Vector
+from .mesh import ArrayMesh
+from ezdxf.math.vec3array import numpy, USE_NUMPY_LIMIT
+
+__all__ = ['decimate_mesh']
+
+# Weight of the constraint planes perpendicular to boundary edges, preserves the mesh boundary
+BOUNDARY_WEIGHT = 10.
+# Max. count of collapse passes, each pass collapses an independent set of edges
+MAX_PASSES = 1000
+# Max. count of attempts to select edges for a collapse pass, if collapses of an attempt flip faces
+MAX_ATTEMPTS = 8
+# Count of cost levels, edges of the same level are selected in pseudo random order for more parallel collapses
+PRIORITY_LEVELS = 16
+# Max. count of rounds to select independent edges for a collapse pass
+SELECTION_ROUNDS = 4
+# Min. cosine between the old and the new normal vector of a face changed by a collapse
+MIN_NORMAL_COS = 0.2
+
+Quadric = List[float]  # aa, ab, ac, ad, bb, bc, bd, cc, cd, dd
+
+
+def decimate_mesh(mesh, target_faces: int = None, max_error: float = None) -> ArrayMesh:
+    """
+    Returns a simplified triangle mesh of `mesh` as new :class:`ArrayMesh`, by quadric error edge collapse
+    (Garland & Heckbert 1997). Convex faces with more than 3 vertices are triangulated in advance, faces with less
+    than 3 vertices and edges are removed. The vertices of `mesh` have to be merged, e.g. by
+    :class:`MeshVertexMerger`, only edges of faces sharing the same vertex indices can be collapsed.
+
+    Each vertex accumulates the quadric error of the planes of its adjacent faces, boundary edges are preserved by
+    additional constraint planes. The edges are collapsed in passes, each pass collapses an independent set of the
+    locally cheapest edges into their optimal locations and rejects collapses which flip adjacent faces, all
+    calculations are vectorized by :mod:`numpy` if installed.
+
+    The decimation stops if the face count is <= `target_faces` or if no edge can be collapsed with a quadric error
+    <= `max_error` squared. The quadric error of a vertex is the sum of squared distances to the planes of all
+    faces merged into this vertex, so `max_error` is an upper bound for the distance of the merged vertices to the
+    original surface.
+
+    Args:
+        mesh: :class:`MeshBuilder`, :class:`ArrayMesh` or :class:`~ezdxf.entities.Mesh` entity or any object
+            providing attributes :attr:`vertices` and :attr:`faces`
+        target_faces: target face count
+        max_error: max. quadric error as distance in drawing units
+
+    Raises:
+        ValueError: `target_faces` and `max_error` are ``None``
+
+    .. versionadded:: 0.14
+
+    """
+    if target_faces is None and max_error is None:
+        raise ValueError('target_faces or max_error required')
+    target_faces = max(int(target_faces or 0), 0)
+    max_cost = math.inf if max_error is None else float(max_error) ** 2
+    if not isinstance(mesh, ArrayMesh):
+        source = mesh
+        mesh = ArrayMesh()
+        mesh.add_mesh(vertices=source.vertices, faces=source.faces)
+    if numpy is not None and len(mesh.face_indices) > USE_NUMPY_LIMIT:
+        points, triangles = _decimate_numpy(
+            mesh.vertices.to_numpy().copy(), _triangulate_numpy(*mesh.faces_to_numpy()), target_faces, max_cost
+        )
+        return ArrayMesh.from_numpy(points, triangles)
+    triangles = list(_triangulate(mesh.faces))
+    points, triangles = _decimate_python([v.xyz for v in mesh.vertices], triangles, target_faces, max_cost)
+    result = ArrayMesh()
+    result.add_mesh(vertices=points, faces=triangles)
+    return result
+
+
+def _triangulate(faces: Iterable[Sequence[int]]) -> Iterable[Tuple[int, int, int]]:
+    # fan triangulation of convex faces
+    for face in faces:
+        for index in range(1, len(face) - 1):
+            yield face[0], face[index], face[index + 1]
+
+
+# Pure Python implementation:
+
+def _plane_quadric(n: Sequence[float], d: float, weight: float = 1.) -> Quadric:
+    a, b, c = n
+    return [
+        a * a * weight, a * b * weight, a * c * weight, a * d * weight, b * b * weight, b * c * weight,
+        b * d * weight, c * c * weight, c * d * weight, d * d * weight,
+    ]
+
+
+def _quadric_cost(q: Quadric, x: float, y: float, z: float) -> float:
+    aa, ab, ac, ad, bb, bc, bd, cc, cd, dd = q
+    return x * x * aa + 2. * x * y * ab + 2. * x * z * ac + 2. * x * ad + y * y * bb + 2. * y * z * bc + \
+        2. * y * bd + z * z * cc + 2. * z * cd + dd
+
+
+def _optimal_location(q: Quadric, p1: Sequence[float], p2: Sequence[float]) -> Tuple[Tuple[float, float, float], float]:
+    # Returns the location with the min. quadric error and the error, solves the symmetric 3x3 linear equation
+    # system by the adjugate matrix, falls back to the best of both end points and their midpoint for singular
+    # systems.
+    aa, ab, ac, ad, bb, bc, bd, cc, cd, dd = q
+    m00 = bb * cc - bc * bc
+    m01 = ac * bc - ab * cc
+    m02 = ab * bc - ac * bb
+    det = aa * m00 + ab * m01 + ac * m02
+    if math.fabs(det) > _singular_limit(aa, bb, cc):
+        m11 = aa * cc - ac * ac
+        m12 = ab * ac - aa * bc
+        m22 = aa * bb - ab * ab
+        x = -(m00 * ad + m01 * bd + m02 * cd) / det
+        y = -(m01 * ad + m11 * bd + m12 * cd) / det
+        z = -(m02 * ad + m12 * bd + m22 * cd) / det
+        # the solution is the global minimum of the quadric error
+        return (x, y, z), max(ad * x + bd * y + cd * z + dd, 0.)
+    candidates = [tuple(p1), tuple(p2), ((p1[0] + p2[0]) * .5, (p1[1] + p2[1]) * .5, (p1[2] + p2[2]) * .5)]
+    costs = [_quadric_cost(q, *p) for p in candidates]
+    index = min(range(len(costs)), key=costs.__getitem__)
+    return candidates[index], max(costs[index], 0.)
+
+
+def _singular_limit(aa: float, bb: float, cc: float) -> float:
+    scale = max(aa, bb, cc)
+    return 1e-9 * scale * scale * scale
+
+
+def _normal(p0: Sequence[float], p1: Sequence[float], p2: Sequence[float]) -> Optional[Vector]:
+    n = (Vector(p1) - p0).cross(Vector(p2) - p0)
+    length = n.magnitude
+    if length < 1e-12:
+        return None
+    return n / length
+
+
+def _decimate_python(points: List[Sequence[float]], triangles: List[Tuple[int, int, int]], target_faces: int,
+                     max_cost: float) -> Tuple[List[Sequence[float]], List[Tuple[int, int, int]]]:
+    count = len(points)
+    triangles = [t for t in triangles if len(set(t)) == 3]
+    quadrics = [[0.] * 10 for _ in range(count)]
+    # (low, high) -> [count, face index]
+    edges: Dict[Tuple[int, int], list] = {}
+    for face_index, (i0, i1, i2) in enumerate(triangles):
+        n = _normal(points[i0], points[i1], points[i2])
+        if n is None:
+            continue
+        k = _plane_quadric(n, -n.dot(points[i0]))
+        for index in (i0, i1, i2):
+            q = quadrics[index]
+            for j in range(10):
+                q[j] += k[j]
+        for a, b in ((i0, i1), (i1, i2), (i2, i0)):
+            key = (a, b) if a < b else (b, a)
+            entry = edges.get(key)
+            if entry is None:
+                edges[key] = [1, face_index, a, b, n]
+            else:
+                entry[0] += 1
+    for edge_count, face_index, a, b, n in edges.values():
+        if edge_count == 1:  # boundary edge
+            m = (Vector(points[b]) - points[a]).cross(n)
+            if m.is_null:
+                continue
+            m = m.normalize()
+            k = _plane_quadric(m, -m.dot(points[a]), BOUNDARY_WEIGHT)
+            for index in (a, b):
+                q = quadrics[index]
+                for j in range(10):
+                    q[j] += k[j]
+
+    for _ in range(MAX_PASSES):
+        face_count = len(triangles)
+        if face_count <= target_faces:
+            break
+        edge_set = set()
+        for i0, i1, i2 in triangles:
+            for a, b in ((i0, i1), (i1, i2), (i2, i0)):
+                edge_set.add((a, b) if a < b else (b, a))
+        candidates = []
+        for a, b in edge_set:
+            q = [qa + qb for qa, qb in zip(quadrics[a], quadrics[b])]
+            location, cost = _optimal_location(q, points[a], points[b])
+            if cost <= max_cost:
+                candidates.append((cost, a, b, location))
+        candidates.sort(key=lambda c: c[0])
+        levels = len(candidates) / PRIORITY_LEVELS
+        candidates = [c for _, _, c in sorted(
+            (int(rank / levels), _tie_break(c[1], c[2]), c) for rank, c in enumerate(candidates)
+        )]
+        limit = _max_collapses(face_count, target_faces)
+        selected = []
+        for _ in range(MAX_ATTEMPTS):
+            selected, rejected = _check_flips(
+                points, triangles, selected + _select_edges(candidates, limit - len(selected))
+            )
+            if len(selected) >= limit or not rejected:
+                break
+            # the next attempt selects the cheapest edges around the rejected and the accepted edges
+            excluded = set(id(c) for c in rejected)
+            used = set(c[1] for c in selected)
+            used.update(c[2] for c in selected)
+            candidates = [c for c in candidates if id(c) not in excluded and c[1] not in used and c[2] not in used]
+        if not selected:
+            break
+        for _, a, b, location in selected:
+            points[a] = location
+            quadrics[a] = [qa + qb for qa, qb in zip(quadrics[a], quadrics[b])]
+        remap = {b: a for _, a, b, _ in selected}
+        new_triangles = []
+        for tri in triangles:
+            tri = tuple(remap.get(i, i) for i in tri)
+            if len(set(tri)) == 3:
+                new_triangles.append(tri)
+        triangles = new_triangles
+
+    # remove unused vertices
+    used = sorted(set(i for tri in triangles for i in tri))
+    index_map = {old: new for new, old in enumerate(used)}
+    return [points[i] for i in used], [tuple(index_map[i] for i in tri) for tri in triangles]
+
+
+def _check_flips(points: List[Sequence[float]], triangles: List[Tuple[int, int, int]],
+                 selected: List[tuple]) -> Tuple[List[tuple], List[tuple]]:
+    # Returns the accepted and the rejected edges of the selected (cost, a, b, location) edges, an edge is
+    # rejected if the collapse flips a remaining face or collapses it to a line.
+    rejected = []
+    while selected:
+        remap = {b: a for _, a, b, _ in selected}
+        moved = {a: location for _, a, _, location in selected}
+        flipped = set()
+        for tri in triangles:
+            if not any(i in remap or i in moved for i in tri):
+                continue
+            new_tri = [remap.get(i, i) for i in tri]
+            if len(set(new_tri)) < 3:
+                continue  # removed face
+            old_normal = _normal(*(points[i] for i in tri))
+            if old_normal is None:
+                continue  # degenerated face has no orientation
+            new_normal = _normal(*(moved.get(i, points[i]) for i in new_tri))
+            if new_normal is None or old_normal.dot(new_normal) < MIN_NORMAL_COS:
+                flipped.update(tri)
+        if not flipped:
+            break
+        rejected.extend(c for c in selected if c[1] in flipped or c[2] in flipped)
+        selected = [c for c in selected if c[1] not in flipped and c[2] not in flipped]
+    return selected, rejected
+
+
+def _tie_break(a: int, b: int) -> int:
+    # pseudo random order of edges with the same cost, a sorted order by vertex index prevents parallel collapses
+    return ((a * 73856093) ^ (b * 19349663)) & 0xffffffff
+
+
+def _select_edges(candidates: List[tuple], limit: int) -> List[tuple]:
+    # Returns vertex disjoint edges of the sorted (cost, a, b, location) candidates, each edge of a selection
+    # round is the cheapest remaining edge of both vertices.
+    order = {id(c): rank for rank, c in enumerate(candidates)}
+    selected = []
+    for _ in range(SELECTION_ROUNDS):
+        best: Dict[int, int] = {}
+        for rank, (_, a, b, _) in enumerate(candidates):
+            best.setdefault(a, rank)
+            best.setdefault(b, rank)
+        selection = [c for rank, c in enumerate(candidates) if best[c[1]] == rank and best[c[2]] == rank]
+        selected.extend(selection)
+        if len(selected) >= limit:
+            break
+        used = set(c[1] for c in selection)
+        used.update(c[2] for c in selection)
+        candidates = [c for c in candidates if c[1] not in used and c[2] not in used]
+    selected.sort(key=lambda c: order[id(c)])
+    return selected[:limit]
+
+
+def _max_collapses(face_count: int, target_faces: int) -> int:
+    # each collapse of an interior edge removes 2 faces
+    return max((face_count - target_faces + 1) // 2, 1)
+
+
+# numpy implementation:
+
+def _decimate_numpy(points: 'numpy.ndarray', triangles: 'numpy.ndarray', target_faces: int,
+                    max_cost: float) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+    count = len(points)
+    triangles = triangles[
+        (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) &
+        (triangles[:, 2] != triangles[:, 0])
+    ]
+    quadrics = numpy.zeros((10, count))  # column major for fast access of single coefficients
+    normals, valid = _normals_numpy(points, triangles)
+    d = -numpy.einsum('ij,ij->i', normals, points[triangles[:, 0]])
+    face_quadrics = _plane_quadrics_numpy(normals[valid], d[valid])
+    for column in range(3):
+        _accumulate(quadrics, triangles[valid, column], face_quadrics)
+    # boundary constraint planes
+    starts = triangles.reshape(-1)
+    ends = triangles[:, [1, 2, 0]].reshape(-1)
+    keys = numpy.minimum(starts, ends) * count + numpy.maximum(starts, ends)
+    _, first, edge_counts = numpy.unique(keys, return_index=True, return_counts=True)
+    boundary = first[edge_counts == 1]
+    boundary = boundary[valid[boundary // 3]]
+    if len(boundary):
+        a = starts[boundary]
+        b = ends[boundary]
+        m = numpy.cross(points[b] - points[a], normals[boundary // 3])
+        length = numpy.linalg.norm(m, axis=1)
+        ok = length > 1e-12
+        m = m[ok] / length[ok, None]
+        boundary_quadrics = _plane_quadrics_numpy(m, -numpy.einsum('ij,ij->i', m, points[a[ok]])) * BOUNDARY_WEIGHT
+        _accumulate(quadrics, a[ok], boundary_quadrics)
+        _accumulate(quadrics, b[ok], boundary_quadrics)
+
+    for _ in range(MAX_PASSES):
+        face_count = len(triangles)
+        if face_count <= target_faces:
+            break
+        starts = triangles.reshape(-1)
+        ends = triangles[:, [1, 2, 0]].reshape(-1)
+        keys = numpy.sort(numpy.minimum(starts, ends) * count + numpy.maximum(starts, ends))
+        keys = keys[numpy.concatenate(([True], keys[1:] != keys[:-1]))]
+        a, b = numpy.divmod(keys, count)
+        locations, costs = _optimal_locations_numpy(quadrics[:, a] + quadrics[:, b], points[a], points[b])
+        candidates = numpy.flatnonzero(costs <= max_cost)
+        if len(candidates) == 0:
+            break
+        candidates = candidates[numpy.argsort(costs[candidates], kind='stable')]
+        levels = numpy.arange(len(candidates)) * PRIORITY_LEVELS // len(candidates)
+        candidates = candidates[numpy.lexsort((_tie_break(a[candidates], b[candidates]), levels))]
+        limit = _max_collapses(face_count, target_faces)
+        normals, valid = _normals_numpy(points, triangles)
+        selected = candidates[:0]
+        for _ in range(MAX_ATTEMPTS):
+            selection = _select_edges_numpy(candidates, a, b, count, limit - len(selected))
+            selected, rejected = _check_flips_numpy(
+                points, triangles, normals, valid, a, b, locations, numpy.concatenate((selected, selection))
+            )
+            if len(selected) >= limit or not len(rejected):
+                break
+            # the next attempt selects the cheapest edges around the rejected and the accepted edges
+            used = numpy.zeros(count, dtype=bool)
+            used[a[selected]] = True
+            used[b[selected]] = True
+            candidates = candidates[
+                ~(numpy.isin(candidates, rejected) | used[a[candidates]] | used[b[candidates]])
+            ]
+        if len(selected) == 0:
+            break
+        points[a[selected]] = locations[selected]
+        quadrics[:, a[selected]] += quadrics[:, b[selected]]
+        remap = numpy.arange(count)
+        remap[b[selected]] = a[selected]
+        triangles = remap[triangles]
+        triangles = triangles[
+            (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) &
+            (triangles[:, 2] != triangles[:, 0])
+        ]
+
+    # remove unused vertices
+    used, inverse = numpy.unique(triangles, return_inverse=True)
+    return points[used], inverse.reshape(-1, 3)
+
+
+def _check_flips_numpy(points: 'numpy.ndarray', triangles: 'numpy.ndarray', normals: 'numpy.ndarray',
+                       valid: 'numpy.ndarray', a: 'numpy.ndarray', b: 'numpy.ndarray', locations: 'numpy.ndarray',
+                       selected: 'numpy.ndarray') -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+    # same as _check_flips() for selected edge indices, `normals` and `valid` are the result of _normals_numpy()
+    # for the current triangles
+    count = len(points)
+    rejected = [selected[:0]]
+    while len(selected):
+        remap = numpy.arange(count)
+        remap[b[selected]] = a[selected]
+        new_points = points.copy()
+        new_points[a[selected]] = locations[selected]
+        moved = numpy.zeros(count, dtype=bool)
+        moved[a[selected]] = True
+        moved[b[selected]] = True
+        affected = numpy.flatnonzero(moved[triangles].any(axis=1) & valid)
+        new_tris = remap[triangles[affected]]
+        kept = (new_tris[:, 0] != new_tris[:, 1]) & (new_tris[:, 1] != new_tris[:, 2]) & \
+               (new_tris[:, 2] != new_tris[:, 0])
+        affected = affected[kept]
+        new_normals, new_valid = _normals_numpy(new_points, new_tris[kept])
+        flipped = ~new_valid | (numpy.einsum('ij,ij->i', normals[affected], new_normals) < MIN_NORMAL_COS)
+        if not numpy.any(flipped):
+            break
+        flipped_vertices = numpy.zeros(count, dtype=bool)
+        flipped_vertices[triangles[affected[flipped]].reshape(-1)] = True
+        mask = flipped_vertices[a[selected]] | flipped_vertices[b[selected]]
+        rejected.append(selected[mask])
+        selected = selected[~mask]
+    return selected, numpy.concatenate(rejected)
+
+
+def _select_edges_numpy(candidates: 'numpy.ndarray', a: 'numpy.ndarray', b: 'numpy.ndarray', count: int,
+                        limit: int) -> 'numpy.ndarray':
+    # same as _select_edges() for sorted candidate edge indices
+    ranks = numpy.arange(len(candidates))  # remaining ranks
+    selected = []
+    selected_count = 0
+    for _ in range(SELECTION_ROUNDS):
+        edges = candidates[ranks]
+        best = numpy.full(count, len(candidates))
+        numpy.minimum.at(best, a[edges], ranks)
+        numpy.minimum.at(best, b[edges], ranks)
+        selection = ranks[(best[a[edges]] == ranks) & (best[b[edges]] == ranks)]
+        selected.append(selection)
+        selected_count += len(selection)
+        if selected_count >= limit:
+            break
+        used = numpy.zeros(count, dtype=bool)
+        used[a[candidates[selection]]] = True
+        used[b[candidates[selection]]] = True
+        ranks = ranks[~(used[a[edges]] | used[b[edges]])]
+    return candidates[numpy.sort(numpy.concatenate(selected))[:limit]]
+
+
+def _triangulate_numpy(indices: 'numpy.ndarray', offsets: 'numpy.ndarray') -> 'numpy.ndarray':
+    # same as _triangulate() for face indices and face offsets
+    offsets = offsets.astype(numpy.int64)
+    counts = numpy.maximum(numpy.diff(offsets) - 2, 0)
+    starts = numpy.repeat(offsets[:-1], counts)
+    # index of the second triangle vertex in its face
+    second = numpy.arange(len(starts)) - numpy.repeat(numpy.cumsum(counts) - counts, counts) + 1
+    return numpy.column_stack((indices[starts], indices[starts + second], indices[starts + second + 1])).astype(
+        numpy.int64)
+
+
+def _normals_numpy(points: 'numpy.ndarray', triangles: 'numpy.ndarray') -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+    p0 = points[triangles[:, 0]]
+    u = points[triangles[:, 1]] - p0
+    v = points[triangles[:, 2]] - p0
+    ux, uy, uz = u.T
+    vx, vy, vz = v.T
+    normals = p0  # reuse memory
+    normals[:, 0] = uy * vz - uz * vy
+    normals[:, 1] = uz * vx - ux * vz
+    normals[:, 2] = ux * vy - uy * vx
+    length = numpy.sqrt(numpy.einsum('ij,ij->i', normals, normals))
+    valid = length >= 1e-12
+    length[~valid] = 1.
+    normals /= length[:, None]
+    return normals, valid
+
+
+def _plane_quadrics_numpy(n: 'numpy.ndarray', d: 'numpy.ndarray') -> 'numpy.ndarray':
+    a, b, c = n.T
+    return numpy.array((a * a, a * b, a * c, a * d, b * b, b * c, b * d, c * c, c * d, d * d))
+
+
+def _accumulate(quadrics: 'numpy.ndarray', indices: 'numpy.ndarray', values: 'numpy.ndarray') -> None:
+    count = quadrics.shape[1]
+    for row in range(10):
+        quadrics[row] += numpy.bincount(indices, weights=values[row], minlength=count)
+
+
+def _quadric_costs_numpy(q: 'numpy.ndarray', p: 'numpy.ndarray') -> 'numpy.ndarray':
+    x, y, z = p.T
+    aa, ab, ac, ad, bb, bc, bd, cc, cd, dd = q
+    return x * x * aa + 2. * x * y * ab + 2. * x * z * ac + 2. * x * ad + y * y * bb + 2. * y * z * bc + \
+        2. * y * bd + z * z * cc + 2. * z * cd + dd
+
+
+def _optimal_locations_numpy(q: 'numpy.ndarray', p1: 'numpy.ndarray',
+                             p2: 'numpy.ndarray') -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+    # same as _optimal_location() for the quadrics of many edges as (10, E) array
+    aa, ab, ac, ad, bb, bc, bd, cc, cd, dd = q
+    m00 = bb * cc - bc * bc
+    m01 = ac * bc - ab * cc
+    m02 = ab * bc - ac * bb
+    m11 = aa * cc - ac * ac
+    m12 = ab * ac - aa * bc
+    m22 = aa * bb - ab * ab
+    det = aa * m00 + ab * m01 + ac * m02
+    scale = numpy.maximum(numpy.maximum(aa, bb), cc)
+    regular = numpy.fabs(det) > 1e-9 * scale * scale * scale
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        factor = -1. / det
+        locations = numpy.empty((len(aa), 3))
+        x = locations[:, 0]
+        y = locations[:, 1]
+        z = locations[:, 2]
+        x[:] = (m00 * ad + m01 * bd + m02 * cd) * factor
+        y[:] = (m01 * ad + m11 * bd + m12 * cd) * factor
+        z[:] = (m02 * ad + m12 * bd + m22 * cd) * factor
+        costs = ad * x + bd * y + cd * z + dd
+    singular = numpy.flatnonzero(~regular)
+    if len(singular):
+        singular_q = q[:, singular]
+        candidates = [p1[singular], p2[singular], (p1[singular] + p2[singular]) * .5]
+        candidate_costs = numpy.column_stack([_quadric_costs_numpy(singular_q, p) for p in candidates])
+        best = numpy.argmin(candidate_costs, axis=1)
+        rows = numpy.arange(len(singular))
+        locations[singular] = numpy.stack(candidates, axis=1)[rows, best]
+        costs[singular] = candidate_costs[rows, best]
+    return locations, numpy.maximum(costs, 0.)
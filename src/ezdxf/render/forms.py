@@ -575,7 +575,7 @@ def from_profiles_linear(profiles: Iterable[Iterable['Vertex']], close=True,
         profiles: list of profiles
         close: close profile polygon if ``True``
         caps: close hull with bottom cap and top cap
-        ngons: use ngons for caps if ``True`` else subdivide caps into triangles
+        ngons: use ngons for caps if ``True`` else triangulate caps, which supports also concave profiles
 
     Returns: :class:`~ezdxf.render.MeshTransformer`
 
@@ -591,10 +591,8 @@ def from_profiles_linear(profiles: Iterable[Iterable['Vertex']], close=True,
             mesh.add_face(base)
             mesh.add_face(top)
         else:
-            for face in ngon_to_triangles(base):
-                mesh.add_face(face)
-            for face in ngon_to_triangles(top):
-                mesh.add_face(face)
+            mesh.add_polygon(base)
+            mesh.add_polygon(top)
 
     for profile1, profile2 in zip(profiles, profiles[1:]):
         prev_v1, prev_v2 = None, None
@@ -666,7 +664,7 @@ def from_profiles_spline(profiles: Iterable[Iterable['Vertex']], subdivide: int
         subdivide: count of face loops
         close: close profile polygon if ``True``
         caps: close hull with bottom cap and top cap
-        ngons: use ngons for caps if ``True`` else subdivide caps into triangles
+        ngons: use ngons for caps if ``True`` else triangulate caps, which supports also concave profiles
 
     Returns: :class:`~ezdxf.render.MeshTransformer`
 
@@ -2,15 +2,24 @@
 # Copyright (c) 2018-2020 Manfred Moitzi
 # License: MIT License
 from typing import List, Sequence, Tuple, Iterable, TYPE_CHECKING, Union, Dict
+from array import array
+import math
 import warnings
 from ezdxf.lldxf.const import DXFValueError
-from ezdxf.math import Matrix44, Vector, NULLVEC
-from ezdxf.math.construct3d import is_planar_face, subdivide_face, normal_vector_3p, subdivide_ngons
+from ezdxf.math import Matrix44, Vector, NULLVEC, Vec3Array, triangulate_polygon_3d
+from ezdxf.math.construct3d import is_planar_face, normal_vector_3p, subdivide_ngons
+from ezdxf.math.vec3array import numpy, USE_NUMPY_LIMIT
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex, BaseLayout, UCS, Polyface, Polymesh
 
 
+# Search order of the neighbor cells of MeshVertexWelder, multiplied by the side of the nearest neighbor cell
+NEIGHBOR_CELLS = (
+    (0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 0), (1, 0, 1), (0, 1, 1), (1, 1, 1),
+)
+
+
 class MeshBuilder:
     """
     A simple Mesh builder. Stores a list of vertices, a list of edges where an edge is a list of indices into the
@@ -57,6 +66,22 @@ class MeshBuilder:
         """
         self.faces.append(self.add_vertices(vertices))
 
+    def add_polygon(self, exterior: Iterable['Vertex'], holes: Iterable[Iterable['Vertex']] = None) -> None:
+        """
+        Add a planar polygon with optional `holes` as triangle faces to the mesh. The polygon is triangulated by
+        :func:`~ezdxf.math.triangulate_polygon_3d`, which supports also concave polygons, the triangles have the
+        same orientation as the `exterior` boundary path.
+
+        Args:
+            exterior: exterior boundary path as list of vertices ``[(x1, y1, z1), (x2, y2, z2), ...]``
+            holes: list of hole boundary paths, each path as list of vertices
+
+        .. versionadded:: 0.14
+
+        """
+        for triangle in triangulate_polygon_3d(exterior, holes):
+            self.add_face(triangle)
+
     def add_edge(self, vertices: Iterable['Vertex']) -> None:
         """
         An edge consist of two vertices ``[v1, v2]``, each vertex is a ``(x, y, z)`` tuple or a
@@ -302,12 +327,14 @@ class MeshTransformer(MeshBuilder):
              quads: create quad faces if ``True`` else create triangles
              edges: also subdivide edges if ``True``
         """
-        mesh = self
-        level = min(int(level), 5)
-        while level > 0:
-            mesh = _subdivide(mesh, quads, edges)
-            level -= 1
-        return MeshTransformer.from_builder(mesh)
+        # merge vertices once, all following levels share the vertices by indices
+        mesh = ArrayMesh.from_builder(MeshVertexMerger.from_builder(self))
+        mesh = mesh.subdivide(min(int(level), 5), quads, edges)
+        result = MeshTransformer()
+        result.vertices = list(mesh.vertices)
+        result.faces = mesh.faces
+        result.edges = mesh.edges
+        return result
 
     def transform(self, matrix: 'Matrix44'):
         """
@@ -414,30 +441,6 @@ class MeshTransformer(MeshBuilder):
         return self.transform(ucs.matrix)
 
 
-def _subdivide(mesh, quads=True, edges=False) -> 'MeshVertexMerger':
-    """ Returns a new :class:`MeshVertexMerger` object with subdivided faces and edges.
-
-    Args:
-         quads: create quad faces if ``True`` else create triangles
-         edges: also subdivide edges if ``True``
-
-    """
-    new_mesh = MeshVertexMerger()
-    for vertices in mesh.faces_as_vertices():
-        if len(vertices) < 3:
-            continue
-        for face in subdivide_face(vertices, quads):
-            new_mesh.add_face(face)
-
-    if edges:
-        for start, end in mesh.edges_as_vertices():
-            mid = start.lerp(end)
-            new_mesh.add_edge((start, mid))
-            new_mesh.add_edge((mid, end))
-
-    return new_mesh
-
-
 class MeshVertexMerger(MeshBuilder):
     """
     Subclass of :class:`MeshBuilder`
@@ -594,3 +597,718 @@ class MeshAverageVertexMerger(MeshBuilder):
         """ Create new mesh from other mesh builder. """
         # rebuild from scratch to crate a valid ledger
         return cls.from_mesh(other)
+
+
+class MeshVertexWelder(MeshBuilder):
+    """
+    Subclass of :class:`MeshBuilder`
+
+    Mesh with unique vertices and no doublets like :class:`MeshVertexMerger`, but vertices are merged by a true
+    distance `tolerance`: a new vertex gets the index of an existing vertex with a distance <= `tolerance`, if
+    such a vertex exists, else the new vertex is added. The location of merged vertices is the location of the
+    first added vertex.
+
+    The existing vertices are stored in a hashed grid with a cell size of 2x `tolerance`, a new vertex is only
+    compared to the vertices of the up to 8 cells touched by the sphere of radius `tolerance` around the new
+    vertex, so vertices close to a cell border are merged, unlike the rounding of :class:`MeshVertexMerger`.
+    Adding many vertices at once by :meth:`weld` or :meth:`add_mesh` uses `numpy` if installed to merge
+    identical vertices and to locate all vertex pairs within `tolerance` by sorted grid cell keys, only vertices
+    with a close predecessor are processed in Python.
+
+    Args:
+        tolerance: max. distance of merged vertices, has to be > 0
+
+    .. versionadded:: 0.14
+
+    """
+
+    # can not support vertex transformation
+    def __init__(self, tolerance: float = 1e-6):
+        if tolerance <= 0:
+            raise ValueError('tolerance has to be > 0')
+        super().__init__()
+        self.tolerance: float = float(tolerance)
+        self._cell_size: float = self.tolerance * 2.
+        # grid cell -> vertex index or list of vertex indices
+        self._grid: Dict[Tuple[int, int, int], Union[int, List[int]]] = {}
+
+    def add_vertices(self, vertices: Iterable['Vertex']) -> Sequence[int]:
+        """
+        Add new `vertices` only, if no vertex within `tolerance` already exist, else the index of the existing vertex
+        is returned as index of the added vertices.
+
+        Args:
+            vertices: list of vertices, vertex as ``(x, y, z)`` tuple or :class:`~ezdxf.math.Vector` objects
+
+        Returns:
+            tuple: indices of the `vertices` added to the :attr:`~MeshBuilder.vertices` list
+
+        """
+        return tuple(self.weld(vertices))
+
+    def weld(self, vertices: Iterable['Vertex']) -> List[int]:
+        """
+        Bulk version of :meth:`add_vertices`, `vertices` can also be a `numpy` array of shape ``(n, 3)``.
+        Returns the vertex indices as list.
+
+        """
+        points = None
+        if numpy is not None:
+            if not isinstance(vertices, (numpy.ndarray, Sequence)):
+                vertices = list(vertices)
+            if len(vertices) > USE_NUMPY_LIMIT or isinstance(vertices, numpy.ndarray):
+                try:  # fast path for (x, y, z) tuples and Vector objects
+                    points = numpy.array(vertices, dtype=float)
+                except (TypeError, ValueError):  # mixed 2D and 3D vertices
+                    pass
+                if points is not None and (points.ndim != 2 or points.shape[1] != 3):
+                    points = None  # 2D vertices
+        if points is None:
+            return [self._add_vertex(v.x, v.y, v.z) for v in Vector.generate(vertices)]
+        if len(points) == 0:
+            return []
+        # merge identical vertices in advance, keep the order of the first occurrence
+        unique, first, inverse = numpy.unique(points, axis=0, return_index=True, return_inverse=True)
+        order = numpy.argsort(first)
+        unique = unique[order]
+        if len(unique) > len(self.vertices):
+            indices = self._weld_array(unique)
+        else:  # a small batch is merged into a big mesh by the grid lookup for each vertex
+            scaled = unique / self._cell_size
+            cells = numpy.floor(scaled)
+            sides = numpy.where(scaled - cells < 0.5, -1, 1)
+            add_vertex = self._add_vertex
+            indices = numpy.array([
+                add_vertex(x, y, z, cell, side) for (x, y, z), cell, side in
+                zip(unique.tolist(), cells.astype(numpy.int64).tolist(), sides.tolist())
+            ], dtype=numpy.int64)
+        rank = numpy.empty_like(order)
+        rank[order] = numpy.arange(len(order))
+        return indices[rank[inverse.reshape(-1)]].tolist()
+
+    def _weld_array(self, unique: 'numpy.ndarray') -> 'numpy.ndarray':
+        # Vectorized version of _add_vertex() for many unique vertices, returns the vertex indices as array.
+        # The existing vertices are processed as first vertices of the batch, they are already more than
+        # `tolerance` apart. The candidate pairs within `tolerance` are located by a sorted array of cell keys
+        # in the same cell order as _find(), only vertices with a close predecessor are merged in a Python loop.
+        existing = len(self.vertices)
+        points = numpy.concatenate([numpy.array(self.vertices, dtype=float).reshape(-1, 3), unique])
+        count = len(points)
+        scaled = points / self._cell_size
+        cells = numpy.floor(scaled)
+        sides = numpy.where(scaled - cells < 0.5, -1, 1)
+        cells = numpy.ascontiguousarray(cells.astype(numpy.int64))
+        keys, neighbor_keys = _packed_cell_keys(cells, sides)
+        key_order = numpy.argsort(keys, kind='stable')  # vertices of a cell in insertion order
+        sorted_keys = keys[key_order]
+        tol2 = self.tolerance * self.tolerance
+        pairs = []
+        for rank, query in enumerate(neighbor_keys):
+            query = query[key_order]  # the search for nearly sorted keys is much faster
+            left = numpy.searchsorted(sorted_keys, query, side='left')
+            counts = numpy.searchsorted(sorted_keys, query, side='right') - left
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            i = numpy.repeat(key_order, counts)
+            starts = numpy.repeat(left - (numpy.cumsum(counts) - counts), counts)
+            j = key_order[numpy.arange(total) + starts]
+            close = j < i
+            i = i[close]
+            j = j[close]
+            close = numpy.sum((points[i] - points[j]) ** 2, axis=1) <= tol2
+            pairs.append((i[close], numpy.full(numpy.count_nonzero(close), rank), j[close]))
+
+        target = numpy.arange(count)  # merged vertex -> vertex to merge with
+        if pairs:
+            i, rank, j = (numpy.concatenate(arrays) for arrays in zip(*pairs))
+            # candidates of each vertex in the search order of _find()
+            order = numpy.lexsort((j, rank, i))
+            merged = target.tolist()
+            for i, j in zip(i[order].tolist(), j[order].tolist()):
+                if merged[i] == i and merged[j] == j:  # vertex i not merged yet and vertex j not merged
+                    merged[i] = j
+            target = numpy.array(merged, dtype=numpy.int64)
+        is_new = target == numpy.arange(count)
+        vertex_index = numpy.cumsum(is_new) - 1
+
+        new = numpy.flatnonzero(is_new[existing:]) + existing
+        self.vertices.extend(Vector(x, y, z) for x, y, z in points[new].tolist())
+        grid = self._grid
+        for key, index in zip(map(tuple, cells[new].tolist()), vertex_index[new].tolist()):
+            entry = grid.get(key)
+            if entry is None:
+                grid[key] = index
+            elif isinstance(entry, int):
+                grid[key] = [entry, index]
+            else:
+                entry.append(index)
+        return vertex_index[target[existing:]]
+
+    def index(self, vertex: 'Vertex') -> int:
+        """
+        Get index of a vertex within `tolerance` of `vertex`, raise :class:`IndexError` if not found.
+
+        Args:
+            vertex: ``(x, y, z)`` tuple or :class:`~ezdxf.math.Vector` object
+
+        (internal API)
+        """
+        x, y, z = Vector(vertex).xyz
+        index = self._find(x, y, z, *self._cell(x, y, z))
+        if index < 0:
+            raise IndexError(f"Vertex {str(vertex)} not found.")
+        return index
+
+    @classmethod
+    def from_builder(cls, other: 'MeshBuilder'):
+        """ Create new mesh from other mesh builder. """
+        # rebuild from scratch to crate a valid grid
+        return cls.from_mesh(other)
+
+    def _cell(self, x: float, y: float, z: float) -> Tuple[List[int], List[int]]:
+        # Returns the grid cell of a vertex and the direction of the nearest neighbor cell for each axis
+        cell = []
+        side = []
+        for value in (x / self._cell_size, y / self._cell_size, z / self._cell_size):
+            floor = math.floor(value)
+            cell.append(floor)
+            side.append(-1 if value - floor < 0.5 else 1)
+        return cell, side
+
+    def _find(self, x: float, y: float, z: float, cell: Sequence[int], side: Sequence[int]) -> int:
+        # Returns the index of an existing vertex within tolerance or -1, checks the cell of the vertex first
+        grid = self._grid
+        vertices = self.vertices
+        tol2 = self.tolerance * self.tolerance
+        cx, cy, cz = cell
+        sx, sy, sz = side
+        for key in (
+                (cx, cy, cz), (cx + sx, cy, cz), (cx, cy + sy, cz), (cx, cy, cz + sz),
+                (cx + sx, cy + sy, cz), (cx + sx, cy, cz + sz), (cx, cy + sy, cz + sz), (cx + sx, cy + sy, cz + sz),
+        ):
+            entry = grid.get(key)
+            if entry is None:
+                continue
+            for index in ((entry,) if isinstance(entry, int) else entry):
+                v = vertices[index]
+                dx = v.x - x
+                dy = v.y - y
+                dz = v.z - z
+                if dx * dx + dy * dy + dz * dz <= tol2:
+                    return index
+        return -1
+
+    def _add_vertex(self, x: float, y: float, z: float, cell: Sequence[int] = None, side: Sequence[int] = None) -> int:
+        if cell is None:
+            cell, side = self._cell(x, y, z)
+        index = self._find(x, y, z, cell, side)
+        if index >= 0:
+            return index
+        index = len(self.vertices)
+        self.vertices.append(Vector(x, y, z))
+        key = tuple(cell)
+        entry = self._grid.get(key)
+        if entry is None:  # most cells store a single vertex index to save memory
+            self._grid[key] = index
+        elif isinstance(entry, int):
+            self._grid[key] = [entry, index]
+        else:
+            entry.append(index)
+        return index
+
+
+class ArrayMesh:
+    """
+    Array based mesh container for big meshes, same functionality as :class:`MeshTransformer`, but the vertices
+    are stored in a :class:`~ezdxf.math.Vec3Array`, the faces are stored as flat array of vertex indices
+    :attr:`face_indices` and an array of :attr:`face_offsets`, the indices of face ``n`` are
+    ``face_indices[face_offsets[n]:face_offsets[n + 1]]``, and the edges are stored as flat array of
+    vertex index pairs :attr:`edge_indices`, all arrays are ``array.array`` objects.
+
+    The arrays can be accessed as :mod:`numpy` arrays without copying the data, the transformation methods
+    are vectorized by :mod:`numpy` if installed and rendering as :class:`~ezdxf.entities.Mesh` entity copies the
+    data into the packed storage of the MESH entity without converting vertices and faces into Python objects.
+
+    .. versionadded:: 0.14
+
+    """
+    DTYPE = 'L'  # typecode of index arrays
+
+    def __init__(self):
+        self.vertices: Vec3Array = Vec3Array()
+        self.face_indices: array = array(self.DTYPE)
+        self.face_offsets: array = array(self.DTYPE, [0])
+        self.edge_indices: array = array(self.DTYPE)
+
+    @property
+    def face_count(self) -> int:
+        """ Count of faces. """
+        return len(self.face_offsets) - 1
+
+    @property
+    def faces(self) -> List[Tuple[int, ...]]:
+        """ Returns all faces as list of vertex index tuples, compatible to :attr:`MeshBuilder.faces`. """
+        indices = self.face_indices
+        offsets = self.face_offsets
+        return [tuple(indices[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+    @property
+    def edges(self) -> List[Tuple[int, int]]:
+        """ Returns all edges as list of vertex index tuples, compatible to :attr:`MeshBuilder.edges`. """
+        indices = self.edge_indices
+        return list(zip(indices[0::2], indices[1::2]))
+
+    def copy(self) -> 'ArrayMesh':
+        """ Returns a copy of mesh. """
+        mesh = self.__class__()
+        mesh.vertices = self.vertices.copy()
+        mesh.face_indices = array(self.DTYPE, self.face_indices)
+        mesh.face_offsets = array(self.DTYPE, self.face_offsets)
+        mesh.edge_indices = array(self.DTYPE, self.edge_indices)
+        return mesh
+
+    def faces_as_vertices(self) -> Iterable[List[Vector]]:
+        """ Iterate over all mesh faces as list of vertices. """
+        v = list(self.vertices)
+        for face in self.faces:
+            yield [v[index] for index in face]
+
+    def edges_as_vertices(self) -> Iterable[Tuple[Vector, Vector]]:
+        """ Iterate over all mesh edges as tuple of two vertices. """
+        v = self.vertices
+        for start, end in self.edges:
+            yield v[start], v[end]
+
+    def add_vertices(self, vertices: Iterable['Vertex']) -> Sequence[int]:
+        """
+        Add new vertices to the mesh, returns the indices of the `vertices` added to the :attr:`vertices` array,
+        see :meth:`MeshBuilder.add_vertices`.
+
+        """
+        start_index = len(self.vertices)
+        self.vertices.extend(vertices)
+        return tuple(range(start_index, len(self.vertices)))
+
+    def add_face(self, vertices: Iterable['Vertex']) -> None:
+        """ Add a face as vertices list to the mesh, see :meth:`MeshBuilder.add_face`. """
+        self.face_indices.extend(self.add_vertices(vertices))
+        self.face_offsets.append(len(self.face_indices))
+
+    def add_polygon(self, exterior: Iterable['Vertex'], holes: Iterable[Iterable['Vertex']] = None) -> None:
+        """ Add a planar polygon with optional `holes` as triangle faces to the mesh, see
+        :meth:`MeshBuilder.add_polygon`.
+        """
+        for triangle in triangulate_polygon_3d(exterior, holes):
+            self.add_face(triangle)
+
+    def add_edge(self, vertices: Iterable['Vertex']) -> None:
+        """ Add an edge as two vertices to the mesh, see :meth:`MeshBuilder.add_edge`. """
+        vertices = list(vertices)
+        if len(vertices) == 2:
+            self.edge_indices.extend(self.add_vertices(vertices))
+        else:
+            raise DXFValueError('Invalid vertices count, expected two vertices.')
+
+    def add_mesh(self,
+                 vertices: Iterable['Vertex'] = None,
+                 faces: Iterable[Sequence[int]] = None,
+                 edges: Iterable[Tuple[int, int]] = None,
+                 mesh=None) -> None:
+        """
+        Add another mesh to this mesh, see :meth:`MeshBuilder.add_mesh`. Adding another :class:`ArrayMesh`
+        concatenates the arrays.
+
+        Args:
+            vertices: list of vertices, a vertex is a ``(x, y, z)`` tuple or :class:`~ezdxf.math.Vector` object
+            faces: list of faces, a face is a list of vertex indices
+            edges: list of edges, an edge is a list of vertex indices
+            mesh: another mesh entity
+
+        """
+        offset = len(self.vertices)
+        if isinstance(mesh, ArrayMesh):
+            self.vertices.values.extend(mesh.vertices.values)
+            self.face_offsets.extend(_offset_indices(mesh.face_offsets[1:], len(self.face_indices)))
+            self.face_indices.extend(_offset_indices(mesh.face_indices, offset))
+            self.edge_indices.extend(_offset_indices(mesh.edge_indices, offset))
+            return
+        if mesh is not None:
+            vertices = mesh.vertices
+            faces = mesh.faces
+            edges = mesh.edges
+        if vertices is None:
+            raise ValueError("Requires vertices or another mesh.")
+        self.vertices.extend(vertices)
+        count = len(self.vertices) - offset
+        face_indices = self.face_indices
+        face_offsets = self.face_offsets
+        for face in faces or []:
+            face = _check_indices(face, count)
+            face_indices.extend(index + offset for index in face)
+            face_offsets.append(len(face_indices))
+        for edge in edges or []:
+            self.edge_indices.extend(index + offset for index in _check_indices(edge, count))
+
+    def faces_to_numpy(self) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        """ Returns the :attr:`face_indices` and :attr:`face_offsets` as :class:`numpy.ndarray` views without
+        copying the data. The size of the arrays can not be changed as long as the views exist.
+        """
+        return (
+            numpy.frombuffer(self.face_indices, dtype=self.DTYPE),
+            numpy.frombuffer(self.face_offsets, dtype=self.DTYPE),
+        )
+
+    def edges_to_numpy(self) -> 'numpy.ndarray':
+        """ Returns the :attr:`edge_indices` as (N, 2) :class:`numpy.ndarray` view without copying the data.
+        The size of the array can not be changed as long as the view exist.
+        """
+        return numpy.frombuffer(self.edge_indices, dtype=self.DTYPE).reshape(-1, 2)
+
+    @classmethod
+    def from_numpy(cls, vertices: 'numpy.ndarray', faces=None, edges: 'numpy.ndarray' = None) -> 'ArrayMesh':
+        """
+        Create new mesh from :mod:`numpy` arrays.
+
+        Args:
+            vertices: vertices as (N, 3) array
+            faces: faces with the same vertex count as (F, K) array of vertex indices or faces with different vertex
+                counts as tuple of a flat array of vertex indices and an array of F + 1 face offsets, see
+                :meth:`faces_to_numpy`
+            edges: edges as (E, 2) array of vertex indices
+
+        """
+        mesh = cls()
+        mesh.vertices = Vec3Array.from_numpy(vertices)
+        count = len(mesh.vertices)
+        if faces is not None:
+            if isinstance(faces, tuple):
+                indices, offsets = faces
+                offsets = numpy.asarray(offsets).reshape(-1)
+                if len(offsets) == 0 or offsets[0] != 0 or numpy.any(numpy.diff(offsets) < 0) or \
+                        offsets[-1] != len(indices):
+                    raise ValueError('invalid face offsets')
+            else:
+                faces = numpy.asarray(faces)
+                if faces.ndim != 2:
+                    raise ValueError('expected faces as array of shape (F, K)')
+                indices = faces
+                offsets = numpy.arange(0, faces.size + 1, max(faces.shape[1], 1))
+            mesh.face_indices = _index_array(indices, count)
+            mesh.face_offsets = _index_array(offsets)
+        if edges is not None:
+            edges = numpy.asarray(edges)
+            if edges.ndim != 2 or edges.shape[1] != 2:
+                raise ValueError('expected edges as array of shape (E, 2)')
+            mesh.edge_indices = _index_array(edges, count)
+        return mesh
+
+    @classmethod
+    def from_mesh(cls, other) -> 'ArrayMesh':
+        """
+        Create new mesh from other mesh, see :meth:`MeshBuilder.from_mesh`.
+
+        Args:
+            other: `mesh` of type :class:`MeshBuilder`, :class:`ArrayMesh` or DXF :class:`~ezdxf.entities.Mesh`
+                entity or any object providing attributes :attr:`vertices`, :attr:`edges` and :attr:`faces`.
+
+        """
+        mesh = cls()
+        mesh.add_mesh(mesh=other)
+        return mesh
+
+    from_builder = from_mesh
+
+    def transform(self, matrix: 'Matrix44') -> 'ArrayMesh':
+        """
+        Transform mesh inplace by applying the transformation `matrix`, uses :mod:`numpy` if installed.
+
+        Args:
+            matrix: 4x4 transformation matrix as :class:`~ezdxf.math.Matrix44` object
+
+        """
+        self.vertices.transform(matrix)
+        return self
+
+    def translate(self, dx: float = 0, dy: float = 0, dz: float = 0) -> 'ArrayMesh':
+        """ Translate mesh inplace, see :meth:`MeshTransformer.translate`. """
+        if isinstance(dx, (float, int)):
+            t = Vector(dx, dy, dz)
+        else:
+            t = Vector(dx)
+        return self.transform(Matrix44.translate(t.x, t.y, t.z))
+
+    def scale(self, sx: float = 1, sy: float = 1, sz: float = 1) -> 'ArrayMesh':
+        """ Scale mesh inplace, see :meth:`MeshTransformer.scale`. """
+        return self.transform(Matrix44.scale(sx, sy, sz))
+
+    def scale_uniform(self, s: float) -> 'ArrayMesh':
+        """ Scale mesh uniform inplace, see :meth:`MeshTransformer.scale_uniform`. """
+        return self.transform(Matrix44.scale(s, s, s))
+
+    def rotate_x(self, angle: float) -> 'ArrayMesh':
+        """ Rotate mesh around x-axis about `angle` in radians inplace. """
+        return self.transform(Matrix44.x_rotate(angle))
+
+    def rotate_y(self, angle: float) -> 'ArrayMesh':
+        """ Rotate mesh around y-axis about `angle` in radians inplace. """
+        return self.transform(Matrix44.y_rotate(angle))
+
+    def rotate_z(self, angle: float) -> 'ArrayMesh':
+        """ Rotate mesh around z-axis about `angle` in radians inplace. """
+        return self.transform(Matrix44.z_rotate(angle))
+
+    def rotate_axis(self, axis: 'Vertex', angle: float) -> 'ArrayMesh':
+        """ Rotate mesh around an arbitrary `axis` located in the origin (0, 0, 0) about `angle` in radians. """
+        return self.transform(Matrix44.axis_rotate(axis, angle))
+
+    def subdivide(self, level: int = 1, quads=True, edges=False) -> 'ArrayMesh':
+        """
+        Returns a new :class:`ArrayMesh` with subdivided faces and edges, same subdivision as
+        :meth:`MeshTransformer.subdivide`: each face is split at the midpoints of its edges and the face center.
+        Faces sharing an edge by vertex indices share the new midpoint vertex, the edge table and the new vertices are
+        calculated vectorized by :mod:`numpy` if installed. Consecutive duplicate vertex indices of a face are
+        removed, faces with less than 3 vertices are removed.
+
+        Args:
+             level: count of subdivide levels
+             quads: create quad faces if ``True`` else create triangles
+             edges: also subdivide edges if ``True`` else edges are removed
+
+        """
+        mesh = self
+        for _ in range(int(level)):
+            if numpy is not None and len(mesh.face_indices) > USE_NUMPY_LIMIT:
+                mesh = _subdivide_numpy(mesh, quads, edges)
+            else:
+                mesh = _subdivide_python(mesh, quads, edges)
+        return mesh.copy() if mesh is self else mesh
+
+    def _transformed_vertices(self, matrix: 'Matrix44' = None, ucs: 'UCS' = None) -> Vec3Array:
+        vertices = self.vertices
+        if matrix is not None:
+            vertices = matrix.transform_array(vertices)
+        if ucs is not None:
+            vertices = ucs.matrix.transform_array(vertices)
+        return vertices
+
+    def render(self, layout: 'BaseLayout', dxfattribs: dict = None, matrix: 'Matrix44' = None, ucs: 'UCS' = None):
+        """
+        Render mesh as :class:`~ezdxf.entities.Mesh` entity into `layout`, see :meth:`MeshBuilder.render`.
+        The data is copied into the packed storage of the MESH entity.
+
+        """
+        mesh = layout.add_mesh(dxfattribs=dxfattribs)
+        mesh.vertices = self._transformed_vertices(matrix, ucs)
+        indices = self.face_indices
+        offsets = self.face_offsets
+        mesh.faces = (indices[start:end] for start, end in zip(offsets, offsets[1:]))
+        mesh.edges = self.edges
+        return mesh
+
+    def render_polyface(self, layout: 'BaseLayout', dxfattribs: dict = None, matrix: 'Matrix44' = None,
+                        ucs: 'UCS' = None):
+        """
+        Render mesh as :class:`~ezdxf.entities.Polyface` entity into `layout`, see
+        :meth:`MeshBuilder.render_polyface`. The vertices are not merged again, ngons are subdivided into triangles.
+
+        """
+        vertices = list(self._transformed_vertices(matrix, ucs))
+        faces = []
+        for face in self.faces:
+            count = len(face)
+            if count < 3:
+                continue
+            if count < 5:
+                faces.append(face)
+            else:  # same subdivision as subdivide_ngons()
+                center = len(vertices)
+                vertices.append(sum((vertices[index] for index in face), NULLVEC) / count)
+                faces.extend((face[index - 1], face[index], center) for index in range(count))
+        polyface = layout.add_polyface(dxfattribs=dxfattribs)
+        polyface.append_indexed_faces(vertices, faces)
+        return polyface
+
+    def render_3dfaces(self, layout: 'BaseLayout', dxfattribs: dict = None, matrix: 'Matrix44' = None,
+                       ucs: 'UCS' = None):
+        """ Render mesh as :class:`~ezdxf.entities.Face3d` entities into `layout`, see
+        :meth:`MeshBuilder.render_3dfaces`.
+        """
+        mesh = self.copy()
+        mesh.vertices = self._transformed_vertices(matrix, ucs)
+        for face in subdivide_ngons(mesh.faces_as_vertices()):
+            layout.add_3dface(face, dxfattribs=dxfattribs)
+
+
+def _packed_cell_keys(cells: 'numpy.ndarray', sides: 'numpy.ndarray') -> Tuple['numpy.ndarray', List['numpy.ndarray']]:
+    # Returns the grid cells of MeshVertexWelder as int64 keys and the keys of the NEIGHBOR_CELLS of each cell,
+    # the key of a neighbor cell without vertices is -1. The cell indices of each axis are replaced by their rank
+    # in the sorted cell indices of the axis, a tolerance much smaller than the mesh extents creates cell indices
+    # beyond the int64 range of packed keys. The (x, y) ranks are ranked again for a too big 3D index range.
+    axes = []
+    for axis in range(3):
+        values = cells[:, axis]
+        order = numpy.argsort(values)
+        existing = _sorted_unique(values[order])
+        axes.append((_rank(existing, values, order), _rank(existing, values + sides[:, axis], order), len(existing)))
+    (x, nx, x_size), (y, ny, y_size), (z, nz, z_size) = axes
+    xy_keys = {}
+    for offset in set((dx, dy) for dx, dy, _ in NEIGHBOR_CELLS):
+        rx = nx if offset[0] else x
+        ry = ny if offset[1] else y
+        xy_keys[offset] = numpy.where((rx < 0) | (ry < 0), -1, rx * y_size + ry)
+    if float(x_size) * float(y_size) * float(z_size) >= 2. ** 62:
+        order = numpy.argsort(xy_keys[0, 0])
+        existing = _sorted_unique(xy_keys[0, 0][order])
+        xy_keys = {offset: _rank(existing, keys, order) for offset, keys in xy_keys.items()}
+    neighbor_keys = []
+    for dx, dy, dz in NEIGHBOR_CELLS:
+        rxy = xy_keys[dx, dy]
+        rz = nz if dz else z
+        neighbor_keys.append(numpy.where((rxy < 0) | (rz < 0), -1, rxy * z_size + rz))
+    return neighbor_keys[0], neighbor_keys
+
+
+def _sorted_unique(values: 'numpy.ndarray') -> 'numpy.ndarray':
+    # Returns the unique values of the sorted 1D array `values`, faster than numpy.unique() for int64 arrays
+    if len(values) == 0:
+        return values
+    return values[numpy.concatenate(([True], values[1:] != values[:-1]))]
+
+
+def _rank(existing: 'numpy.ndarray', values: 'numpy.ndarray', order: 'numpy.ndarray') -> 'numpy.ndarray':
+    # Returns the index of `values` in the sorted array of unique `existing` values, -1 for not existing values.
+    # The search order `order` sorts the `values` nearly, which is much faster than a search in random order.
+    values = values[order]
+    rank = numpy.searchsorted(existing, values)
+    found = existing[numpy.minimum(rank, len(existing) - 1)] == values
+    result = numpy.empty_like(rank)
+    result[order] = numpy.where(found, rank, -1)
+    return result
+
+
+def _subdivide_python(mesh: ArrayMesh, quads: bool, edges: bool) -> ArrayMesh:
+    vertices = list(mesh.vertices)
+    midpoints: Dict[Tuple[int, int], int] = {}  # edge table: (low index, high index) -> midpoint index
+
+    def midpoint(a: int, b: int) -> int:
+        key = (a, b) if a < b else (b, a)
+        try:
+            return midpoints[key]
+        except KeyError:
+            index = len(vertices)
+            vertices.append(vertices[a].lerp(vertices[b]))
+            midpoints[key] = index
+            return index
+
+    result = ArrayMesh()
+    face_indices = result.face_indices
+    face_offsets = result.face_offsets
+    size = 4 if quads else 3
+    for face in mesh.faces:
+        # remove consecutive duplicate indices and a repeated closing index
+        face = [index for i, index in enumerate(face) if index != face[i - 1]]
+        count = len(face)
+        if count < 3:
+            continue
+        center = len(vertices)
+        vertices.append(sum((vertices[index] for index in face), NULLVEC) / count)
+        mids = [midpoint(face[i], face[(i + 1) % count]) for i in range(count)]
+        for i, vertex in enumerate(face):
+            if quads:
+                face_indices.extend((vertex, mids[i], center, mids[i - 1]))
+            else:
+                face_indices.extend((mids[i - 1], vertex, center, vertex, mids[i], center))
+        face_offsets.extend(range(face_offsets[-1] + size, len(face_indices) + 1, size))
+    if edges:
+        for start, end in mesh.edges:
+            mid = midpoint(start, end)
+            result.edge_indices.extend((start, mid, mid, end))
+    result.vertices.extend(vertices)
+    return result
+
+
+def _subdivide_numpy(mesh: ArrayMesh, quads: bool, edges: bool) -> ArrayMesh:
+    vertices = mesh.vertices.to_numpy()
+    indices, offsets = mesh.faces_to_numpy()
+    indices = indices.astype(numpy.int64)
+    offsets = offsets.astype(numpy.int64)
+    counts = numpy.diff(offsets)
+    # remove consecutive duplicate indices and a repeated closing index
+    filled = counts > 0
+    prev_corner = numpy.arange(-1, len(indices) - 1)
+    prev_corner[offsets[:-1][filled]] = offsets[1:][filled] - 1
+    unique = indices != indices[prev_corner]
+    if not numpy.all(unique):
+        indices = indices[unique]
+        counts = numpy.bincount(numpy.repeat(numpy.arange(len(counts)), counts)[unique], minlength=len(counts))
+        offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+    # remove faces with less than 3 vertices
+    valid = counts >= 3
+    if not numpy.all(valid):
+        indices = indices[numpy.repeat(valid, counts)]
+        counts = counts[valid]
+        offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+    starts = offsets[:-1]
+    corner_count = len(indices)
+    # next and previous corner of each face corner
+    next_corner = numpy.arange(1, corner_count + 1)
+    next_corner[offsets[1:] - 1] = starts
+    prev_corner = numpy.arange(-1, corner_count - 1)
+    prev_corner[starts] = offsets[1:] - 1
+    # edge table of all face edges and mesh edges
+    pairs = numpy.column_stack((indices, indices[next_corner]))
+    if edges:
+        pairs = numpy.concatenate((pairs, mesh.edges_to_numpy().astype(numpy.int64)))
+    vertex_count = len(vertices)
+    # edge key: low index * vertex count + high index, 1D unique is much faster than unique rows
+    keys = numpy.minimum(pairs[:, 0], pairs[:, 1]) * vertex_count + numpy.maximum(pairs[:, 0], pairs[:, 1])
+    unique_keys, edge_ids = numpy.unique(keys, return_inverse=True)
+    edge_ids = edge_ids.reshape(-1)
+    edge_count = len(unique_keys)
+    low, high = numpy.divmod(unique_keys, vertex_count)
+    midpoints = (vertices[low] + vertices[high]) * 0.5
+    centers = numpy.add.reduceat(vertices[indices], starts, axis=0) / counts[:, None] if len(counts) else \
+        numpy.empty((0, 3))
+    corner_mid = edge_ids[:corner_count] + vertex_count
+    corner_center = numpy.repeat(numpy.arange(len(counts)), counts) + vertex_count + edge_count
+    if quads:
+        faces = numpy.column_stack((indices, corner_mid, corner_center, corner_mid[prev_corner]))
+    else:
+        faces = numpy.column_stack((
+            corner_mid[prev_corner], indices, corner_center, indices, corner_mid, corner_center,
+        )).reshape(-1, 3)
+    new_edges = None
+    if edges:
+        mesh_edges = mesh.edges_to_numpy().astype(numpy.int64)
+        edge_mid = edge_ids[corner_count:] + vertex_count
+        new_edges = numpy.column_stack((mesh_edges[:, 0], edge_mid, edge_mid, mesh_edges[:, 1])).reshape(-1, 2)
+    return ArrayMesh.from_numpy(numpy.concatenate((vertices, midpoints, centers)), faces, new_edges)
+
+
+def _check_indices(indices: Sequence[int], count: int) -> Sequence[int]:
+    for index in indices:
+        if not (0 <= index < count):
+            raise IndexError(f'invalid vertex index: {index}')
+    return indices
+
+
+def _offset_indices(values: array, offset: int) -> array:
+    # Returns a new index array with `offset` added to all indices
+    if offset == 0:
+        return array(values.typecode, values)
+    if numpy is not None and len(values) > USE_NUMPY_LIMIT:
+        result = array(values.typecode)
+        result.frombytes((numpy.frombuffer(values, dtype=values.typecode) + offset).tobytes())
+        return result
+    return array(values.typecode, (value + offset for value in values))
+
+
+def _index_array(values: 'numpy.ndarray', count: int = None) -> array:
+    # Returns numpy `values` as flat index array, checks all values < count if count is not None
+    values = numpy.asarray(values).reshape(-1)
+    if len(values) and (values.min() < 0 or (count is not None and values.max() >= count)):
+        raise IndexError('invalid vertex index')
+    result = array(ArrayMesh.DTYPE)
+    result.frombytes(numpy.ascontiguousarray(values, dtype=ArrayMesh.DTYPE).tobytes())
+    return result
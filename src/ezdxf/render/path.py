@@ -7,14 +7,15 @@ from enum import Enum
 import math
 from ezdxf.math import (
     Vector, NULLVEC, Bezier4P, Matrix44, bulge_to_arc, cubic_bezier_from_ellipse,
-    ConstructionEllipse, Z_AXIS, BSpline, OCS
+    ConstructionEllipse, Z_AXIS, BSpline, OCS, cubic_bezier_chain_approximation, get_ocs,
+    offset_bulge_polyline_2d,
 )
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import LWPolyline, Polyline, Vertex, Spline, Ellipse, Arc, Circle
     from ezdxf.entities.hatch import PolylinePath, EdgePath
 
-__all__ = ['Path', 'Command']
+__all__ = ['Path', 'Command', 'offset_paths_2d']
 
 
 class Command(Enum):
@@ -305,6 +306,49 @@ class Path(abc.Sequence):
     def approximate(self, segments: int = 20) -> Iterable[Vector]:
         """ Approximate path by vertices, `segments` is the count of approximation segments
         for each cubic bezier curve.
+        """
+        if not self._commands:
+            return
+
+        def approximate_curves():
+            vertices = iter(cubic_bezier_chain_approximation(curves, segments))
+            next(vertices)  # skip first vertex
+            return vertices
+
+        start = self._start
+        yield start
+
+        # consecutive curves are approximated in one batch
+        curves = []
+        for cmd in self._commands:
+            type_ = cmd[0]
+            end_location = cmd[1]
+            if type_ == Command.LINE_TO:
+                if curves:
+                    yield from approximate_curves()
+                    curves = []
+                yield end_location
+            elif type_ == Command.CURVE_TO:
+                curves.append(Bezier4P((start, cmd[2], cmd[3], end_location)))
+            else:
+                raise ValueError(f'Invalid command: {type_}')
+            start = end_location
+        if curves:
+            yield from approximate_curves()
+
+    def flattening(self, distance: float, segments: int = 4) -> Iterable[Vector]:
+        """ Approximate path by vertices and use adaptive flattening by iterative subdivision to approximate cubic
+        Bèzier curves. The argument `segments` is the minimum count of approximation segments for each curve, if
+        the distance from the center of the approximation segment to the curve point at the mid param is bigger
+        than `distance` the segment will be subdivided.
+
+        Args:
+            distance: maximum distance from the center of the cubic (C3) curve to the center of the linear (C1)
+                curve between two approximation points to determine if a segment should be subdivided.
+            segments: minimum segment count per Bézier curve
+
+        .. versionadded:: 0.14
+
         """
         if not self._commands:
             return
@@ -318,13 +362,39 @@ class Path(abc.Sequence):
             if type_ == Command.LINE_TO:
                 yield end_location
             elif type_ == Command.CURVE_TO:
-                pts = iter(Bezier4P((start, cmd[2], cmd[3], end_location)).approximate(segments))
+                pts = iter(Bezier4P((start, cmd[2], cmd[3], end_location)).flattening(distance, segments))
                 next(pts)  # skip first vertex
                 yield from pts
             else:
                 raise ValueError(f'Invalid command: {type_}')
             start = end_location
 
+    def offset_2d(self, offset: float, distance: float = 0.01) -> List['Path']:
+        """ Returns the offset paths of this path as list of :class:`Path` objects. The path is flattened by
+        :meth:`flattening` and offset by :func:`~ezdxf.math.offset_bulge_polyline_2d` in the xy-plane, the z-axis
+        of the path start point is the elevation of the offset paths. Rounded corners of the offset paths are
+        cubic Bézier curves. A closed path is offset as closed polyline.
+
+        Args:
+            offset: offset distance, > ``0`` is left of the path direction
+            distance: max. flattening distance, see :meth:`flattening`
+
+        .. versionadded:: 0.14
+
+        """
+        vertices = list(self.flattening(distance))
+        if len(vertices) < 2:
+            return []
+        closed = self.is_closed
+        ocs = get_ocs()
+        elevation = self._start.z
+        paths = []
+        for points in offset_bulge_polyline_2d(((v.x, v.y) for v in vertices), offset, closed):
+            path = self.__class__()
+            path._setup_polyline_2d(points, close=closed, ocs=ocs, elevation=elevation)
+            paths.append(path)
+        return paths
+
     def transform(self, m: 'Matrix44') -> 'Path':
         """ Returns a new transformed path.
 
@@ -346,6 +416,15 @@ class Path(abc.Sequence):
         return new_path
 
 
+def offset_paths_2d(paths: Iterable[Path], offset: float, distance: float = 0.01) -> List[List[Path]]:
+    """ Returns the offset paths of multiple `paths` in the same order as the input, see :meth:`Path.offset_2d`.
+
+    .. versionadded:: 0.14
+
+    """
+    return [path.offset_2d(offset, distance) for path in paths]
+
+
 def _reverse_bezier_curves(curves: List[Bezier4P]) -> List[Bezier4P]:
     curves = list(c.reverse() for c in curves)
     curves.reverse()
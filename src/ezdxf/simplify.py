@@ -0,0 +1,351 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+# Created: 2020-10-18
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Callable, Tuple, Optional, Union
+from ezdxf.math import douglas_peucker_indices, visvalingam_indices, fit_arcs_indices_2d
+from ezdxf.render.mesh import MeshVertexMerger
+from ezdxf.render.decimation import decimate_mesh
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import LWPolyline, Polyline, DXFGraphic, Vertex, Mesh
+
+__all__ = [
+    'simplify_lwpolyline', 'simplify_polyline', 'simplify_polylines', 'fit_arcs_lwpolyline', 'fit_arcs_polyline',
+    'fit_arcs_polylines', 'simplify_mesh',
+]
+
+METHODS = {
+    'douglas-peucker': douglas_peucker_indices,
+    'visvalingam': visvalingam_indices,
+}
+
+
+def simplify_lwpolyline(lwpolyline: 'LWPolyline', tolerance: float, method: str = 'douglas-peucker') -> int:
+    """
+    Removes vertices of a :class:`~ezdxf.entities.LWPolyline` entity in place, which are not required to
+    represent the polyline within the given `tolerance`. Only vertices between straight segments with the same
+    constant width can be removed, start- and end vertices of arc segments and vertices at width changes are
+    always kept.
+
+    Args:
+        lwpolyline: LWPOLYLINE entity
+        tolerance: max. distance of removed vertices for method ``'douglas-peucker'``, min. triangle area of kept
+            vertices for method ``'visvalingam'``
+        method: ``'douglas-peucker'`` or ``'visvalingam'``
+
+    Returns:
+        count of removed vertices
+
+    Raises:
+        ValueError: invalid `method`
+
+    .. versionadded:: 0.14
+
+    """
+    simplify = _get_method(method)
+    points = lwpolyline.get_points('xyseb')
+    kept = _kept_indices(
+        [(x, y) for x, y, *_ in points],
+        [(s, e, b) for _, _, s, e, b in points],
+        lwpolyline.closed, tolerance, simplify,
+    )
+    removed = len(points) - len(kept)
+    if removed:
+        lwpolyline.set_points([points[index] for index in kept], format='xyseb')
+    return removed
+
+
+def simplify_polyline(polyline: 'Polyline', tolerance: float, method: str = 'douglas-peucker') -> int:
+    """
+    Removes vertices of a 2D or 3D :class:`~ezdxf.entities.Polyline` entity in place, which are not required
+    to represent the polyline within the given `tolerance`. For 2D polylines the same rules for arc segments and
+    width changes apply as for :func:`simplify_lwpolyline`. Polymesh and polyface entities and curve- or spline
+    fitted polylines are not changed.
+
+    Args:
+        polyline: POLYLINE entity
+        tolerance: max. distance of removed vertices for method ``'douglas-peucker'``, min. triangle area of kept
+            vertices for method ``'visvalingam'``
+        method: ``'douglas-peucker'`` or ``'visvalingam'``
+
+    Returns:
+        count of removed vertices
+
+    Raises:
+        ValueError: invalid `method`
+
+    .. versionadded:: 0.14
+
+    """
+    simplify = _get_method(method)
+    if polyline.is_polygon_mesh or polyline.is_poly_face_mesh or \
+            polyline.dxf.flags & (polyline.CURVE_FIT_VERTICES_ADDED | polyline.SPLINE_FIT_VERTICES_ADDED):
+        return 0
+    vertices = polyline.vertices
+    points = [vertex.format('xyzseb') for vertex in vertices]
+    if polyline.is_3d_polyline:
+        kept = _kept_indices([(x, y, z) for x, y, z, *_ in points], None, polyline.is_closed, tolerance, simplify)
+    else:
+        kept = _kept_indices(
+            [(x, y) for x, y, *_ in points],
+            [(s, e, b) for _, _, _, s, e, b in points],
+            polyline.is_closed, tolerance, simplify,
+        )
+    return _remove_vertices(polyline, kept)
+
+
+def simplify_polylines(entities: Iterable['DXFGraphic'], tolerance: float, method: str = 'douglas-peucker') -> int:
+    """
+    Simplifies all LWPOLYLINE and 2D/3D POLYLINE entities of `entities` in place, e.g. all entities of a layout,
+    see :func:`simplify_lwpolyline` and :func:`simplify_polyline`. Other entities are ignored.
+
+    .. code-block:: Python
+
+        simplify_polylines(doc.modelspace(), tolerance=0.001)
+
+    Returns:
+        count of removed vertices
+
+    Raises:
+        ValueError: invalid `method`
+
+    .. versionadded:: 0.14
+
+    """
+    _get_method(method)
+    removed = 0
+    for entity in list(entities):  # POLYLINE vertices are not part of a layout, but copy for safety
+        dxftype = entity.dxftype()
+        if dxftype == 'LWPOLYLINE':
+            removed += simplify_lwpolyline(entity, tolerance, method)
+        elif dxftype == 'POLYLINE':
+            removed += simplify_polyline(entity, tolerance, method)
+    return removed
+
+
+def fit_arcs_lwpolyline(lwpolyline: 'LWPolyline', tolerance: float, min_segments: int = 3) -> int:
+    """
+    Replaces runs of straight segments of a :class:`~ezdxf.entities.LWPolyline` entity in place by arc
+    segments, if all vertices and segments of a run are located within `tolerance` of a circular arc,
+    see :func:`~ezdxf.math.fit_arcs_indices_2d`. Existing arc segments and vertices at width changes are kept.
+
+    Args:
+        lwpolyline: LWPOLYLINE entity
+        tolerance: max. distance of all vertices and segments to a fitted arc
+        min_segments: min. count of straight segments replaced by an arc
+
+    Returns:
+        count of removed vertices
+
+    .. versionadded:: 0.14
+
+    """
+    points = lwpolyline.get_points('xyseb')
+    fitted = _fit_arcs(
+        [(x, y) for x, y, *_ in points],
+        [(s, e, b) for _, _, s, e, b in points],
+        lwpolyline.closed, tolerance, min_segments,
+    )
+    removed = len(points) - len(fitted)
+    if removed:
+        lwpolyline.set_points([points[index][:4] + (bulge,) for index, bulge in fitted], format='xyseb')
+    return removed
+
+
+def fit_arcs_polyline(polyline: 'Polyline', tolerance: float, min_segments: int = 3) -> int:
+    """
+    Replaces runs of straight segments of a 2D :class:`~ezdxf.entities.Polyline` entity in place by arc
+    segments, see :func:`fit_arcs_lwpolyline`. 3D polylines, polymesh and polyface entities and curve- or spline
+    fitted polylines are not changed.
+
+    Returns:
+        count of removed vertices
+
+    .. versionadded:: 0.14
+
+    """
+    if not polyline.is_2d_polyline or \
+            polyline.dxf.flags & (polyline.CURVE_FIT_VERTICES_ADDED | polyline.SPLINE_FIT_VERTICES_ADDED):
+        return 0
+    vertices = polyline.vertices
+    points = [vertex.format('xyseb') for vertex in vertices]
+    fitted = _fit_arcs(
+        [(x, y) for x, y, *_ in points],
+        [(s, e, b) for _, _, s, e, b in points],
+        polyline.is_closed, tolerance, min_segments,
+    )
+    for index, bulge in fitted:
+        if bulge != points[index][4]:
+            vertices[index].dxf.bulge = bulge
+    return _remove_vertices(polyline, [index for index, _ in fitted])
+
+
+def fit_arcs_polylines(entities: Iterable['DXFGraphic'], tolerance: float, min_segments: int = 3,
+                       explode: bool = False) -> int:
+    """
+    Fits arcs into all LWPOLYLINE and 2D POLYLINE entities of `entities` in place, e.g. all entities of a
+    layout, see :func:`fit_arcs_lwpolyline` and :func:`fit_arcs_polyline`. Other entities are ignored.
+
+    If `explode` is ``True``, the modified polylines are replaced by LINE and ARC entities in their layout,
+    polylines without fitted arcs are not exploded. Requires polylines located in a layout.
+
+    .. code-block:: Python
+
+        fit_arcs_polylines(doc.modelspace(), tolerance=0.001)
+
+    Returns:
+        count of removed vertices
+
+    .. versionadded:: 0.14
+
+    """
+    removed = 0
+    for entity in list(entities):  # exploding modifies the layout
+        dxftype = entity.dxftype()
+        if dxftype == 'LWPOLYLINE':
+            count = fit_arcs_lwpolyline(entity, tolerance, min_segments)
+        elif dxftype == 'POLYLINE':
+            count = fit_arcs_polyline(entity, tolerance, min_segments)
+        else:
+            continue
+        if count and explode:
+            entity.explode()
+        removed += count
+    return removed
+
+
+def simplify_mesh(mesh: Union['Mesh', 'Polyline'], target_faces: int = None, max_error: float = None) -> int:
+    """
+    Reduces the face count of a :class:`~ezdxf.entities.Mesh` entity or a :class:`~ezdxf.entities.Polyface`
+    entity in place by quadric error edge collapse, see :func:`~ezdxf.render.decimate_mesh`. The faces of the
+    simplified mesh are triangles, the edges and crease values of the MESH entity are removed, the vertices of
+    the POLYFACE entity are rebuilt with the DXF attributes of the POLYLINE entity.
+
+    The entity is not changed if the decimation does not reduce the face count, e.g. because the triangulation of
+    quadrilaterals doubles the face count. Other entities than MESH and POLYFACE are not changed.
+
+    .. code-block:: Python
+
+        simplify_mesh(mesh, target_faces=len(mesh.faces) // 10)
+
+    Args:
+        mesh: MESH or POLYFACE entity
+        target_faces: target face count
+        max_error: max. quadric error as distance in drawing units
+
+    Returns:
+        count of removed faces
+
+    Raises:
+        ValueError: `target_faces` and `max_error` are ``None``
+
+    .. versionadded:: 0.14
+
+    """
+    dxftype = mesh.dxftype()
+    if dxftype == 'MESH':
+        face_count = len(mesh.faces)
+        result = decimate_mesh(mesh, target_faces, max_error)
+        removed = face_count - result.face_count
+        if removed > 0:
+            mesh.vertices = result.vertices
+            mesh.faces = result.faces
+            mesh.edges = []
+            mesh.creases = []
+        return max(removed, 0)
+    if dxftype == 'POLYLINE' and mesh.is_poly_face_mesh:
+        source = MeshVertexMerger.from_polyface(mesh)
+        result = decimate_mesh(source, target_faces, max_error)
+        removed = len(source.faces) - result.face_count
+        if removed > 0:
+            _remove_vertices(mesh, [])
+            mesh.append_indexed_faces(result.vertices, result.faces)
+        return max(removed, 0)
+    if target_faces is None and max_error is None:
+        raise ValueError('target_faces or max_error required')
+    return 0
+
+
+def _remove_vertices(polyline: 'Polyline', kept: List[int]) -> int:
+    # Removes all VERTEX entities of `polyline` with an index not in `kept`
+    vertices = polyline.vertices
+    removed = len(vertices) - len(kept)
+    if removed:
+        kept = set(kept)
+        polyline.vertices = [vertex for index, vertex in enumerate(vertices) if index in kept]
+        for index, vertex in enumerate(vertices):
+            if index not in kept:
+                if polyline.doc:
+                    polyline.entitydb.delete_entity(vertex)
+                else:
+                    vertex.destroy()
+    return removed
+
+
+def _get_method(method: str) -> Callable[[Iterable['Vertex'], float], List[int]]:
+    try:
+        return METHODS[method]
+    except KeyError:
+        raise ValueError(f'invalid simplification method: {method}')
+
+
+def _locked_runs(count: int, segments: Optional[List[Sequence[float]]], closed: bool) -> Iterable[Tuple[int, int]]:
+    # Yields (start, end) index tuples of runs of straight segments with the same constant width between locked
+    # vertices, the end index of the last run of a closed polyline is `count`.
+    # segments: (start width, end width, bulge) of the segment starting at each vertex or None for 3D polylines
+    locked = [False] * count
+    locked[0] = True
+    if not closed:
+        locked[-1] = True
+    if segments is not None:
+        for index in range(1, count + 1 if closed else count - 1):
+            s1, e1, b1 = segments[index - 1]
+            s2, e2, b2 = segments[index % count]
+            if b1 or b2 or not (s1 == e1 == s2 == e2):
+                locked[index % count] = True
+    if closed:  # the first vertex closes the polyline
+        locked.append(True)
+    start = 0
+    for end in range(1, len(locked)):
+        if locked[end]:
+            yield start, end
+            start = end
+
+
+def _kept_indices(points: List[Sequence[float]], segments: Optional[List[Sequence[float]]], closed: bool,
+                  tolerance: float, simplify: Callable[[Iterable['Vertex'], float], List[int]]) -> List[int]:
+    # Simplifies the runs of straight segments with the same constant width between locked vertices.
+    count = len(points)
+    if count < 3:
+        return list(range(count))
+    if closed:
+        points = points + points[:1]
+    kept = []
+    for start, end in _locked_runs(count, segments, closed):
+        kept.extend(index + start for index in simplify(points[start:end + 1], tolerance)[:-1])
+    if not closed:
+        kept.append(count - 1)
+    return kept
+
+
+def _fit_arcs(points: List[Sequence[float]], segments: List[Sequence[float]], closed: bool, tolerance: float,
+              min_segments: int) -> List[Tuple[int, float]]:
+    # Fits arcs into the runs of straight segments with the same constant width between locked vertices,
+    # returns (index, bulge) tuples of the kept vertices.
+    count = len(points)
+    if count < 3:
+        return [(index, segments[index][2]) for index in range(count)]
+    if closed:
+        points = points + points[:1]
+    fitted = []
+    for start, end in _locked_runs(count, segments, closed):
+        if end - start < min_segments:  # also arc segments
+            fitted.extend((index, segments[index][2]) for index in range(start, end))
+        else:
+            fitted.extend(
+                (index + start, bulge) for index, bulge in
+                fit_arcs_indices_2d(points[start:end + 1], tolerance, min_segments)[:-1]
+            )
+    if not closed:
+        fitted.append((count - 1, segments[-1][2]))
+    return fitted
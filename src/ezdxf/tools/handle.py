@@ -2,16 +2,19 @@
 # Created: 11.03.2011
 # Copyright (c) 2011-2018, Manfred Moitzi
 # License: MIT License
+from typing import List
 
 
 class HandleGenerator:
+    FORMAT = "%X"
+
     def __init__(self, start_value: str = '1'):
         self._handle = int(start_value, 16)
 
     reset = __init__
 
     def __str__(self):
-        return "%X" % self._handle
+        return self.FORMAT % self._handle
 
     def next(self) -> str:
         next_handle = str(self)
@@ -20,12 +23,17 @@ class HandleGenerator:
 
     __next__ = next
 
+    def reserve(self, count: int) -> List[str]:
+        """ Returns the next `count` handles as list. """
+        start = self._handle
+        self._handle += count
+        fmt = self.FORMAT
+        return [fmt % handle for handle in range(start, self._handle)]
+
 
 class ImageKeyGenerator(HandleGenerator):
-    def __str__(self):
-        return "Image%05d" % self._handle
+    FORMAT = "Image%05d"
 
 
 class UnderlayKeyGenerator(HandleGenerator):
-    def __str__(self):
-        return "Underlay%05d" % self._handle
+    FORMAT = "Underlay%05d"
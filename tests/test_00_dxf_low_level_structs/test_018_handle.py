@@ -24,3 +24,9 @@ def test_reset():
     handles = HandleGenerator('200')
     handles.reset('300')
     assert '300' == str(handles)
+
+
+def test_reserve():
+    handles = HandleGenerator('FE')
+    assert handles.reserve(3) == ['FE', 'FF', '100']
+    assert '101' == handles.next()
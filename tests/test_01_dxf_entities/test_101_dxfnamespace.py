@@ -3,7 +3,7 @@
 import pytest
 from copy import deepcopy
 from ezdxf.math import Vector
-from ezdxf.entities.dxfentity import base_class, DXFAttributes, DXFNamespace, SubclassProcessor
+from ezdxf.entities.dxfentity import base_class, DXFAttributes, DXFNamespace, SubclassProcessor, namespace_class
 from ezdxf.entities.dxfgfx import acdb_entity
 from ezdxf.entities.line import acdb_line
 from ezdxf.lldxf.extendedtags import ExtendedTags
@@ -161,6 +161,43 @@ def test_deepcopy_usage(entity, processor):
     assert attribs2.color == 13
 
 
+def test_specialized_namespace_class(entity, processor):
+    attribs = DXFNamespace(processor, entity)
+    assert isinstance(attribs, DXFNamespace)
+    assert type(attribs) is namespace_class(entity.DXFATTRIBS)
+    assert type(attribs) is type(DXFNamespace(entity=DXFEntity())), 'expected cached class'
+    assert type(attribs) is type(attribs.copy(entity))
+    # DXF default values as class attributes
+    assert type(attribs).layer == '0'
+    assert type(attribs).color == 256
+
+
+def test_existing_attribs_shadow_class_defaults(entity, processor):
+    attribs = DXFNamespace(processor, entity)
+    attribs.color = 7
+    assert attribs.color == 7
+    assert attribs.hasattr('color') is True
+    attribs.discard('color')
+    assert attribs.color == 256
+    assert attribs.hasattr('color') is False
+    assert attribs.get('color') is None
+
+
+def test_rewire_to_different_attribute_definitions(entity, processor):
+    class OtherEntity(DXFEntity):
+        DXFATTRIBS = DXFAttributes(base_class, acdb_entity)
+
+    attribs = DXFNamespace(processor, entity)
+    attribs.color = 7
+    other = OtherEntity()
+    attribs.rewire(other)
+    assert type(attribs) is namespace_class(other.DXFATTRIBS)
+    assert attribs.color == 7
+    assert attribs.handle == 'FFFF'
+    with pytest.raises(DXFAttributeError):
+        _ = attribs.start
+
+
 def test_dxf_export_one_attribute(entity, processor):
     attribs = DXFNamespace(processor, entity)
     tagwriter = TagCollector()
@@ -30,6 +30,15 @@ def test_app_data_get(tags):
     assert mozman[-1] == (102, "}")
 
 
+def test_app_data_copy(tags):
+    appdata = AppData()
+    appdata.set(tags.appdata[0])
+    appdata2 = appdata.copy()
+    assert appdata2.get('MOZMAN') == appdata.get('MOZMAN')
+    appdata2.discard('MOZMAN')
+    assert 'MOZMAN' in appdata
+
+
 def test_app_data_add():
     appdata = AppData()
     appdata.add('XXX', [
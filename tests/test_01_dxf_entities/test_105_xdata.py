@@ -103,6 +103,16 @@ def test_cloning(xdata):
     assert 'MOZMAN' not in xdata2
 
 
+def test_copy(xdata):
+    xdata2 = xdata.copy()
+    assert len(xdata2) == 2
+    tags = xdata2.get('MOZMAN')
+    assert tags == xdata.get('MOZMAN')
+    assert tags is not xdata.get('MOZMAN'), 'expected a copy of the tag list'
+    tags.append((1000, 'DataStr3'))
+    assert len(xdata.get('MOZMAN')) == 4
+
+
 def test_dxf_export(xdata):
     tagwriter = TagWriter()
     xdata.export_dxf(tagwriter)
@@ -184,6 +184,27 @@ def test_polyface_optimized_cube(modelspace):
     assert 6 == face.dxf.n_count  # faces count
 
 
+def test_polyface_append_indexed_faces(modelspace):
+    face = modelspace.add_polyface()
+    face.append_face([(0, 0), (1, 1), (2, 2)])
+    face.append_indexed_faces([(0, 0), (1, 0), (1, 1), (0, 1)], [(0, 1, 2, 3), (0, 2, 3)])
+    assert 7 == face.dxf.m_count  # vertices are not merged
+    assert 3 == face.dxf.n_count
+    result = list(face.indexed_faces()[1])
+    assert result[0].indices == (0, 1, 2)  # first face is not changed
+    assert result[1].indices == (3, 4, 5, 6)
+    assert result[2].indices == (3, 5, 6)
+    assert [v.dxf.location for v in result[2]] == [(0, 0), (1, 1), (0, 1)]
+
+
+def test_polyface_append_invalid_indexed_faces(modelspace):
+    face = modelspace.add_polyface()
+    with pytest.raises(ValueError):
+        face.append_indexed_faces([(0, 0), (1, 0), (1, 1)], [(0, 1)])
+    with pytest.raises(ValueError):
+        face.append_indexed_faces([(0, 0), (1, 0), (1, 1)], [(0, 1, 3)])
+
+
 def cube_faces():
     # cube corner points
     p1 = (0, 0, 0)
@@ -5,7 +5,7 @@ import pytest
 import ezdxf
 from ezdxf.entities.mesh import Mesh
 from ezdxf.lldxf.tagwriter import TagCollector, basic_tags_from_text
-from ezdxf.math import Vector, Matrix44
+from ezdxf.math import Vector, Matrix44, Vec3Array
 
 MESH = """0
 MESH
@@ -145,6 +145,26 @@ def test_add_edges(msp):
         assert [0, 1] == mesh_data.edges[0]
 
 
+def test_copy_mesh_data(msp):
+    mesh = msp.add_mesh()
+    with mesh.edit_data() as mesh_data:
+        mesh_data.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+        mesh_data.add_edge([(0, 0, 0), (1, 0, 0)])
+    copy = mesh.copy()
+    assert list(copy.vertices) == list(mesh.vertices)
+    assert list(copy.faces) == list(mesh.faces)
+    assert list(copy.edges) == list(mesh.edges)
+    assert copy.faces.values[0] is not mesh.faces.values[0], 'expected a deep copy of the faces'
+
+
+def test_set_vertices_from_vec3array(msp):
+    mesh = msp.add_mesh()
+    vertices = Vec3Array([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    mesh.vertices = vertices
+    assert list(mesh.vertices) == [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+    assert mesh.vertices.values is not vertices.values, 'expected a copy'
+
+
 def test_vertex_format(msp):
     mesh = msp.add_mesh()
     with mesh.edit_data() as mesh_data:
@@ -0,0 +1,176 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+import ezdxf
+from ezdxf.math import Vec2
+from ezdxf.simplify import (
+    simplify_lwpolyline, simplify_polyline, simplify_polylines, fit_arcs_lwpolyline, fit_arcs_polyline,
+    fit_arcs_polylines, simplify_mesh,
+)
+from ezdxf.render import forms, MeshVertexMerger
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new()
+    return doc.modelspace()
+
+
+def test_simplify_lwpolyline(msp):
+    lwpolyline = msp.add_lwpolyline([(0, 0), (1, 0.001), (2, 0), (3, 0), (3, 3)])
+    assert simplify_lwpolyline(lwpolyline, 0.01) == 2
+    assert lwpolyline.get_points('xy') == [(0, 0), (3, 0), (3, 3)]
+
+
+def test_lwpolyline_keeps_arcs(msp):
+    points = [(0, 0, 0), (1, 0, 0), (2, 0, 1), (3, 0, 0), (4, 0, 0), (5, 0, 0)]
+    lwpolyline = msp.add_lwpolyline(points, format='xyb')
+    assert simplify_lwpolyline(lwpolyline, 0.01) == 2
+    assert lwpolyline.get_points('xyb') == [(0, 0, 0), (2, 0, 1), (3, 0, 0), (5, 0, 0)]
+
+
+def test_lwpolyline_keeps_width_changes(msp):
+    points = [(0, 0, 1, 1), (1, 0, 1, 1), (2, 0, 1, 2), (3, 0, 2, 2), (4, 0, 2, 2), (5, 0, 0, 0)]
+    lwpolyline = msp.add_lwpolyline(points, format='xyse')
+    assert simplify_lwpolyline(lwpolyline, 0.01) == 2
+    assert lwpolyline.get_points('xyse') == [(0, 0, 1, 1), (2, 0, 1, 2), (3, 0, 2, 2), (5, 0, 0, 0)]
+
+
+def test_closed_lwpolyline(msp):
+    points = [(0, 0), (1, 0), (2, 0), (2, 2), (0, 2), (0, 1)]
+    lwpolyline = msp.add_lwpolyline(points, dxfattribs={'closed': True})
+    assert simplify_lwpolyline(lwpolyline, 0.01, method='visvalingam') == 2
+    assert lwpolyline.get_points('xy') == [(0, 0), (2, 0), (2, 2), (0, 2)]
+    assert lwpolyline.closed is True
+
+
+def test_simplify_polyline3d(msp):
+    polyline = msp.add_polyline3d([(0, 0, 0), (1, 0, 0.001), (2, 0, 0), (2, 2, 2)])
+    vertex = polyline.vertices[1]
+    assert simplify_polyline(polyline, 0.01) == 1
+    assert list(polyline.points()) == [(0, 0, 0), (2, 0, 0), (2, 2, 2)]
+    assert vertex.is_alive is False
+
+
+def test_simplify_polyline2d_keeps_arcs(msp):
+    polyline = msp.add_polyline2d([(0, 0, 0), (1, 0, 0), (2, 0, 1), (3, 0, 0), (4, 0, 0)], format='xyb')
+    assert simplify_polyline(polyline, 0.01) == 1
+    assert [v.format('xyb') for v in polyline.vertices] == [(0, 0, 0), (2, 0, 1), (3, 0, 0), (4, 0, 0)]
+
+
+def test_ignore_polymesh(msp):
+    mesh = msp.add_polymesh((3, 3))
+    assert simplify_polyline(mesh, 1) == 0
+
+
+def test_simplify_layout(msp):
+    msp.add_lwpolyline([(0, 0), (1, 0), (2, 0)])
+    msp.add_polyline2d([(0, 0), (1, 0), (2, 0)])
+    msp.add_line((0, 0), (1, 0))
+    assert simplify_polylines(msp, 0.01) == 2
+
+
+def test_invalid_method(msp):
+    with pytest.raises(ValueError):
+        simplify_polylines(msp, 0.01, method='xxx')
+
+
+def half_circle(count=50):
+    return [Vec2.from_angle(math.pi * i / count, 5) for i in range(count + 1)]
+
+
+def test_fit_arcs_lwpolyline(msp):
+    lwpolyline = msp.add_lwpolyline(half_circle() + [(-5, -5)])
+    assert fit_arcs_lwpolyline(lwpolyline, 0.005) == 49
+    points = lwpolyline.get_points('xyb')
+    assert len(points) == 3
+    assert points[0] == pytest.approx((5, 0, 1))
+    assert points[1] == pytest.approx((-5, 0, 0))
+
+
+def test_fit_arcs_keeps_width_changes(msp):
+    points = [(p.x, p.y, 1, 1) for p in half_circle()]
+    points[25] = (points[25][0], points[25][1], 2, 2)
+    lwpolyline = msp.add_lwpolyline(points, format='xyse')
+    assert fit_arcs_lwpolyline(lwpolyline, 0.005) == 47
+    assert [index for index, p in enumerate(points) if p[:2] in lwpolyline.get_points('xy')] == [0, 25, 26, 50]
+    assert lwpolyline.get_points('b')[1] == (0,)  # segment with different width is not fitted
+
+
+def test_fit_arcs_closed_lwpolyline(msp):
+    lwpolyline = msp.add_lwpolyline(half_circle()[:-1] + [(-5, 0)], dxfattribs={'closed': True})
+    assert fit_arcs_lwpolyline(lwpolyline, 0.005) == 49
+    points = lwpolyline.get_points('xyb')
+    assert points[0] == pytest.approx((5, 0, 1))
+    assert points[1] == pytest.approx((-5, 0, 0))
+    assert lwpolyline.closed is True
+
+
+def test_fit_arcs_polyline2d(msp):
+    polyline = msp.add_polyline2d(half_circle())
+    vertex = polyline.vertices[1]
+    assert fit_arcs_polyline(polyline, 0.005) == 49
+    points = [v.format('xyb') for v in polyline.vertices]
+    assert points[0] == pytest.approx((5, 0, 1))
+    assert points[1] == pytest.approx((-5, 0, 0))
+    assert vertex.is_alive is False
+
+
+def test_fit_arcs_ignores_polyline3d(msp):
+    polyline = msp.add_polyline3d(half_circle())
+    assert fit_arcs_polyline(polyline, 0.005) == 0
+
+
+def test_fit_arcs_layout_and_explode(msp):
+    msp.add_lwpolyline(half_circle())
+    msp.add_lwpolyline([(0, 0), (1, 0), (2, 1)])
+    assert fit_arcs_polylines(msp, 0.005, explode=True) == 49
+    assert sorted(e.dxftype() for e in msp) == ['ARC', 'LWPOLYLINE']
+
+
+@pytest.fixture
+def sphere():
+    mesh = MeshVertexMerger()
+    mesh.add_mesh(mesh=forms.sphere(count=32, stacks=16))
+    return mesh
+
+
+def test_simplify_mesh(msp, sphere):
+    mesh = msp.add_mesh()
+    with mesh.edit_data() as data:
+        data.vertices = sphere.vertices
+        data.faces = sphere.faces
+        data.edges = [(0, 1)]
+    assert simplify_mesh(mesh, target_faces=100) == 412
+    assert len(mesh.faces) == 100
+    assert len(mesh.vertices) == 52
+    assert len(mesh.edges) == 0
+
+
+def test_simplify_polyface(msp, sphere):
+    polyface = msp.add_polyface()
+    polyface.append_faces(sphere.faces_as_vertices())
+    assert simplify_mesh(polyface, target_faces=100) == 412
+    vertices, faces = polyface.indexed_faces()
+    assert len(vertices) == 52
+    assert len(list(faces)) == 100
+    assert polyface.dxf.m_count == 52
+    assert polyface.dxf.n_count == 100
+    assert all(vertex.is_alive for vertex in polyface.vertices)
+
+
+def test_simplify_mesh_keeps_entity_without_reduction(msp, sphere):
+    polyface = msp.add_polyface()
+    polyface.append_faces(sphere.faces_as_vertices())
+    count = len(polyface.vertices)
+    # triangulation of the quadrilaterals increases the face count
+    assert simplify_mesh(polyface, max_error=0) == 0
+    assert len(polyface.vertices) == count
+
+
+def test_simplify_mesh_ignores_other_entities(msp):
+    polyline = msp.add_polyline3d([(0, 0, 0), (1, 0, 0), (1, 1, 1)])
+    assert simplify_mesh(polyline, target_faces=1) == 0
+    with pytest.raises(ValueError):
+        simplify_mesh(polyline)
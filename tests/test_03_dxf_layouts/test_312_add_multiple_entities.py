@@ -0,0 +1,199 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import gc
+import ezdxf
+from ezdxf.lldxf.const import DXFInvalidLayerName, DXFVersionError, DXFAttributeError
+
+
+@pytest.fixture(scope='module')
+def doc():
+    return ezdxf.new()
+
+
+@pytest.fixture
+def msp(doc):
+    return doc.modelspace()
+
+
+def test_add_lines(msp):
+    count = len(msp)
+    lines = msp.add_lines([((0, 0), (1, 0)), ((0, 1, 2), (1, 1, 2))], dxfattribs={'layer': 'LINES', 'color': 1})
+    assert len(lines) == 2
+    assert len(msp) == count + 2
+    assert lines[0].dxf.start == (0, 0, 0)
+    assert lines[1].dxf.end == (1, 1, 2)
+    for line in lines:
+        assert line.dxftype() == 'LINE'
+        assert line.dxf.layer == 'LINES'
+        assert line.dxf.color == 1
+        assert line.dxf.owner == msp.layout_key
+        assert line.dxf.handle in msp.entitydb
+
+
+def test_add_lines_has_unique_handles(msp):
+    lines = msp.add_lines([((0, 0), (1, 0))] * 10)
+    assert len(set(line.dxf.handle for line in lines)) == 10
+
+
+def test_add_lines_does_not_share_namespaces(msp):
+    line1, line2 = msp.add_lines([((0, 0), (1, 0))] * 2, dxfattribs={'layer': 'LINES'})
+    line1.dxf.layer = 'CHANGED'
+    assert line2.dxf.layer == 'LINES'
+
+
+def test_add_lines_to_paperspace(doc):
+    psp = doc.layout()
+    line = psp.add_lines([((0, 0), (1, 0))])[0]
+    assert line.dxf.owner == psp.layout_key
+    assert line.dxf.paperspace == 1
+
+
+def test_add_lines_to_block(doc):
+    block = doc.blocks.new('BULK_LINES')
+    block.add_lines([((0, 0), (1, 0))] * 3)
+    assert len(block) == 3
+
+
+def test_validate_common_attributes(msp):
+    with pytest.raises(DXFInvalidLayerName):
+        msp.add_lines([((0, 0), (1, 0))], dxfattribs={'layer': 'INVALID*'})
+
+
+def test_validate_unique_attribute_names(msp):
+    count = len(msp)
+    with pytest.raises(DXFAttributeError):
+        msp.new_entities('LINE', {}, [{'start': (0, 0, 0)}, {'invalid': 1}])
+    assert len(msp) == count, 'no entity should be created'
+
+
+def test_garbage_collector_is_enabled_after_invalid_attribute(msp):
+    with pytest.raises(DXFAttributeError):
+        msp.new_entities('LINE', {}, [{'invalid': 1}])
+    assert gc.isenabled() is True
+
+
+def test_bulk_created_entity_equals_single_created_entity(msp):
+    line1 = msp.add_lines([((0, 0), (1, 0))], dxfattribs={'layer': 'LINES'})[0]
+    line2 = msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES'})
+    assert line1.__dict__.keys() == line2.__dict__.keys()
+    assert type(line1.dxf) is type(line2.dxf)
+    assert line1.dxf._entity is line1
+    attribs = line1.dxf.all_existing_dxf_attribs()
+    del attribs['handle']
+    expected = line2.dxf.all_existing_dxf_attribs()
+    del expected['handle']
+    assert attribs == expected
+
+
+def test_unique_attributes_with_setter_events(msp):
+    lines = msp.new_entities('LINE', {'layer': 'LINES'}, [{'layer': 'L1'}, {'layer': 'L2'}])
+    assert [line.dxf.layer for line in lines] == ['L1', 'L2']
+
+
+def test_add_points(msp):
+    points = msp.add_points([(1, 2), (3, 4, 5)], dxfattribs={'layer': 'POINTS'})
+    assert len(points) == 2
+    assert points[0].dxf.location == (1, 2, 0)
+    assert points[1].dxf.location == (3, 4, 5)
+    assert points[1].dxf.layer == 'POINTS'
+
+
+def test_add_circles(msp):
+    circles = msp.add_circles([(0, 0), (1, 1)], [1, 2])
+    assert len(circles) == 2
+    assert circles[1].dxf.center == (1, 1, 0)
+    assert circles[1].dxf.radius == 2
+    assert isinstance(circles[1].dxf.radius, float)
+
+
+def test_add_lwpolylines(msp):
+    polylines = msp.add_lwpolylines([
+        [(0, 0), (1, 0), (1, 1)],
+        [(0, 0), (2, 0), (2, 2), (0, 2)],
+    ], format='xy', dxfattribs={'closed': True, 'layer': 'LWP'})
+    assert len(polylines) == 2
+    assert len(polylines[0]) == 3
+    assert len(polylines[1]) == 4
+    assert polylines[1][2] == (2, 2, 0, 0, 0)
+    assert all(p.closed for p in polylines)
+    assert all(p.dxf.layer == 'LWP' for p in polylines)
+
+
+def test_add_lwpolylines_requires_dxf_r2000():
+    msp = ezdxf.new('R12').modelspace()
+    with pytest.raises(DXFVersionError):
+        msp.add_lwpolylines([[(0, 0), (1, 0)]])
+
+
+@pytest.fixture(scope='module')
+def symbol(doc):
+    block = doc.blocks.new('SYMBOL', base_point=(1, 1))
+    block.add_circle((1, 1), 0.5)
+    block.add_attdef('NAME', (2, 1), dxfattribs={'height': 0.25})
+    block.add_attdef('TYPE', (2, 0.5), dxfattribs={'height': 0.25, 'rotation': 15})
+    return block
+
+
+def test_add_blockrefs(msp):
+    blockrefs = msp.add_blockrefs('SYMBOL', [(0, 0), (5, 5)], dxfattribs={'layer': 'SYMBOLS'})
+    assert len(blockrefs) == 2
+    assert blockrefs[1].dxf.name == 'SYMBOL'
+    assert blockrefs[1].dxf.insert == (5, 5, 0)
+    assert blockrefs[1].dxf.layer == 'SYMBOLS'
+    assert blockrefs[1].attribs_follow is False
+
+
+def test_add_blockrefs_with_rotation_and_scaling(msp):
+    blockrefs = msp.add_blockrefs('SYMBOL', [(0, 0), (5, 5)], rotations=[30, 45], scales=[2, (1, 2, 3)])
+    assert blockrefs[0].dxf.rotation == 30
+    assert blockrefs[0].dxf.xscale == 2
+    assert blockrefs[0].dxf.zscale == 2
+    assert blockrefs[1].dxf.rotation == 45
+    assert blockrefs[1].dxf.yscale == 2
+    assert blockrefs[1].dxf.zscale == 3
+
+
+def test_add_blockrefs_count_mismatch(msp):
+    with pytest.raises(ezdxf.DXFValueError):
+        msp.add_blockrefs('SYMBOL', [(0, 0), (5, 5)], rotations=[30])
+
+
+@pytest.mark.parametrize('rotation, scale', [(0, 1), (30, 2), (-45, (1, 2, 1))])
+def test_add_blockrefs_with_attribs_like_add_auto_attribs(msp, symbol, rotation, scale):
+    locations = [(0, 0), (5, 5), (-3, 7)]
+    values = [{'NAME': f'P{i}', 'TYPE': 'PUMP'} for i in range(len(locations))]
+    blockrefs = msp.add_blockrefs(
+        'SYMBOL', locations, rotations=[rotation] * 3, scales=[scale] * 3, attribs=values)
+
+    for location, blockref, value in zip(locations, blockrefs, values):
+        expected = msp.add_blockref('SYMBOL', location, dxfattribs={'rotation': rotation})
+        expected.dxf.xscale, expected.dxf.yscale, expected.dxf.zscale = \
+            (scale, scale, scale) if isinstance(scale, int) else scale
+        expected.add_auto_attribs(value)
+
+        assert len(blockref.attribs) == 2
+        assert blockref.seqend is not None
+        for attrib, expected_attrib in zip(blockref.attribs, expected.attribs):
+            assert attrib.dxf.tag == expected_attrib.dxf.tag
+            assert attrib.dxf.text == expected_attrib.dxf.text
+            assert attrib.dxf.insert.isclose(expected_attrib.dxf.insert)
+            assert attrib.dxf.height == pytest.approx(expected_attrib.dxf.height)
+            assert attrib.dxf.rotation == pytest.approx(expected_attrib.dxf.rotation)
+            assert attrib.dxf.owner == blockref.dxf.owner
+            assert attrib.dxf.handle in msp.entitydb
+
+
+def test_add_blockrefs_with_missing_attrib_values(msp, symbol):
+    blockref = msp.add_blockrefs('SYMBOL', [(0, 0)], attribs=[{'NAME': 'P1'}])[0]
+    assert blockref.get_attrib_text('NAME') == 'P1'
+    assert blockref.get_attrib_text('TYPE') == ''
+
+
+def test_add_blockrefs_to_virtual_layout(symbol):
+    from ezdxf.graphicsfactory import VirtualLayout
+    layout = VirtualLayout(symbol.doc)
+    blockrefs = layout.add_blockrefs('SYMBOL', [(0, 0), (1, 1)])
+    assert len(layout.entities) == 2
+    assert blockrefs[1].dxf.insert == (1, 1, 0)
+    assert blockrefs[1].dxf.handle is None
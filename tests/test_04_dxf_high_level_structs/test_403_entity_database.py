@@ -56,6 +56,14 @@ def test_delete_dead_entity_entity():
     # Auditor() removes such dead entities from database see test_restore_integrity_purge()
 
 
+def test_reserve_handles(db):
+    db.handles.reset('FEFD')
+    handles = db.reserve_handles(3)
+    assert handles == ['FEFD', 'FEFF', 'FF00'], 'existing handle FEFE has to be skipped'
+    assert 'FEFD' not in db, 'reserved handles should not be stored in the database'
+    assert db.next_handle() == 'FF01'
+
+
 def test_keys(db):
     assert list(db.keys()) == ['FEFE']
 
@@ -3,6 +3,7 @@
 from typing import Iterable
 import pytest
 import math
+from ezdxf.math import linalg
 from ezdxf.math.linalg import (
     Matrix, gauss_vector_solver, gauss_matrix_solver, gauss_jordan_solver, gauss_jordan_inverse, LUDecomposition,
     tridiagonal_vector_solver, tridiagonal_matrix_solver,
@@ -356,6 +357,45 @@ def test_determinant():
     assert chk.determinant() == det
 
 
+
+@pytest.fixture(scope='module')
+def big_matrix():
+    # above the limit for numpy delegation, deterministic and well conditioned
+    n = linalg.USE_NUMPY_LU_LIMIT + 5
+    return [[math.sin(i * n + j + 1) + (n if i == j else 0) for j in range(n)] for i in range(n)]
+
+
+def test_LU_decomposition_implementations(big_matrix):
+    if linalg.numpy is None:
+        pytest.skip('requires numpy')
+    lu1, index1, det1 = linalg._lu_decomposition(linalg.copy_float_matrix(big_matrix))
+    lu2, index2, det2 = linalg._lu_decomposition_numpy(linalg.copy_float_matrix(big_matrix))
+    assert index1 == index2
+    assert det1 == det2
+    assert Matrix(matrix=lu1) == Matrix(matrix=lu2)
+
+
+def test_LU_decomposition_solver_without_numpy(big_matrix, monkeypatch):
+    B = list(zip(*[[math.cos(i * k) for i in range(len(big_matrix))] for k in range(3)]))
+    result1 = LUDecomposition(big_matrix).solve_matrix(B)
+    monkeypatch.setattr(linalg, 'numpy', None)
+    lu = LUDecomposition(big_matrix)
+    result2 = lu.solve_matrix(B)
+    assert result1 == result2
+    b = [row[0] for row in B]
+    are_close_vectors(result2.col(0), lu.solve_vector(b))
+    are_close_vectors(result2.col(0), gauss_vector_solver(big_matrix, b))
+
+
+def test_mul_without_numpy(big_matrix, monkeypatch):
+    m = Matrix(big_matrix)
+    result1 = m * m
+    monkeypatch.setattr(linalg, 'numpy', None)
+    result2 = m * m
+    assert result1 == result2
+    assert result2[1, 2] == pytest.approx(sum(a * b for a, b in zip(m.row(1), m.col(2))))
+
+
 TRI_DIAGONAL = [
     [2, 3, 0, 0, 0],
     [5, 1, 4, 0, 0],
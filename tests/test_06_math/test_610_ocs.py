@@ -20,7 +20,8 @@ center point, (-5.53851623, 8.87677359, 5.87096886)
 Extrusion direction relative to UCS: X=0.70819791  Y=0.07548520  Z=0.70196702
 
 """
-from ezdxf.math import OCS, Matrix44, Vector
+from ezdxf.math import OCS, Matrix44, Vector, Vec3Array, get_ocs
+from ezdxf.math import ucs
 
 EXTRUSION = (0.7081979129501316, 0.0754851955385861, 0.7019670229772758)
 
@@ -99,3 +100,48 @@ def test_matrix44_to_wcs():
         (-9.56460754, 8.44764172, 9.97894327),
         places=6,
     )
+
+
+def test_get_ocs_returns_shared_instances():
+    assert get_ocs() is get_ocs((0, 0, 1))
+    assert get_ocs().transform is False
+    ocs = get_ocs(EXTRUSION)
+    assert ocs is get_ocs(Vector(EXTRUSION))
+    assert ocs.uz.isclose(EXTRUSION)
+
+
+def test_get_ocs_cache_size(monkeypatch):
+    monkeypatch.setattr(ucs, 'OCS_CACHE_SIZE', 2)
+    monkeypatch.setattr(ucs, '_OCS_CACHE', dict())
+    for x in range(5):
+        get_ocs((x, 1, 1))
+    assert len(ucs._OCS_CACHE) <= 2
+
+
+POINTS = [(-9.56460754, 8.44764172, 9.97894327), (-1.60085321, 9.29648008, 1.85322122), (0, 0, 0)]
+
+
+def test_points_to_wcs_array():
+    ocs = OCS(EXTRUSION)
+    ocs_points = list(ocs.points_from_wcs(POINTS))
+    result = ocs.points_to_wcs_array(ocs_points)
+    assert isinstance(result, Vec3Array)
+    for v1, v2 in zip(result, ocs.points_to_wcs(ocs_points)):
+        assert v1.isclose(v2)
+
+
+def test_points_from_wcs_array():
+    ocs = OCS(EXTRUSION)
+    result = ocs.points_from_wcs_array(Vec3Array(POINTS))
+    assert isinstance(result, Vec3Array)
+    for v1, v2 in zip(result, ocs.points_from_wcs(POINTS)):
+        assert v1.isclose(v2)
+
+
+def test_wcs_ocs_array_returns_copy():
+    ocs = get_ocs()
+    points = Vec3Array(POINTS)
+    result = ocs.points_to_wcs_array(points)
+    assert result == points
+    assert result.values is not points.values
+    assert list(ocs.points_from_wcs_array(POINTS)) == POINTS
@@ -1,7 +1,7 @@
 # Copyright (c) 2018 Manfred Moitzi
 # License: MIT License
 from math import isclose, radians, pi
-from ezdxf.math import UCS, Vector, X_AXIS, Y_AXIS, Z_AXIS, Matrix44
+from ezdxf.math import UCS, Vector, X_AXIS, Y_AXIS, Z_AXIS, Matrix44, Vec3Array
 
 
 def test_ucs_init():
@@ -222,3 +222,16 @@ def test_moveto():
     assert ucs.origin == (1, 2, 3)
     ucs.moveto((3, 2, 1))
     assert ucs.origin == (3, 2, 1)
+
+
+def test_points_to_and_from_wcs_array():
+    ucs = UCS(origin=(3, 3, 3), ux=(1, 2, 0), uz=(2, -1, 5))
+    points = [(1, 2, 3), (-7, 8, -9), (0, 0, 0)]
+    wcs_points = ucs.points_to_wcs_array(points)
+    assert isinstance(wcs_points, Vec3Array)
+    for v1, v2 in zip(wcs_points, ucs.points_to_wcs(points)):
+        assert v1.isclose(v2)
+    ucs_points = ucs.points_from_wcs_array(wcs_points)
+    assert isinstance(ucs_points, Vec3Array)
+    for v1, v2 in zip(ucs_points, points):
+        assert v1.isclose(v2)
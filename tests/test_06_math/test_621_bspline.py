@@ -147,6 +147,62 @@ def test_subdivide_params():
     assert list(subdivide_params([0.0, 0.5, 1.0])) == [0.0, 0.25, 0.5, 0.75, 1.0]
 
 
+@pytest.fixture(params=['numpy', 'python'])
+def batch_backend(request, monkeypatch):
+    from ezdxf.math import bspline
+    if request.param == 'python':
+        monkeypatch.setattr(bspline, 'numpy', None)
+    elif bspline.numpy is None:
+        pytest.skip('requires numpy')
+    return request.param
+
+
+def test_batch_points(batch_backend):
+    spline = BSpline(DEFPOINTS, order=3)
+    params = list(spline.params(20))
+    for p1, p2 in zip(spline.points(params), (spline.point(t) for t in params)):
+        assert p1.isclose(p2)
+
+
+def test_batch_points_rational(batch_backend):
+    spline = BSpline(DEFPOINTS, order=3, weights=[1, 2, 3, 2, 1])
+    params = list(spline.params(20))
+    for p1, p2 in zip(spline.points(params), (spline.point(t) for t in params)):
+        assert p1.isclose(p2)
+
+
+@pytest.mark.parametrize('weights', [None, [1, 2, 3, 2, 1]])
+@pytest.mark.parametrize('order, n', [(4, 2), (2, 1), (5, 4)])
+def test_batch_derivatives(batch_backend, weights, order, n):
+    spline = BSpline(DEFPOINTS, order=order, weights=weights)
+    params = list(spline.params(20))
+    for d1, d2 in zip(spline.derivatives(params, n=n), (spline.derivative(t, n=n) for t in params)):
+        assert len(d1) == n + 1
+        for v1, v2 in zip(d1, d2):
+            assert v1.isclose(v2, abs_tol=1e-6)
+
+
+def test_batch_evaluation_of_empty_params():
+    spline = BSpline(DEFPOINTS, order=3)
+    assert list(spline.points([])) == []
+    assert list(spline.derivatives([])) == []
+
+
+def test_basis_funcs_batch_is_shared_by_same_knot_vector():
+    spline1 = BSpline(DEFPOINTS, order=3)
+    spline2 = BSpline(list(reversed(DEFPOINTS)), order=3)
+    params = list(spline1.params(10))
+    assert spline1.basis.basis_funcs_batch(params) is spline2.basis.basis_funcs_batch(params)
+
+
+def test_flattening():
+    spline = BSpline(DEFPOINTS, order=3)
+    vertices = list(spline.flattening(0.01))
+    assert vertices[0].isclose(DEFPOINTS[0])
+    assert vertices[-1].isclose(DEFPOINTS[-1])
+    assert len(list(spline.flattening(0.001))) > len(vertices)
+
+
 @pytest.fixture
 def weired_spline1():
     # test spline from: 'CADKitSamples\Tamiya TT-01.dxf'
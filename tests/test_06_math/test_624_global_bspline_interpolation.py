@@ -3,10 +3,11 @@ import pytest
 import ezdxf
 from math import isclose
 import math
-from ezdxf.math import Vector
-from ezdxf.math.bspline import global_bspline_interpolation
+from ezdxf.math import Vector, linspace, LUDecomposition
+from ezdxf.math import bspline
+from ezdxf.math.bspline import global_bspline_interpolation, Basis
 from ezdxf.math.parametrize import uniform_t_vector, distance_t_vector, centripetal_t_vector, arc_t_vector, \
-    arc_distances, estimate_tangents
+    arc_distances, estimate_tangents, create_t_vector
 from ezdxf.math.bspline import (
     knots_from_parametrization, required_knot_values, averaged_knots_unconstrained, natural_knots_constrained,
     averaged_knots_constrained,
@@ -175,6 +176,47 @@ def test_bspline_interpolation_first_derivatives(fit_points):
     assert len(spline.control_points) == 2 * len(fit_points)
 
 
+@pytest.fixture(scope='module')
+def many_fit_points():
+    # above the limit for the banded matrix solver
+    return [Vector(t, math.sin(t), math.cos(t * 0.3)) for t in linspace(0, 20, 100)]
+
+
+@pytest.mark.parametrize('tangents', [None, 'end_tangents', 'derivatives'])
+def test_bspline_interpolation_of_many_fit_points(many_fit_points, tangents):
+    if tangents == 'end_tangents':
+        tangents = [Vector(1, 1, 0), Vector(1, 0, 0)]
+    elif tangents == 'derivatives':
+        tangents = estimate_tangents(many_fit_points)
+    spline = global_bspline_interpolation(many_fit_points, degree=3, tangents=tangents)
+    for t, point in zip(spline.t_array, many_fit_points):
+        assert spline.point(t).isclose(point, abs_tol=1e-9)
+
+
+def test_sparse_rows_solver_matches_dense_solver(many_fit_points):
+    t_vector = list(create_t_vector(many_fit_points, 'chord'))
+    knots = knots_from_parametrization(len(many_fit_points) - 1, 3, t_vector, 'natural')
+    rows = bspline._collocation_rows(Basis(knots, 4, len(many_fit_points)), t_vector)
+    m1, m2, _ = bspline._compact_banded_sparse_rows(rows)
+    assert m1 <= 3 and m2 <= 3, 'band width limited by degree'
+    control_points = bspline._solve_sparse_rows(rows, many_fit_points)
+    lu = LUDecomposition(bspline._expand_sparse_rows(rows, len(rows)))
+    expected = Vector.list(lu.solve_matrix(many_fit_points).rows())
+    for v1, v2 in zip(control_points, expected):
+        assert v1.isclose(v2, abs_tol=1e-9)
+
+
+@pytest.mark.skipif(bspline.numpy is None, reason='requires numpy')
+def test_collocation_rows_numpy_implementation(many_fit_points):
+    t_vector = list(create_t_vector(many_fit_points, 'chord'))
+    knots = knots_from_parametrization(len(many_fit_points) - 1, 3, t_vector, 'average')
+    basis = Basis(knots, 4, len(many_fit_points))
+    spans, funcs = bspline._basis_funcs_numpy(basis, t_vector)
+    for span, values, t in zip(spans, funcs, t_vector):
+        assert span == basis.find_span(t)
+        assert values == pytest.approx(basis.basis_funcs(span, t), abs=1e-12)
+
+
 expected = [
     (0.0, 0.0),
     (0.010310831479728222, 0.32375901937484741),
@@ -1,9 +1,12 @@
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
+import pytest
 import math
-from ezdxf.math import ConstructionEllipse
+from ezdxf.math import ConstructionEllipse, Vector, Vec2, Vec3Array
+from ezdxf.math import bezier4p
 from ezdxf.math.bezier4p import (
-    Bezier4P, cubic_bezier_arc_parameters, cubic_bezier_interpolation, cubic_bezier_from_arc, cubic_bezier_from_ellipse
+    Bezier4P, cubic_bezier_arc_parameters, cubic_bezier_interpolation, cubic_bezier_from_arc, cubic_bezier_from_ellipse,
+    cubic_bezier_chain_approximation, bernstein3, bernstein3_table,
 )
 
 DEFPOINTS2D = [(0., 0., 0.), (3., 0., 0.), (7., 10., 0.), (10., 10., 0.)]
@@ -115,6 +118,80 @@ def test_reverse():
     assert list(reversed(vertices)) == rev_vertices
 
 
+def test_flattening():
+    curve = Bezier4P(DEFPOINTS2D)
+    vertices = list(curve.flattening(0.01))
+    assert vertices[0] == DEFPOINTS2D[0]
+    assert vertices[-1] == DEFPOINTS2D[-1]
+    assert len(list(curve.flattening(0.001))) > len(vertices)
+    # a straight line requires no subdivision
+    line = Bezier4P([(0, 0), (1, 0), (2, 0), (3, 0)])
+    assert len(list(line.flattening(0.01, segments=4))) == 5
+
+
+
+def test_approximate():
+    curve = Bezier4P(DEFPOINTS2D)
+    vertices = list(curve.approximate(10))
+    assert len(vertices) == 11
+    assert vertices[0] == DEFPOINTS2D[0]
+    assert vertices[-1] == DEFPOINTS2D[-1]
+    for index, vertex in enumerate(vertices):
+        assert vertex.isclose(curve.point(index * .1))
+
+
+def test_approximate_2d_curve():
+    curve = Bezier4P([(0, 0), (1, 0), (2, 1), (3, 1)])
+    vertices = list(curve.approximate(4))
+    assert all(type(v) is Vec2 for v in vertices)
+    assert vertices[2].isclose(curve.point(0.5))
+
+
+def test_bernstein3_table():
+    table = bernstein3_table(4)
+    assert len(table) == 5
+    assert table[0] == (1, 0, 0, 0)
+    assert table[2] == bernstein3(0.5)
+    assert table[-1] == (0, 0, 0, 1)
+    assert bernstein3_table(4) is table, 'expected shared table'
+    with pytest.raises(ValueError):
+        bernstein3_table(0)
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def batch_backend(request, monkeypatch):
+    if request.param == 'numpy':
+        if bezier4p.numpy is None:
+            pytest.skip('requires numpy')
+    else:
+        monkeypatch.setattr(bezier4p, 'numpy', None)
+    return request.param
+
+
+def test_cubic_bezier_chain_approximation(batch_backend):
+    curves = list(cubic_bezier_interpolation(DEFPOINTS3D))
+    vertices = cubic_bezier_chain_approximation(curves, 8)
+    assert isinstance(vertices, Vec3Array)
+    assert len(vertices) == 1 + len(curves) * 8
+    expected = [curves[0].control_points[0]]
+    for curve in curves:
+        expected.extend(list(curve.approximate(8))[1:])
+    for v1, v2 in zip(vertices, expected):
+        assert v1.isclose(v2)
+    # exact end points of all curves
+    for index, curve in enumerate(curves, 1):
+        assert vertices[index * 8] == curve.control_points[3]
+
+
+def test_cubic_bezier_chain_approximation_of_2d_curves(batch_backend):
+    vertices = cubic_bezier_chain_approximation([Bezier4P(DEFPOINTS2D)], 10)
+    assert vertices[5].isclose(Vector(POINTS2D[5]))
+
+
+def test_cubic_bezier_chain_approximation_without_curves(batch_backend):
+    assert len(cubic_bezier_chain_approximation([], 10)) == 0
+
+
 POINTS2D = [
     (0.000, 0.000),
     (0.928, 0.280),
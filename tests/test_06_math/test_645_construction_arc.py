@@ -160,3 +160,18 @@ def test_angle_span():
     # crossing 0-degree:
     assert ConstructionArc(start_angle=300, end_angle=60).angle_span == 120
     assert ConstructionArc(start_angle=300, end_angle=60, is_counter_clockwise=False).angle_span == 240
+
+
+def test_flattening():
+    arc = ConstructionArc(center=(1, 1), radius=2, start_angle=300, end_angle=60)
+    vertices = list(arc.flattening(0.01))
+    assert vertices[0].isclose(arc.start_point)
+    assert vertices[-1].isclose(arc.end_point)
+    # max. distance of chord center to arc is <= sagitta
+    for v1, v2 in zip(vertices, vertices[1:]):
+        assert 2 - arc.center.distance(v1.lerp(v2)) <= 0.01
+    assert len(list(arc.flattening(0.001))) > len(vertices)
+    # full circle
+    assert len(list(ConstructionArc(radius=1).flattening(1))) == 3
+    # sagitta bigger than radius
+    assert len(list(ConstructionArc(radius=1, end_angle=90).flattening(10))) == 2
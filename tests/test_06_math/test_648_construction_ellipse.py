@@ -234,3 +234,22 @@ def test_params_from_vertices_random():
 def test_to_ocs():
     e = ConstructionEllipse().to_ocs()
     assert e.center == (0, 0)
+
+
+@pytest.mark.parametrize('radius', [0.1, 1, 100])
+def test_flattening_circle(radius):
+    distance = 0.01
+    e = ConstructionEllipse(major_axis=(radius, 0), ratio=1)
+    vertices = list(e.flattening(distance))
+    assert vertices[0].isclose(vertices[-1])
+    for v1, v2 in zip(vertices, vertices[1:]):
+        # for circles the distance to the chord center is the sagitta
+        sagitta = radius - v1.lerp(v2).magnitude
+        assert sagitta <= distance
+
+
+def test_flattening_elliptic_arc():
+    e = ConstructionEllipse(major_axis=(3, 0), ratio=0.5, start_param=0.5, end_param=2.5)
+    vertices = list(e.flattening(0.01))
+    assert vertices[0].isclose(e.start_point)
+    assert vertices[-1].isclose(e.end_point)
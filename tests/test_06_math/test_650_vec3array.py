@@ -0,0 +1,131 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+from array import array
+from ezdxf.math import Vec3Array, Vector, Matrix44
+from ezdxf.math import vec3array
+from ezdxf.lldxf.packedtags import VertexArray
+from ezdxf.lldxf.const import DXFTypeError
+
+POINTS = [(1, 2, 3), (4, 5, 6), (-7, 8, -9), (0, 0, 0)]
+
+
+@pytest.fixture
+def m44():
+    return Matrix44.chain(
+        Matrix44.xyz_rotate(0.5, 1.0, 1.5),
+        Matrix44.scale(2, 3, 4),
+        Matrix44.translate(10, 20, 30),
+    )
+
+
+def test_init():
+    vertices = Vec3Array(POINTS)
+    assert len(vertices) == 4
+    assert vertices[1] == (4, 5, 6)
+    assert vertices[-1] == (0, 0, 0)
+    assert list(vertices) == POINTS
+    with pytest.raises(IndexError):
+        _ = vertices[4]
+
+
+def test_from_array_shares_data():
+    values = array('d', [1, 2, 3, 4, 5, 6])
+    vertices = Vec3Array.from_array(values)
+    assert vertices.values is values
+    with pytest.raises(ValueError):
+        Vec3Array.from_array(array('d', [1, 2]))
+
+
+def test_append_extend_copy():
+    vertices = Vec3Array()
+    vertices.append((1, 2))
+    vertices.extend([(3, 4, 5)])
+    assert list(vertices) == [(1, 2, 0), (3, 4, 5)]
+    vertices2 = vertices.copy()
+    assert vertices2 == vertices
+    assert vertices2.values is not vertices.values
+
+
+@pytest.mark.parametrize('func', [vec3array._transform_array_python, vec3array._transform_array_numpy])
+def test_transform_array_implementations(func, m44):
+    if func is vec3array._transform_array_numpy and not vec3array.HAS_NUMPY:
+        pytest.skip('requires numpy')
+    values = Vec3Array(POINTS).values
+    for translate, expected in ((True, m44.transform_vertices(POINTS)), (False, m44.transform_directions(POINTS))):
+        result = Vec3Array.from_array(func(m44.matrix, values, translate))
+        for v1, v2 in zip(result, expected):
+            assert v1.isclose(v2)
+
+
+def test_transform_array(m44):
+    result = m44.transform_array(POINTS)
+    assert isinstance(result, Vec3Array)
+    for v1, v2 in zip(result, m44.transform_vertices(POINTS)):
+        assert v1.isclose(v2)
+
+
+def test_transform_empty_array(m44):
+    assert len(m44.transform_array([])) == 0
+    assert len(m44.transform_directions_array(Vec3Array())) == 0
+
+
+def test_transform_directions_array(m44):
+    vectors = Vec3Array(POINTS[:3])
+    result = m44.transform_directions_array(vectors, normalize=True)
+    for v1, v2 in zip(result, m44.transform_directions(vectors, normalize=True)):
+        assert v1.isclose(v2)
+
+
+@pytest.mark.parametrize('func', [vec3array._normalize_array_python, vec3array._normalize_array_numpy])
+def test_normalize_array_implementations(func):
+    if func is vec3array._normalize_array_numpy and not vec3array.HAS_NUMPY:
+        pytest.skip('requires numpy')
+    result = Vec3Array.from_array(func(Vec3Array(POINTS[:3]).values))
+    for v1, v2 in zip(result, POINTS[:3]):
+        assert v1.isclose(Vector(v2).normalize())
+    assert len(func(array('d'))) == 0
+    with pytest.raises(ZeroDivisionError):
+        func(Vec3Array(POINTS).values)
+
+
+def test_inplace_transform(m44):
+    vertices = Vec3Array(POINTS)
+    vertices.transform(m44)
+    for v1, v2 in zip(vertices, m44.transform_vertices(POINTS)):
+        assert v1.isclose(v2)
+
+
+@pytest.mark.skipif(not vec3array.HAS_NUMPY, reason='requires numpy')
+def test_numpy_conversion():
+    vertices = Vec3Array(POINTS)
+    ndarray = vertices.to_numpy()
+    assert ndarray.shape == (4, 3)
+    ndarray[0, 0] = 99  # shares data
+    assert vertices[0] == (99, 2, 3)
+    del ndarray
+    assert list(Vec3Array.from_numpy(Vec3Array(POINTS).to_numpy())) == POINTS
+
+
+def test_vertex_array_conversion():
+    vertex_array = VertexArray(data=[1, 2, 3, 4, 5, 6])
+    vertices = vertex_array.vec3array()
+    assert vertices.values is vertex_array.values
+    vertex_array.set_vec3array(Vec3Array(POINTS))
+    assert list(vertex_array) == POINTS
+
+
+def test_vertex_array_conversion_requires_3d_vertices():
+    class Vertex2dArray(VertexArray):
+        VERTEX_SIZE = 2
+
+    with pytest.raises(DXFTypeError):
+        Vertex2dArray().vec3array()
+
+
+def test_vertex_array_transform(m44):
+    vertex_array = VertexArray()
+    vertex_array.extend(POINTS)
+    vertex_array.transform(m44)
+    for v1, v2 in zip(vertex_array, m44.transform_vertices(POINTS)):
+        assert Vector(v1).isclose(v2)
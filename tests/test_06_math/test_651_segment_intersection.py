@@ -0,0 +1,117 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import random
+import math
+from ezdxf.math import intersect_segments_2d, intersect_polylines_2d, intersection_line_line_2d, Vec2
+from ezdxf.math import ConstructionArc
+
+
+def brute_force(segments):
+    segments = [(Vec2(s), Vec2(e)) for s, e in segments]
+    result = []
+    for i in range(len(segments)):
+        for j in range(i + 1, len(segments)):
+            point = intersection_line_line_2d(segments[i], segments[j], virtual=False)
+            if point is not None:
+                result.append((i, j, point))
+    return result
+
+
+def test_no_segments():
+    assert intersect_segments_2d([]) == []
+    assert intersect_segments_2d([((0, 0), (1, 1))]) == []
+
+
+def test_crossing_segments():
+    result = intersect_segments_2d([((0, 0), (2, 2)), ((0, 2), (2, 0)), ((3, 0), (3, 2))])
+    assert len(result) == 1
+    i, j, point = result[0]
+    assert (i, j) == (0, 1)
+    assert point.isclose(Vec2(1, 1))
+
+
+def test_touching_segments():
+    result = intersect_segments_2d([((0, 0), (1, 0)), ((1, 0), (1, 1))])
+    assert len(result) == 1
+    assert result[0][2].isclose(Vec2(1, 0))
+
+
+def test_parallel_segments_do_not_intersect():
+    assert intersect_segments_2d([((0, 0), (2, 0)), ((1, 0), (3, 0)), ((0, 1), (2, 1))]) == []
+
+
+@pytest.mark.parametrize('cell_size', [None, 0.1, 1.0, 100.])
+def test_random_segments_against_brute_force(cell_size):
+    random.seed(17)
+    segments = []
+    for _ in range(200):
+        start = Vec2(random.uniform(0, 50), random.uniform(0, 50))
+        end = start + Vec2.from_deg_angle(random.uniform(0, 360), random.uniform(0.5, 10))
+        segments.append((start, end))
+    expected = brute_force(segments)
+    result = intersect_segments_2d(segments, cell_size=cell_size)
+    assert len(expected) > 10
+    assert [(i, j) for i, j, _ in result] == [(i, j) for i, j, _ in expected]
+    for (_, _, p1), (_, _, p2) in zip(result, expected):
+        assert p1.isclose(p2)
+
+
+def test_long_diagonals_against_brute_force():
+    random.seed(19)
+    segments = []
+    for _ in range(200):
+        start = Vec2(random.uniform(0, 50), random.uniform(0, 50))
+        end = start + Vec2.from_deg_angle(random.uniform(0, 360), random.uniform(0.5, 2))
+        segments.append((start, end))
+    # long segments cross many grid cells
+    segments.extend([
+        (Vec2(0, 0), Vec2(50, 50)),
+        (Vec2(0, 50), Vec2(50, 0)),
+        (Vec2(10, 0), Vec2(20, 50)),
+        (Vec2(0, 10), Vec2(50, 20)),
+    ])
+    expected = brute_force(segments)
+    result = intersect_segments_2d(segments)
+    assert [(i, j) for i, j, _ in result] == [(i, j) for i, j, _ in expected]
+
+
+def test_horizontal_segment_with_tolerance_bigger_than_cell_size():
+    # the tolerance expands the horizontal segment across more than two rows
+    result = intersect_segments_2d([((0, 0), (10, 0)), ((5, -1), (5, 1))], abs_tol=1e-3, cell_size=0.001)
+    assert len(result) == 1
+    i, j, point = result[0]
+    assert (i, j) == (0, 1)
+    assert point.isclose(Vec2(5, 0))
+
+
+def test_invalid_cell_size():
+    with pytest.raises(ValueError):
+        intersect_segments_2d([((0, 0), (1, 1)), ((0, 1), (1, 0))], cell_size=0)
+
+
+def test_polyline_intersections():
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    line = [(-1, 1), (3, 1)]
+    result = intersect_polylines_2d([square, line], closed=False)
+    assert [(loc1, loc2) for loc1, loc2, _ in result] == [((0, 1), (1, 0))]
+    result = intersect_polylines_2d([square, line], closed=True)
+    assert [(loc1, loc2) for loc1, loc2, _ in result] == [((0, 1), (1, 0)), ((0, 3), (1, 0))]
+    assert result[1][2].isclose(Vec2(0, 1))
+
+
+def test_polyline_self_intersection():
+    bow_tie = [(0, 0), (2, 2), (2, 0), (0, 2)]
+    result = intersect_polylines_2d([bow_tie], closed=True)
+    assert len(result) == 1
+    loc1, loc2, point = result[0]
+    assert (loc1, loc2) == ((0, 0), (0, 2))
+    assert point.isclose(Vec2(1, 1))
+
+
+def test_flattened_arcs():
+    arc1 = ConstructionArc(center=(0, 0), radius=1, start_angle=0, end_angle=180)
+    arc2 = ConstructionArc(center=(1.1, 0), radius=1, start_angle=0, end_angle=180)
+    result = intersect_polylines_2d([arc1.flattening(0.001), arc2.flattening(0.001)])
+    assert len(result) == 1
+    assert result[0][2].isclose(Vec2(0.55, math.sqrt(1 - 0.55 ** 2)), abs_tol=1e-3)
@@ -0,0 +1,144 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import random
+import math
+from ezdxf.math import intersect_curves_2d, intersect_curve_with_curves_2d, intersect_polylines_2d
+from ezdxf.math import (
+    ConstructionLine, ConstructionArc, ConstructionEllipse, Bezier4P, BSpline, Vec2, global_bspline_interpolation,
+)
+
+SQRT_075 = math.sqrt(0.75)
+
+
+def test_line_line():
+    line1 = ConstructionLine((0, 0), (2, 2))
+    line2 = ConstructionLine((0, 2), (2, 0))
+    result = intersect_curves_2d(line1, line2)
+    assert len(result) == 1
+    assert result[0].isclose(Vec2(1, 1))
+
+
+def test_line_circle_sorted_along_first_curve():
+    line = ConstructionLine((2, 0.5), (-2, 0.5))
+    circle = ConstructionArc((0, 0), 1)
+    result = intersect_curves_2d(line, circle)
+    assert len(result) == 2
+    assert result[0].isclose(Vec2(SQRT_075, 0.5))
+    assert result[1].isclose(Vec2(-SQRT_075, 0.5))
+
+
+def test_circle_circle():
+    result = intersect_curves_2d(ConstructionArc((0, 0), 1), ConstructionArc((1, 0), 1))
+    assert len(result) == 2
+    assert result[0].isclose(Vec2(0.5, SQRT_075))
+    assert result[1].isclose(Vec2(0.5, -SQRT_075))
+
+
+def test_arc_range():
+    arc = ConstructionArc((0, 0), 1, start_angle=90, end_angle=270)
+    result = intersect_curves_2d(arc, ConstructionArc((1, 0), 1))
+    assert len(result) == 0
+    arc = ConstructionArc((0, 0), 1, start_angle=270, end_angle=90)
+    result = intersect_curves_2d(arc, ConstructionArc((1, 0), 1))
+    assert len(result) == 2
+
+
+def test_tangent_circles():
+    result = intersect_curves_2d(ConstructionArc((0, 0), 1), ConstructionArc((2, 0), 1))
+    assert len(result) == 1
+    assert result[0].isclose(Vec2(1, 0))
+
+
+@pytest.mark.parametrize('extrusion', [(0, 0, 1), (0, 0, -1)])
+def test_ellipse_circle(extrusion):
+    ellipse = ConstructionEllipse(center=(0, 0), major_axis=(2, 0), ratio=0.25, extrusion=extrusion)
+    result = intersect_curves_2d(ellipse, ConstructionArc((0, 0), 1))
+    # x²/4 + y²/0.25 = 1 and x² + y² = 1
+    x = math.sqrt(0.75 / (1 - 0.25 / 4))
+    y = math.sqrt(1 - x * x)
+    expected = [Vec2(x, y), Vec2(-x, y), Vec2(-x, -y), Vec2(x, -y)]
+    assert len(result) == 4
+    for point in expected:
+        assert any(point.isclose(p) for p in result)
+
+
+def test_bezier_line():
+    curve = Bezier4P([(-2, -2), (-1, 4), (1, -4), (2, 2)])
+    result = intersect_curves_2d(curve, ConstructionLine((-3, 0), (3, 0)))
+    assert len(result) == 3
+    assert result[1].isclose(Vec2(0, 0))
+    # curve is point symmetric to the origin
+    assert result[0].isclose(-result[2])
+    for point in result:
+        assert curve.point(curve_param(curve, point.x)).isclose(point, abs_tol=1e-9)
+
+
+def curve_param(curve, x):
+    # bisection of x(t), the x-coordinate of the test curve is monotonic
+    t0, t1 = 0., 1.
+    for _ in range(60):
+        t = (t0 + t1) * .5
+        if curve.point(t).x < x:
+            t0 = t
+        else:
+            t1 = t
+    return t0
+
+
+def test_spline_against_flattening():
+    random.seed(3)
+    spline = global_bspline_interpolation([(i, random.uniform(-5, 5)) for i in range(20)])
+    arcs = [
+        ConstructionArc((random.uniform(0, 20), random.uniform(-5, 5)), random.uniform(0.5, 3),
+                        random.uniform(0, 360), random.uniform(0, 360))
+        for _ in range(30)
+    ]
+    result = intersect_curve_with_curves_2d(spline, arcs)
+    vertices = list(spline.flattening(1e-3))
+    expected = []
+    for index, arc in enumerate(arcs):
+        for loc1, loc2, point in intersect_polylines_2d([vertices, arc.flattening(1e-4)]):
+            if loc1[0] != loc2[0]:
+                expected.append((index, point))
+    assert len(expected) > 10
+    assert len(result) == len(expected)
+    assert [i for i, _ in result] == sorted(i for i, _ in expected)
+    for index, point in result:
+        assert any(i == index and point.isclose(p, abs_tol=1e-2) for i, p in expected)
+
+
+@pytest.mark.parametrize('curve1, curve2', [
+    (ConstructionArc((0, 0), 1, 0, 180), ConstructionArc((0, 0), 1, 0, 180)),
+    (ConstructionArc((0, 0), 1, 0, 180), ConstructionArc((0, 0), 1, 90, 270)),
+    (ConstructionArc((0, 0), 1, 0, 180), ConstructionEllipse(major_axis=(0, 1), start_param=0, end_param=math.pi)),
+])
+def test_coincident_arcs_do_not_intersect(curve1, curve2):
+    assert intersect_curves_2d(curve1, curve2) == []
+
+
+def test_identical_splines_do_not_intersect():
+    spline = BSpline([(0, 0), (1, 2), (3, -1), (5, 3), (7, 0), (9, 1)])
+    assert intersect_curves_2d(spline, spline) == []
+
+
+def test_overlapping_bezier_curves_do_not_intersect():
+    curve = Bezier4P([(0, 0), (1, 2), (3, 2), (4, 0)])
+    # first half of curve by de Casteljau's algorithm
+    half = Bezier4P([(0, 0), (0.5, 1), (1.25, 1.5), (2, 1.5)])
+    assert intersect_curves_2d(curve, half) == []
+
+
+def test_batch_rejects_distant_curves():
+    circle = ConstructionArc((0, 0), 1)
+    curves = [ConstructionLine((5, 5), (6, 6)), ConstructionLine((-2, 0), (2, 0)), ConstructionArc((10, 0), 1)]
+    result = intersect_curve_with_curves_2d(circle, curves)
+    assert [index for index, _ in result] == [1, 1]
+
+
+def test_unsupported_curves():
+    with pytest.raises(TypeError):
+        intersect_curves_2d(ConstructionArc(), [(0, 0), (1, 1)])
+    rational = BSpline([(0, 0), (1, 1), (2, 0), (3, 1)], weights=[1, 2, 2, 1])
+    with pytest.raises(TypeError):
+        intersect_curves_2d(ConstructionArc(), rational)
@@ -0,0 +1,136 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import random
+from ezdxf.math import (
+    Vec2, clip_polygon_2d, clip_polygons_2d, clip_segments_to_rect_2d, clip_polylines_to_rect_2d,
+    greiner_hormann_intersection, greiner_hormann_union, greiner_hormann_difference, clip_polygons_general_2d,
+)
+from ezdxf.math import clipping
+
+SQUARE = [(0, 0), (2, 0), (2, 2), (0, 2)]
+SHIFTED_SQUARE = [(1, 1), (3, 1), (3, 3), (1, 3)]
+U_SHAPE = [(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)]
+BAR = [(-1, 2), (4, 2), (4, 2.5), (-1, 2.5)]
+
+
+def area(polygon):
+    return abs(sum(p1.x * p2.y - p2.x * p1.y for p1, p2 in zip(polygon, polygon[1:] + polygon[:1]))) / 2
+
+
+def same_polygon(polygon, expected):
+    return set(polygon) == set(Vec2.list(expected))
+
+
+@pytest.mark.parametrize('clipper', [SQUARE, list(reversed(SQUARE))])
+def test_clip_polygon_2d(clipper):
+    result = clip_polygon_2d(clipper, SHIFTED_SQUARE)
+    assert same_polygon(result, [(1, 1), (2, 1), (2, 2), (1, 2)])
+
+
+def test_clip_polygon_2d_special_cases():
+    assert clip_polygon_2d(SQUARE, [(3, 3), (4, 3), (4, 4)]) == []
+    triangle = [(0, 0), (2, 0), (2, 2)]
+    assert clip_polygon_2d(SQUARE, triangle) == Vec2.list(triangle)
+    assert same_polygon(clip_polygon_2d(SHIFTED_SQUARE, SQUARE), [(1, 1), (2, 1), (2, 2), (1, 2)])
+    with pytest.raises(ValueError):
+        clip_polygon_2d([(0, 0), (1, 1)], SQUARE)
+
+
+def test_clip_polygons_2d():
+    result = clip_polygons_2d(SQUARE, [SHIFTED_SQUARE, [(5, 5), (6, 5), (6, 6)], SQUARE])
+    assert len(result) == 3
+    assert area(result[0]) == pytest.approx(1)
+    assert result[1] == []
+    assert area(result[2]) == pytest.approx(4)
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        if clipping.numpy is None:
+            pytest.skip('requires numpy')
+        monkeypatch.setattr(clipping, 'USE_NUMPY_LIMIT', 0)
+    else:
+        monkeypatch.setattr(clipping, 'numpy', None)
+    return request.param
+
+
+def test_clip_segments_to_rect_2d(backend):
+    segments = [((-1, 1), (3, 1)), ((3, 3), (4, 4)), ((0.5, 0.5), (1, 1)), ((0, 3), (3, 0)), ((1, -1), (1, -2))]
+    result = clip_segments_to_rect_2d(segments, (2, 2), (0, 0))
+    assert [index for index, _, _ in result] == [0, 2, 3]
+    expected = [((0, 1), (2, 1)), ((0.5, 0.5), (1, 1)), ((1, 2), (2, 1))]
+    for (_, start, end), (s, e) in zip(result, expected):
+        assert start.isclose(Vec2(s))
+        assert end.isclose(Vec2(e))
+
+
+def test_random_segments_against_polygon_clipping(backend):
+    random.seed(7)
+    segments = []
+    for _ in range(200):
+        start = Vec2(random.uniform(0, 10), random.uniform(0, 10))
+        segments.append((start, start + Vec2.from_deg_angle(random.uniform(0, 360), random.uniform(0, 5))))
+    result = clip_segments_to_rect_2d(segments, (2, 3), (8, 7))
+    assert len(result) > 50
+    for index, start, end in result:
+        s, e = segments[index]
+        assert 2 - 1e-9 <= start.x <= 8 + 1e-9 and 3 - 1e-9 <= start.y <= 7 + 1e-9
+        assert 2 - 1e-9 <= end.x <= 8 + 1e-9 and 3 - 1e-9 <= end.y <= 7 + 1e-9
+        # clipped segment is located on the source segment
+        assert abs((e - s).det(start - s)) < 1e-9
+        assert abs((e - s).det(end - s)) < 1e-9
+
+
+def test_clip_polylines_to_rect_2d(backend):
+    polylines = [
+        [(-1, 1), (1, 1), (1, 3), (1.5, 1), (1.5, 0.5)],
+        [(5, 5), (6, 6)],
+        [(0.5, 0.5), (1.5, 0.5), (1.5, 1.5)],
+    ]
+    result = clip_polylines_to_rect_2d(polylines, (0, 0), (2, 2))
+    assert [index for index, _ in result] == [0, 0, 2]
+    assert result[0][1] == Vec2.list([(0, 1), (1, 1), (1, 2)])
+    assert result[1][1] == Vec2.list([(1.25, 2), (1.5, 1), (1.5, 0.5)])
+    assert result[2][1] == Vec2.list(polylines[2])
+
+
+def test_greiner_hormann_convex_polygons():
+    result = greiner_hormann_intersection(SQUARE, SHIFTED_SQUARE)
+    assert len(result) == 1
+    assert same_polygon(result[0], [(1, 1), (2, 1), (2, 2), (1, 2)])
+    result = greiner_hormann_union(SQUARE, SHIFTED_SQUARE)
+    assert len(result) == 1
+    assert area(result[0]) == pytest.approx(7)
+    result = greiner_hormann_difference(SQUARE, SHIFTED_SQUARE)
+    assert len(result) == 1
+    assert area(result[0]) == pytest.approx(3)
+    assert Vec2(0, 0) in result[0]
+
+
+def test_greiner_hormann_concave_polygons():
+    result = greiner_hormann_intersection(U_SHAPE, BAR)
+    assert len(result) == 2
+    assert sorted(area(p) for p in result) == pytest.approx([0.5, 0.5])
+    result = greiner_hormann_difference(U_SHAPE, BAR)
+    assert len(result) == 3
+    assert sum(area(p) for p in result) == pytest.approx(7 - 1)
+
+
+def test_greiner_hormann_without_intersections():
+    inner = [(0.5, 0.5), (1.5, 0.5), (1.5, 1.5), (0.5, 1.5)]
+    outside = [(5, 5), (6, 5), (6, 6)]
+    assert greiner_hormann_intersection(SQUARE, inner) == [Vec2.list(inner)]
+    assert greiner_hormann_intersection(SQUARE, outside) == []
+    assert greiner_hormann_union(inner, SQUARE) == [Vec2.list(SQUARE)]
+    assert greiner_hormann_union(SQUARE, outside) == [Vec2.list(SQUARE), Vec2.list(outside)]
+    assert greiner_hormann_difference(inner, SQUARE) == []
+    assert greiner_hormann_difference(SQUARE, inner) == [Vec2.list(SQUARE), Vec2.list(inner)]
+
+
+def test_clip_polygons_general_2d():
+    result = clip_polygons_general_2d(BAR, [U_SHAPE, [(10, 10), (11, 10), (11, 11)]])
+    assert len(result) == 2
+    assert len(result[0]) == 2
+    assert result[1] == []
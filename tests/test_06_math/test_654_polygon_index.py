@@ -0,0 +1,93 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import random
+from ezdxf.math import Vec2, points_in_polygon_2d, is_point_in_polygon_2d, PolygonIndex
+from ezdxf.math import polygon as polygon_module
+
+SQUARE = [(0, 0), (2, 0), (2, 2), (0, 2)]
+STAR = [Vec2.from_deg_angle(angle, 3 if angle % 72 == 0 else 1) for angle in range(0, 360, 36)]
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        if polygon_module.numpy is None:
+            pytest.skip('requires numpy')
+        monkeypatch.setattr(polygon_module, 'USE_NUMPY_LIMIT', 0)
+    else:
+        monkeypatch.setattr(polygon_module, 'numpy', None)
+    return request.param
+
+
+def random_points(count, size):
+    return [Vec2(random.uniform(-size, size), random.uniform(-size, size)) for _ in range(count)]
+
+
+def test_points_in_polygon_2d(backend):
+    points = [(1, 1), (3, 1), (2, 1), (0, 0), (1, 2), (-1, -1)]
+    assert points_in_polygon_2d(points, SQUARE) == [1, -1, 0, 0, 0, -1]
+
+
+def test_points_in_star_against_single_point_test(backend):
+    random.seed(11)
+    points = random_points(500, 3.5)
+    expected = [is_point_in_polygon_2d(p, STAR) for p in points]
+    assert points_in_polygon_2d(points, STAR) == expected
+    assert 1 in expected and -1 in expected
+
+
+def test_points_in_polygon_2d_errors():
+    assert points_in_polygon_2d([], SQUARE) == []
+    with pytest.raises(ValueError):
+        points_in_polygon_2d([(0, 0)], [(0, 0), (1, 1), (0, 0)])
+
+
+@pytest.fixture
+def parcels():
+    # 10x10 grid of unit squares
+    return [[(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)] for x in range(10) for y in range(10)]
+
+
+def test_empty_index():
+    index = PolygonIndex([])
+    assert len(index) == 0
+    assert index.candidates((0, 0)) == []
+    assert index.locate([(0, 0)]) == [-1]
+
+
+def test_polygons_at(parcels):
+    index = PolygonIndex(parcels, node_size=4)
+    assert len(index) == 100
+    assert index.polygons_at((0.5, 0.5)) == [0]
+    assert index.polygons_at((3.5, 7.5)) == [37]
+    assert index.polygons_at((1, 1)) == [0, 1, 10, 11]  # common corner
+    assert index.polygons_at((11, 11)) == []
+
+
+def test_nested_polygons():
+    index = PolygonIndex([[(0, 0), (10, 0), (10, 10), (0, 10)], SQUARE])
+    assert index.polygons_at((1, 1)) == [0, 1]
+    assert index.locate([(1, 1), (5, 5), (20, 20)]) == [0, 0, -1]
+
+
+@pytest.mark.parametrize('node_size', [2, 3, 16])
+def test_locate_against_brute_force(backend, parcels, node_size):
+    random.seed(node_size)
+    polygons = parcels + [[p * 2 + Vec2(5, 5) for p in STAR]]
+    index = PolygonIndex(polygons, node_size=node_size)
+    points = random_points(300, 12)
+    expected = []
+    for point in points:
+        location = -1
+        for polygon_index, polygon in enumerate(polygons):
+            if is_point_in_polygon_2d(point, Vec2.list(polygon)) >= 0:
+                location = polygon_index
+                break
+        expected.append(location)
+    assert index.locate(points) == expected
+
+
+def test_invalid_node_size():
+    with pytest.raises(ValueError):
+        PolygonIndex([SQUARE], node_size=1)
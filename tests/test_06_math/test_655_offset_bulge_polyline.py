@@ -0,0 +1,162 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from ezdxf.math import offset_bulge_polyline_2d, offset_bulge_polylines_2d
+from ezdxf.math import offset2d
+
+SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10)]
+CORNER_BULGE = math.tan(math.pi / 8)  # quarter circle
+
+
+def min_distance(points, polyline, closed):
+    segments = offset2d._bulge_segments(polyline, closed, 1e-9)
+    return min(offset2d._distance_point_segment(x, y, s) for x, y in points for s in segments)
+
+
+def sample_points(vertices, closed, count=8):
+    segments = offset2d._bulge_segments(vertices, closed, 1e-9)
+    return [offset2d._segment_point(s, t / count) for s in segments for t in range(count + 1)]
+
+
+def assert_vertices(result, expected):
+    assert len(result) == len(expected)
+    for (x1, y1, b1), (x2, y2, b2) in zip(result, expected):
+        assert math.isclose(x1, x2, abs_tol=1e-9)
+        assert math.isclose(y1, y2, abs_tol=1e-9)
+        assert math.isclose(b1, b2, abs_tol=1e-9)
+
+
+def test_empty_polyline():
+    assert offset_bulge_polyline_2d([], 1) == []
+    assert offset_bulge_polyline_2d([(1, 1)], 1) == []
+    assert offset_bulge_polyline_2d([(1, 1), (1, 1)], 1) == []
+
+
+def test_inside_of_closed_square():
+    result = offset_bulge_polyline_2d(SQUARE, 1, closed=True)
+    assert len(result) == 1
+    assert_vertices(result[0], [(1, 1, 0), (9, 1, 0), (9, 9, 0), (1, 9, 0)])
+
+
+def test_outside_of_closed_square_has_round_corners():
+    result = offset_bulge_polyline_2d(SQUARE, -1, closed=True)
+    assert len(result) == 1
+    assert_vertices(result[0], [
+        (0, -1, 0), (10, -1, CORNER_BULGE), (11, 0, 0), (11, 10, CORNER_BULGE),
+        (10, 11, 0), (0, 11, CORNER_BULGE), (-1, 10, 0), (-1, 0, CORNER_BULGE),
+    ])
+
+
+def test_closing_vertex_is_ignored():
+    assert offset_bulge_polyline_2d(SQUARE + [(0, 0)], 1, closed=True) == \
+           offset_bulge_polyline_2d(SQUARE, 1, closed=True)
+
+
+def test_collapsed_closed_square():
+    assert offset_bulge_polyline_2d(SQUARE, 6, closed=True) == []
+
+
+def test_open_polyline():
+    result = offset_bulge_polyline_2d([(0, 0), (10, 0), (10, 10)], 1)
+    assert len(result) == 1
+    assert_vertices(result[0], [(0, 1, 0), (9, 1, 0), (9, 10, 0)])
+
+    result = offset_bulge_polyline_2d([(0, 0), (10, 0), (10, 10)], -1)
+    assert_vertices(result[0], [(0, -1, 0), (10, -1, CORNER_BULGE), (11, 0, 0), (11, 10, 0)])
+
+
+def test_u_turn():
+    result = offset_bulge_polyline_2d([(0, 0), (10, 0), (5, 0)], -1)
+    assert len(result) == 1
+    assert_vertices(result[0], [(0, -1, 0), (10, -1, 1), (10, 1, 0), (5, 1, 0)])
+
+
+def test_circle_keeps_arcs():
+    circle = [(0, 0, 1), (10, 0, 1)]  # counter clockwise, center (5, 0), radius 5
+    result = offset_bulge_polyline_2d(circle, -1, closed=True)
+    assert_vertices(result[0], [(-1, 0, 1), (11, 0, 1)])
+    result = offset_bulge_polyline_2d(circle, 2, closed=True)
+    assert_vertices(result[0], [(2, 0, 1), (8, 0, 1)])
+    assert offset_bulge_polyline_2d(circle, 6, closed=True) == []
+
+
+def test_clockwise_arc():
+    result = offset_bulge_polyline_2d([(0, 0, -1), (10, 0)], 1)
+    assert_vertices(result[0], [(-1, 0, -1), (11, 0, 0)])
+
+
+def test_inside_of_l_shape():
+    l_shape = [(0, 0), (10, 0), (10, 4), (4, 4), (4, 10), (0, 10)]
+    result = offset_bulge_polyline_2d(l_shape, 1, closed=True)
+    assert len(result) == 1
+    assert_vertices(result[0], [
+        (1, 1, 0), (9, 1, 0), (9, 3, 0), (4, 3, -CORNER_BULGE), (3, 4, 0), (3, 9, 0), (1, 9, 0),
+    ])
+
+
+def test_offset_splits_into_multiple_loops():
+    # two squares connected by a narrow channel
+    dumbbell = [(0, 0), (10, 0), (10, 4), (12, 4), (12, 0), (22, 0), (22, 10), (12, 10), (12, 6), (10, 6),
+                (10, 10), (0, 10)]
+    result = offset_bulge_polyline_2d(dumbbell, 2, closed=True)
+    assert len(result) == 2
+    for vertices in result:
+        points = sample_points(vertices, closed=True)
+        assert math.isclose(min_distance(points, dumbbell, True), 2, abs_tol=1e-6)
+
+
+def test_open_polyline_with_close_end_points():
+    # the end of the offset curve is located near the start point of the source polyline
+    hook = [(0, 0), (10, 0), (10, 10), (-3, 10), (-1, 0.5)]
+    result = offset_bulge_polyline_2d(hook, 1)
+    assert len(result) == 1
+    points = sample_points(result[0], closed=False)
+    assert math.isclose(min_distance(points, hook, False), 1, abs_tol=1e-6)
+    # end point trimmed by the circle around the start point (0, 0)
+    assert math.isclose(math.hypot(result[0][-1][0], result[0][-1][1]), 1)
+
+
+@pytest.fixture(params=['box hierarchy', 'brute force'])
+def distance_query(request, monkeypatch):
+    if request.param == 'brute force':
+        monkeypatch.setattr(offset2d, 'MAX_BRUTE_FORCE_SEGMENTS', 10 ** 9)
+    else:
+        monkeypatch.setattr(offset2d, 'MAX_BRUTE_FORCE_SEGMENTS', 0)
+    return request.param
+
+
+@pytest.mark.parametrize('offset', [-1.5, -0.5, 0.5, 1.5])
+def test_wavy_polyline(offset, distance_query):
+    count = 40
+    wave = [(i * 2, 0 if i % 2 else 2, 0.4 * (1 if i % 2 else -1)) for i in range(count)]
+    wave = wave + [((count - 1) * 2, -5, 0), (0, -5, 0)]
+    for closed in (False, True):
+        result = offset_bulge_polyline_2d(wave, offset, closed)
+        assert len(result) > 0
+        for vertices in result:
+            points = sample_points(vertices, closed)
+            assert math.isclose(min_distance(points, wave, closed), abs(offset), abs_tol=1e-6)
+
+
+@pytest.mark.parametrize('offset', [-1, 1])
+def test_dense_circle(offset):
+    # the raw offset curve of a dense polyline has a shallow loop at each concave corner, which is not closer
+    # to the source polyline than the offset distance
+    count = 5000
+    circle = [(100 * math.cos(math.tau * i / count), 100 * math.sin(math.tau * i / count)) for i in range(count)]
+    result = offset_bulge_polyline_2d(circle, offset, closed=True)
+    assert len(result) == 1
+    vertices = result[0]
+    assert len(vertices) == (count if offset > 0 else count * 2)
+    angles = [math.atan2(y, x) % math.tau for x, y, _ in vertices]
+    start = angles.index(min(angles))
+    angles = angles[start:] + angles[:start]
+    assert all(a1 < a2 for a1, a2 in zip(angles, angles[1:])), 'direction reversal'
+
+
+def test_batch_offset():
+    result = offset_bulge_polylines_2d([SQUARE, [(0, 0), (10, 0)]], 1, closed=True)
+    assert len(result) == 2
+    assert result[0] == offset_bulge_polyline_2d(SQUARE, 1, closed=True)
+    assert result[1] == offset_bulge_polyline_2d([(0, 0), (10, 0)], 1, closed=True)
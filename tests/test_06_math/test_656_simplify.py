@@ -0,0 +1,109 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from ezdxf.math import simplify
+from ezdxf.math import (
+    douglas_peucker_indices, simplify_douglas_peucker, visvalingam_indices, simplify_visvalingam, Vector,
+)
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(simplify, 'numpy', None)
+    elif simplify.numpy is None:
+        pytest.skip('numpy not installed')
+    else:
+        monkeypatch.setattr(simplify, 'USE_NUMPY_LIMIT', 0)
+    return request.param
+
+
+def sine_wave(count=200):
+    return [(i, math.sin(i / 10)) for i in range(count)]
+
+
+def max_deviation(vertices, indices):
+    vertices = Vector.list(vertices)
+    result = 0.
+    for start, end in zip(indices, indices[1:]):
+        a = vertices[start]
+        b = vertices[end]
+        for p in vertices[start + 1:end]:
+            result = max(result, simplify._distance_point_segment(p.xyz, a.xyz, b.xyz))
+    return result
+
+
+def test_less_than_3_vertices():
+    assert douglas_peucker_indices([], 1) == []
+    assert douglas_peucker_indices([(0, 0), (1, 0)], 1) == [0, 1]
+    assert visvalingam_indices([(0, 0)], 1) == [0]
+
+
+def test_collinear_vertices(backend):
+    vertices = [(x, 0) for x in range(100)]
+    assert douglas_peucker_indices(vertices, 1e-9) == [0, 99]
+    assert visvalingam_indices(vertices, 1e-9) == [0, 99]
+
+
+def test_douglas_peucker_keeps_corners(backend):
+    vertices = [(0, 0), (1, 0.001), (2, 0), (2, 1), (2, 2)]
+    assert douglas_peucker_indices(vertices, 0.01) == [0, 2, 4]
+    assert douglas_peucker_indices(vertices, 0.0001) == [0, 1, 2, 4]
+    assert simplify_douglas_peucker(vertices, 0.01) == [(0, 0), (2, 0), (2, 2)]
+
+
+@pytest.mark.parametrize('tolerance', [0.001, 0.01, 0.1])
+def test_douglas_peucker_tolerance(tolerance, backend):
+    vertices = sine_wave()
+    indices = douglas_peucker_indices(vertices, tolerance)
+    assert indices[0] == 0
+    assert indices[-1] == len(vertices) - 1
+    assert len(indices) < len(vertices)
+    assert max_deviation(vertices, indices) <= tolerance
+
+
+def test_douglas_peucker_backends_are_equal(monkeypatch):
+    vertices = sine_wave(1000)
+    expected = douglas_peucker_indices(vertices, 0.01)
+    monkeypatch.setattr(simplify, 'numpy', None)
+    assert douglas_peucker_indices(vertices, 0.01) == expected
+
+
+def test_douglas_peucker_3d(backend):
+    vertices = [(0, 0, 0), (1, 0, 0.5), (2, 0, 0)]
+    assert douglas_peucker_indices(vertices, 0.1) == [0, 1, 2]
+
+
+def test_douglas_peucker_closed_polyline(backend):
+    square = [(0, 0), (1, 0), (2, 0), (2, 2), (0, 2), (0, 1), (0, 0)]
+    assert douglas_peucker_indices(square, 0.01) == [0, 2, 3, 4, 6]
+
+
+def test_visvalingam_removes_smallest_areas_first(backend):
+    vertices = [(0, 0), (1, 0.1), (2, 0), (3, 1), (4, 0)]
+    # areas: vertex 1 = 0.1, vertex 3 = 1.0
+    assert visvalingam_indices(vertices, 0.5) == [0, 2, 3, 4]
+    assert visvalingam_indices(vertices, 2.5) == [0, 4]
+    assert simplify_visvalingam(vertices, 0.5) == [(0, 0), (2, 0), (3, 1), (4, 0)]
+
+
+def test_visvalingam_sine_wave(backend):
+    vertices = sine_wave()
+    indices = visvalingam_indices(vertices, 0.01)
+    assert 2 < len(indices) < len(vertices)
+    assert indices == sorted(indices)
+
+
+def test_visvalingam_backends_are_equal(monkeypatch):
+    vertices = sine_wave(1000)
+    expected = visvalingam_indices(vertices, 0.01)
+    monkeypatch.setattr(simplify, 'numpy', None)
+    assert visvalingam_indices(vertices, 0.01) == expected
+
+
+def test_many_vertices_without_recursion_limit(backend):
+    # zigzag with decreasing amplitude forces a deep subdivision
+    vertices = [(i, (0.5 ** (i % 20)) * (-1) ** i) for i in range(5000)]
+    indices = douglas_peucker_indices(vertices, 1e-9)
+    assert max_deviation(vertices, indices) <= 1e-9
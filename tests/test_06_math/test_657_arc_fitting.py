@@ -0,0 +1,93 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from ezdxf.math import arcfit
+from ezdxf.math import fit_arcs_indices_2d, fit_arcs_2d, Vec2
+
+
+def arc_points(center, radius, start_angle, end_angle, count):
+    step = (end_angle - start_angle) / count
+    return [Vec2(center) + Vec2.from_angle(start_angle + step * i, radius) for i in range(count + 1)]
+
+
+def test_less_than_2_vertices():
+    assert fit_arcs_indices_2d([], 0.01) == []
+    assert fit_arcs_indices_2d([(0, 0)], 0.01) == [(0, 0)]
+
+
+def test_straight_lines_are_not_changed():
+    vertices = [(0, 0), (1, 0), (2, 0), (3, 1), (4, 2)]
+    assert fit_arcs_indices_2d(vertices, 0.01) == [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)]
+
+
+def test_half_circle_ccw():
+    vertices = arc_points((0, 0), 5, 0, math.pi, 50)
+    result = fit_arcs_indices_2d(vertices, 0.005)
+    assert len(result) == 2
+    assert result[0][0] == 0
+    assert result[0][1] == pytest.approx(1.0)
+    assert result[1] == (50, 0)
+
+
+def test_quarter_circle_cw():
+    vertices = arc_points((0, 0), 5, math.pi / 2, 0, 30)
+    result = fit_arcs_indices_2d(vertices, 0.01)
+    assert [index for index, _ in result] == [0, 30]
+    assert result[0][1] == pytest.approx(-math.tan(math.pi / 8))
+
+
+def test_arc_and_lines():
+    vertices = arc_points((0, 0), 5, 0, math.pi, 50) + [(-5, -1), (-5, -2), (-4, -3)]
+    x, y, bulge = fit_arcs_2d(vertices, 0.005)[0]
+    assert (x, y) == pytest.approx((5, 0))
+    assert bulge == pytest.approx(1.0)
+    assert [index for index, _ in fit_arcs_indices_2d(vertices, 0.005)] == [0, 50, 51, 52, 53]
+
+
+def test_s_curve():
+    vertices = arc_points((0, 0), 5, math.pi, 0, 40)[:-1] + arc_points((10, 0), 5, math.pi, math.tau, 40)
+    result = fit_arcs_indices_2d(vertices, 0.01)
+    assert [index for index, _ in result] == [0, 40, 80]
+    assert result[0][1] == pytest.approx(-1.0)
+    assert result[1][1] == pytest.approx(1.0)
+
+
+def test_sagitta_of_segments_exceeds_tolerance():
+    # 3.6 degree steps have a sagitta of 0.0025 for radius 5
+    vertices = arc_points((0, 0), 5, 0, math.pi, 50)
+    assert len(fit_arcs_indices_2d(vertices, 0.001)) == 51
+
+
+def test_min_segments():
+    vertices = arc_points((0, 0), 5, 0, math.pi / 2, 3)
+    assert len(fit_arcs_indices_2d(vertices, 0.5, min_segments=3)) == 2
+    assert len(fit_arcs_indices_2d(vertices, 0.5, min_segments=4)) == 4
+
+
+def test_full_circle_is_split():
+    vertices = arc_points((0, 0), 5, 0, math.tau, 100)
+    result = fit_arcs_indices_2d(vertices, 0.01)
+    assert len(result) == 3
+    assert 4 * math.atan(result[0][1]) <= arcfit.MAX_SWEEP_ANGLE
+    assert result[-1][0] == 100
+
+
+def test_noisy_arc_within_tolerance():
+    vertices = [p + Vec2(0, 0.001 * (-1) ** i) for i, p in enumerate(arc_points((0, 0), 10, 0, math.pi / 2, 50))]
+    result = fit_arcs_indices_2d(vertices, 0.01)
+    assert len(result) == 2
+
+
+@pytest.mark.parametrize('tolerance', [1e-2, 1e-3, 1e-4])
+def test_dense_half_circle(tolerance):
+    vertices = arc_points((0, 0), 100, 0, math.pi, 20000)
+    result = fit_arcs_indices_2d(vertices, tolerance)
+    assert len(result) == 2
+    assert result[0][1] == pytest.approx(1.0)
+    assert result[1] == (20000, 0)
+
+
+def test_nearly_straight_polyline_is_not_changed():
+    vertices = [(x, 0.001 * math.sin(x)) for x in range(100)]
+    assert fit_arcs_indices_2d(vertices, 0.01) == [(index, 0) for index in range(100)]
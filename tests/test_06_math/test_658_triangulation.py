@@ -0,0 +1,173 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+import random
+from ezdxf.math import (
+    Vec2, Vector, triangulate_indices_2d, triangulate_polygon_2d, triangulate_polygons_2d, triangulate_polygon_3d,
+    nest_polygons_2d,
+)
+from ezdxf.math import triangulation
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4)]
+HOLE = [(1, 1), (1, 3), (3, 3), (3, 1)]
+L_SHAPE = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+
+
+@pytest.fixture(params=['linear', 'hashing', 'grid'])
+def search(request, monkeypatch):
+    if request.param in ('hashing', 'grid'):
+        monkeypatch.setattr(triangulation, 'USE_HASHING_LIMIT', 0)
+    if request.param == 'grid':
+        monkeypatch.setattr(triangulation, 'USE_GRID_HOLES_LIMIT', 0)
+    return request.param
+
+
+def signed_area(vertices) -> float:
+    area = 0.
+    for index in range(len(vertices)):
+        x0, y0 = vertices[index - 1][:2]
+        x1, y1 = vertices[index][:2]
+        area += (x0 - x1) * (y0 + y1)
+    return area / 2.
+
+
+def check_triangulation(exterior, holes=None):
+    vertices = list(exterior)
+    for hole in holes or []:
+        vertices.extend(hole)
+    triangles = triangulate_indices_2d(exterior, holes)
+    orientation = math.copysign(1., signed_area(exterior))
+    total = 0.
+    for triangle in triangles:
+        area = signed_area([vertices[i] for i in triangle]) * orientation
+        assert area >= 0., 'triangles should have the same orientation as the exterior path'
+        total += area
+    expected = abs(signed_area(exterior)) - sum(abs(signed_area(hole)) for hole in holes or [])
+    assert total == pytest.approx(expected)
+    return triangles
+
+
+def star(count: int, radius1: float = 1., radius2: float = 2.):
+    return [Vec2.from_angle(math.tau * index / count, radius2 if index % 2 else radius1) for index in range(count)]
+
+
+def test_triangle():
+    assert triangulate_indices_2d([(0, 0), (1, 0), (0, 1)]) == [(1, 2, 0)]
+
+
+@pytest.mark.parametrize('path', [[], [(0, 0)], [(0, 0), (1, 0)], [(0, 0), (1, 0), (2, 0)]])
+def test_degenerated_paths(path):
+    assert triangulate_indices_2d(path) == []
+
+
+def test_convex_polygon(search):
+    assert len(check_triangulation(SQUARE)) == 2
+
+
+def test_clockwise_polygon(search):
+    assert len(check_triangulation(list(reversed(SQUARE)))) == 2
+
+
+def test_concave_polygon(search):
+    assert len(check_triangulation(L_SHAPE)) == 4
+
+
+def test_closing_vertex_is_not_referenced():
+    triangles = check_triangulation(L_SHAPE + L_SHAPE[:1])
+    assert len(triangles) == 4
+    assert 6 not in set(i for triangle in triangles for i in triangle)
+
+
+@pytest.mark.parametrize('count', [10, 100, 1000])
+def test_star(search, count):
+    assert len(check_triangulation(star(count))) == count - 2
+
+
+def test_polygon_with_hole(search):
+    assert len(check_triangulation(SQUARE, [HOLE])) == 8
+
+
+def test_hole_orientation_is_ignored():
+    assert len(check_triangulation(SQUARE, [list(reversed(HOLE))])) == 8
+
+
+def test_polygon_with_many_holes(search):
+    circle = [Vec2.from_angle(math.tau * index / 64, 20) for index in range(64)]
+    holes = [
+        [(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)]
+        for x in range(-10, 10, 3) for y in range(-10, 10, 3)
+    ]
+    check_triangulation(circle, holes)
+
+
+def test_polygon_with_random_holes(search):
+    random.seed(23)
+    circle = [Vec2.from_angle(math.tau * index / 64, 20) for index in range(64)]
+    # holes touch each other and the grid lines of the hole search
+    holes = [
+        [Vec2.from_angle(math.tau * index / 5 + angle, radius) + Vec2(x, y) for index in range(5)]
+        for x in range(-12, 12, 2) for y in range(-12, 12, 2)
+        for angle, radius in [(random.uniform(0, math.tau), random.choice([0.5, 0.8, 1.]))]
+    ]
+    check_triangulation(circle, holes)
+
+
+def test_collinear_and_duplicated_vertices(search):
+    path = [(0, 0), (1, 0), (2, 0), (2, 0), (2, 2), (0, 2), (0, 1)]
+    check_triangulation(path)
+
+
+def test_triangulate_polygon_2d():
+    triangles = triangulate_polygon_2d(SQUARE, [HOLE])
+    assert len(triangles) == 8
+    assert all(isinstance(v, Vec2) for triangle in triangles for v in triangle)
+
+
+def test_batch_triangulation():
+    polygons = [[SQUARE, HOLE], [L_SHAPE + L_SHAPE[:1]], []]
+    vertices, triangles = triangulate_polygons_2d(polygons)
+    assert len(vertices) == 14, 'closing vertices should be removed'
+    assert len(triangles) == 12
+    assert min(triangles[8]) >= 8, 'expected indices of the second polygon'
+
+
+def test_triangulate_polygon_3d():
+    # planar face in the yz-plane
+    exterior = [(0, 0, 0), (0, 4, 0), (0, 4, 4), (0, 0, 4)]
+    hole = [(0, 1, 1), (0, 1, 3), (0, 3, 3), (0, 3, 1)]
+    triangles = triangulate_polygon_3d(exterior, [hole])
+    assert len(triangles) == 8
+    for a, b, c in triangles:
+        assert (b - a).cross(c - a).normalize().isclose((1, 0, 0)), 'expected orientation of the exterior path'
+    assert sum((b - a).cross(c - a).magnitude / 2 for a, b, c in triangles) == pytest.approx(12)
+
+
+def test_triangulate_degenerated_polygon_3d():
+    assert triangulate_polygon_3d([(0, 0, 0), (1, 1, 1), (2, 2, 2)]) == []
+
+
+def test_nest_polygons():
+    inner_island = [(1.5, 1.5), (2.5, 1.5), (2.5, 2.5), (1.5, 2.5)]
+    other = [(10, 0), (11, 0), (11, 1), (10, 1)]
+    polygons = nest_polygons_2d([inner_island, HOLE, other, list(reversed(SQUARE))])
+    assert len(polygons) == 3
+    square, island, single = polygons
+    assert len(square) == 2, 'expected exterior path with one hole'
+    assert signed_area(square[0]) == 16, 'exterior path should be counter clockwise oriented'
+    assert signed_area(square[1]) == -4, 'holes should be clockwise oriented'
+    assert island == [Vec2.list(inner_island)]
+    assert single == [Vec2.list(other)]
+
+
+def test_nest_adjacent_polygons():
+    left = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    right = [(1, 0), (3, 0), (3, 1), (1, 1)]
+    assert len(nest_polygons_2d([left, right])) == 2
+
+
+def test_nest_hole_touching_exterior_path():
+    hole = [(0, 2), (2, 1), (2, 3)]
+    polygons = nest_polygons_2d([SQUARE, hole])
+    assert len(polygons) == 1
+    check_triangulation(polygons[0][0], polygons[0][1:])
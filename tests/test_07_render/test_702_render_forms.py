@@ -90,6 +90,20 @@ def test_from_profiles_linear():
     assert len(mesh.faces) == 4
 
 
+def test_from_concave_profiles_linear_triangulated_caps():
+    l_shape = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+    bottom = [Vector(x, y, 0) for x, y in l_shape]
+    top = [Vector(x, y, 1) for x, y in l_shape]
+    mesh = from_profiles_linear([bottom, top], close=True, caps=True, ngons=False)
+    assert len(mesh.vertices) == 12, 'no additional center vertices'
+    assert len(mesh.faces) == 6 + 2 * 4
+    caps = [face for face in mesh.faces_as_vertices() if len(face) == 3]
+    area = sum((b - a).cross(c - a).z / 2 for a, b, c in caps if a.z == 1)
+    assert area == 3, 'top cap triangles should cover the L-shape and point upwards'
+    area = sum((b - a).cross(c - a).z / 2 for a, b, c in caps if a.z == 0)
+    assert area == -3, 'bottom cap triangles should cover the L-shape and point downwards'
+
+
 def test_cylinder():
     mesh = cylinder(12)
     assert len(mesh.faces) == 14  # 1x bottom, 1x top, 12x side
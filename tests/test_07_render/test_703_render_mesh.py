@@ -1,11 +1,13 @@
 # Copyright (c) 2018-2020, Manfred Moitzi
 # License: MIT License
 import pytest
+import random
 from math import radians
 import ezdxf
-from ezdxf.math import Vector, BoundingBox
-from ezdxf.render.forms import cube
-from ezdxf.render.mesh import MeshVertexMerger, MeshBuilder, MeshTransformer, MeshAverageVertexMerger
+from ezdxf.math import Vector, BoundingBox, Matrix44
+from ezdxf.render.forms import cube, cylinder
+from ezdxf.render import mesh as mesh_module
+from ezdxf.render.mesh import MeshVertexMerger, MeshBuilder, MeshTransformer, MeshAverageVertexMerger, MeshVertexWelder, ArrayMesh
 from ezdxf.addons import SierpinskyPyramid
 
 
@@ -55,6 +57,278 @@ def test_average_vertex_merger_index_of():
         merger.index((7, 8, 9))
 
 
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(mesh_module, 'numpy', None)
+    elif mesh_module.numpy is None:
+        pytest.skip('numpy not installed')
+    else:
+        monkeypatch.setattr(mesh_module, 'USE_NUMPY_LIMIT', 0)
+    return request.param
+
+
+def test_vertex_welder_indices(backend):
+    welder = MeshVertexWelder(0.01)
+    indices = welder.add_vertices([(1, 2, 3), (4, 5, 6)])
+    indices2 = welder.add_vertices([(1.005, 2, 3), (4, 5, 6.009)])
+    assert indices == indices2 == (0, 1)
+    assert welder.vertices == [(1, 2, 3), (4, 5, 6)]
+
+
+def test_vertex_welder_true_distance(backend):
+    welder = MeshVertexWelder(0.001)
+    # MeshVertexMerger(precision=2) does not merge these vertices, located at both sides of a rounding boundary
+    assert welder.add_vertices([(0.0149, 0, 0), (0.0151, 0, 0)]) == (0, 0)
+    # diagonal distance > tolerance
+    assert welder.add_vertices([(0.0149 + 0.0008, 0.0008, 0.0008)]) == (1,)
+
+
+@pytest.mark.parametrize('offset', [-0.009, -0.001, 0.001, 0.009])
+def test_vertex_welder_neighbor_cells(offset):
+    welder = MeshVertexWelder(0.01)
+    for index, base in enumerate([0.02, 0.05, 0.0799, 0.1, -0.02]):
+        welder.add_vertices([(base, base, base)])
+        assert welder.add_vertices([(base + offset, base, base)]) == (index,)
+        assert welder.add_vertices([(base, base - offset, base)]) == (index,)
+
+
+def test_vertex_welder_keeps_order_of_first_occurrence(backend):
+    welder = MeshVertexWelder()
+    assert welder.add_vertices([(3, 0, 0), (1, 0, 0), (3, 0, 0), (2, 0, 0), (1, 0, 0)]) == (0, 1, 0, 2, 1)
+    assert welder.vertices == [(3, 0, 0), (1, 0, 0), (2, 0, 0)]
+
+
+def test_vertex_welder_2d_vertices(backend):
+    welder = MeshVertexWelder()
+    assert welder.add_vertices([(1, 2), (1, 2, 0), Vector(3, 4)]) == (0, 0, 1)
+
+
+def test_vertex_welder_numpy_array():
+    numpy = pytest.importorskip('numpy')
+    welder = MeshVertexWelder(0.1)
+    assert welder.weld(numpy.array([[0, 0, 0], [0.05, 0, 0], [1, 1, 1]])) == [0, 0, 1]
+    assert welder.weld(numpy.empty((0, 3))) == []
+
+
+@pytest.mark.parametrize('existing', [0, 20])
+def test_vertex_welder_numpy_and_python_results_are_equal(existing, monkeypatch):
+    pytest.importorskip('numpy')
+    random.seed(7)
+    # clusters of vertices closer than the tolerance, without identical vertices
+    vertices = [
+        (random.randint(0, 4) * 0.1 + random.uniform(-0.03, 0.03), random.randint(0, 4) * 0.1 +
+         random.uniform(-0.03, 0.03), random.choice([0, 0.01]))
+        for _ in range(400)
+    ]
+    numpy_welder = MeshVertexWelder(0.02)
+    numpy_welder.weld(vertices[:existing])
+    numpy_indices = numpy_welder.weld(vertices)
+    monkeypatch.setattr(mesh_module, 'numpy', None)
+    python_welder = MeshVertexWelder(0.02)
+    python_welder.weld(vertices[:existing])
+    assert python_welder.weld(vertices) == numpy_indices
+    assert python_welder.vertices == numpy_welder.vertices
+    # welding continues with the same grid
+    assert python_welder.add_vertices(vertices[:50]) == numpy_welder.add_vertices(vertices[:50])
+
+
+def test_vertex_welder_index_of():
+    welder = MeshVertexWelder(0.01)
+    welder.add_vertices([(1, 2, 3), (4, 5, 6)])
+    assert welder.index((1, 2, 3.005)) == 0
+    assert welder.index((4, 5, 6)) == 1
+    with pytest.raises(IndexError):
+        welder.index((7, 8, 9))
+
+
+def test_vertex_welder_invalid_tolerance():
+    with pytest.raises(ValueError):
+        MeshVertexWelder(0)
+
+
+def test_vertex_welder(backend):
+    pyramid = SierpinskyPyramid(level=4, sides=3)
+    faces = pyramid.faces()
+    mesh = MeshVertexWelder()
+    for vertices in pyramid:
+        mesh.add_mesh(vertices=vertices, faces=faces)
+    assert len(mesh.vertices) == 514
+    assert len(mesh.faces) == 1024
+
+
+def test_array_mesh_add_face():
+    mesh = ArrayMesh()
+    mesh.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    mesh.add_face([(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)])
+    mesh.add_edge([(0, 0, 0), (0, 0, 1)])
+    assert len(mesh.vertices) == 9
+    assert mesh.face_count == 2
+    assert mesh.faces == [(0, 1, 2), (3, 4, 5, 6)]
+    assert mesh.edges == [(7, 8)]
+    assert list(mesh.face_offsets) == [0, 3, 7]
+
+
+def test_array_mesh_from_builder():
+    builder = cube()
+    mesh = ArrayMesh.from_builder(builder)
+    assert list(mesh.vertices) == builder.vertices
+    assert mesh.faces == [tuple(face) for face in builder.faces]
+    # and back
+    transformer = MeshTransformer.from_mesh(mesh)
+    assert transformer.vertices == builder.vertices
+    assert transformer.faces == mesh.faces
+
+
+def test_array_mesh_add_array_mesh():
+    mesh = ArrayMesh.from_builder(cube())
+    mesh.add_mesh(mesh=ArrayMesh.from_builder(cube().translate(2, 0, 0)))
+    assert len(mesh.vertices) == 16
+    assert mesh.face_count == 12
+    assert mesh.faces[6] == tuple(index + 8 for index in mesh.faces[0])
+    assert mesh.vertices[8] == mesh.vertices[0] + (2, 0, 0)
+
+
+def test_array_mesh_invalid_face_index():
+    with pytest.raises(IndexError):
+        ArrayMesh().add_mesh(vertices=[(0, 0, 0), (1, 0, 0)], faces=[(0, 1, 2)])
+
+
+def test_array_mesh_transform():
+    mesh = ArrayMesh.from_builder(cube())
+    expected = cube().translate(1, 2, 3).scale(2, 2, 2)
+    mesh.translate(1, 2, 3).scale(2, 2, 2)
+    assert list(mesh.vertices) == expected.vertices
+
+
+def test_array_mesh_numpy_views():
+    numpy = pytest.importorskip('numpy')
+    mesh = ArrayMesh.from_numpy(
+        numpy.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], dtype=float),
+        numpy.array([(0, 1, 2), (0, 2, 3)]),
+        edges=numpy.array([(0, 2)]),
+    )
+    assert mesh.faces == [(0, 1, 2), (0, 2, 3)]
+    assert mesh.edges == [(0, 2)]
+    indices, offsets = mesh.faces_to_numpy()
+    assert offsets.tolist() == [0, 3, 6]
+    indices[0] = 3  # view without copy
+    assert mesh.faces[0] == (3, 1, 2)
+    vertices = mesh.vertices.to_numpy()
+    vertices[0, 2] = 5.
+    assert mesh.vertices[0] == (0, 0, 5)
+    assert mesh.edges_to_numpy().shape == (1, 2)
+
+
+def test_array_mesh_from_numpy_faces_with_offsets():
+    numpy = pytest.importorskip('numpy')
+    vertices = numpy.zeros((5, 3))
+    mesh = ArrayMesh.from_numpy(vertices, (numpy.array([0, 1, 2, 0, 2, 3, 4]), numpy.array([0, 3, 7])))
+    assert mesh.faces == [(0, 1, 2), (0, 2, 3, 4)]
+    with pytest.raises(ValueError):
+        ArrayMesh.from_numpy(vertices, (numpy.array([0, 1, 2]), numpy.array([0, 4])))
+    with pytest.raises(IndexError):
+        ArrayMesh.from_numpy(vertices, numpy.array([(0, 1, 5)]))
+
+
+def test_array_mesh_render():
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    mesh = ArrayMesh.from_builder(cube())
+    entity = mesh.render(msp, matrix=Matrix44.translate(1, 0, 0))
+    assert list(entity.vertices) == [v + (1, 0, 0) for v in mesh.vertices]
+    assert [tuple(face) for face in entity.faces] == mesh.faces
+
+
+def test_array_mesh_render_polyface():
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    mesh = ArrayMesh.from_builder(cube())
+    mesh.add_face([(0, 0, 2), (1, 0, 2), (2, 1, 2), (1, 2, 2), (0, 1, 2)])  # ngon
+    polyface = mesh.render_polyface(msp)
+    assert polyface.dxf.m_count == 14  # + center vertex of ngon
+    assert polyface.dxf.n_count == 11  # ngon subdivided into 5 triangles
+
+
+def test_mesh_transformer_subdivide():
+    mesh = cube().subdivide(2)
+    assert isinstance(mesh, MeshTransformer)
+    assert len(mesh.vertices) == 98
+    assert len(mesh.faces) == 96
+    assert len(cube().subdivide(1, quads=False).faces) == 48
+
+
+def test_mesh_transformer_subdivide_merges_vertices():
+    mesh = MeshBuilder()
+    mesh.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    mesh.add_face([(0, 0, 0), (1, 1, 0), (0, 1, 0)])  # not merged vertices
+    result = MeshTransformer.from_builder(mesh).subdivide(1)
+    assert len(result.vertices) == 4 + 5 + 2  # shared diagonal midpoint
+
+
+def test_array_mesh_subdivide_quads(backend):
+    mesh = ArrayMesh()
+    mesh.add_mesh(vertices=[(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0)], faces=[(0, 1, 2, 3)])
+    result = mesh.subdivide(1)
+    assert result.face_count == 4
+    assert len(result.vertices) == 9
+    assert list(result.faces_as_vertices())[0] == [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+    assert mesh.face_count == 1, 'source mesh should not be changed'
+
+
+def test_array_mesh_subdivide_triangles(backend):
+    mesh = ArrayMesh()
+    mesh.add_mesh(vertices=[(0, 0, 0), (3, 0, 0), (0, 3, 0)], faces=[(0, 1, 2)])
+    result = mesh.subdivide(1, quads=False)
+    assert result.face_count == 6
+    assert list(result.faces_as_vertices())[:2] == [
+        [(0, 1.5, 0), (0, 0, 0), (1, 1, 0)],
+        [(0, 0, 0), (1.5, 0, 0), (1, 1, 0)],
+    ]
+
+
+def test_array_mesh_subdivide_shares_midpoints(backend):
+    mesh = ArrayMesh.from_builder(cube())
+    result = mesh.subdivide(3)
+    assert result.face_count == 6 * 4 ** 3
+    assert len(result.vertices) == 386  # closed quad mesh: V - E + F = 2
+
+
+def test_array_mesh_subdivide_edges(backend):
+    mesh = ArrayMesh()
+    mesh.add_mesh(vertices=[(0, 0, 0), (2, 0, 0), (2, 2, 0), (7, 7, 7)], faces=[(0, 1, 2), (0, 1)],
+                  edges=[(0, 1), (2, 3)])
+    result = mesh.subdivide(1, edges=True)
+    assert result.face_count == 3  # face with 2 vertices is removed
+    assert len(result.edges) == 4
+    assert len(result.vertices) == 4 + 3 + 1 + 1  # midpoint of edge (0, 1) is shared by face and edge
+    assert mesh.subdivide(1).edges == []
+
+
+def test_array_mesh_subdivide_backends_are_equal(monkeypatch):
+    pytest.importorskip('numpy')
+    mesh = ArrayMesh.from_builder(cube())
+    mesh.add_face([(0, 0, 2), (1, 0, 2), (2, 1, 2), (1, 2, 2), (0, 1, 2)])
+    expected = mesh.subdivide(2, quads=False)
+    monkeypatch.setattr(mesh_module, 'numpy', None)
+    result = mesh.subdivide(2, quads=False)
+
+    def rounded_faces(mesh):
+        return sorted([v.round(9) for v in face] for face in mesh.faces_as_vertices())
+
+    assert rounded_faces(expected) == rounded_faces(result)
+
+
+def test_subdivide_removes_repeated_face_indices(backend):
+    mesh = ArrayMesh()
+    mesh.add_mesh(vertices=[(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0)], faces=[(0, 1, 1, 2, 3, 0)])
+    result = mesh.subdivide(2)
+    assert result.face_count == 16
+    assert len(result.vertices) == 25
+    result = cylinder(12).subdivide(2)
+    assert len(result.vertices) == len(set(v.round(9) for v in result.vertices))
+
+
 def test_mesh_builder():
     dwg = ezdxf.new('R2000')
     pyramid = SierpinskyPyramid(level=4, sides=3)
@@ -235,3 +509,13 @@ def polyface_181_2(msp):
 def test_from_polyface_182_2(polyface_181_2):
     mesh = MeshVertexMerger.from_polyface(polyface_181_2)
     assert len(mesh.vertices) == 8
+
+
+@pytest.mark.parametrize('mesh_class, vertex_count', [(MeshVertexMerger, 8), (ArrayMesh, 24)])
+def test_add_polygon_with_hole(mesh_class, vertex_count):
+    mesh = mesh_class()
+    mesh.add_polygon([(0, 0, 1), (4, 0, 1), (4, 4, 1), (0, 4, 1)], holes=[[(1, 1, 1), (3, 1, 1), (3, 3, 1), (1, 3, 1)]])
+    assert len(mesh.vertices) == vertex_count
+    faces = list(mesh.faces_as_vertices())
+    assert len(faces) == 8
+    assert sum((b - a).cross(c - a).z / 2 for a, b, c in faces) == 12
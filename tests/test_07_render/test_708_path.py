@@ -3,7 +3,7 @@
 
 import pytest
 import math
-from ezdxf.render.path import Path, Command
+from ezdxf.render.path import Path, Command, offset_paths_2d
 from ezdxf.math import Vector, Matrix44, Bezier4P
 
 
@@ -152,6 +152,18 @@ def test_from_circle():
     assert path.is_closed is True
 
 
+def test_flattening():
+    path = Path()
+    path.line_to((2, 0))
+    path.curve_to((4, 0), (2, 1), (4, 1))
+    vertices = list(path.flattening(0.01))
+    assert vertices[0] == (0, 0)
+    assert vertices[1] == (2, 0)
+    assert vertices[-1] == (4, 0)
+    assert len(vertices) > 3
+    assert len(list(path.flattening(0.001))) > len(vertices)
+
+
 def test_lwpolyine_lines():
     from ezdxf.entities import LWPolyline
     pline = LWPolyline()
@@ -273,6 +285,20 @@ def test_approximate_line_curves():
     assert vertices[-1] == (4, 0)
 
 
+def test_approximate_consecutive_curves_and_lines():
+    path = Path()
+    path.curve_to((2, 0), (0, 1), (2, 1))
+    path.curve_to((4, 0), (2, -1), (4, -1))
+    path.line_to((4, 2))
+    path.curve_to((0, 2), (4, 3), (0, 3))
+    vertices = list(path.approximate(10))
+    assert len(vertices) == 1 + 10 + 10 + 1 + 10
+    assert vertices[10] == (2, 0)
+    assert vertices[20] == (4, 0)
+    assert vertices[21] == (4, 2)
+    assert vertices[-1] == (0, 2)
+
+
 def test_transform():
     path = Path()
     path.line_to((2, 0))
@@ -286,5 +312,37 @@ def test_transform():
     assert p2.end == (5, 1)
 
 
+
+def test_offset_2d_closed_path():
+    path = Path.from_vertices([(0, 0, 2), (4, 0, 2), (4, 4, 2), (0, 4, 2)], close=True)
+    result = path.offset_2d(-1)
+    assert len(result) == 1
+    offset_path = result[0]
+    assert offset_path.is_closed
+    assert offset_path.start == (0, -1, 2)
+    assert sum(1 for cmd in offset_path if cmd[0] == Command.CURVE_TO) == 4  # rounded corners
+    for vertex in offset_path.flattening(0.01):
+        assert vertex.z == 2
+        distance = math.hypot(max(abs(vertex.x - 2) - 2, 0), max(abs(vertex.y - 2) - 2, 0))
+        assert math.isclose(distance, 1, abs_tol=1e-3)
+
+
+def test_offset_2d_open_path():
+    path = Path.from_vertices([(0, 0), (4, 0)])
+    result = path.offset_2d(1)
+    assert len(result) == 1
+    assert result[0].start == (0, 1)
+    assert result[0].end == (4, 1)
+    assert Path().offset_2d(1) == []
+
+
+def test_offset_paths_2d():
+    paths = [Path.from_vertices([(0, 0), (4, 0), (4, 4), (0, 4)], close=True), Path.from_vertices([(0, 0), (4, 0)])]
+    result = offset_paths_2d(paths, 3)
+    assert len(result) == 2
+    assert result[0] == []  # collapsed
+    assert len(result[1]) == 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -0,0 +1,94 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+from collections import Counter
+from ezdxf.render import forms, decimation
+from ezdxf.render.mesh import MeshVertexMerger, MeshBuilder, ArrayMesh
+from ezdxf.render.decimation import decimate_mesh
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(decimation, 'numpy', None)
+    elif decimation.numpy is None:
+        pytest.skip('numpy not installed')
+    else:
+        monkeypatch.setattr(decimation, 'USE_NUMPY_LIMIT', 0)
+    return request.param
+
+
+def grid(count: int) -> MeshVertexMerger:
+    mesh = MeshVertexMerger()
+    for x in range(count):
+        for y in range(count):
+            mesh.add_face([(x, y, 0), (x + 1, y, 0), (x + 1, y + 1, 0), (x, y + 1, 0)])
+    return mesh
+
+
+def sphere() -> MeshVertexMerger:
+    mesh = MeshVertexMerger()
+    mesh.add_mesh(mesh=forms.sphere(count=32, stacks=16, radius=1))
+    return mesh
+
+
+def edge_counts(mesh: ArrayMesh) -> Counter:
+    edges = Counter()
+    for face in mesh.faces:
+        for index in range(len(face)):
+            a, b = face[index - 1], face[index]
+            edges[(min(a, b), max(a, b))] += 1
+    return edges
+
+
+def test_requires_target_faces_or_max_error():
+    with pytest.raises(ValueError):
+        decimate_mesh(grid(2))
+
+
+def test_returns_triangles(backend):
+    mesh = sphere()
+    result = decimate_mesh(mesh, max_error=0)
+    assert result.face_count == sum(len(face) - 2 for face in mesh.faces), 'faces should be triangulated'
+    assert all(len(face) == 3 for face in result.faces)
+
+
+def test_empty_mesh(backend):
+    result = decimate_mesh(MeshBuilder(), target_faces=0)
+    assert len(result.vertices) == 0
+    assert result.face_count == 0
+
+
+def test_planar_grid_keeps_boundary(backend):
+    result = decimate_mesh(grid(10), target_faces=2)
+    assert result.face_count == 2
+    assert sorted(v.xyz for v in result.vertices) == [(0, 0, 0), (0, 10, 0), (10, 0, 0), (10, 10, 0)]
+
+
+def test_target_faces(backend):
+    result = decimate_mesh(sphere(), target_faces=100)
+    assert result.face_count == 100
+    assert len(result.vertices) == 52, 'unused vertices should be removed'
+
+
+def test_closed_mesh_stays_closed(backend):
+    result = decimate_mesh(sphere(), target_faces=50)
+    edges = edge_counts(result)
+    assert set(edges.values()) == {2}
+    assert len(result.vertices) - len(edges) + result.face_count == 2, 'invalid Euler characteristic'
+
+
+def test_max_error(backend):
+    mesh = sphere()
+    coarse = decimate_mesh(mesh, max_error=0.1)
+    fine = decimate_mesh(mesh, max_error=0.01)
+    assert coarse.face_count < fine.face_count < len(mesh.faces) * 2
+    for vertex in coarse.vertices:
+        assert abs(vertex.magnitude - 1) < 0.1
+
+
+def test_array_mesh_input(backend):
+    mesh = ArrayMesh.from_mesh(sphere())
+    result = decimate_mesh(mesh, target_faces=100)
+    assert result.face_count == 100
+    assert mesh.face_count == 512, 'source mesh should not be changed'
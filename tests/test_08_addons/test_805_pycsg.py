@@ -1,6 +1,7 @@
 # License: MIT License
-from ezdxf.addons.pycsg import CSG, Vector, BSPNode, Polygon
-from ezdxf.render.forms import cube, sphere, cone_2p, cylinder_2p
+from ezdxf.addons import pycsg
+from ezdxf.addons.pycsg import CSG, Vector, BSPNode, Polygon, _pick_split_polygon
+from ezdxf.render.forms import cube, sphere, cone_2p, cylinder_2p, circle, translate, rotation_form
 
 
 def test_cube_intersect():
@@ -70,3 +71,144 @@ def test_example_infiniteRecursion():
     p0 = Polygon([v0, v1, v2, v3])
     polygons = [p0]
     node = BSPNode(polygons)
+
+
+def volume(csg: CSG) -> float:
+    mesh = csg.mesh()
+    v = 0.
+    for face in mesh.faces_as_vertices():
+        for index in range(1, len(face) - 1):
+            v += face[0].dot(face[index].cross(face[index + 1]))
+    return v / 6.
+
+
+def test_polygon_coords():
+    p0 = Polygon([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    assert p0.vertices == [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+    assert p0.extents() == (0, 0, 0, 1, 1, 0)
+    assert p0.plane.normal.isclose((0, 0, 1))
+
+
+def test_flip_polygon_does_not_flip_shared_plane():
+    p0 = Polygon([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    p1 = p0.clone()
+    p1.flip()
+    assert p1.vertices == [(1, 1, 0), (1, 0, 0), (0, 0, 0)]
+    assert p1.plane.normal.isclose((0, 0, -1))
+    assert p0.plane.normal.isclose((0, 0, 1))
+
+
+def test_skip_degenerated_faces():
+    mesh = cube()
+    mesh.faces.append((0, 0, 1))
+    assert len(CSG(mesh).polygons) == 6
+
+
+def test_collinear_leading_vertices():
+    p0 = Polygon([(0, 0, 0), (0.5, 0, 0), (1, 0, 0), (1, 1, 0)])
+    assert p0.plane.normal.isclose((0, 0, 1))
+
+
+def test_deep_bsp_tree_without_recursion_limit():
+    # BSP tree of a convex solid is a linear chain of nodes
+    polygons = CSG(sphere(count=48, stacks=24)).polygons
+    node = BSPNode(polygons)
+    assert len(list(node.nodes())) > 1000
+    copy = node.clone()
+    copy.invert()
+    copy.invert()
+    copy.clip_to(node)
+    assert len(copy.all_polygons()) == len(polygons)
+
+
+def test_disjoint_solids():
+    a = CSG(cube())
+    b = CSG(cube().translate(3, 0, 0))
+    assert len((a + b).polygons) == 12
+    assert len((a - b).polygons) == 6
+    assert len((a * b).polygons) == 0
+
+
+def test_overlapping_cubes():
+    a = CSG(cube())
+    b = CSG(cube().translate(0.5, 0.5, 0.5))
+    assert abs(volume(a + b) - 1.875) < 1e-9
+    assert abs(volume(a - b) - 0.875) < 1e-9
+    assert abs(volume(a * b) - 0.125) < 1e-9
+
+
+def test_polygons_outside_of_overlap_region_are_unchanged():
+    plate = cube().scale(10, 10, 1).subdivide(2)
+    hole = CSG(cube().scale(1, 1, 2))
+    result = CSG(plate) - hole
+    assert abs(volume(result) - 99) < 1e-9
+    # 8 of 96 faces of the plate are inside of the overlap region
+    faces = set(tuple(v.xyz for v in p.vertices) for p in result.polygons)
+    unchanged = [face for face in plate.faces_as_vertices() if min(abs(v.x) + abs(v.y) for v in face) > 0]
+    assert len(unchanged) == 88
+    assert all(tuple(v.xyz for v in face) in faces for face in unchanged)
+
+
+def test_polygon_bounding_sphere():
+    p0 = Polygon([(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0)])
+    cx, cy, cz, radius = p0.sphere
+    assert (cx, cy, cz) == (1, 1, 0)
+    assert abs(radius - 2 ** 0.5) < 1e-12
+    p0.flip()
+    assert p0.sphere == (cx, cy, cz, radius)
+
+
+def test_split_polygons_far_away_from_plane():
+    plane = Polygon([(0, 0, 0), (1, 0, 0), (1, 1, 0)]).plane
+    above = Polygon([(0, 0, 1), (1, 0, 1), (1, 1, 1)])
+    below = Polygon([(0, 0, -1), (1, 0, -1), (1, 1, -1)])
+    crossing = Polygon([(0, 0, -1), (1, 0, -1), (1, 0, 1)])
+    coplanar = []
+    front = []
+    back = []
+    for polygon in (above, below, crossing):
+        plane.split_polygon(polygon, coplanar, coplanar, front, back)
+    assert coplanar == []
+    assert front[0] is above and back[0] is below
+    assert len(front) == 2 and len(back) == 2
+
+
+def bsp_tree_depth(root: BSPNode) -> int:
+    depth = 0
+    stack = [(root, 1)]
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        for child in (node.front, node.back):
+            if child:
+                stack.append((child, level + 1))
+    return depth
+
+
+def torus(count: int):
+    profile = translate(circle(count // 2, radius=.3, close=True), (0, 1, 0))
+    return rotation_form(count, profile)
+
+
+def test_split_plane_heuristic_for_convex_solids():
+    polygons = CSG(sphere(count=16, stacks=8)).polygons
+    assert _pick_split_polygon(polygons) == (0, True)
+
+
+def test_split_plane_heuristic_reduces_bsp_tree_depth(monkeypatch):
+    polygons = CSG(torus(32)).polygons
+    index, convex = _pick_split_polygon(polygons)
+    assert convex is False
+    depth = bsp_tree_depth(BSPNode(polygons))
+    # disable heuristic, always split at the first polygon of each set
+    monkeypatch.setattr(pycsg, 'SPLIT_SAMPLES', len(polygons))
+    assert depth < bsp_tree_depth(BSPNode(polygons))
+
+
+def test_overlapping_tori():
+    a = CSG(torus(32))
+    b = CSG(torus(32).translate(.1, .3, .2))
+    union = volume(a + b)
+    intersection = volume(a * b)
+    assert abs(union + intersection - 2 * volume(a)) < 1e-6
+    assert abs(volume(a - b) + intersection - volume(a)) < 1e-6
@@ -226,12 +226,33 @@ def test_3d_circle_path(msp, path_backend):
 def test_3d_arc_basic(msp, basic):
     msp.add_arc((0, 0), radius=2, start_angle=30, end_angle=60,
                 dxfattribs={'extrusion': (0, 1, 1)})
+    basic.out.max_flattening_distance = 0.001
     basic.draw_entities(msp)
     result = basic.out.collector
     assert len(result) > 10
     assert unique_types(result) == {'line'}
 
 
+def test_flattening_distance_of_basic_backend(msp, basic):
+    msp.add_arc((0, 0), radius=2, start_angle=30, end_angle=60,
+                dxfattribs={'extrusion': (0, 1, 1)})
+    basic.draw_entities(msp)
+    count = len(basic.out.collector)
+    basic.out.collector = []
+    basic.out.max_flattening_distance = 0.001
+    basic.draw_entities(msp)
+    assert len(basic.out.collector) > count
+
+
+def test_deprecated_bezier_approximation_count(msp, basic):
+    msp.add_arc((0, 0), radius=2, start_angle=30, end_angle=60,
+                dxfattribs={'extrusion': (0, 1, 1)})
+    with pytest.deprecated_call():
+        basic.out.bezier_approximation_count = 16
+    basic.draw_entities(msp)
+    assert len(basic.out.collector) == 16
+
+
 def test_3d_arc_path(msp, path_backend):
     msp.add_arc((0, 0), radius=2, start_angle=30, end_angle=60,
                 dxfattribs={'extrusion': (0, 1, 1)})
@@ -244,6 +265,7 @@ def test_3d_arc_path(msp, path_backend):
 def test_3d_ellipse_basic(msp, basic):
     msp.add_ellipse((0, 0), major_axis=(1, 0, 0), ratio=0.5, start_param=1, end_param=2,
                     dxfattribs={'extrusion': (0, 1, 1)})
+    basic.out.max_flattening_distance = 0.001
     basic.draw_entities(msp)
     result = basic.out.collector
     assert len(result) > 10
@@ -292,6 +314,16 @@ def test_hatch(msp, basic):
     assert result[0][0] == 'filled_polygon'
 
 
+def test_hatch_with_hole(msp, basic):
+    hatch = msp.add_hatch()
+    hatch.paths.add_polyline_path([(0, 0), (3, 0), (3, 3), (0, 3)])
+    hatch.paths.add_polyline_path([(1, 1), (2, 1), (2, 2), (1, 2)])
+    basic.draw_entities(msp)
+    result = basic.out.collector
+    assert unique_types(result) == {'filled_polygon'}
+    assert len(result) == 8, 'expected triangulated polygon with hole'
+
+
 def test_basic_spline(msp, basic):
     msp.add_spline(fit_points=[(0, 0), (3, 2), (4, 5), (6, 4), (12, 0)])
     basic.draw_entities(msp)